@@ -1,12 +1,13 @@
-import threading
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends, status
+import asyncio
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 import uvicorn
-from typing import Optional, List
-from pydantic import BaseModel
+from typing import Optional, List, Dict, Set, Union
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from datetime import datetime, timedelta
-import json
+import orjson
 import jwt
 from passlib.context import CryptContext
 import os
@@ -25,124 +26,269 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+class ConnState:
+    """Per-connection bookkeeping kept in slots rather than a dict"""
+    __slots__ = ("user_id", "subscriptions", "connected_at")
+    
+    def __init__(self, user_id: Optional[int] = None):
+        self.user_id = user_id
+        self.subscriptions: Set[str] = {"all"}  # Default subscription
+        self.connected_at = datetime.utcnow()
+
 # Enhanced WebSocket connection manager
 class ConnectionManager:
+    # All state is owned by the server event loop; background threads must go
+    # through enqueue()/enqueue_many() rather than touching it directly
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.connection_info = {}  # websocket: {"user_id": int, "subscriptions": list}
-        self._lock = threading.Lock()
+        self.active_connections: Set[WebSocket] = set()
+        self.connection_info: Dict[WebSocket, ConnState] = {}
+        self.subs_index: Dict[str, Set[WebSocket]] = {}  # subscription: subscribed websockets
+        self.queues: Dict[WebSocket, asyncio.Queue] = {}  # websocket: pending encoded frames
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Sender tasks write to their sockets concurrently; cap how many
+        # writes may be in flight at once so a burst can't pile up unbounded
+        self._send_slots = asyncio.Semaphore(256)
+        self.send_timeout = 10  # seconds a single write may take before the client is dropped
+        # Sockets whose send failed, dropped together by the next sweep
+        self._failed: Set[WebSocket] = set()
+        # Coalesced updates waiting for the next flush: message_type -> items
+        self._pending: Dict[str, List[dict]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.flush_interval = 0.05  # seconds
+        self.max_pending = 10000  # per type; further updates are dropped until the next flush
+        self.fanout_slice = 50  # queues filled per event loop turn during a broadcast
+        self.max_queued = 1000  # frames per connection; the oldest is dropped beyond this
     
     async def connect(self, websocket: WebSocket, user_id: Optional[int] = None):
         await websocket.accept()
-        with self._lock:
-            self.active_connections.append(websocket)
-            self.connection_info[websocket] = {
-                "user_id": user_id,
-                "subscriptions": ["all"],  # Default subscription
-                "connected_at": datetime.utcnow()
-            }
+        self._loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.max_queued)
+        self.active_connections.add(websocket)
+        self.connection_info[websocket] = ConnState(user_id)
+        self.subs_index.setdefault("all", set()).add(websocket)
+        self.queues[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(self._sender_loop(websocket, queue))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
         print(f"WebSocket connected. Total connections: {len(self.active_connections)}")
     
     def disconnect(self, websocket: WebSocket):
-        with self._lock:
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
-            if websocket in self.connection_info:
-                del self.connection_info[websocket]
-        print(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
-    
-    async def send_personal_message(self, message: str, websocket: WebSocket):
+        self.disconnect_many({websocket})
+    
+    def disconnect_many(self, websockets: Set[WebSocket]):
+        """Drop a set of connections and all their bookkeeping in one pass"""
+        self.active_connections.difference_update(websockets)
+        current = asyncio.current_task()
+        for websocket in websockets:
+            conn_info = self.connection_info.pop(websocket, None)
+            if conn_info is not None:
+                for sub in conn_info.subscriptions:
+                    self._unindex(websocket, sub)
+            self.queues.pop(websocket, None)
+            sender = self._senders.pop(websocket, None)
+            if sender is not None and sender is not current:
+                sender.cancel()
+        print(f"WebSocket disconnected ({len(websockets)}). Total connections: {len(self.active_connections)}")
+    
+    def _mark_failed(self, websocket: WebSocket):
+        """Record a dead socket; a network flap gets cleaned up by a single sweep"""
+        if not self._failed:
+            self._loop.call_soon(self._sweep_failed)
+        self._failed.add(websocket)
+    
+    def _sweep_failed(self):
+        failed, self._failed = self._failed, set()
+        self.disconnect_many(failed)
+    
+    async def send_personal_message(self, data: Union[dict, bytes], websocket: WebSocket):
+        if not isinstance(data, bytes):
+            data = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
         try:
-            await websocket.send_text(message)
+            await websocket.send_bytes(data)
         except Exception as e:
             print(f"Error sending personal message: {e}")
             self.disconnect(websocket)
     
-    async def broadcast(self, message: str, message_type: str = "update", target_subscriptions: List[str] = None):
+    async def _sender_loop(self, websocket: WebSocket, queue: asyncio.Queue):
         """
-        Broadcast message to connections with matching subscriptions
+        Send queued messages for one connection, coalescing everything that
+        piled up while the previous send was in flight into a single frame
         """
-        # Handle the message data safely
-        try:
-            if isinstance(message, str) and message.strip():
-                data = json.loads(message)
-            elif isinstance(message, str) and not message.strip():
-                data = {"message": message}
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            if len(batch) == 1:
+                frame = batch[0]
             else:
-                data = message
-        except json.JSONDecodeError:
-            data = {"message": message}
-        
-        payload = {
-            "type": message_type,
-            "timestamp": datetime.utcnow().isoformat(),
-            "data": data
-        }
-        json_message = json.dumps(payload)
-        
-        disconnected = []
-        with self._lock:
-            connections = self.active_connections.copy()
+                frame = b'{"type":"batch","items":[' + b','.join(batch) + b']}'
+            
+            if await self._safe_send(websocket, frame) is not None:
+                self._mark_failed(websocket)
+                return
+    
+    async def _safe_send(self, websocket: WebSocket, frame: bytes) -> Optional[WebSocket]:
+        """Send a frame, returning the websocket if the send failed"""
+        try:
+            async with self._send_slots:
+                await asyncio.wait_for(websocket.send_bytes(frame), self.send_timeout)
+        except asyncio.TimeoutError:
+            # A client that stopped reading would otherwise hold a send slot forever
+            print(f"WebSocket send timed out after {self.send_timeout}s; closing connection")
+            asyncio.create_task(self._close(websocket))
+            return websocket
+        except Exception as e:
+            print(f"Error sending message to WebSocket: {e}")
+            return websocket
+        return None
+    
+    async def _close(self, websocket: WebSocket):
+        """Close a connection without waiting on a peer that has stopped reading"""
+        try:
+            await asyncio.wait_for(websocket.close(code=status.WS_1011_INTERNAL_ERROR), self.send_timeout)
+        except Exception:
+            pass
+    
+    async def _push(self, frame: bytes, connections):
+        """
+        Queue an encoded frame for each connection, yielding to the event
+        loop between slices so a large fan-out does not starve other tasks
+        """
+        connections = list(connections)
+        for start in range(0, len(connections), self.fanout_slice):
+            if start:
+                await asyncio.sleep(0)
+            for connection in connections[start:start + self.fanout_slice]:
+                queue = self.queues.get(connection)
+                if queue is None:
+                    continue
+                if queue.full():
+                    # A client this far behind only needs the newest updates
+                    queue.get_nowait()
+                queue.put_nowait(frame)
+    
+    async def broadcast(self, data: Union[dict, list, bytes], message_type: str = "update",
+                        target_subscriptions: List[str] = None, raw: bool = False):
+        """
+        Broadcast data to connections with matching subscriptions; with raw=True,
+        data is already-encoded JSON bytes and is spliced into the envelope as is
+        """
+        if self._loop is None:
+            # No client has connected yet, so there is nobody to deliver to
+            return
         
-        for connection in connections:
-            try:
-                # Check if connection should receive this message
-                should_send = True
-                if target_subscriptions:
-                    conn_info = self.connection_info.get(connection, {})
-                    subscriptions = conn_info.get("subscriptions", [])
-                    should_send = any(sub in subscriptions for sub in target_subscriptions)
-                
-                if should_send:
-                    await connection.send_text(json_message)
-                    
-            except Exception as e:
-                print(f"Error sending message to WebSocket: {e}")
-                disconnected.append(connection)
+        if raw:
+            frame = b'{"type":%s,"timestamp":"%s","data":%s}' % (
+                orjson.dumps(message_type), datetime.utcnow().isoformat().encode(), data
+            )
+        else:
+            payload = {
+                "type": message_type,
+                "timestamp": datetime.utcnow().isoformat(),
+                "data": data
+            }
+            # Encoded once to UTF-8 and shared as a binary frame by every recipient
+            frame = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
         
-        # Clean up disconnected connections
-        for conn in disconnected:
-            self.disconnect(conn)
+        if target_subscriptions:
+            # Fan-out to the union of the subscription index buckets only
+            connections = set().union(*(self.subs_index.get(sub, ()) for sub in target_subscriptions))
+        else:
+            connections = self.queues
+        await self._push(frame, connections)
+    
+    def enqueue(self, message_type: str, item: dict):
+        """
+        Queue an update to go out with the next coalesced broadcast of its
+        type; safe to call from background threads
+        """
+        self.enqueue_many(message_type, [item])
+    
+    def enqueue_many(self, message_type: str, items: List[dict]):
+        """Queue several updates of one type with a single loop wakeup"""
+        if self._loop is None or not items:
+            return
+        self._loop.call_soon_threadsafe(self._add_pending, message_type, items)
+    
+    def _add_pending(self, message_type: str, items: List[dict]):
+        pending = self._pending.setdefault(message_type, [])
+        room = self.max_pending - len(pending)
+        if room < len(items):
+            print(f"Dropping {len(items) - max(room, 0)} queued {message_type} updates: flush backlog full")
+        pending.extend(items[:max(room, 0)])
+    
+    async def _flush_loop(self):
+        """Broadcast pending updates as one message per type every flush_interval"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self._pending:
+                continue
+            pending, self._pending = self._pending, {}
+            for message_type, items in pending.items():
+                await self.broadcast(items, message_type)
     
     def subscribe(self, websocket: WebSocket, subscription_type: str):
         """Subscribe a connection to specific updates"""
-        with self._lock:
-            if websocket in self.connection_info:
-                subscriptions = self.connection_info[websocket]["subscriptions"]
-                if subscription_type not in subscriptions:
-                    subscriptions.append(subscription_type)
+        if websocket in self.connection_info:
+            subscriptions = self.connection_info[websocket].subscriptions
+            if subscription_type not in subscriptions:
+                subscriptions.add(subscription_type)
+                self.subs_index.setdefault(subscription_type, set()).add(websocket)
     
     def unsubscribe(self, websocket: WebSocket, subscription_type: str):
         """Unsubscribe a connection from specific updates"""
-        with self._lock:
-            if websocket in self.connection_info:
-                subscriptions = self.connection_info[websocket]["subscriptions"]
-                if subscription_type in subscriptions:
-                    subscriptions.remove(subscription_type)
+        if websocket in self.connection_info:
+            subscriptions = self.connection_info[websocket].subscriptions
+            if subscription_type in subscriptions:
+                subscriptions.discard(subscription_type)
+                self._unindex(websocket, subscription_type)
+    
+    def _unindex(self, websocket: WebSocket, subscription_type: str):
+        """Remove a connection from the subscription index, dropping empty buckets"""
+        bucket = self.subs_index.get(subscription_type)
+        if bucket is not None:
+            bucket.discard(websocket)
+            if not bucket:
+                del self.subs_index[subscription_type]
     
     def get_connection_count(self) -> int:
         """Get number of active connections"""
-        with self._lock:
-            return len(self.active_connections)
+        return len(self.active_connections)
 
 manager = ConnectionManager()
 
+# Pre-encoded replies for the frequent client control messages
+PONG_TMPL = b'{"type":"pong","timestamp":"%s","server_time":"%s"}'
+SUBSCRIBED_TMPL = b'{"type":"subscribed","status":"success","subscriptions":%s}'
+UNSUBSCRIBED_TMPL = b'{"type":"unsubscribed","status":"success","subscriptions":%s}'
+INVALID_JSON_FRAME = b'{"type":"error","message":"Invalid JSON"}'
+
 # Database setup
-from database import get_database_url, init_db
+from database import get_database_url, init_db, init_async_db
 SQLALCHEMY_DATABASE_URL = get_database_url()
 
 # Initialize database
 engine = init_db(SQLALCHEMY_DATABASE_URL)
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+# Request handlers use an asyncio engine so DB I/O never blocks the event loop
+async_engine = init_async_db(SQLALCHEMY_DATABASE_URL)
+SessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async def get_db():
+    async with SessionLocal() as db:
+        yield db
 
 # Import models after engine is created
-from models import Base, Server, ServerSpec
+from models import Base, Server, ServerCredentials, ServerSpec, Metric, MetricRollup, MetricArchive, utcnow
 
 # Create tables if they don't exist
 Base.metadata.create_all(bind=engine)
@@ -152,6 +298,7 @@ from services.ssh_service import ssh_service
 from services.monitoring_service import init_monitoring_service
 from services.alert_service import init_alert_service
 from services.log_service import init_log_service
+from services.metric_archive import decode_block
 
 # Initialize all services with WebSocket manager
 monitoring_service = init_monitoring_service(SQLALCHEMY_DATABASE_URL, manager)
@@ -172,14 +319,22 @@ class ServerCreate(BaseModel):
     password: Optional[str] = None
 
 class ServerResponse(BaseModel):
+    # Read straight from Server rows instead of an intermediate dict
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     name: str
     ip: str
     port: int
     user: str
-    status: str
+    is_active: Optional[bool] = Field(default=None, exclude=True)
     created_at: datetime
     updated_at: datetime
+    
+    @computed_field
+    @property
+    def status(self) -> str:
+        return "active" if self.is_active else "inactive"
 
 class ServerUpdate(BaseModel):
     name: Optional[str] = None
@@ -208,88 +363,59 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
             
             # Handle different message types
             if message.get("type") == "ping":
-                await manager.send_personal_message(
-                    json.dumps({
-                        "type": "pong",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "server_time": datetime.utcnow().isoformat()
-                    }),
-                    websocket
-                )
+                now = datetime.utcnow().isoformat().encode()
+                await manager.send_personal_message(PONG_TMPL % (now, now), websocket)
             elif message.get("type") == "subscribe":
                 # Client wants to subscribe to specific updates
                 subscriptions = message.get("subscriptions", ["all"])
                 for sub in subscriptions:
                     manager.subscribe(websocket, sub)
                 
-                await manager.send_personal_message(
-                    json.dumps({
-                        "type": "subscribed",
-                        "status": "success",
-                        "subscriptions": subscriptions
-                    }),
-                    websocket
-                )
+                await manager.send_personal_message(SUBSCRIBED_TMPL % orjson.dumps(subscriptions), websocket)
             elif message.get("type") == "unsubscribe":
                 # Client wants to unsubscribe from specific updates
                 subscriptions = message.get("subscriptions", [])
                 for sub in subscriptions:
                     manager.unsubscribe(websocket, sub)
                 
-                await manager.send_personal_message(
-                    json.dumps({
-                        "type": "unsubscribed",
-                        "status": "success",
-                        "subscriptions": subscriptions
-                    }),
-                    websocket
-                )
+                await manager.send_personal_message(UNSUBSCRIBED_TMPL % orjson.dumps(subscriptions), websocket)
             elif message.get("type") == "get_status":
                 # Client wants current server statuses
                 statuses = monitoring_service.get_all_server_statuses()
-                await manager.send_personal_message(
-                    json.dumps({
-                        "type": "server_statuses",
-                        "data": statuses,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }),
-                    websocket
-                )
+                await manager.send_personal_message({
+                    "type": "server_statuses",
+                    "data": statuses,
+                    "timestamp": datetime.utcnow().isoformat()
+                }, websocket)
             elif message.get("type") == "acknowledge_alert":
                 # Client acknowledges an alert
                 alert_id = message.get("alert_id")
                 if alert_id:
-                    success = alert_service.mark_alert_resolved(alert_id)
+                    success = await asyncio.to_thread(alert_service.mark_alert_resolved, alert_id)
                     if success:
-                        await manager.broadcast(
-                            json.dumps({
-                                "type": "alert_acknowledged",
-                                "alert_id": alert_id,
-                                "timestamp": datetime.utcnow().isoformat()
-                            }),
-                            "alert_update"
-                        )
+                        await manager.broadcast({
+                            "type": "alert_acknowledged",
+                            "alert_id": alert_id,
+                            "timestamp": datetime.utcnow().isoformat()
+                        }, "alert_update")
             
     except WebSocketDisconnect:
         manager.disconnect(websocket)
-    except json.JSONDecodeError:
-        await manager.send_personal_message(
-            json.dumps({"type": "error", "message": "Invalid JSON"}),
-            websocket
-        )
+    except orjson.JSONDecodeError:
+        await manager.send_personal_message(INVALID_JSON_FRAME, websocket)
+        manager.disconnect(websocket)
     except Exception as e:
         print(f"WebSocket error: {e}")
         manager.disconnect(websocket)
 
 # Server endpoints
 @app.post("/servers/", response_model=ServerResponse)
-async def create_server(server: ServerCreate):
+async def create_server(server: ServerCreate, db: AsyncSession = Depends(get_db)):
     """Create a new server"""
-    db = SessionLocal()
     try:
         # Create server record
         db_server = Server(
@@ -297,86 +423,62 @@ async def create_server(server: ServerCreate):
             ip=server.ip,
             port=server.port,
             user=server.user,
-            ssh_key_path=server.ssh_key_path,
-            password_encrypted=server.password,  # Note: In production, encrypt this
-            is_active=True
+            is_active=True,
+            credentials=ServerCredentials(
+                ssh_key_path=server.ssh_key_path,
+                password_encrypted=server.password  # Encrypted by the column type
+            )
         )
         
         db.add(db_server)
-        db.commit()
-        db.refresh(db_server)
+        await db.flush()  # assigns db_server.id without ending the transaction
         
-        # Create associated ServerSpec record
-        db_spec = ServerSpec(server_id=db_server.id)
-        db.add(db_spec)
-        db.commit()
+        # Create associated ServerSpec record; both rows commit together
+        db.add(ServerSpec(server_id=db_server.id))
+        await db.commit()
+        await db.refresh(db_server)
         
         # Broadcast new server creation
-        await manager.broadcast(f"New server created: {server.name}", "server_created")
+        await manager.broadcast({"message": f"New server created: {server.name}"}, "server_created")
         
-        return {
-            "id": db_server.id,
-            "name": db_server.name,
-            "ip": db_server.ip,
-            "port": db_server.port,
-            "user": db_server.user,
-            "status": "active" if db_server.is_active else "inactive",
-            "created_at": db_server.created_at,
-            "updated_at": db_server.updated_at
-        }
+        return db_server
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        db.close()
+
+async def _stream_servers():
+    """
+    Encode servers into a JSON array as rows arrive from the database, so
+    the full inventory is never held in memory at once
+    """
+    # The response body outlives request dependencies, so use a dedicated session
+    async with SessionLocal() as db:
+        rows = await db.stream_scalars(select(Server).execution_options(yield_per=200))
+        separator = b'['
+        async for server in rows:
+            yield separator + ServerResponse.model_validate(server).model_dump_json().encode()
+            separator = b','
+        yield b']' if separator == b',' else b'[]'
 
 @app.get("/servers/", response_model=List[ServerResponse])
 async def list_servers():
     """List all servers"""
-    db = SessionLocal()
-    try:
-        servers = db.query(Server).all()
-        return [{
-            "id": server.id,
-            "name": server.name,
-            "ip": server.ip,
-            "port": server.port,
-            "user": server.user,
-            "status": "active" if server.is_active else "inactive",
-            "created_at": server.created_at,
-            "updated_at": server.updated_at
-        } for server in servers]
-    finally:
-        db.close()
+    return StreamingResponse(_stream_servers(), media_type="application/json")
 
 @app.get("/servers/{server_id}", response_model=ServerResponse)
-async def get_server(server_id: int):
+async def get_server(server_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific server by ID"""
-    db = SessionLocal()
-    try:
-        server = db.query(Server).filter(Server.id == server_id).first()
-        if not server:
-            raise HTTPException(status_code=404, detail="Server not found")
-        
-        return {
-            "id": server.id,
-            "name": server.name,
-            "ip": server.ip,
-            "port": server.port,
-            "user": server.user,
-            "status": "active" if server.is_active else "inactive",
-            "created_at": server.created_at,
-            "updated_at": server.updated_at
-        }
-    finally:
-        db.close()
+    server = await db.scalar(select(Server).where(Server.id == server_id))
+    if not server:
+        raise HTTPException(status_code=404, detail="Server not found")
+    
+    return server
 
 @app.put("/servers/{server_id}", response_model=ServerResponse)
-async def update_server(server_id: int, server_update: ServerUpdate):
+async def update_server(server_id: int, server_update: ServerUpdate, db: AsyncSession = Depends(get_db)):
     """Update a server"""
-    db = SessionLocal()
     try:
-        server = db.query(Server).filter(Server.id == server_id).first()
+        server = await db.scalar(select(Server).where(Server.id == server_id))
         if not server:
             raise HTTPException(status_code=404, detail="Server not found")
         
@@ -389,90 +491,83 @@ async def update_server(server_id: int, server_update: ServerUpdate):
             server.port = server_update.port
         if server_update.user is not None:
             server.user = server_update.user
-        if server_update.ssh_key_path is not None:
-            server.ssh_key_path = server_update.ssh_key_path
-        if server_update.password is not None:
-            server.password_encrypted = server_update.password  # Note: In production, encrypt this
+        if server_update.ssh_key_path is not None or server_update.password is not None:
+            credentials = await db.get(ServerCredentials, server_id) or ServerCredentials(server_id=server_id)
+            if server_update.ssh_key_path is not None:
+                credentials.ssh_key_path = server_update.ssh_key_path
+            if server_update.password is not None:
+                credentials.password_encrypted = server_update.password  # Encrypted by the column type
+            db.add(credentials)
+            # onupdate only fires when the servers row itself changes; the
+            # monitoring credentials cache is keyed on updated_at, so a
+            # credentials-only edit has to bump it explicitly
+            server.updated_at = utcnow()
         
-        server.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(server)
+        await db.commit()
+        await db.refresh(server)
         
         # Broadcast server update
-        await manager.broadcast(f"Server updated: {server.name}", "server_updated")
+        await manager.broadcast({"message": f"Server updated: {server.name}"}, "server_updated")
         
-        return {
-            "id": server.id,
-            "name": server.name,
-            "ip": server.ip,
-            "port": server.port,
-            "user": server.user,
-            "status": "active" if server.is_active else "inactive",
-            "created_at": server.created_at,
-            "updated_at": server.updated_at
-        }
+        return server
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        db.close()
 
 @app.delete("/servers/{server_id}", response_model=dict)
-async def delete_server(server_id: int):
+async def delete_server(server_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a server"""
-    db = SessionLocal()
     try:
-        server = db.query(Server).filter(Server.id == server_id).first()
+        # Deleting detaches the child rows, so load the collections up front
+        server = await db.scalar(
+            select(Server)
+            .options(
+                selectinload(Server.credentials),
+                selectinload(Server.commands),
+                selectinload(Server.log_sources),
+                selectinload(Server.alerts),
+                selectinload(Server.metrics)
+            )
+            .where(Server.id == server_id)
+        )
         if not server:
             raise HTTPException(status_code=404, detail="Server not found")
         
         server_name = server.name
-        db.delete(server)
-        db.commit()
+        # Rollups and archive blocks have no relationship on Server to cascade through
+        await db.execute(delete(MetricRollup).where(MetricRollup.server_id == server_id))
+        await db.execute(delete(MetricArchive).where(MetricArchive.server_id == server_id))
+        await db.delete(server)
+        await db.commit()
         
         # Broadcast server deletion
-        await manager.broadcast(f"Server deleted: {server_name}", "server_deleted")
+        await manager.broadcast({"message": f"Server deleted: {server_name}"}, "server_deleted")
         
         return {"message": "Server deleted successfully", "id": server_id}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        db.close()
 
 @app.post("/servers/{server_id}/toggle", response_model=ServerResponse)
-async def toggle_server_status(server_id: int):
+async def toggle_server_status(server_id: int, db: AsyncSession = Depends(get_db)):
     """Toggle server active status"""
-    db = SessionLocal()
     try:
-        server = db.query(Server).filter(Server.id == server_id).first()
+        server = await db.scalar(select(Server).where(Server.id == server_id))
         if not server:
             raise HTTPException(status_code=404, detail="Server not found")
         
         server.is_active = not server.is_active
-        server.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(server)
+        await db.commit()
+        await db.refresh(server)
         
         # Broadcast status change
         status = "activated" if server.is_active else "deactivated"
-        await manager.broadcast(f"Server {status}: {server.name}", "server_status_changed")
+        await manager.broadcast({"message": f"Server {status}: {server.name}"}, "server_status_changed")
         
-        return {
-            "id": server.id,
-            "name": server.name,
-            "ip": server.ip,
-            "port": server.port,
-            "user": server.user,
-            "status": "active" if server.is_active else "inactive",
-            "created_at": server.created_at,
-            "updated_at": server.updated_at
-        }
+        return server
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        db.close()
 
 # Alert Service Endpoints
 class AlertConditionCreate(BaseModel):
@@ -490,7 +585,8 @@ class AlertConditionCreate(BaseModel):
 @app.post("/alerts/", response_model=dict)
 async def create_alert_condition(alert_data: AlertConditionCreate):
     """Create a new alert condition"""
-    success = alert_service.create_alert_condition(
+    success = await asyncio.to_thread(
+        alert_service.create_alert_condition,
         name=alert_data.name,
         server_id=alert_data.server_id,
         metric_type=alert_data.metric_type,
@@ -504,7 +600,7 @@ async def create_alert_condition(alert_data: AlertConditionCreate):
     )
     
     if success:
-        await manager.broadcast(f"New alert condition created: {alert_data.name}", "alert_created")
+        await manager.broadcast({"message": f"New alert condition created: {alert_data.name}"}, "alert_created")
         return {"message": "Alert condition created successfully"}
     else:
         raise HTTPException(status_code=500, detail="Failed to create alert condition")
@@ -512,7 +608,7 @@ async def create_alert_condition(alert_data: AlertConditionCreate):
 @app.get("/alerts/", response_model=List[dict])
 async def get_alert_conditions():
     """Get all active alert conditions"""
-    alerts = alert_service.get_active_alerts()
+    alerts = await asyncio.to_thread(alert_service.get_active_alerts)
     
     return [{
         "id": alert.id,
@@ -527,10 +623,55 @@ async def get_alert_conditions():
         "is_active": alert.is_active
     } for alert in alerts]
 
+class AlertConditionUpdate(BaseModel):
+    name: Optional[str] = None
+    metric_type: Optional[str] = None
+    field: Optional[str] = None
+    comparison: Optional[str] = None
+    threshold_value: Optional[float] = None
+    severity: Optional[str] = None
+    cooldown_minutes: Optional[int] = None
+    notification_emails: Optional[str] = None
+    is_active: Optional[bool] = None
+
+@app.put("/alerts/{alert_id}", response_model=dict)
+async def update_alert_condition(alert_id: int, alert_update: AlertConditionUpdate):
+    """Update an alert condition; only the fields provided are changed"""
+    changes = alert_update.model_dump(exclude_unset=True)
+    success = await asyncio.to_thread(alert_service.update_alert_condition, alert_id, **changes)
+    
+    if success:
+        await manager.broadcast({"message": f"Alert condition {alert_id} updated"}, "alert_updated")
+        return {"message": "Alert condition updated successfully", "id": alert_id}
+    else:
+        raise HTTPException(status_code=404, detail="Alert condition not found")
+
+@app.delete("/alerts/{alert_id}", response_model=dict)
+async def delete_alert_condition(alert_id: int):
+    """Delete an alert condition; its alert history is kept"""
+    success = await asyncio.to_thread(alert_service.delete_alert_condition, alert_id)
+    
+    if success:
+        await manager.broadcast({"message": f"Alert condition {alert_id} deleted"}, "alert_deleted")
+        return {"message": "Alert condition deleted successfully", "id": alert_id}
+    else:
+        raise HTTPException(status_code=404, detail="Alert condition not found")
+
 @app.get("/alerts/history/", response_model=List[dict])
-async def get_alert_history(limit: int = 100):
-    """Get alert history"""
-    history = alert_service.get_alert_history(limit)
+async def get_alert_history(response: Response, limit: int = 100, before: Optional[str] = None):
+    """Get alert history; pass the X-Next-Cursor header back as `before` for the next page"""
+    cursor = None
+    if before is not None:
+        # "<triggered_at ISO timestamp>,<id>"
+        try:
+            triggered_at, history_id = before.rsplit(",", 1)
+            cursor = (datetime.fromisoformat(triggered_at), int(history_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="before must be a cursor from X-Next-Cursor")
+    history = await asyncio.to_thread(alert_service.get_alert_history, limit, cursor)
+    if len(history) == limit and history[-1].triggered_at:
+        last = history[-1]
+        response.headers["X-Next-Cursor"] = f"{last.triggered_at.isoformat()},{last.id}"
     
     return [{
         "id": item.id,
@@ -546,10 +687,10 @@ async def get_alert_history(limit: int = 100):
 @app.post("/alerts/{alert_id}/resolve", response_model=dict)
 async def resolve_alert(alert_id: int):
     """Mark an alert as resolved"""
-    success = alert_service.mark_alert_resolved(alert_id)
+    success = await asyncio.to_thread(alert_service.mark_alert_resolved, alert_id)
     
     if success:
-        await manager.broadcast(f"Alert {alert_id} marked as resolved", "alert_resolved")
+        await manager.broadcast({"message": f"Alert {alert_id} marked as resolved"}, "alert_resolved")
         return {"message": "Alert marked as resolved"}
     else:
         raise HTTPException(status_code=404, detail="Alert not found")
@@ -570,7 +711,8 @@ async def create_log_source(log_source: LogSourceCreate):
     """Create a new log source"""
     custom_patterns_dict = log_source.custom_patterns or {}
     
-    success = log_service.create_log_source(
+    success = await asyncio.to_thread(
+        log_service.create_log_source,
         server_id=log_source.server_id,
         name=log_source.name,
         file_path=log_source.file_path,
@@ -582,7 +724,7 @@ async def create_log_source(log_source: LogSourceCreate):
     )
     
     if success:
-        await manager.broadcast(f"New log source created: {log_source.name}", "log_source_created")
+        await manager.broadcast({"message": f"New log source created: {log_source.name}"}, "log_source_created")
         return {"message": "Log source created successfully"}
     else:
         raise HTTPException(status_code=500, detail="Failed to create log source")
@@ -590,7 +732,7 @@ async def create_log_source(log_source: LogSourceCreate):
 @app.get("/logs/sources/", response_model=List[dict])
 async def get_log_sources():
     """Get all log sources"""
-    sources = log_service.get_log_sources()
+    sources = await asyncio.to_thread(log_service.get_log_sources)
     
     return [{
         "id": source.id,
@@ -604,65 +746,65 @@ async def get_log_sources():
 @app.get("/logs/analyze/{server_id}", response_model=dict)
 async def analyze_logs(server_id: int):
     """Analyze logs for a specific server"""
-    results = log_service.analyze_logs(server_id)
+    results = await asyncio.to_thread(log_service.analyze_logs, server_id)
     
     # Save results to database
-    log_service.save_log_results(server_id, results)
+    await asyncio.to_thread(log_service.save_log_results, server_id, results)
     
     return results
 
 @app.get("/logs/recent/{log_source_id}", response_model=List[dict])
 async def get_recent_logs(log_source_id: int, limit: int = 50):
     """Get recent log entries from a specific log source"""
-    return log_service.get_recent_log_entries(log_source_id, limit)
+    return await asyncio.to_thread(log_service.get_recent_log_entries, log_source_id, limit)
 
 # Monitoring endpoints
 @app.post("/servers/{server_id}/monitor/start")
 async def start_monitoring_server(server_id: int):
     """Start monitoring a specific server"""
-    monitoring_service.add_server_to_monitoring(server_id)
-    await manager.broadcast(json.dumps({
+    # Adding a server runs an immediate SSH status check
+    await asyncio.to_thread(monitoring_service.add_server_to_monitoring, server_id)
+    await manager.broadcast({
         "type": "monitoring_started",
         "server_id": server_id,
         "message": f"Started monitoring server {server_id}",
         "timestamp": datetime.utcnow().isoformat()
-    }), "monitoring_started")
+    }, "monitoring_started")
     return {"message": "Server monitoring started"}
 
 @app.post("/servers/{server_id}/monitor/stop")
 async def stop_monitoring_server(server_id: int):
     """Stop monitoring a specific server"""
     monitoring_service.remove_server_from_monitoring(server_id)
-    await manager.broadcast(f"Stopped monitoring server {server_id}", "monitoring_stopped")
+    await manager.broadcast({"message": f"Stopped monitoring server {server_id}"}, "monitoring_stopped")
     return {"message": "Server monitoring stopped"}
 
 @app.get("/servers/{server_id}/metrics", response_model=dict)
-async def get_server_metrics(server_id: int):
+async def get_server_metrics(server_id: int, db: AsyncSession = Depends(get_db)):
     """Get current metrics for a server"""
     # Connect to server and get metrics
-    db = SessionLocal()
     try:
-        server = db.query(Server).filter(Server.id == server_id).first()
+        server = await db.scalar(select(Server).where(Server.id == server_id))
         if not server:
             raise HTTPException(status_code=404, detail="Server not found")
         
         # Get a fresh connection to the server
         if server_id not in ssh_service.clients:
-            use_key = server.ssh_key_path is not None
-            success, message = ssh_service.connect(
+            credentials = await db.get(ServerCredentials, server_id)
+            success, message = await asyncio.to_thread(
+                ssh_service.connect,
                 server_id=server_id,
                 hostname=server.ip,
                 port=server.port,
                 username=server.user,
-                password=server.password_encrypted if not use_key else None,
-                key_path=server.ssh_key_path if use_key else None
+                **(credentials.connect_args() if credentials else {})
             )
             
             if not success:
                 raise HTTPException(status_code=500, detail=f"Failed to connect: {message}")
         
         # Get metrics
-        metrics = ssh_service.get_metrics(server_id)
+        metrics = await asyncio.to_thread(ssh_service.get_metrics, server_id)
         if not metrics:
             raise HTTPException(status_code=500, detail="Failed to get metrics")
         
@@ -670,33 +812,32 @@ async def get_server_metrics(server_id: int):
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        db.close()
 
 @app.get("/servers/{server_id}/specs", response_model=dict)
-async def get_server_specs(server_id: int):
+async def get_server_specs(server_id: int, db: AsyncSession = Depends(get_db)):
     """Get server hardware specifications"""
-    db = SessionLocal()
     try:
-        server = db.query(Server).filter(Server.id == server_id).first()
+        server = await db.scalar(
+            select(Server).where(Server.id == server_id)
+        )
         if not server:
             raise HTTPException(status_code=404, detail="Server not found")
         
         if not server.specs or not server.specs.cpu_model:
             # If no specs exist or they have null values, try to get them from the server
             if server_id not in ssh_service.clients:
-                use_key = server.ssh_key_path is not None
-                success, message = ssh_service.connect(
+                credentials = await db.get(ServerCredentials, server_id)
+                success, message = await asyncio.to_thread(
+                    ssh_service.connect,
                     server_id=server_id,
                     hostname=server.ip,
                     port=server.port,
                     username=server.user,
-                    password=server.password_encrypted if not use_key else None,
-                    key_path=server.ssh_key_path if use_key else None
+                    **(credentials.connect_args() if credentials else {})
                 )
                 
                 if success:
-                    hardware_info = ssh_service.get_hardware_info(server_id)
+                    hardware_info = await asyncio.to_thread(ssh_service.get_hardware_info, server_id)
                     if hardware_info:
                         # Update the database with new specs
                         if not server.specs:
@@ -706,10 +847,10 @@ async def get_server_specs(server_id: int):
                         server.specs.cpu_cores = hardware_info.get('cpu_cores', 0)
                         server.specs.cpu_threads = hardware_info.get('cpu_threads', None)
                         server.specs.total_ram = hardware_info.get('total_ram', '')
-                        server.specs.disk_info = json.dumps(hardware_info.get('disks', []))
+                        server.specs.disk_info = orjson.dumps(hardware_info.get('disks', [])).decode()
                         server.specs.os_info = hardware_info.get('os_info', '')
                         server.specs.last_updated = datetime.utcnow()
-                        db.commit()
+                        await db.commit()
         
         if server.specs:
             return {
@@ -718,7 +859,7 @@ async def get_server_specs(server_id: int):
                 "cpu_cores": server.specs.cpu_cores,
                 "cpu_threads": server.specs.cpu_threads,
                 "total_ram": server.specs.total_ram,
-                "disk_info": json.loads(server.specs.disk_info) if server.specs.disk_info else [],
+                "disk_info": orjson.loads(server.specs.disk_info) if server.specs.disk_info else [],
                 "os_info": server.specs.os_info,
                 "last_updated": server.specs.last_updated.isoformat() if server.specs.last_updated else None
             }
@@ -727,14 +868,84 @@ async def get_server_specs(server_id: int):
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        db.close()
 
 @app.get("/servers/{server_id}/metrics/realtime", response_model=dict)
-async def get_realtime_metrics(server_id: int):
+async def get_realtime_metrics(server_id: int, db: AsyncSession = Depends(get_db)):
     """Get real-time metrics for a server"""
     # This is an alias for the regular metrics endpoint
-    return await get_server_metrics(server_id)
+    return await get_server_metrics(server_id, db)
+
+HISTORY_RANGE_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+@app.get("/servers/{server_id}/metrics/history", response_model=dict)
+async def get_metrics_history(server_id: int, time_range: str = Query("1h", alias="range"),
+                              raw: bool = False, db: AsyncSession = Depends(get_db)):
+    """
+    Get stored metric samples for a server over a recent time range, e.g.
+    30m, 1h, 7d; pass raw=true for every sample instead of rollup buckets
+    """
+    unit = HISTORY_RANGE_UNITS.get(time_range[-1:])
+    if unit is None or not time_range[:-1].isdigit():
+        raise HTTPException(status_code=400, detail="range must look like 30m, 6h or 7d")
+    span = timedelta(**{unit: int(time_range[:-1])})
+    since = datetime.utcnow() - span
+    
+    # Long ranges read pre-aggregated buckets instead of every raw sample
+    # unless raw samples are asked for
+    granularity = None if raw or span <= timedelta(hours=6) else 60 if span <= timedelta(days=2) else 3600
+    if granularity:
+        rows = await db.execute(
+            select(MetricRollup.bucket, MetricRollup.metric_type, MetricRollup.min_v,
+                   MetricRollup.max_v, MetricRollup.avg_v)
+            .where(MetricRollup.server_id == server_id,
+                   MetricRollup.granularity == granularity,
+                   MetricRollup.bucket >= since)
+            .order_by(MetricRollup.bucket)
+        )
+        series: Dict[str, list] = {}
+        for bucket, metric_type, min_v, max_v, avg_v in rows:
+            series.setdefault(metric_type, []).append({
+                "timestamp": bucket.isoformat(),
+                "value": {"min": min_v, "max": max_v, "avg": avg_v}
+            })
+        return {"server_id": server_id, "range": time_range, "since": since.isoformat(),
+                "granularity": granularity, "metrics": series}
+    
+    series: Dict[str, list] = {}
+    
+    # Samples past the archive window only survive in the hourly archive
+    # blocks, which all predate the remaining raw rows
+    archives = (await db.scalars(
+        select(MetricArchive)
+        .where(MetricArchive.server_id == server_id,
+               MetricArchive.start_ts >= since.replace(minute=0, second=0, microsecond=0))
+        .order_by(MetricArchive.start_ts, MetricArchive.id)
+    )).all()
+    if archives:
+        decoded = await asyncio.to_thread(lambda: [(a.metric_type, decode_block(a)) for a in archives])
+        for metric_type, samples in decoded:
+            for sample in samples:
+                if sample["timestamp"] >= since:
+                    series.setdefault(metric_type, []).append({
+                        "timestamp": sample["timestamp"].isoformat(),
+                        "value": sample["value"]
+                    })
+    
+    # Plain column tuples straight from Core; no ORM instance per sample
+    rows = await db.execute(
+        select(Metric.timestamp, Metric.metric_type, Metric.value)
+        .where(Metric.server_id == server_id, Metric.timestamp >= since)
+        .order_by(Metric.timestamp)
+    )
+    
+    for timestamp, metric_type, value in rows:
+        series.setdefault(metric_type, []).append({
+            "timestamp": timestamp.isoformat(),
+            "value": value
+        })
+    
+    return {"server_id": server_id, "range": time_range, "since": since.isoformat(),
+            "granularity": None, "metrics": series}
 
 # Real-time status endpoints
 @app.get("/status/realtime")
@@ -761,4 +972,23 @@ async def get_server_realtime_status(server_id: int):
     }
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Prefer the uvloop event loop and httptools parser; uvloop is not
+    # available on Windows, so fall back to the stock implementations there
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop=loop_impl,
+        http=http_impl
+    )
\ No newline at end of file
@@ -1,14 +1,305 @@
+import csv
+import io
 import sqlite3
 from pathlib import Path
 import os
 import logging
-from sqlalchemy import create_engine, text
+import orjson
+from datetime import date
+from typing import Any, Dict, List, Optional
+from sqlalchemy import PrimaryKeyConstraint, create_engine, event, insert, inspect, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker
-from models import Base
+from sqlalchemy.ext.asyncio import create_async_engine
+from models import Base, ServerCredentials
 
 # Database configuration
 DB_PATH = Path(__file__).parent.parent / "data" / "app.db"
 
+# Applied to every new SQLite connection: WAL lets readers proceed while the
+# monitoring services write, and NORMAL sync only fsyncs at checkpoints
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+def _json_dumps(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def _json_loads(value):
+    # SQLite gives JSON columns NUMERIC affinity, so a bare number is
+    # stored, and comes back, already converted
+    if isinstance(value, (int, float)):
+        return value
+    return orjson.loads(value)
+
+# Passed to every engine so JSON/JSONB columns encode and decode with orjson
+JSON_ENGINE_OPTIONS = {
+    "json_serializer": _json_dumps,
+    "json_deserializer": _json_loads,
+}
+
+def enable_sqlite_pragmas(engine) -> None:
+    """Register the SQLite pragmas on an engine (no-op for other backends)"""
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+def create_service_engine(database_url: str, **overrides):
+    """
+    Engine for the background services: a LIFO QueuePool so the few hot
+    connections stay warm, the SQLite pragmas, and orjson for JSON columns.
+    Pre-ping is only needed for a database behind the network.
+    """
+    is_sqlite = database_url.startswith('sqlite')
+    options = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 5,
+        "pool_recycle": 300,
+        "pool_use_lifo": True,
+        "pool_pre_ping": not is_sqlite,
+        **JSON_ENGINE_OPTIONS,
+    }
+    if is_sqlite:
+        options["connect_args"] = {"check_same_thread": False, "timeout": 30}
+    options.update(overrides)
+    engine = create_engine(database_url, **options)
+    enable_sqlite_pragmas(engine)
+    return engine
+
+# Append-only time-series tables; on PostgreSQL they are range-partitioned
+# by month so retention is a DROP of old partitions rather than row DELETEs
+PARTITIONED_TABLES = ("metrics", "log_entries", "command_results")
+
+@compiles(PrimaryKeyConstraint, 'postgresql')
+def _partitioned_primary_key(constraint, compiler, **kw):
+    # PostgreSQL requires the partition key to be part of the primary key;
+    # the mapped key stays id alone, so SQLite keeps id as its rowid
+    if constraint.table.name in PARTITIONED_TABLES:
+        return "PRIMARY KEY (id, timestamp)"
+    return compiler.visit_primary_key_constraint(constraint, **kw)
+
+for _name in PARTITIONED_TABLES:
+    # Only read by the PostgreSQL DDL compiler
+    Base.metadata.tables[_name].dialect_kwargs['postgresql_partition_by'] = 'RANGE (timestamp)'
+
+def _add_months(day: date, months: int) -> date:
+    years, month = divmod(day.month - 1 + months, 12)
+    return day.replace(year=day.year + years, month=month + 1)
+
+def maintain_time_partitions(engine, months_ahead: int = 2, retention_months: Optional[int] = None) -> None:
+    """
+    Pre-create the upcoming monthly partitions and drop those older than the
+    retention window (no-op for backends other than PostgreSQL)
+    """
+    if engine.dialect.name != 'postgresql':
+        return
+    
+    this_month = date.today().replace(day=1)
+    for table in PARTITIONED_TABLES:
+        try:
+            with engine.begin() as conn:
+                has_default = conn.execute(
+                    text("SELECT to_regclass(:name) IS NOT NULL"), {"name": f"{table}_default"}
+                ).scalar()
+                for offset in range(months_ahead + 1):
+                    start = _add_months(this_month, offset)
+                    end = _add_months(start, 1)
+                    partition = f"{table}_p{start:%Y%m}"
+                    bounds = f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                    if not has_default:
+                        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {table} {bounds}"))
+                        continue
+                    if conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": partition}).scalar():
+                        continue
+                    # A new range may not overlap rows already in the DEFAULT
+                    # partition, so move them into the table before attaching it
+                    conn.execute(text(f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+                    conn.execute(text(
+                        f"WITH moved AS (DELETE FROM {table}_default "
+                        f"WHERE timestamp >= '{start}' AND timestamp < '{end}' RETURNING *) "
+                        f"INSERT INTO {partition} SELECT * FROM moved"
+                    ))
+                    conn.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {partition} {bounds}"))
+                
+                # Created after the monthly ranges; catches rows outside them
+                conn.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+                
+                if retention_months:
+                    cutoff_month = _add_months(this_month, -retention_months)
+                    cutoff = f"{table}_p{cutoff_month:%Y%m}"
+                    # Expired rows that never had a monthly partition
+                    conn.execute(text(f"DELETE FROM {table}_default WHERE timestamp < '{cutoff_month}'"))
+                    partitions = conn.execute(text(
+                        "SELECT c.relname FROM pg_inherits i "
+                        "JOIN pg_class c ON c.oid = i.inhrelid "
+                        "JOIN pg_class p ON p.oid = i.inhparent "
+                        "WHERE p.relname = :table"
+                    ), {"table": table}).scalars().all()
+                    for partition in partitions:
+                        # Names sort chronologically, e.g. metrics_p202401 < metrics_p202402
+                        if partition != f"{table}_default" and partition < cutoff:
+                            conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition}"))
+                            conn.execute(text(f"DROP TABLE {partition}"))
+        except Exception as e:
+            logging.warning(f"Partition maintenance failed for {table}: {e}")
+
+def ensure_indexes(engine) -> None:
+    """
+    Create any model index missing from an existing database; create_all
+    only adds indexes along with tables it creates
+    """
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                index.create(engine)
+            except Exception as e:
+                logging.warning(f"Could not create index {index.name}: {e}")
+
+# Columns added to existing tables since the first release; create_all only
+# creates missing tables, so init_db adds these to databases that predate them
+ADDED_COLUMNS = (
+    ("alerts", "version_id", "INTEGER NOT NULL DEFAULT 0"),
+    ("custom_commands", "version_id", "INTEGER NOT NULL DEFAULT 0"),
+    ("telegram_config", "version_id", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+def add_missing_columns(engine) -> None:
+    """Add any ADDED_COLUMNS entry an existing table lacks"""
+    inspector = inspect(engine)
+    for table, column, ddl in ADDED_COLUMNS:
+        if column in {c['name'] for c in inspector.get_columns(table)}:
+            continue
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+        logging.info(f"Added column {table}.{column}")
+
+def convert_metric_values(engine) -> None:
+    """
+    Retype metrics.value from the JSON text older releases stored to JSONB;
+    SQLite keeps JSON as text, so only PostgreSQL needs converting
+    """
+    if engine.dialect.name != 'postgresql':
+        return
+    (column,) = [c for c in inspect(engine).get_columns('metrics') if c['name'] == 'value']
+    if isinstance(column['type'], JSONB):
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE metrics ALTER COLUMN value TYPE JSONB USING value::jsonb"))
+    logging.info("Converted metrics.value to JSONB")
+
+def backfill_server_credentials(engine) -> None:
+    """
+    Move SSH credentials from the legacy servers columns into
+    server_credentials for databases created before the split; passwords
+    are (re-)encrypted on the way and cleared from servers afterwards
+    """
+    if 'password_encrypted' not in {c['name'] for c in inspect(engine).get_columns('servers')}:
+        return
+    
+    with engine.begin() as conn:
+        rows = conn.execute(text(
+            "SELECT id, ssh_key_path, password_encrypted, use_key FROM servers s "
+            "WHERE NOT EXISTS (SELECT 1 FROM server_credentials c WHERE c.server_id = s.id) "
+            "AND (ssh_key_path IS NOT NULL OR password_encrypted IS NOT NULL)"
+        )).all()
+        if rows:
+            # Legacy values are plaintext, or already encrypted tokens
+            decrypt = ServerCredentials.password_encrypted.type.process_result_value
+            conn.execute(insert(ServerCredentials), [{
+                'server_id': server_id,
+                'ssh_key_path': ssh_key_path,
+                'password_encrypted': decrypt(password, engine.dialect),
+                'use_key': True if use_key is None else bool(use_key)
+            } for server_id, ssh_key_path, password, use_key in rows])
+            logging.info(f"Moved SSH credentials of {len(rows)} servers to server_credentials")
+        conn.execute(text(
+            "UPDATE servers SET password_encrypted = NULL WHERE password_encrypted IS NOT NULL "
+            "AND id IN (SELECT server_id FROM server_credentials)"
+        ))
+
+# Batches above this size go through COPY on PostgreSQL
+COPY_THRESHOLD = 100
+COPY_NULL = '\\N'
+
+def bulk_insert(session, model, rows: List[Dict[str, Any]], batch_size: int = 1000) -> None:
+    """
+    Insert plain row dicts with one executemany per batch instead of an ORM
+    object and round-trip per row; the caller commits
+    """
+    if len(rows) > COPY_THRESHOLD and copy_insert(session, model, rows):
+        return
+    for start in range(0, len(rows), batch_size):
+        session.execute(insert(model), rows[start:start + batch_size])
+
+def _copy_cell(value: Any) -> Any:
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode()
+    if isinstance(value, bytes):
+        return '\\x' + value.hex()
+    return value
+
+def _copy_buffer(table, columns: List[str], rows: List[Dict[str, Any]], dialect) -> io.StringIO:
+    """
+    CSV payload for COPY; each value goes through its column type's bind
+    processor first, so TypeDecorators (IntEnumType, EncryptedString, JSON)
+    are stored exactly as an INSERT would store them
+    """
+    processors = [table.c[column].type.bind_processor(dialect) for column in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            _copy_cell(process(row.get(column)) if process else row.get(column))
+            for column, process in zip(columns, processors)
+        ])
+    buffer.seek(0)
+    return buffer
+
+def copy_insert(session, model, rows: List[Dict[str, Any]]) -> bool:
+    """
+    Stream rows into the model's table with COPY FROM STDIN on
+    PostgreSQL/psycopg2; returns False on any other driver so the caller
+    falls back to executemany
+    """
+    connection = session.connection()
+    if connection.dialect.name != 'postgresql' or connection.dialect.driver != 'psycopg2':
+        return False
+
+    columns = list(rows[0].keys())
+    buffer = _copy_buffer(model.__table__, columns, rows, connection.dialect)
+
+    column_list = ', '.join(f'"{column}"' for column in columns)
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({column_list}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buffer
+        )
+    finally:
+        cursor.close()
+    return True
+
 def init_db(database_url: str = None):
     """Initialize the database with required schema"""
     if database_url is None:
@@ -18,10 +309,31 @@ def init_db(database_url: str = None):
 
     try:
         # Create engine
-        engine = create_engine(database_url, connect_args={"check_same_thread": False})
+        if database_url.startswith('sqlite'):
+            engine = create_engine(
+                database_url,
+                connect_args={"check_same_thread": False, "timeout": 30},
+                pool_size=10,
+                max_overflow=20,
+                **JSON_ENGINE_OPTIONS
+            )
+        else:
+            engine = create_engine(database_url, pool_size=10, max_overflow=20, **JSON_ENGINE_OPTIONS)
+        enable_sqlite_pragmas(engine)
+        
+        # Name columns use the citext type on PostgreSQL
+        if engine.dialect.name == 'postgresql':
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
+        add_missing_columns(engine)
+        convert_metric_values(engine)
+        ensure_indexes(engine)
+        backfill_server_credentials(engine)
+        retention = os.getenv('METRICS_RETENTION_MONTHS')
+        maintain_time_partitions(engine, retention_months=int(retention) if retention else None)
         
         # Test connection
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -38,6 +350,39 @@ def init_db(database_url: str = None):
         logging.error(f"Database initialization failed: {e}")
         raise
 
+def get_async_database_url(database_url: str) -> str:
+    """Map a database URL onto its asyncio driver"""
+    if database_url.startswith('sqlite:///'):
+        return database_url.replace('sqlite:///', 'sqlite+aiosqlite:///', 1)
+    if database_url.startswith('postgresql://'):
+        return database_url.replace('postgresql://', 'postgresql+asyncpg://', 1)
+    return database_url
+
+def init_async_db(database_url: str = None):
+    """Create the asyncio engine used by request handlers (schema comes from init_db)"""
+    if database_url is None:
+        database_url = f"sqlite:///{DB_PATH}"
+    
+    # pool_pre_ping drops connections the server closed while idle instead
+    # of failing the next request that checks one out
+    if database_url.startswith('sqlite'):
+        engine = create_async_engine(
+            get_async_database_url(database_url),
+            connect_args={"timeout": 30},
+            pool_pre_ping=True,
+            **JSON_ENGINE_OPTIONS
+        )
+    else:
+        engine = create_async_engine(
+            get_async_database_url(database_url),
+            pool_size=20,
+            max_overflow=10,
+            pool_pre_ping=True,
+            **JSON_ENGINE_OPTIONS
+        )
+    enable_sqlite_pragmas(engine.sync_engine)
+    return engine
+
 def get_database_url():
     """Get database URL from environment or default"""
     import os
@@ -1,14 +1,43 @@
 # Database models initialization
 # This file will be used to import all models and create database tables
 
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import DateTime, String
+from sqlalchemy.dialects.postgresql import CITEXT
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, configure_mappers
+from sqlalchemy.sql.expression import FunctionElement
 
 # Create shared Base instance
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
+
+class utcnow(FunctionElement):
+    """Database-side current time as naive UTC, matching datetime.utcnow()"""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, 'postgresql')
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+# Display names compare case-insensitively (CITEXT on PostgreSQL, NOCASE
+# collation on SQLite), so equality lookups can use the plain index on the column
+NameString = (String(100)
+              .with_variant(String(100, collation='NOCASE'), 'sqlite')
+              .with_variant(CITEXT(), 'postgresql'))
 
 # Import all server models
-from .server_models import Server, ServerSpec, CustomCommand, CommandResult
-from .server_models import LogSource, LogEntry, LogResult, Metric, TelegramConfig
+from .server_models import Server, ServerCredentials, ServerSpec, CustomCommand, CommandResult
+from .server_models import LogSource, LogEntry, LogResult, Metric, MetricRollup, MetricArchive, TelegramConfig
+from .server_models import LogLevel
 
 # Import all alert models
-from .alert_models import Alert, AlertHistory
\ No newline at end of file
+from .alert_models import Alert, AlertHistory
+
+# Resolve all relationships once at import instead of on first query
+configure_mappers()
\ No newline at end of file
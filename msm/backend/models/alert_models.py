@@ -1,42 +1,58 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Float, String, Text, Boolean, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
-from datetime import datetime
 
 # Import shared Base from __init__.py
-from . import Base
+from . import Base, NameString, utcnow
 
 class Alert(Base):
     __tablename__ = 'alerts'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     server_id = Column(Integer, ForeignKey('servers.id'))
-    name = Column(String(100), nullable=False)
+    name = Column(NameString, nullable=False)
     metric_type = Column(String(50), nullable=False)  # 'cpu', 'memory', 'disk', etc.
     field = Column(String(50), nullable=False)  # 'totalUsage', 'usage_percent', etc.
     comparison = Column(String(20), nullable=False)  # '>', '<', '=='
-    threshold_value = Column(Integer, nullable=False)
+    threshold_value = Column(Float, nullable=False)
     severity = Column(String(20), default='medium')
     cooldown_minutes = Column(Integer, default=10)
     notification_emails = Column(Text)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    version_id = Column(Integer, nullable=False, default=0)
     
     # Relationships
-    server = relationship("Server", back_populates="alerts")
-    history = relationship("AlertHistory", back_populates="alert")
+    server = relationship("Server", back_populates="alerts", lazy="raise_on_sql")
+    history = relationship("AlertHistory", back_populates="alert", lazy="raise_on_sql")
+    
+    # Partial index holding only the active alerts the evaluator loads
+    __table_args__ = (
+        Index('ix_alerts_active_server', 'server_id', 'is_active',
+              postgresql_where=text('is_active'), sqlite_where=text('is_active')),
+    )
+    
+    # Concurrent edits fail with StaleDataError instead of silently overwriting
+    __mapper_args__ = {"version_id_col": version_id}
 
 class AlertHistory(Base):
     __tablename__ = 'alert_history'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     alert_id = Column(Integer, ForeignKey('alerts.id'))
     server_id = Column(Integer, ForeignKey('servers.id'))
     message = Column(Text)
     severity = Column(String(20))
-    triggered_at = Column(DateTime, default=datetime.utcnow)
+    triggered_at = Column(DateTime, server_default=utcnow())
     resolved = Column(Boolean, default=False)
     resolved_at = Column(DateTime)
     
     # Relationships
-    alert = relationship("Alert", back_populates="history")
-    server = relationship("Server")
\ No newline at end of file
+    alert = relationship("Alert", back_populates="history", lazy="raise_on_sql")
+    server = relationship("Server", lazy="raise_on_sql")
+    
+    # Newest-first history pages walk these instead of scanning the table
+    __table_args__ = (
+        Index("ix_alert_history_triggered_at", triggered_at.desc(), id.desc()),
+        Index("ix_alert_history_server_time", "server_id", "triggered_at"),
+        Index("ix_alert_history_alert_time", "alert_id", "triggered_at"),
+    )
\ No newline at end of file
@@ -1,38 +1,132 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, SmallInteger, String, Text, Boolean, ForeignKey, DateTime, Float, Index, JSON, CheckConstraint, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
+from Crypto.Cipher import AES
+from Crypto.Random import get_random_bytes
 from datetime import datetime
+from enum import IntEnum
+from typing import Any, Optional
+from functools import lru_cache
+from pathlib import Path
+import base64
+import hashlib
+import os
 
 # Import shared Base from __init__.py
-from . import Base
+from . import Base, NameString, utcnow
+
+class LogLevel(IntEnum):
+    INFO = 1
+    WARNING = 2
+    ERROR = 3
+    CRITICAL = 4
+
+class IntEnumType(TypeDecorator):
+    """Stores an IntEnum as a SMALLINT and returns enum members on load"""
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # Accept level names as parsed from log lines, e.g. 'ERROR'
+            value = self.enum_class[value.upper()]
+        return int(value)
+    
+    def process_result_value(self, value, dialect):
+        return None if value is None else self.enum_class(value)
+
+# Generated on first use unless MSM_SECRET_KEY is set; lives beside app.db
+SECRET_KEY_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "secret.key"
+
+@lru_cache(maxsize=None)
+def _master_key() -> bytes:
+    """AES-256 key for secrets stored in the database"""
+    env_key = os.getenv('MSM_SECRET_KEY')
+    if env_key:
+        return hashlib.sha256(env_key.encode()).digest()
+    if not SECRET_KEY_PATH.exists():
+        SECRET_KEY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        SECRET_KEY_PATH.write_bytes(get_random_bytes(32))
+        os.chmod(SECRET_KEY_PATH, 0o600)
+    return SECRET_KEY_PATH.read_bytes()
+
+def _decrypt(token: str) -> str:
+    blob = base64.b64decode(token)
+    nonce, ciphertext, tag = blob[:12], blob[12:-16], blob[-16:]
+    cipher = AES.new(_master_key(), AES.MODE_GCM, nonce=nonce)
+    return cipher.decrypt_and_verify(ciphertext, tag).decode()
+
+class EncryptedString(TypeDecorator):
+    """Text encrypted at rest with AES-256-GCM; reads return plaintext"""
+    impl = Text
+    cache_ok = True
+    PREFIX = "gcm:"
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        nonce = get_random_bytes(12)
+        cipher = AES.new(_master_key(), AES.MODE_GCM, nonce=nonce)
+        ciphertext, tag = cipher.encrypt_and_digest(value.encode())
+        return self.PREFIX + base64.b64encode(nonce + ciphertext + tag).decode()
+    
+    def process_result_value(self, value, dialect):
+        if value is None or not value.startswith(self.PREFIX):
+            # Rows written before encryption still hold plaintext
+            return value
+        return _decrypt(value[len(self.PREFIX):])
 
 class Server(Base):
     __tablename__ = 'servers'
     
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    name = Column(NameString, nullable=False, index=True)
     ip = Column(String(50), nullable=False)
     port = Column(Integer, default=22)
     user = Column(String(50), nullable=False)
-    ssh_key_path = Column(Text)
-    password_encrypted = Column(Text)
-    use_key = Column(Boolean, default=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     last_connected = Column(DateTime)
     status = Column(String(50), default='unknown')
     
-    # Relationships
-    specs = relationship("ServerSpec", back_populates="server", uselist=False)
-    commands = relationship("CustomCommand", back_populates="server")
-    log_sources = relationship("LogSource", back_populates="server")
-    alerts = relationship("Alert", back_populates="server")
-    metrics = relationship("Metric", back_populates="server")
+    # Relationships; specs is 1:1 and always wanted, the collections are
+    # unbounded so lazy loads raise and callers opt in with selectinload()
+    specs = relationship("ServerSpec", back_populates="server", uselist=False, lazy="joined")
+    credentials = relationship("ServerCredentials", uselist=False, lazy="raise_on_sql", cascade="all, delete-orphan")
+    commands = relationship("CustomCommand", back_populates="server", lazy="raise_on_sql")
+    log_sources = relationship("LogSource", back_populates="server", lazy="raise_on_sql")
+    alerts = relationship("Alert", back_populates="server", lazy="raise_on_sql")
+    metrics = relationship("Metric", back_populates="server", lazy="raise_on_sql")
+
+class ServerCredentials(Base):
+    """SSH credentials, kept out of the servers row that status polling reads"""
+    __tablename__ = 'server_credentials'
+    
+    server_id = Column(Integer, ForeignKey('servers.id'), primary_key=True)
+    ssh_key_path = Column(Text)
+    password_encrypted = Column(EncryptedString)
+    use_key = Column(Boolean, default=True)
+    
+    def connect_args(self) -> dict:
+        """Password/key_path keyword arguments for ssh_service.connect"""
+        use_key = self.use_key and self.ssh_key_path
+        return {
+            "password": self.password_encrypted if not use_key else None,
+            "key_path": self.ssh_key_path if use_key else None
+        }
 
 class ServerSpec(Base):
     __tablename__ = 'server_specs'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     server_id = Column(Integer, ForeignKey('servers.id'), unique=True)
     cpu_model = Column(String(100))
     cpu_cores = Column(Integer)
@@ -45,92 +139,155 @@ class ServerSpec(Base):
     last_updated = Column(DateTime)
     
     # Relationships
-    server = relationship("Server", back_populates="specs")
+    server = relationship("Server", back_populates="specs", lazy="raise_on_sql")
 
 class CustomCommand(Base):
     __tablename__ = 'custom_commands'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     server_id = Column(Integer, ForeignKey('servers.id'))
-    name = Column(String(100), nullable=False)
+    name = Column(NameString, nullable=False)
     command = Column(Text, nullable=False)
     regex_pattern = Column(Text)
     enabled = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    version_id = Column(Integer, nullable=False, default=0)
     
     # Relationships
-    server = relationship("Server", back_populates="commands")
-    results = relationship("CommandResult", back_populates="command")
+    server = relationship("Server", back_populates="commands", lazy="raise_on_sql")
+    results = relationship("CommandResult", back_populates="command", lazy="raise_on_sql")
+    
+    # Concurrent edits fail with StaleDataError instead of silently overwriting
+    __mapper_args__ = {"version_id_col": version_id}
 
-class CommandResult(Base):
+# High-volume time-series rows are declared as dataclasses (eq=False keeps
+# ORM identity semantics); timestamps are left to the database default
+class CommandResult(MappedAsDataclass, Base, eq=False):
     __tablename__ = 'command_results'
     
-    id = Column(Integer, primary_key=True, index=True)
-    command_id = Column(Integer, ForeignKey('custom_commands.id'))
-    output = Column(Text)
-    parsed_value = Column(String(255))
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)  # stays serial when partitioning adds timestamp to the PK
+    command_id: Mapped[Optional[int]] = mapped_column(ForeignKey('custom_commands.id'))
+    output: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    parsed_value: Mapped[Optional[str]] = mapped_column(String(255), default=None)
+    timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), init=False)
     
     # Relationships
-    command = relationship("CustomCommand", back_populates="results")
+    command: Mapped["CustomCommand"] = relationship(back_populates="results", lazy="raise_on_sql", init=False, repr=False)
+    
+    __table_args__ = (
+        Index("ix_command_results_command_ts", "command_id", "timestamp"),
+    )
 
 class LogSource(Base):
     __tablename__ = 'log_sources'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     server_id = Column(Integer, ForeignKey('servers.id'))
-    name = Column(String(100), nullable=False)
+    name = Column(NameString, nullable=False)
     source_type = Column(String(50), nullable=False)  # 'journalctl', 'file', 'docker'
     source_path = Column(Text, nullable=False)
     enabled = Column(Boolean, default=True)
     
     # Relationships
-    server = relationship("Server", back_populates="log_sources")
-    entries = relationship("LogEntry", back_populates="source")
+    server = relationship("Server", back_populates="log_sources", lazy="raise_on_sql")
+    entries = relationship("LogEntry", back_populates="source", lazy="raise_on_sql")
 
-class LogEntry(Base):
+class LogEntry(MappedAsDataclass, Base, eq=False):
     __tablename__ = 'log_entries'
     
-    id = Column(Integer, primary_key=True, index=True)
-    source_id = Column(Integer, ForeignKey('log_sources.id'))
-    timestamp = Column(DateTime, default=datetime.utcnow)
-    level = Column(String(20))  # 'INFO', 'WARNING', 'ERROR', 'CRITICAL'
-    message = Column(Text)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)
+    source_id: Mapped[Optional[int]] = mapped_column(ForeignKey('log_sources.id'))
+    level: Mapped[Optional[LogLevel]] = mapped_column(IntEnumType(LogLevel), default=None)
+    message: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), init=False)
     
     # Relationships
-    source = relationship("LogSource", back_populates="entries")
+    source: Mapped["LogSource"] = relationship(back_populates="entries", lazy="raise_on_sql", init=False, repr=False)
+    
+    __table_args__ = (
+        Index("ix_log_entries_source_ts", "source_id", "timestamp"),
+    )
 
 class LogResult(Base):
     __tablename__ = 'log_results'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     server_id = Column(Integer, ForeignKey('servers.id'))
     result_type = Column(String(50), nullable=False)
     result_value = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, server_default=utcnow())
     
     # Relationships
-    server = relationship("Server")
+    server = relationship("Server", lazy="raise_on_sql")
 
-class Metric(Base):
+class Metric(MappedAsDataclass, Base, eq=False):
     __tablename__ = 'metrics'
     
-    id = Column(Integer, primary_key=True, index=True)
-    server_id = Column(Integer, ForeignKey('servers.id'))
-    metric_type = Column(String(50), nullable=False)  # 'cpu', 'ram', 'disk', 'network'
-    value = Column(Text, nullable=False)  # Changed to Text to store JSON
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)
+    server_id: Mapped[Optional[int]] = mapped_column(ForeignKey('servers.id'))
+    metric_type: Mapped[str] = mapped_column(String(50))  # 'cpu', 'ram', 'disk', 'network'
+    # The reading (cpu/memory/disk breakdown) as native JSON
+    value: Mapped[Any] = mapped_column(JSON().with_variant(JSONB(), 'postgresql'))
+    timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), init=False)
     
     # Relationships
-    server = relationship("Server", back_populates="metrics")
+    server: Mapped["Server"] = relationship(back_populates="metrics", lazy="raise_on_sql", init=False, repr=False)
+    
+    # Latest-value lookups filter on server and metric type, newest first
+    __table_args__ = (
+        Index("ix_metrics_server_type_ts", "server_id", "metric_type", "timestamp"),
+    )
+
+class MetricRollup(Base):
+    """Aggregates of a metric's headline value per fixed time bucket"""
+    __tablename__ = 'metric_rollups'
+    
+    id = Column(Integer, primary_key=True)
+    server_id = Column(Integer, ForeignKey('servers.id'))
+    metric_type = Column(String(50), nullable=False)
+    granularity = Column(Integer, nullable=False)  # bucket width in seconds
+    bucket = Column(DateTime, nullable=False)  # bucket start
+    min_v = Column(Float, nullable=False)
+    max_v = Column(Float, nullable=False)
+    avg_v = Column(Float, nullable=False)
+    sum_v = Column(Float, nullable=False)
+    count_v = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_metric_rollups_lookup", "server_id", "metric_type", "granularity", "bucket"),
+    )
+
+class MetricArchive(Base):
+    """An hour of one server's metric series, Gorilla-compressed (see services/metric_archive.py)"""
+    __tablename__ = 'metric_archives'
+    
+    id = Column(Integer, primary_key=True)
+    server_id = Column(Integer, ForeignKey('servers.id'))
+    metric_type = Column(String(50), nullable=False)
+    start_ts = Column(DateTime, nullable=False)  # hour the block covers
+    count = Column(Integer, nullable=False)
+    fields = Column(JSON, nullable=False)  # [[name, 'int'|'float'], ...] in stream order
+    constants = Column(JSON)  # non-numeric reading fields, e.g. mount_point
+    encoded = Column(LargeBinary, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_metric_archives_server_type_ts", "server_id", "metric_type", "start_ts"),
+    )
 
 class TelegramConfig(Base):
     __tablename__ = 'telegram_config'
     
-    id = Column(Integer, primary_key=True, index=True)
-    bot_token = Column(String(100))
+    id = Column(Integer, primary_key=True, default=1)
+    bot_token = Column(EncryptedString)
     chat_id = Column(String(50))
     enabled = Column(Boolean, default=False)
     last_test = Column(DateTime)
     last_notification = Column(DateTime)
-    notification_count = Column(Integer, default=0)
\ No newline at end of file
+    notification_count = Column(Integer, default=0)
+    version_id = Column(Integer, nullable=False, default=0)
+    
+    # There is only ever one configuration row
+    __table_args__ = (
+        CheckConstraint("id = 1", name="singleton"),
+    )
+    __mapper_args__ = {"version_id_col": version_id}
\ No newline at end of file
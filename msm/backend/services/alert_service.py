@@ -3,18 +3,35 @@
 
 import threading
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Dict, Any, List, Optional
+import heapq
+import math
+import operator
+import queue
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select, tuple_, union_all
+from sqlalchemy.orm import selectinload, sessionmaker
 from models import Server, Metric
+from database import create_service_engine
 from models import Alert as AlertCondition, AlertHistory
 
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+
+COMPARISONS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '==': operator.eq
+}
+
+# Eviction priority of tracked alerts: severity first, then freshness
+SEVERITY_RANK = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+FRESHNESS_DECAY = 1 / 600  # per second
+
+# Latest-metric lookups are sent in chunks of this many (server, type) pairs
+LATEST_METRIC_BATCH = 50
 
 class AlertService:
     """
@@ -29,24 +46,45 @@ class AlertService:
         self.websocket_manager = websocket_manager
         
         # Create database engine and session
-        self.engine = create_engine(database_url, connect_args={"check_same_thread": False})
+        self.engine = create_service_engine(database_url, pool_size=5, max_overflow=10)
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self.Session = SessionLocal
         
         # Thread safety
         self._lock = threading.Lock()
+        self._escalation_cv = threading.Condition(self._lock)
         
         # Alert checking interval - reduced for more frequent checking
         self.check_interval = 30  # Check every 30 seconds instead of 60
+        self.min_check_interval = 5
+        self.max_check_interval = 300
+        self._interval = self.check_interval
+        self._last_trigger_count = 0
+        self._near_threshold_count = 0
+        self._wake = threading.Event()  # set to re-check immediately
+        self._shutdown = threading.Event()
+        self._threads: List[threading.Thread] = []
         
         # Notification settings
         self.smtp_servers = {}
         self.email_from = None
+        self._mail_queue = queue.Queue(maxsize=1000)
+        self.mail_batch_window = 5  # seconds to gather mails for the same recipients
+        # Deliveries run on a dedicated pool; each pool thread keeps its own
+        # SMTP session, and at most notify_workers * 10 sends may be pending
+        self.notify_workers = 4
+        self._notify_pool: Optional[ThreadPoolExecutor] = None
+        self._notify_slots = threading.BoundedSemaphore(self.notify_workers * 10)
+        self._smtp_local = threading.local()
+        self._smtp_sessions: List[smtplib.SMTP] = []
         
         # Alert conditions cache
-        self.alert_conditions = []
-        self.last_alert_triggers = {}  # alert_id: last_trigger_time
+        self._conditions_by_id: Dict[int, AlertCondition] = {}
+        self._next_eligible: Dict[int, float] = {}  # alert_id: monotonic time its cooldown ends
         self.active_alerts = {}  # alert_id: alert_data for escalation
+        self._escalation_heap: List[Tuple[float, int]] = []  # (due time, alert_id)
+        self.escalation_delay = 900  # 15 minutes unresolved before escalating
+        self.max_active_alerts = 10000
     
     def start(self) -> None:
         """
@@ -56,24 +94,48 @@ class AlertService:
             return
             
         self.running = True
+        self._shutdown.clear()
+        self._notify_pool = ThreadPoolExecutor(max_workers=self.notify_workers,
+                                               thread_name_prefix='alert-notify')
         self.logger.info("Starting alert service...")
         
-        # Start alert checking thread
-        alert_thread = threading.Thread(target=self._alert_monitoring_loop, daemon=True)
-        alert_thread.start()
-        
-        # Start alert escalation thread
-        escalation_thread = threading.Thread(target=self._alert_escalation_loop, daemon=True)
-        escalation_thread.start()
+        self._threads = [
+            # Alert checking thread
+            threading.Thread(target=self._alert_monitoring_loop, daemon=True),
+            # Alert escalation thread
+            threading.Thread(target=self._alert_escalation_loop, daemon=True),
+            # Email delivery thread so SMTP never blocks alert checks
+            threading.Thread(target=self._mail_worker, daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
         
         # Load current alert conditions
         self._load_alert_conditions()
     
-    def stop(self) -> None:
+    def stop(self, timeout: float = 5) -> None:
         """
-        Stop the alert service
+        Stop the alert service, waking every loop and waiting for them to exit
         """
         self.running = False
+        self._shutdown.set()
+        self._wake.set()
+        with self._escalation_cv:
+            self._escalation_cv.notify_all()
+        try:
+            # Cuts the mail worker's batch window short
+            self._mail_queue.put_nowait(None)
+        except queue.Full:
+            pass  # the worker is busy draining and checks running between batches
+        
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+        self._threads = []
+        if self._notify_pool is not None:
+            self._notify_pool.shutdown(wait=False, cancel_futures=True)
+            self._notify_pool = None
+        self._close_smtp_sessions()
         self.logger.info("Alert service stopped")
     
     def configure_email(self, smtp_server: str, port: int, username: str, 
@@ -93,212 +155,327 @@ class AlertService:
     
     def _load_alert_conditions(self) -> None:
         """
-        Load all active alert conditions from database
+        Load all active alert conditions from database (cold start)
         """
         db = self.Session()
         try:
-            self.alert_conditions = db.query(AlertCondition).filter(
+            alert_conditions = db.query(AlertCondition).filter(
                 AlertCondition.is_active == True
             ).all()
-            self.logger.info(f"Loaded {len(self.alert_conditions)} active alert conditions")
+            for alert_cond in alert_conditions:
+                self._prepare_condition(alert_cond)
+            with self._lock:
+                self._conditions_by_id = {alert_cond.id: alert_cond for alert_cond in alert_conditions}
+            self.logger.info(f"Loaded {len(alert_conditions)} active alert conditions")
         except Exception as e:
             self.logger.error(f"Error loading alert conditions: {e}")
         finally:
             db.close()
     
+    def _prepare_condition(self, alert_cond: AlertCondition) -> None:
+        # Resolve the comparison once so checks are a single call
+        alert_cond._cmp = COMPARISONS.get(alert_cond.comparison, lambda value, threshold: False)
+        # Split the recipient list once instead of on every email
+        alert_cond._recipients = tuple(
+            email.strip() for email in (alert_cond.notification_emails or '').split(',') if email.strip()
+        )
+        alert_cond._threshold = float(alert_cond.threshold_value)
+    
+    def _cache_condition(self, alert_cond: AlertCondition) -> None:
+        """
+        Put a committed condition into the cache, or drop it if inactive
+        """
+        with self._lock:
+            if alert_cond.is_active:
+                self._prepare_condition(alert_cond)
+                self._conditions_by_id[alert_cond.id] = alert_cond
+            else:
+                self._conditions_by_id.pop(alert_cond.id, None)
+        self._wake.set()
+    
+    @property
+    def alert_conditions(self) -> List[AlertCondition]:
+        """Snapshot of the cached active conditions"""
+        with self._lock:
+            return list(self._conditions_by_id.values())
+    
     def _alert_monitoring_loop(self) -> None:
         """
         Main alert monitoring loop that runs continuously
         """
         while self.running:
             try:
+                # Cleared before the check so a change made during it still
+                # wakes the wait below
+                self._wake.clear()
                 self._check_alert_conditions()
                 
-                # Sleep until next check
-                time.sleep(self.check_interval)
+                # Sleep until next check, or until conditions change
+                self._wake.wait(self._next_interval())
                 
             except Exception as e:
                 self.logger.error(f"Error in alert monitoring loop: {e}")
-                time.sleep(30)  # Wait longer if error occurs
+                if self._shutdown.wait(30):  # Wait longer if error occurs
+                    break
+    
+    def _next_interval(self) -> float:
+        """
+        Check sooner while conditions are firing or close to their threshold,
+        back off toward the cap while everything is quiet
+        """
+        with self._lock:
+            conditions = len(self._conditions_by_id)
+        if not conditions:
+            return self.max_check_interval
+        
+        active = self._last_trigger_count + self._near_threshold_count
+        if active:
+            interval = self.check_interval * max(0.2, 1 - active / conditions)
+        else:
+            interval = self._interval * 1.5
+        self._interval = min(self.max_check_interval, max(self.min_check_interval, interval))
+        return self._interval
     
     def _alert_escalation_loop(self) -> None:
         """
-        Handle alert escalation for unresolved alerts
+        Handle alert escalation for unresolved alerts, sleeping until the
+        next one falls due
         """
         while self.running:
             try:
-                current_time = time.time()
                 escalation_needed = []
                 
-                with self._lock:
-                    for alert_id, alert_data in self.active_alerts.items():
-                        # Check if alert needs escalation (after 15 minutes)
-                        if current_time - alert_data['triggered_at'] > 900:  # 15 minutes
+                with self._escalation_cv:
+                    now = time.time()
+                    while self._escalation_heap and self._escalation_heap[0][0] <= now:
+                        _, alert_id = heapq.heappop(self._escalation_heap)
+                        # Resolved alerts leave stale entries behind; skip them
+                        if alert_id in self.active_alerts:
                             escalation_needed.append(alert_id)
+                            # Escalate again if it stays unresolved
+                            heapq.heappush(self._escalation_heap, (now + self.escalation_delay, alert_id))
+                    
+                    if not escalation_needed:
+                        timeout = self._escalation_heap[0][0] - now if self._escalation_heap else None
+                        self._escalation_cv.wait(timeout)
                 
                 # Process escalations
                 for alert_id in escalation_needed:
                     self._escalate_alert(alert_id)
                 
-                time.sleep(60)  # Check for escalations every minute
-                
             except Exception as e:
                 self.logger.error(f"Error in alert escalation loop: {e}")
-                time.sleep(60)
+                if self._shutdown.wait(60):
+                    break
     
     def _check_alert_conditions(self) -> None:
         """
         Check all alert conditions against current metrics
         """
-        if not self.alert_conditions:
+        alert_conditions = self.alert_conditions
+        if not alert_conditions:
             return
         
-        self.logger.info(f"Checking {len(self.alert_conditions)} alert conditions...")
+        self.logger.info(f"Checking {len(alert_conditions)} alert conditions...")
         
-        db = self.Session()
-        try:
-            for alert_cond in self.alert_conditions:
+        # One session and one transaction for the whole cycle
+        with self.Session() as db:
+            try:
+                latest = self._get_latest_metrics(db, alert_conditions)
+            except Exception as e:
+                self.logger.error(f"Error getting latest metrics: {e}")
+                return
+            
+            # Forget cooldowns that have ended
+            now = time.monotonic()
+            self._next_eligible = {alert_id: until for alert_id, until in self._next_eligible.items() if until > now}
+            
+            triggered = near = 0
+            fired = []
+            for alert_cond in alert_conditions:
                 try:
-                    self._check_single_alert_condition(alert_cond)
+                    state, message = self._check_single_alert_condition(alert_cond, latest, now)
+                    if state == 'triggered':
+                        triggered += 1
+                        fired.append((alert_cond, self._record_alert(db, alert_cond, message), message))
+                    elif state == 'near':
+                        near += 1
                 except Exception as e:
                     self.logger.error(f"Error checking alert {alert_cond.id}: {e}")
-        finally:
-            db.close()
+            self._last_trigger_count = triggered
+            self._near_threshold_count = near
+            
+            if not fired:
+                return
+            try:
+                # Assign history ids, then commit every trigger of the cycle at once
+                db.flush()
+                fired = [(alert_cond, history.id, message) for alert_cond, history, message in fired]
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                self.logger.error(f"Error triggering alerts: {e}")
+                return
+        
+        updates = [self._notify_alert(alert_cond, alert_history_id, message)
+                   for alert_cond, alert_history_id, message in fired]
+        
+        # Goes out with the manager's next coalesced flush as one frame;
+        # clients expand list-valued data per item
+        if self.websocket_manager:
+            self.websocket_manager.enqueue_many("alert_update", updates)
+    
+    def _get_latest_metrics(self, db, alert_conditions: List[AlertCondition]) -> Dict[tuple, Any]:
+        """
+        Fetch the newest value for every (server_id, metric_type)
+        the alert conditions watch, one query per batch of pairs
+        """
+        pairs = list({(a.server_id, a.metric_type) for a in alert_conditions})
+        latest = {}
+        for start in range(0, len(pairs), LATEST_METRIC_BATCH):
+            # One index seek per pair, combined into a single statement
+            newest = [
+                select(
+                    select(Metric.server_id, Metric.metric_type, Metric.value)
+                    .where(Metric.server_id == server_id, Metric.metric_type == metric_type)
+                    .order_by(Metric.timestamp.desc())
+                    .limit(1)
+                    .subquery()
+                )
+                for server_id, metric_type in pairs[start:start + LATEST_METRIC_BATCH]
+            ]
+            for server_id, metric_type, value in db.execute(union_all(*newest)):
+                latest[(server_id, metric_type)] = value
+        return latest
     
-    def _check_single_alert_condition(self, alert_cond: AlertCondition) -> None:
+    def _check_single_alert_condition(self, alert_cond: AlertCondition, latest: Dict[tuple, Any],
+                                      now: float) -> tuple:
         """
-        Check a single alert condition
+        Check a single alert condition against the latest metrics; returns
+        (state, message) where state is 'triggered', 'near' (within 10% of
+        the threshold) or None
         """
         # Skip if alert is disabled
         if not alert_cond.is_active:
-            return
+            return None, None
         
         # Check cooldown period to avoid duplicate alerts
-        if alert_cond.id in self.last_alert_triggers:
-            last_trigger = self.last_alert_triggers[alert_cond.id]
-            cooldown = alert_cond.cooldown_minutes * 60
-            if time.time() - last_trigger < cooldown:
-                return
+        if self._next_eligible.get(alert_cond.id, 0.0) > now:
+            return None, None
         
         # Get relevant metric for this alert
-        metric_value = self._get_metric_value(alert_cond)
+        metric_value = self._metric_value(alert_cond, latest.get((alert_cond.server_id, alert_cond.metric_type)))
         if metric_value is None:
             self.logger.warning(f"No metric data available for alert {alert_cond.id}")
-            return
-        
-        # Check condition
-        trigger_alert = False
-        message = f"Server {alert_cond.server_id}"
+            return None, None
         
-        if alert_cond.comparison == '>':
-            if metric_value > alert_cond.threshold_value:
-                trigger_alert = True
-                message += f" {alert_cond.metric_type} {metric_value} > {alert_cond.threshold_value}"
-        elif alert_cond.comparison == '<':
-            if metric_value < alert_cond.threshold_value:
-                trigger_alert = True
-                message += f" {alert_cond.metric_type} {metric_value} < {alert_cond.threshold_value}"
-        elif alert_cond.comparison == '==':
-            if metric_value == alert_cond.threshold_value:
-                trigger_alert = True
-                message += f" {alert_cond.metric_type} {metric_value} == {alert_cond.threshold_value}"
+        if not alert_cond._cmp(metric_value, alert_cond._threshold):
+            threshold = alert_cond._threshold
+            if threshold and abs(metric_value - threshold) / abs(threshold) < 0.1:
+                return 'near', None
+            return None, None
         
-        if trigger_alert:
-            self._trigger_alert(alert_cond, message)
+        message = f"Server {alert_cond.server_id} {alert_cond.metric_type} {metric_value} " \
+                  f"{alert_cond.comparison} {alert_cond.threshold_value}"
+        return 'triggered', message
     
-    def _get_metric_value(self, alert_cond: AlertCondition) -> Optional[float]:
+    def _metric_value(self, alert_cond: AlertCondition, value: Any) -> Optional[float]:
         """
-        Get the current value for the specified metric
+        Extract the value an alert condition compares from a metric value
         """
-        db = self.Session()
-        try:
-            # Get the most recent metric for this server and type
-            metric = db.query(Metric).filter(
-                Metric.server_id == alert_cond.server_id,
-                Metric.metric_type == alert_cond.metric_type
-            ).order_by(Metric.timestamp.desc()).first()
-            
-            if metric:
-                # Parse the stored JSON value
-                try:
-                    metric_data = json.loads(metric.value)
-                    return float(metric_data[alert_cond.field])
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    pass
-            
+        if value is None:
             return None
-        except Exception as e:
-            self.logger.error(f"Error getting metric value: {e}")
+        # Readings come back already decoded
+        try:
+            if isinstance(value, dict):
+                return float(value[alert_cond.field])
+            return float(value)
+        except (TypeError, KeyError, ValueError):
             return None
-        finally:
-            db.close()
     
-    def _trigger_alert(self, alert_cond: AlertCondition, message: str) -> None:
-        """
-        Trigger an alert and send notifications
-        """
-        db = self.Session()
+    def _record_alert(self, db, alert_cond: AlertCondition, message: str) -> AlertHistory:
+        """
+        Add the alert history record for a trigger; the caller commits
+        """
+        alert_history = AlertHistory(
+            alert_id=alert_cond.id,
+            server_id=alert_cond.server_id,
+            message=message,
+            severity=alert_cond.severity,
+            triggered_at=datetime.utcnow(),
+            resolved=False
+        )
+        db.add(alert_history)
+        return alert_history
+    
+    def _notify_alert(self, alert_cond: AlertCondition, alert_history_id: int, message: str) -> Dict[str, Any]:
+        """
+        Track a committed alert for escalation and send email notifications;
+        returns the websocket update for the caller to broadcast
+        """
+        websocket_message = {
+            "type": "alert_triggered",
+            "alert_id": alert_history_id,
+            "alert_condition_id": alert_cond.id,
+            "server_id": alert_cond.server_id,
+            "name": alert_cond.name,
+            "severity": alert_cond.severity,
+            "message": message,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
         try:
-            # Create alert history record
-            alert_history = AlertHistory(
-                alert_id=alert_cond.id,
-                server_id=alert_cond.server_id,
-                message=message,
-                severity=alert_cond.severity,
-                triggered_at=datetime.utcnow(),
-                resolved=False
-            )
-            db.add(alert_history)
-            db.commit()
-            
-            # Update last trigger time
-            self.last_alert_triggers[alert_cond.id] = time.time()
+            # Start the cooldown
+            self._next_eligible[alert_cond.id] = time.monotonic() + alert_cond.cooldown_minutes * 60
             
             # Store in active alerts for escalation tracking
             with self._lock:
-                self.active_alerts[alert_history.id] = {
+                if len(self.active_alerts) >= self.max_active_alerts:
+                    self._evict_active_alert()
+                self.active_alerts[alert_history_id] = {
                     'alert_id': alert_cond.id,
                     'server_id': alert_cond.server_id,
                     'severity': alert_cond.severity,
                     'triggered_at': time.time(),
                     'message': message
                 }
-            
-            # Send notifications
-            alert_message = f"🚨 ALERT: {alert_cond.name}\n" \
-                          f"Severity: {alert_cond.severity}\n" \
-                          f"Message: {message}\n" \
-                          f"Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}"
+                heapq.heappush(self._escalation_heap, (time.time() + self.escalation_delay, alert_history_id))
+                self._escalation_cv.notify()
             
             self.logger.info(f"Alert triggered: {message}")
             
-            # Broadcast via WebSocket immediately
-            if self.websocket_manager:
-                websocket_message = {
-                    "type": "alert_triggered",
-                    "alert_id": alert_history.id,
-                    "alert_condition_id": alert_cond.id,
-                    "server_id": alert_cond.server_id,
-                    "name": alert_cond.name,
-                    "severity": alert_cond.severity,
-                    "message": message,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                self.websocket_manager.broadcast(json.dumps(websocket_message), "alert_update")
-            
             # Send email notification if configured
-            if self.email_from and 'default' in self.smtp_servers:
+            if alert_cond._recipients and self.email_from and 'default' in self.smtp_servers:
+                alert_message = f"🚨 ALERT: {alert_cond.name}\n" \
+                              f"Severity: {alert_cond.severity}\n" \
+                              f"Message: {message}\n" \
+                              f"Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}"
                 self._send_email_notification(
                     alert_message,
                     f"Server Alert: {alert_cond.name}",
-                    alert_cond.notification_emails
+                    alert_cond._recipients
                 )
             
         except Exception as e:
-            db.rollback()
             self.logger.error(f"Error triggering alert: {e}")
-        finally:
-            db.close()
+        
+        return websocket_message
+    
+    def _evict_active_alert(self) -> None:
+        """
+        Stop tracking the least important unresolved alert: the lowest
+        severity, and among equals the oldest. Caller holds self._lock.
+        """
+        now = time.time()
+        
+        def score(item):
+            alert_data = item[1]
+            freshness = math.exp(-FRESHNESS_DECAY * (now - alert_data['triggered_at']))
+            return SEVERITY_RANK.get(alert_data['severity'], 2) + freshness
+        
+        alert_id, _ = min(self.active_alerts.items(), key=score)
+        del self.active_alerts[alert_id]
+        self.logger.warning(f"Active alert limit reached, no longer tracking alert {alert_id}")
     
     def _escalate_alert(self, alert_history_id: int) -> None:
         """
@@ -326,7 +503,7 @@ class AlertService:
                     "message": alert_data['message'],
                     "timestamp": datetime.utcnow().isoformat()
                 }
-                self.websocket_manager.broadcast(json.dumps(escalation_ws_message), "alert_update")
+                self.websocket_manager.enqueue("alert_update", escalation_ws_message)
             
             # Send escalation email
             if self.email_from and 'default' in self.smtp_servers:
@@ -337,35 +514,139 @@ class AlertService:
                 )
     
     def _send_email_notification(self, message: str, subject: str, 
-                                recipients: Optional[str]) -> None:
+                                recipients: Optional[Tuple[str, ...]]) -> None:
         """
-        Send email notification about an alert
+        Queue an email notification about an alert for the mail worker
         """
         if not recipients:
             return
         
         try:
-            email_list = [email.strip() for email in recipients.split(',')]
+            self._mail_queue.put_nowait((subject, message, recipients))
+        except queue.Full:
+            self.logger.warning(f"Mail queue full, dropping alert email: {subject}")
+    
+    def _mail_worker(self) -> None:
+        """
+        Deliver queued emails, merging mails to the same recipients that
+        arrive within the batch window into one message; a None in the
+        queue is stop() waking the worker
+        """
+        while self.running:
+            try:
+                first = self._mail_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            if first is None:
+                continue
             
-            msg = MIMEMultipart()
-            msg['From'] = self.email_from
-            msg['To'] = ', '.join(email_list)
-            msg['Subject'] = subject
+            # Gather whatever else arrives during the batch window
+            pending = [first]
+            deadline = time.time() + self.mail_batch_window
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    mail = self._mail_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if mail is None:
+                    break
+                pending.append(mail)
             
-            msg.attach(MIMEText(message, 'plain'))
+            by_recipients: Dict[Tuple[str, ...], List[tuple]] = {}
+            for subject, message, recipients in pending:
+                by_recipients.setdefault(recipients, []).append((subject, message))
             
+            for recipients, mails in by_recipients.items():
+                if len(mails) == 1:
+                    subject, message = mails[0]
+                else:
+                    subject = f"{len(mails)} server alerts"
+                    message = "\n\n".join(f"{s}\n{m}" for s, m in mails)
+                self._submit_notification(self._deliver_email, message, subject, recipients)
+    
+    def _submit_notification(self, fn, *args) -> None:
+        """
+        Run a notification send on the notify pool, dropping it when too
+        many sends are already pending
+        """
+        if not self._notify_slots.acquire(blocking=False):
+            self.logger.warning("Notification pool saturated, dropping notification")
+            return
+        try:
+            future = self._notify_pool.submit(fn, *args)
+        except (AttributeError, RuntimeError):
+            # Pool already shut down
+            self._notify_slots.release()
+            return
+        future.add_done_callback(lambda _: self._notify_slots.release())
+    
+    def _smtp_connection(self) -> smtplib.SMTP:
+        """
+        Reuse this thread's SMTP session across emails, logging in when it is opened
+        """
+        server = getattr(self._smtp_local, 'server', None)
+        if server is None:
             smtp_config = self.smtp_servers['default']
+            server = smtplib.SMTP(smtp_config['server'], smtp_config['port'])
+            if smtp_config['use_tls']:
+                server.starttls()
+            if smtp_config['username'] and smtp_config['password']:
+                server.login(smtp_config['username'], smtp_config['password'])
+            self._smtp_local.server = server
+            with self._lock:
+                self._smtp_sessions.append(server)
+        return server
+    
+    def _close_smtp(self) -> None:
+        """Close this thread's SMTP session"""
+        server = getattr(self._smtp_local, 'server', None)
+        if server is not None:
+            self._smtp_local.server = None
+            with self._lock:
+                if server in self._smtp_sessions:
+                    self._smtp_sessions.remove(server)
+            try:
+                server.quit()
+            except Exception:
+                pass
+    
+    def _close_smtp_sessions(self) -> None:
+        """Close the SMTP sessions of every pool thread"""
+        with self._lock:
+            sessions, self._smtp_sessions = self._smtp_sessions, []
+        for server in sessions:
+            try:
+                server.quit()
+            except Exception:
+                pass
+    
+    def _deliver_email(self, message: str, subject: str, recipients: Tuple[str, ...]) -> None:
+        """
+        Send one email over this pool thread's SMTP session
+        """
+        try:
+            to = ', '.join(recipients)
             
-            with smtplib.SMTP(smtp_config['server'], smtp_config['port']) as server:
-                if smtp_config['use_tls']:
-                    server.starttls()
-                if smtp_config['username'] and smtp_config['password']:
-                    server.login(smtp_config['username'], smtp_config['password'])
-                server.send_message(msg)
+            msg = EmailMessage()
+            msg['From'] = self.email_from
+            msg['To'] = to
+            msg['Subject'] = subject
+            msg.set_content(message)
+            
+            try:
+                self._smtp_connection().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The server closed the idle session; reconnect once
+                self._close_smtp()
+                self._smtp_connection().send_message(msg)
             
-            self.logger.info(f"Alert email sent to {', '.join(email_list)}")
+            self.logger.info(f"Alert email sent to {to}")
             
         except Exception as e:
+            self._close_smtp()
             self.logger.error(f"Error sending email notification: {e}")
     
     def create_alert_condition(self, name: str, server_id: int, metric_type: str,
@@ -392,9 +673,10 @@ class AlertService:
             
             db.add(alert_cond)
             db.commit()
+            db.refresh(alert_cond)
             
-            # Reload alert conditions
-            self._load_alert_conditions()
+            # Add to the cache without re-querying every condition
+            self._cache_condition(alert_cond)
             
             self.logger.info(f"Created new alert condition: {name}")
             return True
@@ -406,19 +688,72 @@ class AlertService:
         finally:
             db.close()
     
+    def update_alert_condition(self, alert_id: int, **changes) -> bool:
+        """
+        Update fields of an alert condition and refresh its cache entry
+        """
+        db = self.Session()
+        try:
+            alert_cond = db.get(AlertCondition, alert_id)
+            if not alert_cond:
+                return False
+            for key, value in changes.items():
+                setattr(alert_cond, key, value)
+            db.commit()
+            db.refresh(alert_cond)
+            
+            self._cache_condition(alert_cond)
+            return True
+            
+        except Exception as e:
+            db.rollback()
+            self.logger.error(f"Error updating alert condition: {e}")
+            return False
+        finally:
+            db.close()
+    
+    def delete_alert_condition(self, alert_id: int) -> bool:
+        """
+        Delete an alert condition and drop it from the cache
+        """
+        db = self.Session()
+        try:
+            # History rows are kept; load them so their alert_id can be cleared
+            alert_cond = db.get(AlertCondition, alert_id, options=[selectinload(AlertCondition.history)])
+            if not alert_cond:
+                return False
+            db.delete(alert_cond)
+            db.commit()
+            
+            with self._lock:
+                self._conditions_by_id.pop(alert_id, None)
+            return True
+            
+        except Exception as e:
+            db.rollback()
+            self.logger.error(f"Error deleting alert condition: {e}")
+            return False
+        finally:
+            db.close()
+    
     def get_active_alerts(self) -> List[AlertCondition]:
         """
         Get all active alert conditions
         """
         return self.alert_conditions
     
-    def get_alert_history(self, limit: int = 100) -> List[AlertHistory]:
+    def get_alert_history(self, limit: int = 100,
+                          before: Optional[Tuple[datetime, int]] = None) -> List[AlertHistory]:
         """
-        Get recent alert history
+        Get recent alert history, optionally only entries before a
+        (triggered_at, id) cursor; id breaks ties between equal timestamps
         """
         db = self.Session()
         try:
-            history = db.query(AlertHistory).order_by(AlertHistory.triggered_at.desc()).limit(limit).all()
+            query = db.query(AlertHistory)
+            if before is not None:
+                query = query.filter(tuple_(AlertHistory.triggered_at, AlertHistory.id) < tuple_(*before))
+            history = query.order_by(AlertHistory.triggered_at.desc(), AlertHistory.id.desc()).limit(limit).all()
             return history
         except Exception as e:
             self.logger.error(f"Error getting alert history: {e}")
@@ -450,7 +785,7 @@ class AlertService:
                         "alert_id": alert_history_id,
                         "timestamp": datetime.utcnow().isoformat()
                     }
-                    self.websocket_manager.broadcast(json.dumps(resolution_message), "alert_update")
+                    self.websocket_manager.enqueue("alert_update", resolution_message)
                 
                 return True
             return False
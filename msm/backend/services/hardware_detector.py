@@ -5,12 +5,21 @@ import platform
 import psutil
 import socket
 import re
+import struct
 import logging
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 import subprocess
 
+OS_RELEASE_RE = re.compile(rb'^PRETTY_NAME="?([^"\n]+)"?$', re.MULTILINE)
+LSB_DESCRIPTION_RE = re.compile(r'Description:\s*(.+)')
+
+# Read-only images (snap loop mounts) always report full and devtmpfs is
+# device nodes; overlay and tmpfs stay since they can be a container's root
+PSEUDO_FILESYSTEMS = {'squashfs', 'devtmpfs'}
+
 class HardwareDetector:
     """
     Service for detecting local server hardware and system information
@@ -19,6 +28,18 @@ class HardwareDetector:
     
     def __init__(self):
         self.logger = logging.getLogger('HardwareDetector')
+        # Prime psutil's counters so later interval=None calls return the
+        # usage since the previous call instead of blocking to sample
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        
+        # Per-mount disk_usage results shared by the disk info and space checks
+        self._disk_cache: Dict[str, Tuple[float, Any]] = {}
+        self.disk_cache_ttl = 10
+        
+        # Interface addresses change rarely; enumerate them at most every 30s
+        self._interfaces_cache: Optional[Tuple[float, Dict[str, List[Dict[str, Any]]]]] = None
+        self.interfaces_cache_ttl = 30
     
     def get_system_info(self) -> Dict[str, Any]:
         """
@@ -39,42 +60,54 @@ class HardwareDetector:
         """Get operating system information"""
         try:
             return {
-                'system': platform.system(),
-                'release': platform.release(),
-                'version': platform.version(),
-                'architecture': platform.architecture()[0],
-                'hostname': socket.gethostname(),
-                'kernel': platform.uname().version,
-                'distribution': self._get_distribution_info()
+                **self._get_platform_info(),
+                'hostname': socket.gethostname()
             }
         except Exception as e:
             self.logger.error(f"Error getting OS info: {e}")
             return {}
     
+    # OS, distribution and CPU model are fixed for the life of the process,
+    # so they are looked up once
+    @lru_cache(maxsize=1)
+    def _get_platform_info(self) -> Dict[str, str]:
+        # One uname() for every field; pointer size gives the bitness without
+        # platform.architecture() inspecting the interpreter binary
+        uname = platform.uname()
+        return {
+            'system': uname.system,
+            'release': uname.release,
+            'version': uname.version,
+            'architecture': f"{struct.calcsize('P') * 8}bit",
+            'kernel': uname.version,
+            'distribution': self._get_distribution_info()
+        }
+    
+    @lru_cache(maxsize=1)
     def _get_distribution_info(self) -> Optional[str]:
         """Get Linux distribution info if applicable"""
         try:
             if platform.system() == 'Linux':
-                # Try lsb_release first
+                # /etc/os-release exists on every systemd distribution and
+                # avoids forking lsb_release
+                try:
+                    with open('/etc/os-release', 'rb') as f:
+                        match = OS_RELEASE_RE.search(f.read())
+                    if match:
+                        return match.group(1).decode('utf-8', 'replace').strip()
+                except OSError:
+                    pass
+                
+                # Fall back to lsb_release
                 try:
                     result = subprocess.run(['lsb_release', '-d'], 
                                           capture_output=True, text=True, timeout=5)
                     if result.returncode == 0:
-                        match = re.search(r'Description:\s*(.+)', result.stdout)
+                        match = LSB_DESCRIPTION_RE.search(result.stdout)
                         if match:
                             return match.group(1).strip()
                 except:
                     pass
-                
-                # Try /etc/os-release
-                try:
-                    with open('/etc/os-release', 'r') as f:
-                        lines = f.readlines()
-                        for line in lines:
-                            if line.startswith('PRETTY_NAME='):
-                                return line.split('=', 1)[1].strip().strip('"')
-                except:
-                    pass
             return None
         except Exception as e:
             self.logger.error(f"Error getting distribution info: {e}")
@@ -84,18 +117,24 @@ class HardwareDetector:
         """Get CPU information"""
         try:
             cpu_freq = psutil.cpu_freq()
+            physical_cores, logical_cores = self._get_core_counts()
             return {
-                'physical_cores': psutil.cpu_count(logical=False),
-                'logical_cores': psutil.cpu_count(logical=True),
+                'physical_cores': physical_cores,
+                'logical_cores': logical_cores,
                 'max_frequency': cpu_freq.max if cpu_freq else None,
                 'current_frequency': cpu_freq.current if cpu_freq else None,
                 'brand': self._get_cpu_brand(),
-                'usage': psutil.cpu_percent(interval=1, percpu=True)
+                'usage': psutil.cpu_percent(interval=None, percpu=True)
             }
         except Exception as e:
             self.logger.error(f"Error getting CPU info: {e}")
             return {}
     
+    @lru_cache(maxsize=1)
+    def _get_core_counts(self) -> Tuple[Optional[int], Optional[int]]:
+        return psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)
+    
+    @lru_cache(maxsize=1)
     def _get_cpu_brand(self) -> Optional[str]:
         """Get CPU brand/model"""
         try:
@@ -146,61 +185,88 @@ class HardwareDetector:
             self.logger.error(f"Error getting memory info: {e}")
             return {}
     
+    def _get_disk_usages(self) -> List[Tuple[Any, Any]]:
+        """
+        (partition, usage) for each real mounted disk, reusing disk_usage
+        results younger than the cache TTL
+        """
+        now = time.monotonic()
+        usages = []
+        for partition in psutil.disk_partitions(all=False):
+            if not partition.fstype or not partition.mountpoint:
+                continue
+            if partition.fstype in PSEUDO_FILESYSTEMS and partition.mountpoint != '/':
+                continue
+            cached = self._disk_cache.get(partition.mountpoint)
+            if cached and now - cached[0] < self.disk_cache_ttl:
+                usage = cached[1]
+            else:
+                try:
+                    usage = psutil.disk_usage(partition.mountpoint)
+                except Exception as e:
+                    self.logger.warning(f"Error getting disk usage for {partition.mountpoint}: {e}")
+                    continue
+                self._disk_cache[partition.mountpoint] = (now, usage)
+            usages.append((partition, usage))
+        return usages
+    
     def _get_disk_info(self) -> List[Dict[str, Any]]:
         """Get disk information"""
         try:
             disks = []
-            for partition in psutil.disk_partitions(all=False):
-                if partition.fstype and partition.mountpoint:
-                    try:
-                        usage = psutil.disk_usage(partition.mountpoint)
-                        disks.append({
-                            'device': partition.device,
-                            'mount_point': partition.mountpoint,
-                            'file_system': partition.fstype,
-                            'total_gb': round(usage.total / (1024 * 1024 * 1024), 2),
-                            'used_gb': round(usage.used / (1024 * 1024 * 1024), 2),
-                            'free_gb': round(usage.free / (1024 * 1024 * 1024), 2),
-                            'usage_percentage': usage.percent
-                        })
-                    except Exception as e:
-                        self.logger.warning(f"Error getting disk usage for {partition.mountpoint}: {e}")
+            for partition, usage in self._get_disk_usages():
+                disks.append({
+                    'device': partition.device,
+                    'mount_point': partition.mountpoint,
+                    'file_system': partition.fstype,
+                    'total_gb': round(usage.total / (1024 * 1024 * 1024), 2),
+                    'used_gb': round(usage.used / (1024 * 1024 * 1024), 2),
+                    'free_gb': round(usage.free / (1024 * 1024 * 1024), 2),
+                    'usage_percentage': usage.percent
+                })
             return disks
         except Exception as e:
             self.logger.error(f"Error getting disk info: {e}")
             return []
     
+    def _get_interface_details(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Addresses per interface"""
+        now = time.monotonic()
+        if self._interfaces_cache and now - self._interfaces_cache[0] < self.interfaces_cache_ttl:
+            return self._interfaces_cache[1]
+        
+        interface_details = {}
+        for interface, addrs in psutil.net_if_addrs().items():
+            ips = []
+            for addr in addrs:
+                if addr.family == socket.AF_INET:
+                    ips.append({
+                        'ip': addr.address,
+                        'netmask': addr.netmask,
+                        'broadcast': addr.broadcast
+                    })
+                elif addr.family == socket.AF_INET6:
+                    ips.append({
+                        'ip': addr.address,
+                        'prefixlen': addr.netmask if hasattr(addr, 'netmask') else None
+                    })
+            
+            if ips:
+                interface_details[interface] = ips
+        
+        self._interfaces_cache = (now, interface_details)
+        return interface_details
+    
     def _get_network_info(self) -> Dict[str, Any]:
         """Get network information"""
         try:
             net_io = psutil.net_io_counters()
-            interfaces = psutil.net_if_addrs()
-            
-            interface_details = {}
-            for interface, addrs in interfaces.items():
-                ips = []
-                for addr in addrs:
-                    if addr.family == socket.AF_INET:
-                        ips.append({
-                            'ip': addr.address,
-                            'netmask': addr.netmask,
-                            'broadcast': addr.broadcast
-                        })
-                    elif addr.family == socket.AF_INET6:
-                        ips.append({
-                            'ip': addr.address,
-                            'prefixlen': addr.netmask if hasattr(addr, 'netmask') else None
-                        })
-                
-                if ips:
-                    interface_details[interface] = ips
-            
             return {
                 'bytes_sent': net_io.bytes_sent,
                 'bytes_received': net_io.bytes_recv,
                 'packets_sent': net_io.packets_sent,
                 'packets_received': net_io.packets_recv,
-                'interfaces': interface_details
+                'interfaces': self._get_interface_details()
             }
         except Exception as e:
             self.logger.error(f"Error getting network info: {e}")
@@ -232,7 +298,7 @@ class HardwareDetector:
     
     def get_cpu_usage(self) -> float:
         """Get current CPU usage percentage"""
-        return psutil.cpu_percent(interval=1)
+        return psutil.cpu_percent(interval=None)
     
     def get_memory_usage(self) -> Dict[str, float]:
         """Get current memory usage"""
@@ -246,19 +312,14 @@ class HardwareDetector:
     def check_disk_space(self, threshold: float = 90.0) -> List[Dict[str, Any]]:
         """Check disks for low space and return alarms"""
         alarms = []
-        for partition in psutil.disk_partitions(all=False):
-            if partition.fstype and partition.mountpoint:
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    if usage.percent >= threshold:
-                        alarms.append({
-                            'device': partition.device,
-                            'mount_point': partition.mountpoint,
-                            'usage_percentage': usage.percent,
-                            'free_mb': round(usage.free / (1024 * 1024), 2)
-                        })
-                except Exception as e:
-                    self.logger.warning(f"Error checking disk {partition.mountpoint}: {e}")
+        for partition, usage in self._get_disk_usages():
+            if usage.percent >= threshold:
+                alarms.append({
+                    'device': partition.device,
+                    'mount_point': partition.mountpoint,
+                    'usage_percentage': usage.percent,
+                    'free_mb': round(usage.free / (1024 * 1024), 2)
+                })
         return alarms
 
 # Singleton instance
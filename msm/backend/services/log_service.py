@@ -1,16 +1,138 @@
 # Minimal Server Manager - Log Service
 # Handles log parsing, analysis and storage
 
-import json
+import heapq
 import logging
+import mmap
+import orjson
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from models import LogSource, LogResult, Server
+from database import bulk_insert, create_service_engine
 
 import re
 import os
+
+# RE2 matches in linear time with no backtracking; use it for the per-line
+# format patterns when google-re2 is installed, stdlib re otherwise
+try:
+    import re2 as line_re
+except ImportError:
+    line_re = re
+
+# Severity markers counted per line, matched against the upper-cased line;
+# plain substring tests give the same result as a case-insensitive regex,
+# and each one is a literal fast search, which splitting an alternation
+# into per-prefix regexes would only approximate.
+# The error markers (ERROR, CRITICAL, FATAL, SEVERE) are tested inline in
+# _parse_log_file to avoid a generator per line.
+WARNING_MARKER = 'WARN'
+
+# Line formats understood by _parse_log_line; only used when the
+# separator-based split below does not fit the line
+COMMON_LOG_RE = line_re.compile(r'(\S+) (\S+) (\S+) \[([^\]]+)\] "([^"]+)" (\d+) (\S+)')
+SYSLOG_RE = line_re.compile(r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}) ([^\s]+) ([^:]+): (.+)')
+
+def _tail_lines(path: str, limit: int) -> List[str]:
+    """
+    Return the last limit lines of a file by reading fixed-size chunks
+    backwards from its end, like tail(1), instead of scanning the whole file
+    """
+    if limit <= 0:
+        return []
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b''
+        # limit + 1 newlines guarantee limit complete lines (the file may
+        # end with a newline)
+        while position > 0 and data.count(b'\n') <= limit:
+            chunk = min(LOG_READ_BUFFER, position)
+            position -= chunk
+            f.seek(position)
+            data = f.read(chunk) + data
+    lines = data.decode('utf-8', errors='replace').splitlines()
+    return lines[-limit:]
+
+def _scan_log_bytes(path: str, start: int, keep: int) -> tuple:
+    """
+    Count error and warning lines from byte offset start to the end of the
+    file using C-level bytes operations over an mmap, without parsing each
+    line. Returns (error_count, warning_count, last keep non-blank lines,
+    end offset).
+    
+    The counts match the parsing path, which counts parsed lines only: its
+    parser falls back to a plain entry for any line it cannot split, so
+    every non-blank line counts there too. The one difference is a line
+    whose parser raises, which the parsing path skips and this counts.
+    """
+    error_count = warning_count = 0
+    last_chunk = b''
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = len(mm)
+        position = start
+        while position < end:
+            # Cut windows on a newline so no line is split between two
+            stop = min(position + MMAP_SCAN_WINDOW, end)
+            if stop < end:
+                newline = mm.rfind(b'\n', position, stop)
+                if newline >= position:
+                    stop = newline + 1
+            last_chunk = mm[position:stop]
+            position = stop
+            for line in last_chunk.upper().split(b'\n'):
+                if b'ERROR' in line or b'CRITICAL' in line or b'FATAL' in line or b'SEVERE' in line:
+                    error_count += 1
+                if b'WARN' in line:
+                    warning_count += 1
+    recent = [line.decode('utf-8', errors='replace').strip() for line in last_chunk.split(b'\n') if line.strip()]
+    return error_count, warning_count, recent[-keep:], end
+
+def _split_common_line(line: str) -> Optional[tuple]:
+    """Slice a Common Log Format line on its fixed separators; None when the
+    line does not have the expected shape"""
+    head, _, rest = line.partition(' [')
+    fields = head.split(' ')
+    timestamp, _, rest = rest.partition('] "')
+    request, _, rest = rest.partition('" ')
+    tail = rest.split(' ', 2)
+    if (len(fields) != 3 or not all(fields) or not timestamp or not request
+            or len(tail) < 2 or not tail[0].isdigit() or not tail[1]):
+        return None
+    return fields[0], fields[1], fields[2], timestamp, request, tail[0], tail[1]
+
+def _split_syslog_line(line: str) -> Optional[tuple]:
+    """Slice a syslog line ('Mmm dd hh:mm:ss host process: message') on its
+    fixed separators; None when the line does not have the expected shape"""
+    timestamp = line[:15]
+    if len(line) < 17 or line[15] != ' ' or timestamp[9] != ':' or timestamp[12] != ':':
+        return None
+    hostname, _, rest = line[16:].partition(' ')
+    process, _, message = rest.partition(': ')
+    if not hostname or not process or ':' in process or not message:
+        return None
+    return timestamp, hostname, process, message
+
+# Parsed entries kept per source for the recent entries list
+RECENT_ENTRIES_PER_SOURCE = 10
+
+# New data beyond this size is counted with _scan_log_bytes instead of
+# parsing every line; only the newest lines are parsed for recent entries
+MMAP_SCAN_THRESHOLD = 1024 * 1024
+MMAP_SCAN_WINDOW = 8 * 1024 * 1024
+
+# Upper bound on threads parsing one server's log sources at once
+MAX_PARSE_WORKERS = 8
+
+# Read log files in 64 KiB chunks rather than the 8 KiB default
+LOG_READ_BUFFER = 64 * 1024
+
+# Read positions per log source, kept across restarts
+LOG_POSITIONS_FILE = Path(__file__).resolve().parent.parent.parent / "data" / "log_positions.json"
  
 class LogService:
     """
@@ -23,12 +145,23 @@ class LogService:
         self.database_url = database_url
         
         # Create database engine and session
-        self.engine = create_engine(database_url, connect_args={"check_same_thread": False})
+        self.engine = create_service_engine(database_url)
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
-        self.Session = SessionLocal
+        # One session per thread, reused across calls; close() only releases
+        # its connection back to the pool
+        self.Session = scoped_session(SessionLocal)
         
-        # Log file cache
-        self.log_file_cache = {}  # source_id: (file_path, position)
+        # Log file cache, persisted to LOG_POSITIONS_FILE
+        self.log_file_cache = self._load_log_positions()  # source_id: (inode, position)
+        self._log_positions_dirty = False
+        self._log_positions_lock = threading.Lock()
+        
+        # Line parsers by log format; other formats use the plain fallback
+        self._line_parsers = {
+            'common': self._parse_common_line,
+            'syslog': self._parse_syslog_line,
+            'json': self._parse_json_line
+        }
     
     def analyze_logs(self, server_id: int) -> Dict[str, Any]:
         """
@@ -53,19 +186,19 @@ class LogService:
             if not sources:
                 return results
             
-            # Analyze each log source
-            for source in sources:
-                log_results = self._parse_log_file(source)
+            # Analyze the sources in parallel; file reads release the GIL
+            with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(sources))) as executor:
+                source_results = list(executor.map(self._parse_log_file, sources))
+            
+            for log_results in source_results:
                 results['error_count'] += log_results['error_count']
                 results['warning_count'] += log_results['warning_count']
                 results['pattern_matches'].extend(log_results['pattern_matches'])
-                results['recent_entries'].extend(log_results['recent_entries'][:10])  # Limit to 10 recent
+                results['recent_entries'].extend(log_results['recent_entries'])  # Up to 10 recent
             
-            # Sort and limit results
-            results['pattern_matches'].sort(key=lambda x: x['count'], reverse=True)
-            results['pattern_matches'] = results['pattern_matches'][:20]  # Top 20 matches
-            results['recent_entries'].sort(key=lambda x: x['timestamp'], reverse=True)
-            results['recent_entries'] = results['recent_entries'][:20]  # Most recent 20
+            # Keep the top results without sorting everything
+            results['pattern_matches'] = heapq.nlargest(20, results['pattern_matches'], key=lambda x: x['count'])  # Top 20 matches
+            results['recent_entries'] = heapq.nlargest(20, results['recent_entries'], key=lambda x: x['timestamp'])  # Most recent 20
             
             return results
             
@@ -74,6 +207,34 @@ class LogService:
             return results
         finally:
             db.close()
+            self._save_log_positions()
+    
+    def _load_log_positions(self) -> Dict[int, tuple]:
+        """
+        Load the persisted read positions, ignoring a missing or corrupt file
+        """
+        try:
+            with open(LOG_POSITIONS_FILE, 'rb') as f:
+                return {int(source_id): tuple(entry) for source_id, entry in orjson.loads(f.read()).items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+    
+    def _save_log_positions(self):
+        """
+        Write the read positions to disk if they changed
+        """
+        with self._log_positions_lock:
+            if not self._log_positions_dirty:
+                return
+            try:
+                LOG_POSITIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = LOG_POSITIONS_FILE.with_suffix('.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps({str(source_id): list(entry) for source_id, entry in self.log_file_cache.items()}))
+                os.replace(tmp_path, LOG_POSITIONS_FILE)
+                self._log_positions_dirty = False
+            except OSError as e:
+                self.logger.warning(f"Could not save log positions: {e}")
     
     def _parse_log_file(self, log_source: LogSource) -> Dict[str, Any]:
         """
@@ -83,47 +244,80 @@ class LogService:
             'error_count': 0,
             'warning_count': 0,
             'pattern_matches': [],
-            'recent_entries': []
+            # Only the newest entries per source are ever reported
+            'recent_entries': deque(maxlen=RECENT_ENTRIES_PER_SOURCE)
         }
         
         try:
-            # Check if log file exists and is accessible
-            if not os.path.exists(log_source.source_path):
+            # The stat doubles as the existence check
+            try:
+                stat = os.stat(log_source.source_path)
+            except FileNotFoundError:
                 self.logger.warning(f"Log file not found: {log_source.source_path}")
                 return results
             
-            # Get current position or start from beginning
-            current_position = self.log_file_cache.get(log_source.id, 0)
+            # One fallback timestamp for every line parsed in this pass
+            now = datetime.now().isoformat()
             
-            # Open and read the log file
-            with open(log_source.source_path, 'r') as f:
-                # Seek to last known position
-                if current_position > 0:
-                    f.seek(current_position)
-                
-                # Read new lines
-                lines = f.readlines()
-                
-                # Update position
-                if lines:
-                    self.log_file_cache[log_source.id] = f.tell()
-                
-                # Parse each line
-                for line_index, line in enumerate(lines):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # Parse line according to log format
-                    log_entry = self._parse_log_line(line, log_source.source_type)
+            # Get current position or start from beginning; a new inode or a
+            # file shorter than the saved position means it was rotated
+            inode, current_position = self.log_file_cache.get(log_source.id, (stat.st_ino, 0))
+            if inode != stat.st_ino or stat.st_size < current_position:
+                current_position = 0
+            
+            # Large backlogs: count severities on raw bytes and only parse
+            # the lines that end up in recent_entries
+            if stat.st_size - current_position > MMAP_SCAN_THRESHOLD:
+                error_count, warning_count, recent_lines, end = _scan_log_bytes(
+                    log_source.source_path, current_position, RECENT_ENTRIES_PER_SOURCE)
+                results['error_count'] = error_count
+                results['warning_count'] = warning_count
+                parse_line = self._get_line_parser(log_source.source_type)
+                for line in recent_lines:
+                    log_entry = parse_line(line, now)
                     if log_entry:
                         results['recent_entries'].append(log_entry)
-                        
-                        # Count errors and warnings (basic patterns)
-                        if re.search(r'(ERROR|CRITICAL|FATAL|SEVERE)', line, re.IGNORECASE):
-                            results['error_count'] += 1
-                        if re.search(r'(WARN|WARNING)', line, re.IGNORECASE):
-                            results['warning_count'] += 1
+                with self._log_positions_lock:
+                    self.log_file_cache[log_source.id] = (stat.st_ino, end)
+                    self._log_positions_dirty = True
+                return results
+            
+            # Read all new data at once (about MMAP_SCAN_THRESHOLD bytes at
+            # most here) and decode it in one call
+            with open(log_source.source_path, 'rb') as f:
+                f.seek(current_position)
+                data = f.read()
+            
+            # Parse each new line; lookups are hoisted and counts kept in
+            # locals since this loop runs once per line
+            parse_line = self._get_line_parser(log_source.source_type)
+            append_entry = results['recent_entries'].append
+            error_count = warning_count = 0
+            for line in data.decode('utf-8', errors='replace').split('\n'):
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # Parse line according to log format
+                log_entry = parse_line(line, now)
+                if log_entry:
+                    append_entry(log_entry)
+                    
+                    # Count errors and warnings (basic patterns)
+                    upper = line.upper()
+                    if ('ERROR' in upper or 'CRITICAL' in upper
+                            or 'FATAL' in upper or 'SEVERE' in upper):
+                        error_count += 1
+                    if WARNING_MARKER in upper:
+                        warning_count += 1
+            results['error_count'] = error_count
+            results['warning_count'] = warning_count
+            
+            # Update position
+            if data:
+                with self._log_positions_lock:
+                    self.log_file_cache[log_source.id] = (stat.st_ino, current_position + len(data))
+                    self._log_positions_dirty = True
             
             return results
             
@@ -131,65 +325,96 @@ class LogService:
             self.logger.error(f"Error parsing log file {log_source.source_path}: {e}")
             return results
     
-    def _parse_log_line(self, line: str, log_format: str) -> Optional[Dict[str, Any]]:
+    def _parse_log_line(self, line: str, log_format: str, now: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Parse a log line according to the specified format; now is the
+        timestamp used for lines without one, shared by a whole batch
+        """
+        if now is None:
+            now = datetime.now().isoformat()
+        return self._get_line_parser(log_format)(line, now)
+    
+    def _get_line_parser(self, log_format: str):
+        """
+        Resolve the parser for a log format once; the returned function
+        takes (line, now) and falls back to a plain entry
+        """
+        parser = self._line_parsers.get(log_format)
+        logger = self.logger
+        
+        def parse_line(line: str, now: str) -> Optional[Dict[str, Any]]:
+            try:
+                entry = parser(line, now) if parser else None
+                if entry:
+                    return entry
+                
+                # Fallback: basic parsing for any format
+                return {
+                    'timestamp': now,
+                    'message': line,
+                    'raw': line
+                }
+                
+            except Exception as e:
+                logger.warning(f"Error parsing log line: {line}. Error: {e}")
+                return None
+        
+        return parse_line
+    
+    def _parse_common_line(self, line: str, now: str) -> Optional[Dict[str, Any]]:
+        """
+        Common Log Format: IP - user [timestamp] "request" status size
+        """
+        fields = _split_common_line(line)
+        if fields is None:
+            match = COMMON_LOG_RE.match(line)
+            fields = match.groups() if match else None
+        if not fields:
+            return None
+        return {
+            'timestamp': self._parse_common_log_time(fields[3], now),
+            'ip': fields[0],
+            'user': fields[1],
+            'method': fields[2],
+            'request': fields[4],
+            'status': fields[5],
+            'size': fields[6],
+            'raw': line
+        }
+    
+    def _parse_syslog_line(self, line: str, now: str) -> Optional[Dict[str, Any]]:
         """
-        Parse a log line according to the specified format
+        Syslog format: timestamp hostname process[pid]: message
+        """
+        fields = _split_syslog_line(line)
+        if fields is None:
+            match = SYSLOG_RE.match(line)
+            fields = match.groups() if match else None
+        if not fields:
+            return None
+        return {
+            'timestamp': fields[0],
+            'hostname': fields[1],
+            'process': fields[2],
+            'message': fields[3],
+            'raw': line
+        }
+    
+    def _parse_json_line(self, line: str, now: str) -> Optional[Dict[str, Any]]:
+        """
+        JSON log format, one object per line
         """
         try:
-            # Common log formats
-            if log_format == 'common':
-                # Common Log Format: IP - user [timestamp] "request" status size
-                pattern = r'(\S+) (\S+) (\S+) \[([^\]]+)\] "([^"]+)" (\d+) (\S+)'
-                match = re.match(pattern, line)
-                if match:
-                    return {
-                        'timestamp': self._parse_common_log_time(match.group(4)),
-                        'ip': match.group(1),
-                        'user': match.group(2),
-                        'method': match.group(3),
-                        'request': match.group(5),
-                        'status': match.group(6),
-                        'size': match.group(7),
-                        'raw': line
-                    }
-            
-            elif log_format == 'syslog':
-                # Syslog format: timestamp hostname process[pid]: message
-                pattern = r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}) ([^\s]+) ([^:]+): (.+)'
-                match = re.match(pattern, line)
-                if match:
-                    return {
-                        'timestamp': match.group(1),
-                        'hostname': match.group(2),
-                        'process': match.group(3),
-                        'message': match.group(4),
-                        'raw': line
-                    }
-            
-            elif log_format == 'json':
-                # JSON log format
-                try:
-                    json_data = json.loads(line)
-                    return {
-                        'json': json_data,
-                        'timestamp': json_data.get('timestamp', json_data.get('@timestamp', datetime.now().isoformat())),
-                        'raw': line
-                    }
-                except json.JSONDecodeError:
-                    pass
-            
-            # Fallback: basic parsing for any format
-            return {
-                'timestamp': datetime.now().isoformat(),
-                'message': line,
-                'raw': line
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"Error parsing log line: {line}. Error: {e}")
+            json_data = orjson.loads(line)
+        except orjson.JSONDecodeError:
             return None
+        return {
+            'json': json_data,
+            'timestamp': json_data.get('timestamp', json_data.get('@timestamp', now)),
+            'raw': line
+        }
     
-    def _parse_common_log_time(self, time_str: str) -> str:
+    def _parse_common_log_time(self, time_str: str, now: str) -> str:
         """
         Parse Common Log Format timestamp
         """
@@ -198,7 +423,7 @@ class LogService:
             dt = datetime.strptime(time_str, '%d/%b/%Y:%H:%M:%S %z')
             return dt.isoformat()
         except ValueError:
-            return datetime.now().isoformat()
+            return now
     
     def create_log_source(self, server_id: int, name: str, file_path: str,
                           format: str = 'auto', error_pattern: str = None,
@@ -253,31 +478,33 @@ class LogService:
         """
         db = self.Session()
         try:
+            now = datetime.utcnow()
+            rows = []
+            
             # Save overall results
             for key, value in log_results.items():
                 if key != 'recent_entries':  # Skip saving individual entries
-                    log_result = LogResult(
-                        server_id=server_id,
-                        result_type=key,
-                        result_value=str(value),
-                        timestamp=datetime.utcnow()
-                    )
-                    db.add(log_result)
+                    rows.append({
+                        'server_id': server_id,
+                        'result_type': key,
+                        'result_value': str(value),
+                        'timestamp': now
+                    })
             
             # Save pattern matches if any
             if 'pattern_matches' in log_results:
                 for pattern_match in log_results['pattern_matches']:
-                    log_result = LogResult(
-                        server_id=server_id,
-                        result_type=f"pattern_{pattern_match['name']}",
-                        result_value=json.dumps({
+                    rows.append({
+                        'server_id': server_id,
+                        'result_type': f"pattern_{pattern_match['name']}",
+                        'result_value': orjson.dumps({
                             'count': pattern_match['count'],
                             'examples': pattern_match['examples']
-                        }),
-                        timestamp=datetime.utcnow()
-                    )
-                    db.add(log_result)
+                        }).decode(),
+                        'timestamp': now
+                    })
             
+            bulk_insert(db, LogResult, rows)
             db.commit()
             self.logger.info(f"Saved log results for server {server_id}")
             return True
@@ -298,19 +525,23 @@ class LogService:
         db = self.Session()
         try:
             log_source = db.query(LogSource).filter(LogSource.id == log_source_id).first()
-            if not log_source or not os.path.exists(log_source.source_path):
+            if not log_source:
+                return entries
+            
+            # Read only the last N lines from the end of the log file
+            try:
+                lines = _tail_lines(log_source.source_path, limit)
+            except FileNotFoundError:
                 return entries
             
-            # Read last N lines from the log file
-            with open(log_source.source_path, 'r') as f:
-                # Read lines from the end
-                lines = []
-                for line in f.readlines()[-limit:]:
-                    line = line.strip()
-                    if line:
-                        parsed = self._parse_log_line(line, log_source.source_type)
-                        if parsed:
-                            entries.append(parsed)
+            now = datetime.now().isoformat()
+            parse_line = self._get_line_parser(log_source.source_type)
+            for line in lines:
+                line = line.strip()
+                if line:
+                    parsed = parse_line(line, now)
+                    if parsed:
+                        entries.append(parsed)
             
             return entries
             
@@ -0,0 +1,214 @@
+# Minimal Server Manager - Metric Archive
+# Compacts old raw metric rows into hourly Gorilla-encoded blocks
+
+import logging
+import math
+import struct
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Tuple
+from sqlalchemy import delete, select
+from models import Metric, MetricArchive
+from database import bulk_insert
+
+logger = logging.getLogger('MetricArchive')
+
+EPOCH = datetime(1970, 1, 1)
+
+# Delta-of-delta buckets for timestamps: (prefix, prefix width, value width)
+DOD_BUCKETS = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12))
+
+class _BitWriter:
+    def __init__(self):
+        self.value = 0
+        self.nbits = 0
+
+    def write(self, bits: int, width: int):
+        self.value = (self.value << width) | (bits & ((1 << width) - 1))
+        self.nbits += width
+
+    def getvalue(self) -> bytes:
+        pad = -self.nbits % 8
+        return (self.value << pad).to_bytes((self.nbits + pad) // 8, 'big')
+
+class _BitReader:
+    def __init__(self, data: bytes):
+        self.value = int.from_bytes(data, 'big')
+        self.total = len(data) * 8
+        self.pos = 0
+
+    def read(self, width: int) -> int:
+        self.pos += width
+        return (self.value >> (self.total - self.pos)) & ((1 << width) - 1)
+
+    def read_signed(self, width: int) -> int:
+        value = self.read(width)
+        return value - (1 << width) if value >> (width - 1) else value
+
+def _float_bits(value: float) -> int:
+    return struct.unpack('>Q', struct.pack('>d', value))[0]
+
+def _bits_float(bits: int) -> float:
+    return struct.unpack('>d', struct.pack('>Q', bits))[0]
+
+def _write_timestamps(writer: _BitWriter, timestamps: List[int]):
+    """Delta-of-delta encode whole-second timestamps"""
+    writer.write(timestamps[0], 64)
+    prev_delta = 0
+    for prev, current in zip(timestamps, timestamps[1:]):
+        delta = current - prev
+        dod = delta - prev_delta
+        prev_delta = delta
+        if dod == 0:
+            writer.write(0, 1)
+            continue
+        for prefix, prefix_width, width in DOD_BUCKETS:
+            if -(1 << (width - 1)) <= dod < (1 << (width - 1)):
+                writer.write(prefix, prefix_width)
+                writer.write(dod, width)
+                break
+        else:
+            writer.write(0b1111, 4)
+            writer.write(dod, 32)
+
+def _read_timestamps(reader: _BitReader, count: int) -> List[int]:
+    timestamps = [reader.read(64)]
+    delta = 0
+    for _ in range(count - 1):
+        if reader.read(1) == 0:
+            dod = 0
+        elif reader.read(1) == 0:
+            dod = reader.read_signed(7)
+        elif reader.read(1) == 0:
+            dod = reader.read_signed(9)
+        elif reader.read(1) == 0:
+            dod = reader.read_signed(12)
+        else:
+            dod = reader.read_signed(32)
+        delta += dod
+        timestamps.append(timestamps[-1] + delta)
+    return timestamps
+
+def _write_values(writer: _BitWriter, values: List[float]):
+    """XOR-encode floats against their predecessor, reusing the previous
+    leading/trailing zero window when the new XOR fits inside it"""
+    prev = _float_bits(values[0])
+    writer.write(prev, 64)
+    prev_leading, prev_trailing = -1, -1
+    for value in values[1:]:
+        bits = _float_bits(value)
+        xor = bits ^ prev
+        prev = bits
+        if xor == 0:
+            writer.write(0, 1)
+            continue
+        writer.write(1, 1)
+        leading = min(64 - xor.bit_length(), 31)
+        trailing = (xor & -xor).bit_length() - 1
+        if prev_leading >= 0 and leading >= prev_leading and trailing >= prev_trailing:
+            writer.write(0, 1)
+            writer.write(xor >> prev_trailing, 64 - prev_leading - prev_trailing)
+        else:
+            meaningful = 64 - leading - trailing
+            writer.write(1, 1)
+            writer.write(leading, 5)
+            writer.write(meaningful - 1, 6)
+            writer.write(xor >> trailing, meaningful)
+            prev_leading, prev_trailing = leading, trailing
+
+def _read_values(reader: _BitReader, count: int) -> List[float]:
+    prev = reader.read(64)
+    values = [_bits_float(prev)]
+    leading, trailing = 0, 0
+    for _ in range(count - 1):
+        if reader.read(1) == 1:
+            if reader.read(1) == 1:
+                leading = reader.read(5)
+                trailing = 64 - leading - (reader.read(6) + 1)
+            prev ^= reader.read(64 - leading - trailing) << trailing
+        values.append(_bits_float(prev))
+    return values
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def encode_block(samples: List[Tuple[datetime, Any]]) -> Dict[str, Any]:
+    """
+    Encode one series of (timestamp, value) samples into an archive row
+    body: the timestamps, then one value stream per numeric field
+    """
+    if not any(isinstance(value, dict) for _, value in samples):
+        # Scalar series: a single stream, NaN for empty samples
+        fields = [[None, 'float']]
+        columns = [[float(value) if _is_number(value) else math.nan for _, value in samples]]
+        constants = {}
+    else:
+        readings = [value if isinstance(value, dict) else {} for _, value in samples]
+        names = sorted({key for reading in readings for key, value in reading.items() if _is_number(value)})
+        fields = [[name, 'int' if all(isinstance(r.get(name, 0), int) for r in readings) else 'float']
+                  for name in names]
+        # Missing fields are stored as NaN and dropped again on decode
+        columns = [[float(r[name]) if _is_number(r.get(name)) else math.nan for r in readings]
+                   for name in names]
+        constants = {key: value for key, value in readings[0].items() if not _is_number(value)}
+
+    writer = _BitWriter()
+    _write_timestamps(writer, [int((ts - EPOCH).total_seconds()) for ts, _ in samples])
+    for column in columns:
+        _write_values(writer, column)
+
+    return {
+        'count': len(samples),
+        'fields': fields,
+        'constants': constants,
+        'encoded': writer.getvalue()
+    }
+
+def decode_block(archive: MetricArchive) -> List[Dict[str, Any]]:
+    """Expand an archive row back into {'timestamp', 'value'} samples"""
+    reader = _BitReader(archive.encoded)
+    timestamps = _read_timestamps(reader, archive.count)
+    columns = [_read_values(reader, archive.count) for _ in archive.fields]
+
+    samples = []
+    for i, seconds in enumerate(timestamps):
+        if archive.fields == [[None, 'float']]:
+            value = None if math.isnan(columns[0][i]) else columns[0][i]
+        else:
+            value = dict(archive.constants or {})
+            for (name, kind), column in zip(archive.fields, columns):
+                if not math.isnan(column[i]):
+                    value[name] = int(column[i]) if kind == 'int' else column[i]
+        samples.append({'timestamp': EPOCH + timedelta(seconds=seconds), 'value': value})
+    return samples
+
+def archive_metrics(db, cutoff: datetime, batch_size: int = 50000) -> int:
+    """
+    Move raw metrics older than cutoff into hourly archive blocks, deleting
+    the raw rows; returns the number of rows archived. The caller commits.
+    """
+    rows = db.execute(
+        select(Metric.id, Metric.server_id, Metric.metric_type, Metric.timestamp, Metric.value)
+        .where(Metric.timestamp < cutoff)
+        .order_by(Metric.server_id, Metric.metric_type, Metric.timestamp)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return 0
+
+    blocks: Dict[tuple, list] = {}
+    for _, server_id, metric_type, timestamp, value in rows:
+        hour = timestamp.replace(minute=0, second=0, microsecond=0)
+        blocks.setdefault((server_id, metric_type, hour), []).append((timestamp, value))
+
+    archives = []
+    for (server_id, metric_type, hour), samples in blocks.items():
+        archives.append({'server_id': server_id, 'metric_type': metric_type,
+                         'start_ts': hour, **encode_block(samples)})
+    bulk_insert(db, MetricArchive, archives)
+
+    ids = [row[0] for row in rows]
+    for start in range(0, len(ids), 500):
+        db.execute(delete(Metric).where(Metric.id.in_(ids[start:start + 500])))
+
+    logger.info(f"Archived {len(rows)} metric rows into {len(archives)} blocks")
+    return len(rows)
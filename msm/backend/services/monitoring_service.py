@@ -5,13 +5,36 @@ import threading
 import time
 import json
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from models import Server, ServerSpec, Metric, CustomCommand
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, lazyload, sessionmaker
+from models import Server, ServerCredentials, ServerSpec, Metric, MetricRollup, CustomCommand, CommandResult
 from models import CustomCommand as Command
 from services.ssh_service import ssh_service
+from database import bulk_insert, create_service_engine
+from services.metric_archive import archive_metrics
+
+@lru_cache(maxsize=1024)
+def _compiled_pattern(pattern: str) -> re.Pattern:
+    """Compile a custom command's regex once per distinct pattern text"""
+    return re.compile(pattern, re.MULTILINE)
+
+# Rollup bucket widths in seconds (1 minute, 1 hour)
+ROLLUP_GRANULARITIES = (60, 3600)
+EPOCH = datetime(1970, 1, 1)
+
+def _headline_value(metric_type: str, reading: Any) -> Optional[float]:
+    """The single number a reading is charted and rolled up by"""
+    if not isinstance(reading, dict):
+        return None
+    if metric_type == 'cpu':
+        return reading.get('totalUsage')
+    return reading.get('usage_percent')  # memory and disk_* readings
 
 class MonitoringService:
     """
@@ -26,7 +49,7 @@ class MonitoringService:
         self.websocket_manager = websocket_manager
         
         # Create database engine and session
-        self.engine = create_engine(database_url, connect_args={"check_same_thread": False})
+        self.engine = create_service_engine(database_url)
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self.Session = SessionLocal
         
@@ -38,6 +61,17 @@ class MonitoringService:
         self.status_check_interval = 10  # Quick status checks every 10 seconds
         self.active_servers = {}  # server_id: last_monitoring_time
         self.server_status_cache = {}  # server_id: current_status
+        # Decrypted connect kwargs per server: server_id -> (updated_at, kwargs)
+        self._credentials_cache: Dict[int, tuple] = {}
+        # Open rollup buckets: (server_id, metric_type, granularity) -> [bucket, min, max, sum, count]
+        self._rollups: Dict[tuple, list] = {}
+        # Raw metrics older than this are compacted into hourly archive blocks
+        self.archive_after = timedelta(days=int(os.getenv('METRICS_ARCHIVE_AFTER_DAYS', '7')))
+        self.archive_interval = 3600  # seconds between archive passes
+        self._last_archive = 0.0
+        # SSH probes run in parallel; they are network-bound
+        self.probe_workers = 16
+        self._probe_pool: Optional[ThreadPoolExecutor] = None
         
     def start(self) -> None:
         """
@@ -48,6 +82,9 @@ class MonitoringService:
             
         self.running = True
         self.logger.info("Starting monitoring service...")
+        self._restore_rollups()
+        self._probe_pool = ThreadPoolExecutor(max_workers=self.probe_workers,
+                                              thread_name_prefix='msm-probe')
         
         # Start monitoring thread
         monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
@@ -62,6 +99,9 @@ class MonitoringService:
         Stop the monitoring service
         """
         self.running = False
+        if self._probe_pool is not None:
+            self._probe_pool.shutdown(wait=False, cancel_futures=True)
+            self._probe_pool = None
         self.logger.info("Monitoring service stopped")
     
     def add_server_to_monitoring(self, server_id: int) -> None:
@@ -84,6 +124,7 @@ class MonitoringService:
                 del self.active_servers[server_id]
             if server_id in self.server_status_cache:
                 del self.server_status_cache[server_id]
+            self._credentials_cache.pop(server_id, None)
             self.logger.info(f"Removed server {server_id} from monitoring")
     
     def _monitoring_loop(self) -> None:
@@ -95,6 +136,10 @@ class MonitoringService:
                 self._monitor_all_servers()
                 self._execute_custom_commands()
                 
+                if time.time() - self._last_archive >= self.archive_interval:
+                    self._last_archive = time.time()
+                    self._archive_old_metrics()
+                
                 # Sleep until next monitoring cycle
                 time.sleep(self.monitoring_interval)
                 
@@ -121,24 +166,36 @@ class MonitoringService:
         with self._lock:
             server_ids = list(self.active_servers.keys())
         
-        if not server_ids:
+        pool = self._probe_pool
+        if not server_ids or pool is None:
             return
-            
-        for server_id in server_ids:
-            try:
-                self._check_server_status_immediate(server_id)
-            except Exception as e:
-                self.logger.error(f"Error checking status for server {server_id}: {e}")
+        
+        # Each check uses its own session, so they can run side by side
+        futures = {pool.submit(self._check_server_status_immediate, server_id): server_id
+                   for server_id in server_ids}
+        done, not_done = wait(futures, timeout=self.status_check_interval)
+        for future in done:
+            if future.exception():
+                self.logger.error(f"Error checking status for server {futures[future]}: {future.exception()}")
+        if not_done:
+            self.logger.warning(f"{len(not_done)} status checks still running after {self.status_check_interval}s")
     
     def _check_server_status_immediate(self, server_id: int) -> None:
         """
-        Immediately check and update server status
+        Immediately check and update server status; no session is held
+        while the SSH check runs
         """
-        db = self.Session()
         try:
-            server = db.query(Server).filter(Server.id == server_id).first()
-            if not server:
-                return
+            db = self.Session()
+            try:
+                # Status checks never read specs, so skip the eager join
+                server = db.query(Server).options(lazyload(Server.specs)).filter(Server.id == server_id).first()
+                if not server:
+                    return
+                server_name, ip, port, user = server.name, server.ip, server.port, server.user
+                connect_args = None if server_id in ssh_service.clients else self._connect_args(db, server)
+            finally:
+                db.close()
                 
             # Check connection status
             old_status = self.server_status_cache.get(server_id, 'unknown')
@@ -146,22 +203,14 @@ class MonitoringService:
             
             try:
                 # Quick connection test
-                if server_id in ssh_service.clients:
+                if connect_args is None:
                     # Test with a simple command
                     success, _, _ = ssh_service.execute_command(server_id, "echo 'ping'")
                     if success:
                         new_status = 'online'
                 else:
                     # Try to connect
-                    use_key = server.use_key and server.ssh_key_path
-                    success, message = ssh_service.connect(
-                        server_id=server_id,
-                        hostname=server.ip,
-                        port=server.port,
-                        username=server.user,
-                        password=server.password_encrypted if not use_key else None,
-                        key_path=server.ssh_key_path if use_key else None
-                    )
+                    success, message = self._ensure_connected(server_id, ip, port, user, connect_args)
                     if success:
                         new_status = 'online'
             except Exception as e:
@@ -170,162 +219,241 @@ class MonitoringService:
             
             # Update status if changed
             if old_status != new_status:
-                server.status = new_status
-                server.last_connected = datetime.utcnow() if new_status == 'online' else server.last_connected
-                db.commit()
+                db = self.Session()
+                try:
+                    server = db.query(Server).options(lazyload(Server.specs)).filter(Server.id == server_id).first()
+                    if not server:
+                        return
+                    server.status = new_status
+                    server.last_connected = datetime.utcnow() if new_status == 'online' else server.last_connected
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                finally:
+                    db.close()
                 
                 # Update cache
                 with self._lock:
                     self.server_status_cache[server_id] = new_status
                 
                 # Broadcast status change via WebSocket
-                if self.websocket_manager:
-                    status_message = {
-                        "type": "server_status_change",
-                        "server_id": server_id,
-                        "server_name": server.name,
-                        "status": new_status,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                    # Use a thread-safe approach for WebSocket broadcasting
-                    self._broadcast_websocket_message(status_message, "status_update")
+                self._broadcast_status_change_async(server_id, server_name, new_status)
                 
-                self.logger.info(f"Server {server.name} status changed: {old_status} -> {new_status}")
+                self.logger.info(f"Server {server_name} status changed: {old_status} -> {new_status}")
                 
         except Exception as e:
             self.logger.error(f"Error in immediate status check for server {server_id}: {e}")
-        finally:
-            db.close()
     
     def _monitor_all_servers(self) -> None:
         """
-        Monitor all active servers
+        Monitor all active servers: SSH probes run in parallel on the probe
+        pool with no session open, then the results are applied in one short
+        session with one bulk insert of metrics and one commit
         """
         with self._lock:
             server_ids = list(self.active_servers.keys())
         
-        if not server_ids:
+        pool = self._probe_pool
+        if not server_ids or pool is None:
             return
             
         self.logger.info(f"Monitoring {len(server_ids)} active servers...")
         
+        # Read what the probes need, then release the connection before any
+        # SSH round trip; probe threads only see plain values, never ORM objects
         db = self.Session()
         try:
-            for server_id in server_ids:
-                try:
-                    self._monitor_server(server_id)
-                except Exception as e:
-                    self.logger.error(f"Error monitoring server {server_id}: {e}")
+            servers = db.query(Server).options(joinedload(Server.specs)).filter(Server.id.in_(server_ids)).all()
+            for server_id in set(server_ids) - {server.id for server in servers}:
+                self.logger.warning(f"Server {server_id} not found")
+            futures = {}
+            for server in servers:
+                futures[pool.submit(
+                    self._probe_server, server.id, server.name, server.ip, server.port, server.user,
+                    self._connect_args(db, server), self._specs_due(server)
+                )] = server.id
         finally:
             db.close()
-    
-    def _monitor_server(self, server_id: int) -> None:
-        """
-        Monitor a single server and store metrics
-        """
+        
+        done, not_done = wait(futures, timeout=self.monitoring_interval)
+        if not_done:
+            self.logger.warning(f"{len(not_done)} server probes still running after {self.monitoring_interval}s")
+        
+        probes = {}
+        for future in done:
+            try:
+                probes[futures[future]] = future.result()
+            except Exception as e:
+                self.logger.error(f"Error monitoring server {futures[future]}: {e}")
+        if not probes:
+            return
+        
         db = self.Session()
         try:
-            server = db.query(Server).filter(Server.id == server_id).first()
-            if not server:
-                self.logger.warning(f"Server {server_id} not found")
-                return
-                
-            # Connect to server if not already connected
-            if server_id not in ssh_service.clients:
-                self.logger.info(f"Connecting to server {server.name} ({server.ip}:{server.port})...")
-                
-                # Determine connection method
-                use_key = server.use_key and server.ssh_key_path
-                success, message = ssh_service.connect(
-                    server_id=server_id,
-                    hostname=server.ip,
-                    port=server.port,
-                    username=server.user,
-                    password=server.password_encrypted if not use_key else None,
-                    key_path=server.ssh_key_path if use_key else None
-                )
-                
-                if not success:
-                    self.logger.error(f"Failed to connect to server {server.name}: {message}")
-                    # Update status to offline
-                    if server.status != 'offline':
-                        server.status = 'offline'
-                        db.commit()
-                        self._broadcast_status_change_async(server_id, server.name, 'offline')
-                    return
-                    
-                self.logger.info(f"Connected to server {server.name}")
-            
-            # Get current server status
-            success, stdout, stderr = ssh_service.execute_command(server_id, "uptime")
+            # Fresh rows, so concurrent edits and status checks are not overwritten
+            servers = db.query(Server).options(joinedload(Server.specs)).filter(Server.id.in_(probes)).all()
+            rows = []
+            broadcasts = []
+            for server in servers:
+                try:
+                    rows.extend(self._apply_probe(server, probes[server.id], broadcasts))
+                except Exception as e:
+                    self.logger.error(f"Error monitoring server {server.id}: {e}")
             
-            # Update server status
-            if success:
-                if server.status != 'online':
-                    server.status = "online"
-                    server.last_connected = datetime.utcnow()
-                    db.commit()
-                    self._broadcast_status_change_async(server_id, server.name, 'online')
-            else:
-                if server.status != 'offline':
-                    server.status = "offline"
-                    db.commit()
-                    self._broadcast_status_change_async(server_id, server.name, 'offline')
+            bulk_insert(db, Metric, rows)
+            bulk_insert(db, MetricRollup, self._accumulate_rollups(rows))
+            db.commit()
             
-            # Get performance metrics
-            metrics = ssh_service.get_metrics(server_id)
-            if metrics:
-                self._store_metrics(server_id, metrics)
-                
-                # Broadcast metrics via WebSocket
-                if self.websocket_manager:
-                    metrics_message = {
-                        "type": "metrics_update",
-                        "server_id": server_id,
-                        "server_name": server.name,
-                        "metrics": metrics,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                    # Use a thread-safe approach for WebSocket broadcasting
-                    self._broadcast_websocket_message(metrics_message, "metrics_update")
-                
-            # Get hardware info and update specs (less frequently)
-            if (not server.specs or not server.specs.last_updated or
-                (datetime.utcnow() - server.specs.last_updated).days >= 1):
-                hardware_info = ssh_service.get_hardware_info(server_id)
-                if hardware_info:
-                    self._update_server_specs(server, hardware_info)
-                    
+            # Clients only hear about changes that were actually stored
+            for message_data, subscription_type in broadcasts:
+                self._broadcast_websocket_message(message_data, subscription_type)
+            if rows:
+                self.logger.info(f"Stored {len(rows)} metrics for {len(server_ids)} servers")
         except Exception as e:
-            self.logger.error(f"Error monitoring server {server_id}: {e}")
+            db.rollback()
+            self.logger.error(f"Error storing monitoring cycle: {e}")
         finally:
             db.close()
     
+    def _connect_args(self, db, server: Server) -> Dict[str, Any]:
+        """
+        password/key_path kwargs for ssh_service.connect; decrypted once per
+        server revision, since every credentials change bumps updated_at
+        """
+        with self._lock:
+            cached = self._credentials_cache.get(server.id)
+        if cached is not None and cached[0] == server.updated_at:
+            return cached[1]
+        
+        credentials = db.get(ServerCredentials, server.id)
+        connect_args = credentials.connect_args() if credentials else {}
+        with self._lock:
+            self._credentials_cache[server.id] = (server.updated_at, connect_args)
+        return connect_args
+    
+    def _ensure_connected(self, server_id: int, hostname: str, port: int, username: str,
+                          connect_args: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Connect to a server unless a connection is already open
+        Returns (success, message)
+        """
+        if server_id in ssh_service.clients:
+            return True, "Already connected"
+        self.logger.info(f"Connecting to server {server_id} ({hostname}:{port})...")
+        return ssh_service.connect(
+            server_id=server_id,
+            hostname=hostname,
+            port=port,
+            username=username,
+            **connect_args
+        )
+    
+    def _specs_due(self, server: Server) -> bool:
+        """
+        Hardware specs are refreshed at most once a day
+        """
+        return (not server.specs or not server.specs.last_updated or
+                (datetime.utcnow() - server.specs.last_updated).days >= 1)
+    
+    def _probe_server(self, server_id: int, name: str, ip: str, port: int, user: str,
+                      connect_args: Dict[str, Any], want_specs: bool) -> Dict[str, Any]:
+        """
+        Run the SSH side of monitoring one server; runs on the probe pool
+        and touches no database state
+        """
+        probe = {'connected': True, 'online': False, 'metrics': None, 'hardware_info': None}
+        
+        # Connect to server if not already connected
+        success, message = self._ensure_connected(server_id, ip, port, user, connect_args)
+        if not success:
+            self.logger.error(f"Failed to connect to server {name}: {message}")
+            probe['connected'] = False
+            return probe
+        
+        # Get performance metrics; a successful read doubles as the liveness check
+        probe['metrics'] = ssh_service.get_metrics(server_id)
+        probe['online'] = probe['metrics'] is not None
+        
+        # Get hardware info (less frequently)
+        if want_specs:
+            probe['hardware_info'] = ssh_service.get_hardware_info(server_id)
+        
+        return probe
+    
+    def _apply_probe(self, server: Server, probe: Dict[str, Any],
+                     broadcasts: List[Tuple[dict, str]]) -> List[Dict[str, Any]]:
+        """
+        Stage one probe's status and spec changes on the session-attached
+        server and return its metric rows; the WebSocket messages go to
+        broadcasts, which the caller sends once it has inserted and committed
+        """
+        server_id = server.id
+        
+        # Update server status
+        if probe['online']:
+            if server.status != 'online':
+                server.status = "online"
+                server.last_connected = datetime.utcnow()
+                broadcasts.append((self._status_message(server_id, server.name, 'online'), "status_update"))
+        else:
+            if server.status != 'offline':
+                server.status = "offline"
+                broadcasts.append((self._status_message(server_id, server.name, 'offline'), "status_update"))
+        if not probe['connected']:
+            return []
+        
+        rows = []
+        metrics = probe['metrics']
+        if metrics:
+            rows = self._metric_rows(server_id, metrics)
+            
+            # Broadcast metrics via WebSocket
+            if self.websocket_manager:
+                metrics_message = {
+                    "type": "metrics_update",
+                    "server_id": server_id,
+                    "server_name": server.name,
+                    "metrics": metrics,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+                broadcasts.append((metrics_message, "metrics_update"))
+        
+        if probe['hardware_info']:
+            self._update_server_specs(server, probe['hardware_info'])
+        
+        return rows
+    
     def _broadcast_websocket_message(self, message_data: dict, subscription_type: str) -> None:
         """
-        Thread-safe WebSocket broadcasting using asyncio.run() in a new event loop
+        Thread-safe WebSocket broadcasting; updates are coalesced per type
+        and flushed by the server event loop
         """
         if self.websocket_manager:
             try:
-                import asyncio
-                # Create a new event loop for this thread
-                asyncio.run(self.websocket_manager.broadcast(json.dumps(message_data), subscription_type))
+                self.websocket_manager.enqueue(subscription_type, message_data)
             except Exception as e:
                 self.logger.error(f"Failed to broadcast WebSocket message: {e}")
     
+    def _status_message(self, server_id: int, server_name: str, status: str) -> dict:
+        """
+        WebSocket payload announcing a server status change
+        """
+        return {
+            "type": "server_status_change",
+            "server_id": server_id,
+            "server_name": server_name,
+            "status": status,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
     def _broadcast_status_change_async(self, server_id: int, server_name: str, status: str) -> None:
         """
         Broadcast server status change via WebSocket (async version)
         """
         if self.websocket_manager:
-            status_message = {
-                "type": "server_status_change",
-                "server_id": server_id,
-                "server_name": server_name,
-                "status": status,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            self._broadcast_websocket_message(status_message, "status_update")
+            self._broadcast_websocket_message(self._status_message(server_id, server_name, status),
+                                              "status_update")
     
     def _broadcast_status_change(self, server_id: int, server_name: str, status: str) -> None:
         """
@@ -333,78 +461,143 @@ class MonitoringService:
         """
         self._broadcast_status_change_async(server_id, server_name, status)
     
-    def _store_metrics(self, server_id: int, metrics: Dict[str, Any]) -> None:
+    def _metric_rows(self, server_id: int, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Turn one metrics reading into Metric row dicts
+        """
+        now = datetime.utcnow()
+        rows = []
+        
+        # CPU metrics
+        if metrics.get('cpu_usage') is not None:
+            rows.append({'server_id': server_id, 'metric_type': 'cpu',
+                         'value': metrics['cpu_usage'], 'timestamp': now})
+            
+        # Memory metrics
+        if metrics.get('memory_usage') is not None:
+            rows.append({'server_id': server_id, 'metric_type': 'memory',
+                         'value': metrics['memory_usage'], 'timestamp': now})
+            
+        # Disk metrics
+        if 'disk_usage' in metrics:
+            for disk in metrics['disk_usage']:
+                rows.append({'server_id': server_id,
+                             'metric_type': f"disk_{disk['mount_point'].replace('/', '_')}",
+                             'value': disk, 'timestamp': now})
+        
+        return rows
+    
+    def _accumulate_rollups(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fold new samples into the open rollup buckets, returning rows for
+        the buckets that a newer sample has closed
+        """
+        closed = []
+        for row in rows:
+            value = _headline_value(row['metric_type'], row['value'])
+            if value is None:
+                continue
+            seconds = int((row['timestamp'] - EPOCH).total_seconds())
+            for granularity in ROLLUP_GRANULARITIES:
+                bucket = EPOCH + timedelta(seconds=seconds - seconds % granularity)
+                key = (row['server_id'], row['metric_type'], granularity)
+                acc = self._rollups.get(key)
+                if acc is not None and acc[0] != bucket:
+                    closed.append(self._rollup_row(key, acc))
+                    acc = None
+                if acc is None:
+                    self._rollups[key] = [bucket, value, value, value, 1]
+                else:
+                    acc[1] = min(acc[1], value)
+                    acc[2] = max(acc[2], value)
+                    acc[3] += value
+                    acc[4] += 1
+        return closed
+    
+    def _restore_rollups(self) -> None:
         """
-        Store performance metrics in the database
+        Rebuild the open rollup buckets from the raw metrics of the last
+        hour or so, since they only live in memory; buckets that closed
+        while the service was down are stored unless already present
         """
+        since = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
         db = self.Session()
         try:
-            # Store CPU metrics
-            if 'cpu_usage' in metrics:
-                cpu_metric = Metric(
-                    server_id=server_id,
-                    metric_type='cpu',
-                    value=json.dumps(metrics['cpu_usage']),
-                    timestamp=datetime.utcnow()
-                )
-                db.add(cpu_metric)
-                
-            # Store memory metrics
-            if 'memory_usage' in metrics:
-                memory_metric = Metric(
-                    server_id=server_id,
-                    metric_type='memory',
-                    value=json.dumps(metrics['memory_usage']),
-                    timestamp=datetime.utcnow()
-                )
-                db.add(memory_metric)
-                
-            # Store disk metrics  
-            if 'disk_usage' in metrics:
-                for disk in metrics['disk_usage']:
-                    disk_metric = Metric(
-                        server_id=server_id,
-                        metric_type=f"disk_{disk['mount_point'].replace('/', '_')}",
-                        value=json.dumps(disk),
-                        timestamp=datetime.utcnow()
-                    )
-                    db.add(disk_metric)
-                    
-            db.commit()
-            self.logger.info(f"Stored metrics for server {server_id}")
+            samples = db.execute(
+                select(Metric.server_id, Metric.metric_type, Metric.value, Metric.timestamp)
+                .where(Metric.timestamp >= since)
+                .order_by(Metric.timestamp)
+            ).all()
+            self._rollups = {}
+            closed = self._accumulate_rollups([
+                {'server_id': server_id, 'metric_type': metric_type, 'value': value, 'timestamp': timestamp}
+                for server_id, metric_type, value, timestamp in samples
+            ])
             
+            stored = set(db.execute(
+                select(MetricRollup.server_id, MetricRollup.metric_type,
+                       MetricRollup.granularity, MetricRollup.bucket)
+                .where(MetricRollup.bucket >= since)
+            ).all())
+            missing = [row for row in closed
+                       if (row['server_id'], row['metric_type'], row['granularity'], row['bucket']) not in stored]
+            bulk_insert(db, MetricRollup, missing)
+            db.commit()
+            self.logger.info(f"Restored {len(self._rollups)} open rollup buckets from {len(samples)} metrics")
         except Exception as e:
             db.rollback()
-            self.logger.error(f"Error storing metrics for server {server_id}: {e}")
+            self.logger.error(f"Error restoring rollup buckets: {e}")
         finally:
             db.close()
     
-    def _update_server_specs(self, server: Server, hardware_info: Dict[str, Any]) -> None:
+    def _rollup_row(self, key: tuple, acc: list) -> Dict[str, Any]:
+        server_id, metric_type, granularity = key
+        bucket, min_v, max_v, sum_v, count_v = acc
+        return {
+            'server_id': server_id,
+            'metric_type': metric_type,
+            'granularity': granularity,
+            'bucket': bucket,
+            'min_v': min_v,
+            'max_v': max_v,
+            'avg_v': sum_v / count_v,
+            'sum_v': sum_v,
+            'count_v': count_v
+        }
+    
+    def _archive_old_metrics(self) -> None:
         """
-        Update server hardware specifications
+        Compact raw metrics past the archive window into hourly blocks
         """
+        # Only whole hours, so a block never has to be reopened
+        cutoff = (datetime.utcnow() - self.archive_after).replace(minute=0, second=0, microsecond=0)
         db = self.Session()
         try:
-            if not server.specs:
-                server.specs = ServerSpec()
-                
-            server.specs.cpu_model = hardware_info.get('cpu_model', '')
-            server.specs.cpu_cores = hardware_info.get('cpu_cores', 0)
-            server.specs.cpu_threads = hardware_info.get('cpu_threads', 0)
-            server.specs.total_ram = hardware_info.get('total_ram', '')
-            server.specs.disk_info = json.dumps(hardware_info.get('disks', []))
-            server.specs.os_info = hardware_info.get('os_info', '')
-            server.specs.last_updated = datetime.utcnow()
-            
-            db.commit()
-            self.logger.info(f"Updated hardware specs for server {server.id}")
-            
+            while archive_metrics(db, cutoff):
+                db.commit()
         except Exception as e:
             db.rollback()
-            self.logger.error(f"Error updating hardware specs for server {server.id}: {e}")
+            self.logger.error(f"Error archiving metrics: {e}")
         finally:
             db.close()
     
+    def _update_server_specs(self, server: Server, hardware_info: Dict[str, Any]) -> None:
+        """
+        Update server hardware specifications on a session-attached server;
+        the caller commits
+        """
+        if not server.specs:
+            server.specs = ServerSpec()
+            
+        server.specs.cpu_model = hardware_info.get('cpu_model', '')
+        server.specs.cpu_cores = hardware_info.get('cpu_cores', 0)
+        server.specs.cpu_threads = hardware_info.get('cpu_threads', 0)
+        server.specs.total_ram = hardware_info.get('total_ram', '')
+        server.specs.disk_info = json.dumps(hardware_info.get('disks', []))
+        server.specs.os_info = hardware_info.get('os_info', '')
+        server.specs.last_updated = datetime.utcnow()
+        self.logger.info(f"Updated hardware specs for server {server.id}")
+    
     def _execute_custom_commands(self) -> None:
         """
         Execute custom commands for all servers that have them configured
@@ -422,14 +615,8 @@ class MonitoringService:
                         if not server:
                             continue
                             
-                        use_key = server.use_key and server.ssh_key_path
-                        success, message = ssh_service.connect(
-                            server_id=command.server_id,
-                            hostname=server.ip,
-                            port=server.port,
-                            username=server.user,
-                            password=server.password_encrypted if not use_key else None,
-                            key_path=server.ssh_key_path if use_key else None
+                        success, message = self._ensure_connected(
+                            command.server_id, server.ip, server.port, server.user, self._connect_args(db, server)
                         )
                         
                         if not success:
@@ -442,8 +629,13 @@ class MonitoringService:
                     if success:
                         self.logger.info(f"Command '{command.name}' completed successfully on server {command.server_id}")
                         
-                        # Store the result
-                        # TODO: Implement result storage
+                        # Store the result, with the value extracted by the command's regex
+                        db.add(CommandResult(
+                            command_id=command.id,
+                            output=stdout,
+                            parsed_value=self._parse_command_output(command.regex_pattern, stdout)
+                        ))
+                        db.commit()
                         
                     else:
                         self.logger.error(f"Command '{command.name}' failed on server {command.server_id}: {stderr}")
@@ -453,6 +645,23 @@ class MonitoringService:
         finally:
             db.close()
     
+    def _parse_command_output(self, pattern: Optional[str], output: str) -> Optional[str]:
+        """
+        Extract a value from command output: the first capture group if the
+        pattern has one, otherwise the whole match
+        """
+        if not pattern:
+            return None
+        try:
+            match = _compiled_pattern(pattern).search(output)
+        except re.error as e:
+            self.logger.error(f"Invalid command regex {pattern!r}: {e}")
+            return None
+        if not match:
+            return None
+        value = match.group(1) if match.groups() else match.group(0)
+        return value[:255] if value is not None else None
+    
     def get_server_status(self, server_id: int) -> Optional[str]:
         """
         Get current status of a specific server
@@ -12,6 +12,15 @@ from typing import Optional, Dict, Any, Tuple
 import logging
 from datetime import datetime
 
+# CPU, memory and disk probes fused into one command so a metrics read costs
+# a single SSH channel round trip
+METRICS_SECTION_MARKER = '--msm-section--'
+METRICS_COMMAND = (
+    f"top -bn1 | grep 'Cpu(s)'; echo '{METRICS_SECTION_MARKER}'; "
+    f"free -m; echo '{METRICS_SECTION_MARKER}'; "
+    "df -h"
+)
+
 class SSHService:
     """
     Service for managing SSH connections to remote servers
@@ -21,6 +30,7 @@ class SSHService:
     def __init__(self):
         self.logger = logging.getLogger('SSHService')
         self._lock = threading.Lock()  # Thread safety lock
+        self._connect_locks = {}  # server_id: lock held while (re)connecting that server
         self.clients = {}  # server_id: {'ssh': ssh_client, 'last_used': timestamp, 'connection_info': dict}
         self.connection_timeout = 300  # 5 minutes timeout for idle connections
         self.max_retries = 3
@@ -32,7 +42,10 @@ class SSHService:
         Establish SSH connection to a server with retry logic and thread safety
         Returns (success, message)
         """
+        # Serialize per server only, so different servers connect in parallel
         with self._lock:
+            connect_lock = self._connect_locks.setdefault(server_id, threading.Lock())
+        with connect_lock:
             # Check if already connected and connection is still valid
             if server_id in self.clients:
                 client_info = self.clients[server_id]
@@ -49,7 +62,8 @@ class SSHService:
                         return True, "Already connected"
                 except:
                     # Connection is dead, remove it
-                    self._remove_connection(server_id)
+                    with self._lock:
+                        self._remove_connection(server_id)
             
             # Try to connect with retries
             for attempt in range(self.max_retries):
@@ -74,16 +88,17 @@ class SSHService:
                     ssh.get_transport().set_keepalive(30)
                     
                     # Store the active connection with metadata
-                    self.clients[server_id] = {
-                        'ssh': ssh,
-                        'last_used': time.time(),
-                        'connection_info': {
-                            'hostname': hostname,
-                            'port': port,
-                            'username': username,
-                            'connected_at': datetime.utcnow()
+                    with self._lock:
+                        self.clients[server_id] = {
+                            'ssh': ssh,
+                            'last_used': time.time(),
+                            'connection_info': {
+                                'hostname': hostname,
+                                'port': port,
+                                'username': username,
+                                'connected_at': datetime.utcnow()
+                            }
                         }
-                    }
                     
                     self.logger.info(f"Connected to server {server_id} ({hostname}:{port})")
                     return True, "Connection successful"
@@ -206,25 +221,19 @@ class SSHService:
         try:
             ssh = self.clients[server_id]['ssh']
             
-            metrics = {}
-            
-            # CPU usage
-            stdin, stdout, stderr = ssh.exec_command("top -bn1 | grep 'Cpu(s)'")
-            cpu_output = stdout.read().decode('utf-8')
-            cpu_usage = self._extract_cpu_usage(cpu_output)
-            metrics['cpu_usage'] = cpu_usage
+            # One exec for all three probes; sections are split on a marker line
+            stdin, stdout, stderr = ssh.exec_command(METRICS_COMMAND)
+            output = stdout.read().decode('utf-8')
+            sections = output.split(METRICS_SECTION_MARKER + '\n')
+            if len(sections) != 3:
+                self.logger.error(f"Unexpected metrics output from server {server_id}")
+                return None
+            cpu_output, mem_output, disk_output = sections
             
-            # Memory usage
-            stdin, stdout, stderr = ssh.exec_command("free -m")
-            mem_output = stdout.read().decode('utf-8')
-            mem_usage = self._extract_memory_usage(mem_output)
-            metrics['memory_usage'] = mem_usage
-            
-            # Disk usage
-            stdin, stdout, stderr = ssh.exec_command("df -h")
-            disk_output = stdout.read().decode('utf-8')
-            disk_usage = self._extract_disk_usage(disk_output)
-            metrics['disk_usage'] = disk_usage
+            metrics = {}
+            metrics['cpu_usage'] = self._extract_cpu_usage(cpu_output)
+            metrics['memory_usage'] = self._extract_memory_usage(mem_output)
+            metrics['disk_usage'] = self._extract_disk_usage(disk_output)
             
             return metrics
             
@@ -1,3 +1,3 @@
 /*! For license information please see bundle.js.LICENSE.txt */
-(()=>{"use strict";var e,t,n={56:(e,t,n)=>{e.exports=function(e){var t=n.nc;t&&e.setAttribute("nonce",t)}},72:e=>{var t=[];function n(e){for(var n=-1,r=0;r<t.length;r++)if(t[r].identifier===e){n=r;break}return n}function r(e,r){for(var o={},l=[],i=0;i<e.length;i++){var c=e[i],s=r.base?c[0]+r.base:c[0],u=o[s]||0,f="".concat(s," ").concat(u);o[s]=u+1;var d=n(f),m={css:c[1],media:c[2],sourceMap:c[3],supports:c[4],layer:c[5]};if(-1!==d)t[d].references++,t[d].updater(m);else{var p=a(m,r);r.byIndex=i,t.splice(i,0,{identifier:f,updater:p,references:1})}l.push(f)}return l}function a(e,t){var n=t.domAPI(t);return n.update(e),function(t){if(t){if(t.css===e.css&&t.media===e.media&&t.sourceMap===e.sourceMap&&t.supports===e.supports&&t.layer===e.layer)return;n.update(e=t)}else n.remove()}}e.exports=function(e,a){var o=r(e=e||[],a=a||{});return function(e){e=e||[];for(var l=0;l<o.length;l++){var i=n(o[l]);t[i].references--}for(var c=r(e,a),s=0;s<o.length;s++){var u=n(o[s]);0===t[u].references&&(t[u].updater(),t.splice(u,1))}o=c}}},113:e=>{e.exports=function(e,t){if(t.styleSheet)t.styleSheet.cssText=e;else{for(;t.firstChild;)t.removeChild(t.firstChild);t.appendChild(document.createTextNode(e))}}},159:e=>{e.exports=function(e){var t=document.createElement("style");return e.setAttributes(t,e.attributes),e.insert(t,e.options),t}},287:(e,t)=>{var n=Symbol.for("react.element"),r=Symbol.for("react.portal"),a=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),l=Symbol.for("react.profiler"),i=Symbol.for("react.provider"),c=Symbol.for("react.context"),s=Symbol.for("react.forward_ref"),u=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),m=Symbol.iterator,p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h=Object.assign,v={};function g(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||p}function b(){}function A(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||p}g.prototype.isReactComponent={},g.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},g.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},b.prototype=g.prototype;var y=A.prototype=new b;y.constructor=A,h(y,g.prototype),y.isPureReactComponent=!0;var E=Array.isArray,w=Object.prototype.hasOwnProperty,x={current:null},k={key:!0,ref:!0,__self:!0,__source:!0};function S(e,t,r){var a,o={},l=null,i=null;if(null!=t)for(a in void 0!==t.ref&&(i=t.ref),void 0!==t.key&&(l=""+t.key),t)w.call(t,a)&&!k.hasOwnProperty(a)&&(o[a]=t[a]);var c=arguments.length-2;if(1===c)o.children=r;else if(1<c){for(var s=Array(c),u=0;u<c;u++)s[u]=arguments[u+2];o.children=s}if(e&&e.defaultProps)for(a in c=e.defaultProps)void 0===o[a]&&(o[a]=c[a]);return{$$typeof:n,type:e,key:l,ref:i,props:o,_owner:x.current}}function N(e){return"object"==typeof e&&null!==e&&e.$$typeof===n}var C=/\/+/g;function B(e,t){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return t[e]})}(""+e.key):t.toString(36)}function _(e,t,a,o,l){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var c=!1;if(null===e)c=!0;else switch(i){case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case n:case r:c=!0}}if(c)return l=l(c=e),e=""===o?"."+B(c,0):o,E(l)?(a="",null!=e&&(a=e.replace(C,"$&/")+"/"),_(l,t,a,"",function(e){return e})):null!=l&&(N(l)&&(l=function(e,t){return{$$typeof:n,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(l,a+(!l.key||c&&c.key===l.key?"":(""+l.key).replace(C,"$&/")+"/")+e)),t.push(l)),1;if(c=0,o=""===o?".":o+":",E(e))for(var s=0;s<e.length;s++){var u=o+B(i=e[s],s);c+=_(i,t,a,u,l)}else if(u=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=m&&e[m]||e["@@iterator"])?e:null}(e),"function"==typeof u)for(e=u.call(e),s=0;!(i=e.next()).done;)c+=_(i=i.value,t,a,u=o+B(i,s++),l);else if("object"===i)throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return c}function O(e,t,n){if(null==e)return e;var r=[],a=0;return _(e,r,"","",function(e){return t.call(n,e,a++)}),r}function P(e){if(-1===e._status){var t=e._result;(t=t()).then(function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)},function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)}),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var j={current:null},M={transition:null},T={ReactCurrentDispatcher:j,ReactCurrentBatchConfig:M,ReactCurrentOwner:x};function z(){throw Error("act(...) is not supported in production builds of React.")}t.Children={map:O,forEach:function(e,t,n){O(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return O(e,function(){t++}),t},toArray:function(e){return O(e,function(e){return e})||[]},only:function(e){if(!N(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=g,t.Fragment=a,t.Profiler=l,t.PureComponent=A,t.StrictMode=o,t.Suspense=u,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=T,t.act=z,t.cloneElement=function(e,t,r){if(null==e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var a=h({},e.props),o=e.key,l=e.ref,i=e._owner;if(null!=t){if(void 0!==t.ref&&(l=t.ref,i=x.current),void 0!==t.key&&(o=""+t.key),e.type&&e.type.defaultProps)var c=e.type.defaultProps;for(s in t)w.call(t,s)&&!k.hasOwnProperty(s)&&(a[s]=void 0===t[s]&&void 0!==c?c[s]:t[s])}var s=arguments.length-2;if(1===s)a.children=r;else if(1<s){c=Array(s);for(var u=0;u<s;u++)c[u]=arguments[u+2];a.children=c}return{$$typeof:n,type:e.type,key:o,ref:l,props:a,_owner:i}},t.createContext=function(e){return(e={$$typeof:c,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:i,_context:e},e.Consumer=e},t.createElement=S,t.createFactory=function(e){var t=S.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:s,render:e}},t.isValidElement=N,t.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:P}},t.memo=function(e,t){return{$$typeof:f,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=M.transition;M.transition={};try{e()}finally{M.transition=t}},t.unstable_act=z,t.useCallback=function(e,t){return j.current.useCallback(e,t)},t.useContext=function(e){return j.current.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e){return j.current.useDeferredValue(e)},t.useEffect=function(e,t){return j.current.useEffect(e,t)},t.useId=function(){return j.current.useId()},t.useImperativeHandle=function(e,t,n){return j.current.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return j.current.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return j.current.useLayoutEffect(e,t)},t.useMemo=function(e,t){return j.current.useMemo(e,t)},t.useReducer=function(e,t,n){return j.current.useReducer(e,t,n)},t.useRef=function(e){return j.current.useRef(e)},t.useState=function(e){return j.current.useState(e)},t.useSyncExternalStore=function(e,t,n){return j.current.useSyncExternalStore(e,t,n)},t.useTransition=function(){return j.current.useTransition()},t.version="18.3.1"},314:e=>{e.exports=function(e){var t=[];return t.toString=function(){return this.map(function(t){var n="",r=void 0!==t[5];return t[4]&&(n+="@supports (".concat(t[4],") {")),t[2]&&(n+="@media ".concat(t[2]," {")),r&&(n+="@layer".concat(t[5].length>0?" ".concat(t[5]):""," {")),n+=e(t),r&&(n+="}"),t[2]&&(n+="}"),t[4]&&(n+="}"),n}).join("")},t.i=function(e,n,r,a,o){"string"==typeof e&&(e=[[null,e,void 0]]);var l={};if(r)for(var i=0;i<this.length;i++){var c=this[i][0];null!=c&&(l[c]=!0)}for(var s=0;s<e.length;s++){var u=[].concat(e[s]);r&&l[u[0]]||(void 0!==o&&(void 0===u[5]||(u[1]="@layer".concat(u[5].length>0?" ".concat(u[5]):""," {").concat(u[1],"}")),u[5]=o),n&&(u[2]?(u[1]="@media ".concat(u[2]," {").concat(u[1],"}"),u[2]=n):u[2]=n),a&&(u[4]?(u[1]="@supports (".concat(u[4],") {").concat(u[1],"}"),u[4]=a):u[4]="".concat(a)),t.push(u))}},t}},338:(e,t,n)=>{var r=n(961);t.createRoot=r.createRoot,t.hydrateRoot=r.hydrateRoot},354:e=>{e.exports=function(e){var t=e[1],n=e[3];if(!n)return t;if("function"==typeof btoa){var r=btoa(unescape(encodeURIComponent(JSON.stringify(n)))),a="sourceMappingURL=data:application/json;charset=utf-8;base64,".concat(r),o="/*# ".concat(a," */");return[t].concat([o]).join("\n")}return[t].join("\n")}},463:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,a=e[r];if(!(0<o(a,t)))break e;e[r]=t,e[n]=a,n=r}}function r(e){return 0===e.length?null:e[0]}function a(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,a=e.length,l=a>>>1;r<l;){var i=2*(r+1)-1,c=e[i],s=i+1,u=e[s];if(0>o(c,n))s<a&&0>o(u,c)?(e[r]=u,e[s]=n,r=s):(e[r]=c,e[i]=n,r=i);else{if(!(s<a&&0>o(u,n)))break e;e[r]=u,e[s]=n,r=s}}}return t}function o(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if("object"==typeof performance&&"function"==typeof performance.now){var l=performance;t.unstable_now=function(){return l.now()}}else{var i=Date,c=i.now();t.unstable_now=function(){return i.now()-c}}var s=[],u=[],f=1,d=null,m=3,p=!1,h=!1,v=!1,g="function"==typeof setTimeout?setTimeout:null,b="function"==typeof clearTimeout?clearTimeout:null,A="undefined"!=typeof setImmediate?setImmediate:null;function y(e){for(var t=r(u);null!==t;){if(null===t.callback)a(u);else{if(!(t.startTime<=e))break;a(u),t.sortIndex=t.expirationTime,n(s,t)}t=r(u)}}function E(e){if(v=!1,y(e),!h)if(null!==r(s))h=!0,M(w);else{var t=r(u);null!==t&&T(E,t.startTime-e)}}function w(e,n){h=!1,v&&(v=!1,b(N),N=-1),p=!0;var o=m;try{for(y(n),d=r(s);null!==d&&(!(d.expirationTime>n)||e&&!_());){var l=d.callback;if("function"==typeof l){d.callback=null,m=d.priorityLevel;var i=l(d.expirationTime<=n);n=t.unstable_now(),"function"==typeof i?d.callback=i:d===r(s)&&a(s),y(n)}else a(s);d=r(s)}if(null!==d)var c=!0;else{var f=r(u);null!==f&&T(E,f.startTime-n),c=!1}return c}finally{d=null,m=o,p=!1}}"undefined"!=typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var x,k=!1,S=null,N=-1,C=5,B=-1;function _(){return!(t.unstable_now()-B<C)}function O(){if(null!==S){var e=t.unstable_now();B=e;var n=!0;try{n=S(!0,e)}finally{n?x():(k=!1,S=null)}}else k=!1}if("function"==typeof A)x=function(){A(O)};else if("undefined"!=typeof MessageChannel){var P=new MessageChannel,j=P.port2;P.port1.onmessage=O,x=function(){j.postMessage(null)}}else x=function(){g(O,0)};function M(e){S=e,k||(k=!0,x())}function T(e,n){N=g(function(){e(t.unstable_now())},n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){h||p||(h=!0,M(w))},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):C=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return m},t.unstable_getFirstCallbackNode=function(){return r(s)},t.unstable_next=function(e){switch(m){case 1:case 2:case 3:var t=3;break;default:t=m}var n=m;m=t;try{return e()}finally{m=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=function(){},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=m;m=e;try{return t()}finally{m=n}},t.unstable_scheduleCallback=function(e,a,o){var l=t.unstable_now();switch(o="object"==typeof o&&null!==o&&"number"==typeof(o=o.delay)&&0<o?l+o:l,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:f++,callback:a,priorityLevel:e,startTime:o,expirationTime:i=o+i,sortIndex:-1},o>l?(e.sortIndex=o,n(u,e),null===r(s)&&e===r(u)&&(v?(b(N),N=-1):v=!0,T(E,o-l))):(e.sortIndex=i,n(s,e),h||p||(h=!0,M(w))),e},t.unstable_shouldYield=_,t.unstable_wrapCallback=function(e){var t=m;return function(){var n=m;m=t;try{return e.apply(this,arguments)}finally{m=n}}}},540:(e,t,n)=>{e.exports=n(287)},551:(e,t,n)=>{var r=n(540),a=n(982);function o(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var l=new Set,i={};function c(e,t){s(e,t),s(e+"Capture",t)}function s(e,t){for(i[e]=t,e=0;e<t.length;e++)l.add(t[e])}var u=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),f=Object.prototype.hasOwnProperty,d=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,m={},p={};function h(e,t,n,r,a,o,l){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=a,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=l}var v={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){v[e]=new h(e,0,!1,e,null,!1,!1)}),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];v[t]=new h(t,1,!1,e[1],null,!1,!1)}),["contentEditable","draggable","spellCheck","value"].forEach(function(e){v[e]=new h(e,2,!1,e.toLowerCase(),null,!1,!1)}),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){v[e]=new h(e,2,!1,e,null,!1,!1)}),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){v[e]=new h(e,3,!1,e.toLowerCase(),null,!1,!1)}),["checked","multiple","muted","selected"].forEach(function(e){v[e]=new h(e,3,!0,e,null,!1,!1)}),["capture","download"].forEach(function(e){v[e]=new h(e,4,!1,e,null,!1,!1)}),["cols","rows","size","span"].forEach(function(e){v[e]=new h(e,6,!1,e,null,!1,!1)}),["rowSpan","start"].forEach(function(e){v[e]=new h(e,5,!1,e.toLowerCase(),null,!1,!1)});var g=/[\-:]([a-z])/g;function b(e){return e[1].toUpperCase()}function A(e,t,n,r){var a=v.hasOwnProperty(t)?v[t]:null;(null!==a?0!==a.type:r||!(2<t.length)||"o"!==t[0]&&"O"!==t[0]||"n"!==t[1]&&"N"!==t[1])&&(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,a,r)&&(n=null),r||null===a?function(e){return!!f.call(p,e)||!f.call(m,e)&&(d.test(e)?p[e]=!0:(m[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):a.mustUseProperty?e[a.propertyName]=null===n?3!==a.type&&"":n:(t=a.attributeName,r=a.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(a=a.type)||4===a&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,null,!1,!1)}),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)}),["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)}),["tabIndex","crossOrigin"].forEach(function(e){v[e]=new h(e,1,!1,e.toLowerCase(),null,!1,!1)}),v.xlinkHref=new h("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach(function(e){v[e]=new h(e,1,!1,e.toLowerCase(),null,!0,!0)});var y=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,E=Symbol.for("react.element"),w=Symbol.for("react.portal"),x=Symbol.for("react.fragment"),k=Symbol.for("react.strict_mode"),S=Symbol.for("react.profiler"),N=Symbol.for("react.provider"),C=Symbol.for("react.context"),B=Symbol.for("react.forward_ref"),_=Symbol.for("react.suspense"),O=Symbol.for("react.suspense_list"),P=Symbol.for("react.memo"),j=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var M=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var T=Symbol.iterator;function z(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=T&&e[T]||e["@@iterator"])?e:null}var L,D=Object.assign;function R(e){if(void 0===L)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);L=t&&t[1]||""}return"\n"+L+e}var F=!1;function I(e,t){if(!e||F)return"";F=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(e){var r=e}Reflect.construct(e,[],t)}else{try{t.call()}catch(e){r=e}e.call(t.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(t){if(t&&r&&"string"==typeof t.stack){for(var a=t.stack.split("\n"),o=r.stack.split("\n"),l=a.length-1,i=o.length-1;1<=l&&0<=i&&a[l]!==o[i];)i--;for(;1<=l&&0<=i;l--,i--)if(a[l]!==o[i]){if(1!==l||1!==i)do{if(l--,0>--i||a[l]!==o[i]){var c="\n"+a[l].replace(" at new "," at ");return e.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",e.displayName)),c}}while(1<=l&&0<=i);break}}}finally{F=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?R(e):""}function U(e){switch(e.tag){case 5:return R(e.type);case 16:return R("Lazy");case 13:return R("Suspense");case 19:return R("SuspenseList");case 0:case 2:case 15:return I(e.type,!1);case 11:return I(e.type.render,!1);case 1:return I(e.type,!0);default:return""}}function W(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case x:return"Fragment";case w:return"Portal";case S:return"Profiler";case k:return"StrictMode";case _:return"Suspense";case O:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case C:return(e.displayName||"Context")+".Consumer";case N:return(e._context.displayName||"Context")+".Provider";case B:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case P:return null!==(t=e.displayName||null)?t:W(e.type)||"Memo";case j:t=e._payload,e=e._init;try{return W(e(t))}catch(e){}}return null}function H(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=t.render).displayName||e.name||"",t.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return W(t);case 8:return t===k?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"==typeof t)return t.displayName||t.name||null;if("string"==typeof t)return t}return null}function $(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function q(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function V(e){e._valueTracker||(e._valueTracker=function(e){var t=q(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var a=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return a.call(this)},set:function(e){r=""+e,o.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function G(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=q(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function Q(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Y(e,t){var n=t.checked;return D({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function K(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=$(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function X(e,t){null!=(t=t.checked)&&A(e,"checked",t,!1)}function J(e,t){X(e,t);var n=$(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?ee(e,t.type,n):t.hasOwnProperty("defaultValue")&&ee(e,t.type,$(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function Z(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function ee(e,t,n){"number"===t&&Q(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var te=Array.isArray;function ne(e,t,n,r){if(e=e.options,t){t={};for(var a=0;a<n.length;a++)t["$"+n[a]]=!0;for(n=0;n<e.length;n++)a=t.hasOwnProperty("$"+e[n].value),e[n].selected!==a&&(e[n].selected=a),a&&r&&(e[n].defaultSelected=!0)}else{for(n=""+$(n),t=null,a=0;a<e.length;a++){if(e[a].value===n)return e[a].selected=!0,void(r&&(e[a].defaultSelected=!0));null!==t||e[a].disabled||(t=e[a])}null!==t&&(t.selected=!0)}}function re(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(o(91));return D({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function ae(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(o(92));if(te(n)){if(1<n.length)throw Error(o(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:$(n)}}function oe(e,t){var n=$(t.value),r=$(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function le(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}function ie(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ce(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?ie(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var se,ue,fe=(ue=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((se=se||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=se.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction(function(){return ue(e,t)})}:ue);function de(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var me={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},pe=["Webkit","ms","Moz","O"];function he(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||me.hasOwnProperty(e)&&me[e]?(""+t).trim():t+"px"}function ve(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),a=he(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,a):e[n]=a}}Object.keys(me).forEach(function(e){pe.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),me[t]=me[e]})});var ge=D({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function be(e,t){if(t){if(ge[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(o(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(o(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(o(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(o(62))}}function Ae(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ye=null;function Ee(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var we=null,xe=null,ke=null;function Se(e){if(e=Aa(e)){if("function"!=typeof we)throw Error(o(280));var t=e.stateNode;t&&(t=Ea(t),we(e.stateNode,e.type,t))}}function Ne(e){xe?ke?ke.push(e):ke=[e]:xe=e}function Ce(){if(xe){var e=xe,t=ke;if(ke=xe=null,Se(e),t)for(e=0;e<t.length;e++)Se(t[e])}}function Be(e,t){return e(t)}function _e(){}var Oe=!1;function Pe(e,t,n){if(Oe)return e(t,n);Oe=!0;try{return Be(e,t,n)}finally{Oe=!1,(null!==xe||null!==ke)&&(_e(),Ce())}}function je(e,t){var n=e.stateNode;if(null===n)return null;var r=Ea(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(o(231,t,typeof n));return n}var Me=!1;if(u)try{var Te={};Object.defineProperty(Te,"passive",{get:function(){Me=!0}}),window.addEventListener("test",Te,Te),window.removeEventListener("test",Te,Te)}catch(ue){Me=!1}function ze(e,t,n,r,a,o,l,i,c){var s=Array.prototype.slice.call(arguments,3);try{t.apply(n,s)}catch(e){this.onError(e)}}var Le=!1,De=null,Re=!1,Fe=null,Ie={onError:function(e){Le=!0,De=e}};function Ue(e,t,n,r,a,o,l,i,c){Le=!1,De=null,ze.apply(Ie,arguments)}function We(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{!!(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function He(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function $e(e){if(We(e)!==e)throw Error(o(188))}function qe(e){return null!==(e=function(e){var t=e.alternate;if(!t){if(null===(t=We(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var a=n.return;if(null===a)break;var l=a.alternate;if(null===l){if(null!==(r=a.return)){n=r;continue}break}if(a.child===l.child){for(l=a.child;l;){if(l===n)return $e(a),e;if(l===r)return $e(a),t;l=l.sibling}throw Error(o(188))}if(n.return!==r.return)n=a,r=l;else{for(var i=!1,c=a.child;c;){if(c===n){i=!0,n=a,r=l;break}if(c===r){i=!0,r=a,n=l;break}c=c.sibling}if(!i){for(c=l.child;c;){if(c===n){i=!0,n=l,r=a;break}if(c===r){i=!0,r=l,n=a;break}c=c.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(e))?Ve(e):null}function Ve(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var t=Ve(e);if(null!==t)return t;e=e.sibling}return null}var Ge=a.unstable_scheduleCallback,Qe=a.unstable_cancelCallback,Ye=a.unstable_shouldYield,Ke=a.unstable_requestPaint,Xe=a.unstable_now,Je=a.unstable_getCurrentPriorityLevel,Ze=a.unstable_ImmediatePriority,et=a.unstable_UserBlockingPriority,tt=a.unstable_NormalPriority,nt=a.unstable_LowPriority,rt=a.unstable_IdlePriority,at=null,ot=null,lt=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(it(e)/ct|0)|0},it=Math.log,ct=Math.LN2,st=64,ut=4194304;function ft(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function dt(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,a=e.suspendedLanes,o=e.pingedLanes,l=268435455&n;if(0!==l){var i=l&~a;0!==i?r=ft(i):0!==(o&=l)&&(r=ft(o))}else 0!==(l=n&~a)?r=ft(l):0!==o&&(r=ft(o));if(0===r)return 0;if(0!==t&&t!==r&&0===(t&a)&&((a=r&-r)>=(o=t&-t)||16===a&&4194240&o))return t;if(4&r&&(r|=16&n),0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)a=1<<(n=31-lt(t)),r|=e[n],t&=~a;return r}function mt(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function pt(e){return 0!=(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function ht(){var e=st;return!(4194240&(st<<=1))&&(st=64),e}function vt(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function gt(e,t,n){e.pendingLanes|=t,536870912!==t&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[t=31-lt(t)]=n}function bt(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-lt(n),a=1<<r;a&t|e[r]&t&&(e[r]|=t),n&=~a}}var At=0;function yt(e){return 1<(e&=-e)?4<e?268435455&e?16:536870912:4:1}var Et,wt,xt,kt,St,Nt=!1,Ct=[],Bt=null,_t=null,Ot=null,Pt=new Map,jt=new Map,Mt=[],Tt="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function zt(e,t){switch(e){case"focusin":case"focusout":Bt=null;break;case"dragenter":case"dragleave":_t=null;break;case"mouseover":case"mouseout":Ot=null;break;case"pointerover":case"pointerout":Pt.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":jt.delete(t.pointerId)}}function Lt(e,t,n,r,a,o){return null===e||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[a]},null!==t&&null!==(t=Aa(t))&&wt(t),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==a&&-1===t.indexOf(a)&&t.push(a),e)}function Dt(e){var t=ba(e.target);if(null!==t){var n=We(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=He(n)))return e.blockedOn=t,void St(e.priority,function(){xt(n)})}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Rt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Yt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=Aa(n))&&wt(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);ye=r,n.target.dispatchEvent(r),ye=null,t.shift()}return!0}function Ft(e,t,n){Rt(e)&&n.delete(t)}function It(){Nt=!1,null!==Bt&&Rt(Bt)&&(Bt=null),null!==_t&&Rt(_t)&&(_t=null),null!==Ot&&Rt(Ot)&&(Ot=null),Pt.forEach(Ft),jt.forEach(Ft)}function Ut(e,t){e.blockedOn===t&&(e.blockedOn=null,Nt||(Nt=!0,a.unstable_scheduleCallback(a.unstable_NormalPriority,It)))}function Wt(e){function t(t){return Ut(t,e)}if(0<Ct.length){Ut(Ct[0],e);for(var n=1;n<Ct.length;n++){var r=Ct[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==Bt&&Ut(Bt,e),null!==_t&&Ut(_t,e),null!==Ot&&Ut(Ot,e),Pt.forEach(t),jt.forEach(t),n=0;n<Mt.length;n++)(r=Mt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<Mt.length&&null===(n=Mt[0]).blockedOn;)Dt(n),null===n.blockedOn&&Mt.shift()}var Ht=y.ReactCurrentBatchConfig,$t=!0;function qt(e,t,n,r){var a=At,o=Ht.transition;Ht.transition=null;try{At=1,Gt(e,t,n,r)}finally{At=a,Ht.transition=o}}function Vt(e,t,n,r){var a=At,o=Ht.transition;Ht.transition=null;try{At=4,Gt(e,t,n,r)}finally{At=a,Ht.transition=o}}function Gt(e,t,n,r){if($t){var a=Yt(e,t,n,r);if(null===a)$r(e,t,r,Qt,n),zt(e,r);else if(function(e,t,n,r,a){switch(t){case"focusin":return Bt=Lt(Bt,e,t,n,r,a),!0;case"dragenter":return _t=Lt(_t,e,t,n,r,a),!0;case"mouseover":return Ot=Lt(Ot,e,t,n,r,a),!0;case"pointerover":var o=a.pointerId;return Pt.set(o,Lt(Pt.get(o)||null,e,t,n,r,a)),!0;case"gotpointercapture":return o=a.pointerId,jt.set(o,Lt(jt.get(o)||null,e,t,n,r,a)),!0}return!1}(a,e,t,n,r))r.stopPropagation();else if(zt(e,r),4&t&&-1<Tt.indexOf(e)){for(;null!==a;){var o=Aa(a);if(null!==o&&Et(o),null===(o=Yt(e,t,n,r))&&$r(e,t,r,Qt,n),o===a)break;a=o}null!==a&&r.stopPropagation()}else $r(e,t,r,null,n)}}var Qt=null;function Yt(e,t,n,r){if(Qt=null,null!==(e=ba(e=Ee(r))))if(null===(t=We(e)))e=null;else if(13===(n=t.tag)){if(null!==(e=He(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Qt=e,null}function Kt(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Je()){case Ze:return 1;case et:return 4;case tt:case nt:return 16;case rt:return 536870912;default:return 16}default:return 16}}var Xt=null,Jt=null,Zt=null;function en(){if(Zt)return Zt;var e,t,n=Jt,r=n.length,a="value"in Xt?Xt.value:Xt.textContent,o=a.length;for(e=0;e<r&&n[e]===a[e];e++);var l=r-e;for(t=1;t<=l&&n[r-t]===a[o-t];t++);return Zt=a.slice(e,1<t?1-t:void 0)}function tn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function nn(){return!0}function rn(){return!1}function an(e){function t(t,n,r,a,o){for(var l in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=a,this.target=o,this.currentTarget=null,e)e.hasOwnProperty(l)&&(t=e[l],this[l]=t?t(a):a[l]);return this.isDefaultPrevented=(null!=a.defaultPrevented?a.defaultPrevented:!1===a.returnValue)?nn:rn,this.isPropagationStopped=rn,this}return D(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=nn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=nn)},persist:function(){},isPersistent:nn}),t}var on,ln,cn,sn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},un=an(sn),fn=D({},sn,{view:0,detail:0}),dn=an(fn),mn=D({},fn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Sn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==cn&&(cn&&"mousemove"===e.type?(on=e.screenX-cn.screenX,ln=e.screenY-cn.screenY):ln=on=0,cn=e),on)},movementY:function(e){return"movementY"in e?e.movementY:ln}}),pn=an(mn),hn=an(D({},mn,{dataTransfer:0})),vn=an(D({},fn,{relatedTarget:0})),gn=an(D({},sn,{animationName:0,elapsedTime:0,pseudoElement:0})),bn=D({},sn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),An=an(bn),yn=an(D({},sn,{data:0})),En={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},wn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},xn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function kn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=xn[e])&&!!t[e]}function Sn(){return kn}var Nn=D({},fn,{key:function(e){if(e.key){var t=En[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=tn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?wn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Sn,charCode:function(e){return"keypress"===e.type?tn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Cn=an(Nn),Bn=an(D({},mn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),_n=an(D({},fn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Sn})),On=an(D({},sn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Pn=D({},mn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),jn=an(Pn),Mn=[9,13,27,32],Tn=u&&"CompositionEvent"in window,zn=null;u&&"documentMode"in document&&(zn=document.documentMode);var Ln=u&&"TextEvent"in window&&!zn,Dn=u&&(!Tn||zn&&8<zn&&11>=zn),Rn=String.fromCharCode(32),Fn=!1;function In(e,t){switch(e){case"keyup":return-1!==Mn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Un(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var Wn=!1,Hn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function $n(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Hn[e.type]:"textarea"===t}function qn(e,t,n,r){Ne(r),0<(t=Vr(t,"onChange")).length&&(n=new un("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Vn=null,Gn=null;function Qn(e){Rr(e,0)}function Yn(e){if(G(ya(e)))return e}function Kn(e,t){if("change"===e)return t}var Xn=!1;if(u){var Jn;if(u){var Zn="oninput"in document;if(!Zn){var er=document.createElement("div");er.setAttribute("oninput","return;"),Zn="function"==typeof er.oninput}Jn=Zn}else Jn=!1;Xn=Jn&&(!document.documentMode||9<document.documentMode)}function tr(){Vn&&(Vn.detachEvent("onpropertychange",nr),Gn=Vn=null)}function nr(e){if("value"===e.propertyName&&Yn(Gn)){var t=[];qn(t,Gn,e,Ee(e)),Pe(Qn,t)}}function rr(e,t,n){"focusin"===e?(tr(),Gn=n,(Vn=t).attachEvent("onpropertychange",nr)):"focusout"===e&&tr()}function ar(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Yn(Gn)}function or(e,t){if("click"===e)return Yn(t)}function lr(e,t){if("input"===e||"change"===e)return Yn(t)}var ir="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t};function cr(e,t){if(ir(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var a=n[r];if(!f.call(t,a)||!ir(e[a],t[a]))return!1}return!0}function sr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function ur(e,t){var n,r=sr(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=sr(r)}}function fr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?fr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function dr(){for(var e=window,t=Q();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=Q((e=t.contentWindow).document)}return t}function mr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function pr(e){var t=dr(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&fr(n.ownerDocument.documentElement,n)){if(null!==r&&mr(n))if(t=r.start,void 0===(e=r.end)&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if((e=(t=n.ownerDocument||document)&&t.defaultView||window).getSelection){e=e.getSelection();var a=n.textContent.length,o=Math.min(r.start,a);r=void 0===r.end?o:Math.min(r.end,a),!e.extend&&o>r&&(a=r,r=o,o=a),a=ur(n,o);var l=ur(n,r);a&&l&&(1!==e.rangeCount||e.anchorNode!==a.node||e.anchorOffset!==a.offset||e.focusNode!==l.node||e.focusOffset!==l.offset)&&((t=t.createRange()).setStart(a.node,a.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(l.node,l.offset)):(t.setEnd(l.node,l.offset),e.addRange(t)))}for(t=[],e=n;e=e.parentNode;)1===e.nodeType&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"==typeof n.focus&&n.focus(),n=0;n<t.length;n++)(e=t[n]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var hr=u&&"documentMode"in document&&11>=document.documentMode,vr=null,gr=null,br=null,Ar=!1;function yr(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;Ar||null==vr||vr!==Q(r)||(r="selectionStart"in(r=vr)&&mr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},br&&cr(br,r)||(br=r,0<(r=Vr(gr,"onSelect")).length&&(t=new un("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=vr)))}function Er(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var wr={animationend:Er("Animation","AnimationEnd"),animationiteration:Er("Animation","AnimationIteration"),animationstart:Er("Animation","AnimationStart"),transitionend:Er("Transition","TransitionEnd")},xr={},kr={};function Sr(e){if(xr[e])return xr[e];if(!wr[e])return e;var t,n=wr[e];for(t in n)if(n.hasOwnProperty(t)&&t in kr)return xr[e]=n[t];return e}u&&(kr=document.createElement("div").style,"AnimationEvent"in window||(delete wr.animationend.animation,delete wr.animationiteration.animation,delete wr.animationstart.animation),"TransitionEvent"in window||delete wr.transitionend.transition);var Nr=Sr("animationend"),Cr=Sr("animationiteration"),Br=Sr("animationstart"),_r=Sr("transitionend"),Or=new Map,Pr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function jr(e,t){Or.set(e,t),c(t,[e])}for(var Mr=0;Mr<Pr.length;Mr++){var Tr=Pr[Mr];jr(Tr.toLowerCase(),"on"+(Tr[0].toUpperCase()+Tr.slice(1)))}jr(Nr,"onAnimationEnd"),jr(Cr,"onAnimationIteration"),jr(Br,"onAnimationStart"),jr("dblclick","onDoubleClick"),jr("focusin","onFocus"),jr("focusout","onBlur"),jr(_r,"onTransitionEnd"),s("onMouseEnter",["mouseout","mouseover"]),s("onMouseLeave",["mouseout","mouseover"]),s("onPointerEnter",["pointerout","pointerover"]),s("onPointerLeave",["pointerout","pointerover"]),c("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),c("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),c("onBeforeInput",["compositionend","keypress","textInput","paste"]),c("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),c("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),c("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var zr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Lr=new Set("cancel close invalid load scroll toggle".split(" ").concat(zr));function Dr(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,a,l,i,c,s){if(Ue.apply(this,arguments),Le){if(!Le)throw Error(o(198));var u=De;Le=!1,De=null,Re||(Re=!0,Fe=u)}}(r,t,void 0,e),e.currentTarget=null}function Rr(e,t){t=!!(4&t);for(var n=0;n<e.length;n++){var r=e[n],a=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var l=r.length-1;0<=l;l--){var i=r[l],c=i.instance,s=i.currentTarget;if(i=i.listener,c!==o&&a.isPropagationStopped())break e;Dr(a,i,s),o=c}else for(l=0;l<r.length;l++){if(c=(i=r[l]).instance,s=i.currentTarget,i=i.listener,c!==o&&a.isPropagationStopped())break e;Dr(a,i,s),o=c}}}if(Re)throw e=Fe,Re=!1,Fe=null,e}function Fr(e,t){var n=t[ha];void 0===n&&(n=t[ha]=new Set);var r=e+"__bubble";n.has(r)||(Hr(t,e,2,!1),n.add(r))}function Ir(e,t,n){var r=0;t&&(r|=4),Hr(n,e,r,t)}var Ur="_reactListening"+Math.random().toString(36).slice(2);function Wr(e){if(!e[Ur]){e[Ur]=!0,l.forEach(function(t){"selectionchange"!==t&&(Lr.has(t)||Ir(t,!1,e),Ir(t,!0,e))});var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Ur]||(t[Ur]=!0,Ir("selectionchange",!1,t))}}function Hr(e,t,n,r){switch(Kt(t)){case 1:var a=qt;break;case 4:a=Vt;break;default:a=Gt}n=a.bind(null,t,n,e),a=void 0,!Me||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(a=!0),r?void 0!==a?e.addEventListener(t,n,{capture:!0,passive:a}):e.addEventListener(t,n,!0):void 0!==a?e.addEventListener(t,n,{passive:a}):e.addEventListener(t,n,!1)}function $r(e,t,n,r,a){var o=r;if(!(1&t||2&t||null===r))e:for(;;){if(null===r)return;var l=r.tag;if(3===l||4===l){var i=r.stateNode.containerInfo;if(i===a||8===i.nodeType&&i.parentNode===a)break;if(4===l)for(l=r.return;null!==l;){var c=l.tag;if((3===c||4===c)&&((c=l.stateNode.containerInfo)===a||8===c.nodeType&&c.parentNode===a))return;l=l.return}for(;null!==i;){if(null===(l=ba(i)))return;if(5===(c=l.tag)||6===c){r=o=l;continue e}i=i.parentNode}}r=r.return}Pe(function(){var r=o,a=Ee(n),l=[];e:{var i=Or.get(e);if(void 0!==i){var c=un,s=e;switch(e){case"keypress":if(0===tn(n))break e;case"keydown":case"keyup":c=Cn;break;case"focusin":s="focus",c=vn;break;case"focusout":s="blur",c=vn;break;case"beforeblur":case"afterblur":c=vn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":c=pn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":c=hn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":c=_n;break;case Nr:case Cr:case Br:c=gn;break;case _r:c=On;break;case"scroll":c=dn;break;case"wheel":c=jn;break;case"copy":case"cut":case"paste":c=An;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":c=Bn}var u=!!(4&t),f=!u&&"scroll"===e,d=u?null!==i?i+"Capture":null:i;u=[];for(var m,p=r;null!==p;){var h=(m=p).stateNode;if(5===m.tag&&null!==h&&(m=h,null!==d&&null!=(h=je(p,d))&&u.push(qr(p,h,m))),f)break;p=p.return}0<u.length&&(i=new c(i,s,null,n,a),l.push({event:i,listeners:u}))}}if(!(7&t)){if(c="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||n===ye||!(s=n.relatedTarget||n.fromElement)||!ba(s)&&!s[pa])&&(c||i)&&(i=a.window===a?a:(i=a.ownerDocument)?i.defaultView||i.parentWindow:window,c?(c=r,null!==(s=(s=n.relatedTarget||n.toElement)?ba(s):null)&&(s!==(f=We(s))||5!==s.tag&&6!==s.tag)&&(s=null)):(c=null,s=r),c!==s)){if(u=pn,h="onMouseLeave",d="onMouseEnter",p="mouse","pointerout"!==e&&"pointerover"!==e||(u=Bn,h="onPointerLeave",d="onPointerEnter",p="pointer"),f=null==c?i:ya(c),m=null==s?i:ya(s),(i=new u(h,p+"leave",c,n,a)).target=f,i.relatedTarget=m,h=null,ba(a)===r&&((u=new u(d,p+"enter",s,n,a)).target=m,u.relatedTarget=f,h=u),f=h,c&&s)e:{for(d=s,p=0,m=u=c;m;m=Gr(m))p++;for(m=0,h=d;h;h=Gr(h))m++;for(;0<p-m;)u=Gr(u),p--;for(;0<m-p;)d=Gr(d),m--;for(;p--;){if(u===d||null!==d&&u===d.alternate)break e;u=Gr(u),d=Gr(d)}u=null}else u=null;null!==c&&Qr(l,i,c,u,!1),null!==s&&null!==f&&Qr(l,f,s,u,!0)}if("select"===(c=(i=r?ya(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===c&&"file"===i.type)var v=Kn;else if($n(i))if(Xn)v=lr;else{v=ar;var g=rr}else(c=i.nodeName)&&"input"===c.toLowerCase()&&("checkbox"===i.type||"radio"===i.type)&&(v=or);switch(v&&(v=v(e,r))?qn(l,v,n,a):(g&&g(e,i,r),"focusout"===e&&(g=i._wrapperState)&&g.controlled&&"number"===i.type&&ee(i,"number",i.value)),g=r?ya(r):window,e){case"focusin":($n(g)||"true"===g.contentEditable)&&(vr=g,gr=r,br=null);break;case"focusout":br=gr=vr=null;break;case"mousedown":Ar=!0;break;case"contextmenu":case"mouseup":case"dragend":Ar=!1,yr(l,n,a);break;case"selectionchange":if(hr)break;case"keydown":case"keyup":yr(l,n,a)}var b;if(Tn)e:{switch(e){case"compositionstart":var A="onCompositionStart";break e;case"compositionend":A="onCompositionEnd";break e;case"compositionupdate":A="onCompositionUpdate";break e}A=void 0}else Wn?In(e,n)&&(A="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(A="onCompositionStart");A&&(Dn&&"ko"!==n.locale&&(Wn||"onCompositionStart"!==A?"onCompositionEnd"===A&&Wn&&(b=en()):(Jt="value"in(Xt=a)?Xt.value:Xt.textContent,Wn=!0)),0<(g=Vr(r,A)).length&&(A=new yn(A,e,null,n,a),l.push({event:A,listeners:g}),(b||null!==(b=Un(n)))&&(A.data=b))),(b=Ln?function(e,t){switch(e){case"compositionend":return Un(t);case"keypress":return 32!==t.which?null:(Fn=!0,Rn);case"textInput":return(e=t.data)===Rn&&Fn?null:e;default:return null}}(e,n):function(e,t){if(Wn)return"compositionend"===e||!Tn&&In(e,t)?(e=en(),Zt=Jt=Xt=null,Wn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Dn&&"ko"!==t.locale?null:t.data}}(e,n))&&0<(r=Vr(r,"onBeforeInput")).length&&(a=new yn("onBeforeInput","beforeinput",null,n,a),l.push({event:a,listeners:r}),a.data=b)}Rr(l,t)})}function qr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Vr(e,t){for(var n=t+"Capture",r=[];null!==e;){var a=e,o=a.stateNode;5===a.tag&&null!==o&&(a=o,null!=(o=je(e,n))&&r.unshift(qr(e,o,a)),null!=(o=je(e,t))&&r.push(qr(e,o,a))),e=e.return}return r}function Gr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Qr(e,t,n,r,a){for(var o=t._reactName,l=[];null!==n&&n!==r;){var i=n,c=i.alternate,s=i.stateNode;if(null!==c&&c===r)break;5===i.tag&&null!==s&&(i=s,a?null!=(c=je(n,o))&&l.unshift(qr(n,c,i)):a||null!=(c=je(n,o))&&l.push(qr(n,c,i))),n=n.return}0!==l.length&&e.push({event:t,listeners:l})}var Yr=/\r\n?/g,Kr=/\u0000|\uFFFD/g;function Xr(e){return("string"==typeof e?e:""+e).replace(Yr,"\n").replace(Kr,"")}function Jr(e,t,n){if(t=Xr(t),Xr(e)!==t&&n)throw Error(o(425))}function Zr(){}var ea=null,ta=null;function na(e,t){return"textarea"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ra="function"==typeof setTimeout?setTimeout:void 0,aa="function"==typeof clearTimeout?clearTimeout:void 0,oa="function"==typeof Promise?Promise:void 0,la="function"==typeof queueMicrotask?queueMicrotask:void 0!==oa?function(e){return oa.resolve(null).then(e).catch(ia)}:ra;function ia(e){setTimeout(function(){throw e})}function ca(e,t){var n=t,r=0;do{var a=n.nextSibling;if(e.removeChild(n),a&&8===a.nodeType)if("/$"===(n=a.data)){if(0===r)return e.removeChild(a),void Wt(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=a}while(n);Wt(t)}function sa(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t)break;if("/$"===t)return null}}return e}function ua(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var fa=Math.random().toString(36).slice(2),da="__reactFiber$"+fa,ma="__reactProps$"+fa,pa="__reactContainer$"+fa,ha="__reactEvents$"+fa,va="__reactListeners$"+fa,ga="__reactHandles$"+fa;function ba(e){var t=e[da];if(t)return t;for(var n=e.parentNode;n;){if(t=n[pa]||n[da]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=ua(e);null!==e;){if(n=e[da])return n;e=ua(e)}return t}n=(e=n).parentNode}return null}function Aa(e){return!(e=e[da]||e[pa])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function ya(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(o(33))}function Ea(e){return e[ma]||null}var wa=[],xa=-1;function ka(e){return{current:e}}function Sa(e){0>xa||(e.current=wa[xa],wa[xa]=null,xa--)}function Na(e,t){xa++,wa[xa]=e.current,e.current=t}var Ca={},Ba=ka(Ca),_a=ka(!1),Oa=Ca;function Pa(e,t){var n=e.type.contextTypes;if(!n)return Ca;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var a,o={};for(a in n)o[a]=t[a];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function ja(e){return null!=e.childContextTypes}function Ma(){Sa(_a),Sa(Ba)}function Ta(e,t,n){if(Ba.current!==Ca)throw Error(o(168));Na(Ba,t),Na(_a,n)}function za(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var a in r=r.getChildContext())if(!(a in t))throw Error(o(108,H(e)||"Unknown",a));return D({},n,r)}function La(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ca,Oa=Ba.current,Na(Ba,e),Na(_a,_a.current),!0}function Da(e,t,n){var r=e.stateNode;if(!r)throw Error(o(169));n?(e=za(e,t,Oa),r.__reactInternalMemoizedMergedChildContext=e,Sa(_a),Sa(Ba),Na(Ba,e)):Sa(_a),Na(_a,n)}var Ra=null,Fa=!1,Ia=!1;function Ua(e){null===Ra?Ra=[e]:Ra.push(e)}function Wa(){if(!Ia&&null!==Ra){Ia=!0;var e=0,t=At;try{var n=Ra;for(At=1;e<n.length;e++){var r=n[e];do{r=r(!0)}while(null!==r)}Ra=null,Fa=!1}catch(t){throw null!==Ra&&(Ra=Ra.slice(e+1)),Ge(Ze,Wa),t}finally{At=t,Ia=!1}}return null}var Ha=[],$a=0,qa=null,Va=0,Ga=[],Qa=0,Ya=null,Ka=1,Xa="";function Ja(e,t){Ha[$a++]=Va,Ha[$a++]=qa,qa=e,Va=t}function Za(e,t,n){Ga[Qa++]=Ka,Ga[Qa++]=Xa,Ga[Qa++]=Ya,Ya=e;var r=Ka;e=Xa;var a=32-lt(r)-1;r&=~(1<<a),n+=1;var o=32-lt(t)+a;if(30<o){var l=a-a%5;o=(r&(1<<l)-1).toString(32),r>>=l,a-=l,Ka=1<<32-lt(t)+a|n<<a|r,Xa=o+e}else Ka=1<<o|n<<a|r,Xa=e}function eo(e){null!==e.return&&(Ja(e,1),Za(e,1,0))}function to(e){for(;e===qa;)qa=Ha[--$a],Ha[$a]=null,Va=Ha[--$a],Ha[$a]=null;for(;e===Ya;)Ya=Ga[--Qa],Ga[Qa]=null,Xa=Ga[--Qa],Ga[Qa]=null,Ka=Ga[--Qa],Ga[Qa]=null}var no=null,ro=null,ao=!1,oo=null;function lo(e,t){var n=Ps(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,null===(t=e.deletions)?(e.deletions=[n],e.flags|=16):t.push(n)}function io(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,no=e,ro=sa(t.firstChild),!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,no=e,ro=null,!0);case 13:return null!==(t=8!==t.nodeType?null:t)&&(n=null!==Ya?{id:Ka,overflow:Xa}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},(n=Ps(18,null,null,0)).stateNode=t,n.return=e,e.child=n,no=e,ro=null,!0);default:return!1}}function co(e){return!(!(1&e.mode)||128&e.flags)}function so(e){if(ao){var t=ro;if(t){var n=t;if(!io(e,t)){if(co(e))throw Error(o(418));t=sa(n.nextSibling);var r=no;t&&io(e,t)?lo(r,n):(e.flags=-4097&e.flags|2,ao=!1,no=e)}}else{if(co(e))throw Error(o(418));e.flags=-4097&e.flags|2,ao=!1,no=e}}}function uo(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;no=e}function fo(e){if(e!==no)return!1;if(!ao)return uo(e),ao=!0,!1;var t;if((t=3!==e.tag)&&!(t=5!==e.tag)&&(t="head"!==(t=e.type)&&"body"!==t&&!na(e.type,e.memoizedProps)),t&&(t=ro)){if(co(e))throw mo(),Error(o(418));for(;t;)lo(e,t),t=sa(t.nextSibling)}if(uo(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){ro=sa(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}ro=null}}else ro=no?sa(e.stateNode.nextSibling):null;return!0}function mo(){for(var e=ro;e;)e=sa(e.nextSibling)}function po(){ro=no=null,ao=!1}function ho(e){null===oo?oo=[e]:oo.push(e)}var vo=y.ReactCurrentBatchConfig;function go(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(o(309));var r=n.stateNode}if(!r)throw Error(o(147,e));var a=r,l=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===l?t.ref:(t=function(e){var t=a.refs;null===e?delete t[l]:t[l]=e},t._stringRef=l,t)}if("string"!=typeof e)throw Error(o(284));if(!n._owner)throw Error(o(290,e))}return e}function bo(e,t){throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Ao(e){return(0,e._init)(e._payload)}function yo(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function a(e,t){return(e=Ms(e,t)).index=0,e.sibling=null,e}function l(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=2,n):r:(t.flags|=2,n):(t.flags|=1048576,n)}function i(t){return e&&null===t.alternate&&(t.flags|=2),t}function c(e,t,n,r){return null===t||6!==t.tag?((t=Ds(n,e.mode,r)).return=e,t):((t=a(t,n)).return=e,t)}function s(e,t,n,r){var o=n.type;return o===x?f(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===o||"object"==typeof o&&null!==o&&o.$$typeof===j&&Ao(o)===t.type)?((r=a(t,n.props)).ref=go(e,t,n),r.return=e,r):((r=Ts(n.type,n.key,n.props,null,e.mode,r)).ref=go(e,t,n),r.return=e,r)}function u(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Rs(n,e.mode,r)).return=e,t):((t=a(t,n.children||[])).return=e,t)}function f(e,t,n,r,o){return null===t||7!==t.tag?((t=zs(n,e.mode,r,o)).return=e,t):((t=a(t,n)).return=e,t)}function d(e,t,n){if("string"==typeof t&&""!==t||"number"==typeof t)return(t=Ds(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case E:return(n=Ts(t.type,t.key,t.props,null,e.mode,n)).ref=go(e,null,t),n.return=e,n;case w:return(t=Rs(t,e.mode,n)).return=e,t;case j:return d(e,(0,t._init)(t._payload),n)}if(te(t)||z(t))return(t=zs(t,e.mode,n,null)).return=e,t;bo(e,t)}return null}function m(e,t,n,r){var a=null!==t?t.key:null;if("string"==typeof n&&""!==n||"number"==typeof n)return null!==a?null:c(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case E:return n.key===a?s(e,t,n,r):null;case w:return n.key===a?u(e,t,n,r):null;case j:return m(e,t,(a=n._init)(n._payload),r)}if(te(n)||z(n))return null!==a?null:f(e,t,n,r,null);bo(e,n)}return null}function p(e,t,n,r,a){if("string"==typeof r&&""!==r||"number"==typeof r)return c(t,e=e.get(n)||null,""+r,a);if("object"==typeof r&&null!==r){switch(r.$$typeof){case E:return s(t,e=e.get(null===r.key?n:r.key)||null,r,a);case w:return u(t,e=e.get(null===r.key?n:r.key)||null,r,a);case j:return p(e,t,n,(0,r._init)(r._payload),a)}if(te(r)||z(r))return f(t,e=e.get(n)||null,r,a,null);bo(t,r)}return null}function h(a,o,i,c){for(var s=null,u=null,f=o,h=o=0,v=null;null!==f&&h<i.length;h++){f.index>h?(v=f,f=null):v=f.sibling;var g=m(a,f,i[h],c);if(null===g){null===f&&(f=v);break}e&&f&&null===g.alternate&&t(a,f),o=l(g,o,h),null===u?s=g:u.sibling=g,u=g,f=v}if(h===i.length)return n(a,f),ao&&Ja(a,h),s;if(null===f){for(;h<i.length;h++)null!==(f=d(a,i[h],c))&&(o=l(f,o,h),null===u?s=f:u.sibling=f,u=f);return ao&&Ja(a,h),s}for(f=r(a,f);h<i.length;h++)null!==(v=p(f,a,h,i[h],c))&&(e&&null!==v.alternate&&f.delete(null===v.key?h:v.key),o=l(v,o,h),null===u?s=v:u.sibling=v,u=v);return e&&f.forEach(function(e){return t(a,e)}),ao&&Ja(a,h),s}function v(a,i,c,s){var u=z(c);if("function"!=typeof u)throw Error(o(150));if(null==(c=u.call(c)))throw Error(o(151));for(var f=u=null,h=i,v=i=0,g=null,b=c.next();null!==h&&!b.done;v++,b=c.next()){h.index>v?(g=h,h=null):g=h.sibling;var A=m(a,h,b.value,s);if(null===A){null===h&&(h=g);break}e&&h&&null===A.alternate&&t(a,h),i=l(A,i,v),null===f?u=A:f.sibling=A,f=A,h=g}if(b.done)return n(a,h),ao&&Ja(a,v),u;if(null===h){for(;!b.done;v++,b=c.next())null!==(b=d(a,b.value,s))&&(i=l(b,i,v),null===f?u=b:f.sibling=b,f=b);return ao&&Ja(a,v),u}for(h=r(a,h);!b.done;v++,b=c.next())null!==(b=p(h,a,v,b.value,s))&&(e&&null!==b.alternate&&h.delete(null===b.key?v:b.key),i=l(b,i,v),null===f?u=b:f.sibling=b,f=b);return e&&h.forEach(function(e){return t(a,e)}),ao&&Ja(a,v),u}return function e(r,o,l,c){if("object"==typeof l&&null!==l&&l.type===x&&null===l.key&&(l=l.props.children),"object"==typeof l&&null!==l){switch(l.$$typeof){case E:e:{for(var s=l.key,u=o;null!==u;){if(u.key===s){if((s=l.type)===x){if(7===u.tag){n(r,u.sibling),(o=a(u,l.props.children)).return=r,r=o;break e}}else if(u.elementType===s||"object"==typeof s&&null!==s&&s.$$typeof===j&&Ao(s)===u.type){n(r,u.sibling),(o=a(u,l.props)).ref=go(r,u,l),o.return=r,r=o;break e}n(r,u);break}t(r,u),u=u.sibling}l.type===x?((o=zs(l.props.children,r.mode,c,l.key)).return=r,r=o):((c=Ts(l.type,l.key,l.props,null,r.mode,c)).ref=go(r,o,l),c.return=r,r=c)}return i(r);case w:e:{for(u=l.key;null!==o;){if(o.key===u){if(4===o.tag&&o.stateNode.containerInfo===l.containerInfo&&o.stateNode.implementation===l.implementation){n(r,o.sibling),(o=a(o,l.children||[])).return=r,r=o;break e}n(r,o);break}t(r,o),o=o.sibling}(o=Rs(l,r.mode,c)).return=r,r=o}return i(r);case j:return e(r,o,(u=l._init)(l._payload),c)}if(te(l))return h(r,o,l,c);if(z(l))return v(r,o,l,c);bo(r,l)}return"string"==typeof l&&""!==l||"number"==typeof l?(l=""+l,null!==o&&6===o.tag?(n(r,o.sibling),(o=a(o,l)).return=r,r=o):(n(r,o),(o=Ds(l,r.mode,c)).return=r,r=o),i(r)):n(r,o)}}var Eo=yo(!0),wo=yo(!1),xo=ka(null),ko=null,So=null,No=null;function Co(){No=So=ko=null}function Bo(e){var t=xo.current;Sa(xo),e._currentValue=t}function _o(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Oo(e,t){ko=e,No=So=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&t)&&(Ai=!0),e.firstContext=null)}function Po(e){var t=e._currentValue;if(No!==e)if(e={context:e,memoizedValue:t,next:null},null===So){if(null===ko)throw Error(o(308));So=e,ko.dependencies={lanes:0,firstContext:e}}else So=So.next=e;return t}var jo=null;function Mo(e){null===jo?jo=[e]:jo.push(e)}function To(e,t,n,r){var a=t.interleaved;return null===a?(n.next=n,Mo(t)):(n.next=a.next,a.next=n),t.interleaved=n,zo(e,r)}function zo(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}var Lo=!1;function Do(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Ro(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Fo(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Io(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,2&Bc){var a=r.pending;return null===a?t.next=t:(t.next=a.next,a.next=t),r.pending=t,zo(e,n)}return null===(a=r.interleaved)?(t.next=t,Mo(r)):(t.next=a.next,a.next=t),r.interleaved=t,zo(e,n)}function Uo(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,4194240&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,bt(e,n)}}function Wo(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var a=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var l={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?a=o=l:o=o.next=l,n=n.next}while(null!==n);null===o?a=o=t:o=o.next=t}else a=o=t;return n={baseState:r.baseState,firstBaseUpdate:a,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Ho(e,t,n,r){var a=e.updateQueue;Lo=!1;var o=a.firstBaseUpdate,l=a.lastBaseUpdate,i=a.shared.pending;if(null!==i){a.shared.pending=null;var c=i,s=c.next;c.next=null,null===l?o=s:l.next=s,l=c;var u=e.alternate;null!==u&&(i=(u=u.updateQueue).lastBaseUpdate)!==l&&(null===i?u.firstBaseUpdate=s:i.next=s,u.lastBaseUpdate=c)}if(null!==o){var f=a.baseState;for(l=0,u=s=c=null,i=o;;){var d=i.lane,m=i.eventTime;if((r&d)===d){null!==u&&(u=u.next={eventTime:m,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var p=e,h=i;switch(d=t,m=n,h.tag){case 1:if("function"==typeof(p=h.payload)){f=p.call(m,f,d);break e}f=p;break e;case 3:p.flags=-65537&p.flags|128;case 0:if(null==(d="function"==typeof(p=h.payload)?p.call(m,f,d):p))break e;f=D({},f,d);break e;case 2:Lo=!0}}null!==i.callback&&0!==i.lane&&(e.flags|=64,null===(d=a.effects)?a.effects=[i]:d.push(i))}else m={eventTime:m,lane:d,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===u?(s=u=m,c=f):u=u.next=m,l|=d;if(null===(i=i.next)){if(null===(i=a.shared.pending))break;i=(d=i).next,d.next=null,a.lastBaseUpdate=d,a.shared.pending=null}}if(null===u&&(c=f),a.baseState=c,a.firstBaseUpdate=s,a.lastBaseUpdate=u,null!==(t=a.shared.interleaved)){a=t;do{l|=a.lane,a=a.next}while(a!==t)}else null===o&&(a.shared.lanes=0);Lc|=l,e.lanes=l,e.memoizedState=f}}function $o(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],a=r.callback;if(null!==a){if(r.callback=null,r=n,"function"!=typeof a)throw Error(o(191,a));a.call(r)}}}var qo={},Vo=ka(qo),Go=ka(qo),Qo=ka(qo);function Yo(e){if(e===qo)throw Error(o(174));return e}function Ko(e,t){switch(Na(Qo,t),Na(Go,e),Na(Vo,qo),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ce(null,"");break;default:t=ce(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}Sa(Vo),Na(Vo,t)}function Xo(){Sa(Vo),Sa(Go),Sa(Qo)}function Jo(e){Yo(Qo.current);var t=Yo(Vo.current),n=ce(t,e.type);t!==n&&(Na(Go,e),Na(Vo,n))}function Zo(e){Go.current===e&&(Sa(Vo),Sa(Go))}var el=ka(0);function tl(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(128&t.flags)return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var nl=[];function rl(){for(var e=0;e<nl.length;e++)nl[e]._workInProgressVersionPrimary=null;nl.length=0}var al=y.ReactCurrentDispatcher,ol=y.ReactCurrentBatchConfig,ll=0,il=null,cl=null,sl=null,ul=!1,fl=!1,dl=0,ml=0;function pl(){throw Error(o(321))}function hl(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!ir(e[n],t[n]))return!1;return!0}function vl(e,t,n,r,a,l){if(ll=l,il=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,al.current=null===e||null===e.memoizedState?Zl:ei,e=n(r,a),fl){l=0;do{if(fl=!1,dl=0,25<=l)throw Error(o(301));l+=1,sl=cl=null,t.updateQueue=null,al.current=ti,e=n(r,a)}while(fl)}if(al.current=Jl,t=null!==cl&&null!==cl.next,ll=0,sl=cl=il=null,ul=!1,t)throw Error(o(300));return e}function gl(){var e=0!==dl;return dl=0,e}function bl(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===sl?il.memoizedState=sl=e:sl=sl.next=e,sl}function Al(){if(null===cl){var e=il.alternate;e=null!==e?e.memoizedState:null}else e=cl.next;var t=null===sl?il.memoizedState:sl.next;if(null!==t)sl=t,cl=e;else{if(null===e)throw Error(o(310));e={memoizedState:(cl=e).memoizedState,baseState:cl.baseState,baseQueue:cl.baseQueue,queue:cl.queue,next:null},null===sl?il.memoizedState=sl=e:sl=sl.next=e}return sl}function yl(e,t){return"function"==typeof t?t(e):t}function El(e){var t=Al(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=cl,a=r.baseQueue,l=n.pending;if(null!==l){if(null!==a){var i=a.next;a.next=l.next,l.next=i}r.baseQueue=a=l,n.pending=null}if(null!==a){l=a.next,r=r.baseState;var c=i=null,s=null,u=l;do{var f=u.lane;if((ll&f)===f)null!==s&&(s=s.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:e(r,u.action);else{var d={lane:f,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};null===s?(c=s=d,i=r):s=s.next=d,il.lanes|=f,Lc|=f}u=u.next}while(null!==u&&u!==l);null===s?i=r:s.next=c,ir(r,t.memoizedState)||(Ai=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(null!==(e=n.interleaved)){a=e;do{l=a.lane,il.lanes|=l,Lc|=l,a=a.next}while(a!==e)}else null===a&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function wl(e){var t=Al(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,a=n.pending,l=t.memoizedState;if(null!==a){n.pending=null;var i=a=a.next;do{l=e(l,i.action),i=i.next}while(i!==a);ir(l,t.memoizedState)||(Ai=!0),t.memoizedState=l,null===t.baseQueue&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function xl(){}function kl(e,t){var n=il,r=Al(),a=t(),l=!ir(r.memoizedState,a);if(l&&(r.memoizedState=a,Ai=!0),r=r.queue,Ll(Cl.bind(null,n,r,e),[e]),r.getSnapshot!==t||l||null!==sl&&1&sl.memoizedState.tag){if(n.flags|=2048,Pl(9,Nl.bind(null,n,r,a,t),void 0,null),null===_c)throw Error(o(349));30&ll||Sl(n,t,a)}return a}function Sl(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=il.updateQueue)?(t={lastEffect:null,stores:null},il.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Nl(e,t,n,r){t.value=n,t.getSnapshot=r,Bl(t)&&_l(e)}function Cl(e,t,n){return n(function(){Bl(t)&&_l(e)})}function Bl(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!ir(e,n)}catch(e){return!0}}function _l(e){var t=zo(e,1);null!==t&&ns(t,e,1,-1)}function Ol(e){var t=bl();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:yl,lastRenderedState:e},t.queue=e,e=e.dispatch=Ql.bind(null,il,e),[t.memoizedState,e]}function Pl(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=il.updateQueue)?(t={lastEffect:null,stores:null},il.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function jl(){return Al().memoizedState}function Ml(e,t,n,r){var a=bl();il.flags|=e,a.memoizedState=Pl(1|t,n,void 0,void 0===r?null:r)}function Tl(e,t,n,r){var a=Al();r=void 0===r?null:r;var o=void 0;if(null!==cl){var l=cl.memoizedState;if(o=l.destroy,null!==r&&hl(r,l.deps))return void(a.memoizedState=Pl(t,n,o,r))}il.flags|=e,a.memoizedState=Pl(1|t,n,o,r)}function zl(e,t){return Ml(8390656,8,e,t)}function Ll(e,t){return Tl(2048,8,e,t)}function Dl(e,t){return Tl(4,2,e,t)}function Rl(e,t){return Tl(4,4,e,t)}function Fl(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Il(e,t,n){return n=null!=n?n.concat([e]):null,Tl(4,4,Fl.bind(null,t,e),n)}function Ul(){}function Wl(e,t){var n=Al();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&hl(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Hl(e,t){var n=Al();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&hl(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function $l(e,t,n){return 21&ll?(ir(n,t)||(n=ht(),il.lanes|=n,Lc|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,Ai=!0),e.memoizedState=n)}function ql(e,t){var n=At;At=0!==n&&4>n?n:4,e(!0);var r=ol.transition;ol.transition={};try{e(!1),t()}finally{At=n,ol.transition=r}}function Vl(){return Al().memoizedState}function Gl(e,t,n){var r=ts(e);n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Yl(e)?Kl(t,n):null!==(n=To(e,t,n,r))&&(ns(n,e,r,es()),Xl(n,t,r))}function Ql(e,t,n){var r=ts(e),a={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Yl(e))Kl(t,a);else{var o=e.alternate;if(0===e.lanes&&(null===o||0===o.lanes)&&null!==(o=t.lastRenderedReducer))try{var l=t.lastRenderedState,i=o(l,n);if(a.hasEagerState=!0,a.eagerState=i,ir(i,l)){var c=t.interleaved;return null===c?(a.next=a,Mo(t)):(a.next=c.next,c.next=a),void(t.interleaved=a)}}catch(e){}null!==(n=To(e,t,a,r))&&(ns(n,e,r,a=es()),Xl(n,t,r))}}function Yl(e){var t=e.alternate;return e===il||null!==t&&t===il}function Kl(e,t){fl=ul=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Xl(e,t,n){if(4194240&n){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,bt(e,n)}}var Jl={readContext:Po,useCallback:pl,useContext:pl,useEffect:pl,useImperativeHandle:pl,useInsertionEffect:pl,useLayoutEffect:pl,useMemo:pl,useReducer:pl,useRef:pl,useState:pl,useDebugValue:pl,useDeferredValue:pl,useTransition:pl,useMutableSource:pl,useSyncExternalStore:pl,useId:pl,unstable_isNewReconciler:!1},Zl={readContext:Po,useCallback:function(e,t){return bl().memoizedState=[e,void 0===t?null:t],e},useContext:Po,useEffect:zl,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,Ml(4194308,4,Fl.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Ml(4194308,4,e,t)},useInsertionEffect:function(e,t){return Ml(4,2,e,t)},useMemo:function(e,t){var n=bl();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=bl();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Gl.bind(null,il,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},bl().memoizedState=e},useState:Ol,useDebugValue:Ul,useDeferredValue:function(e){return bl().memoizedState=e},useTransition:function(){var e=Ol(!1),t=e[0];return e=ql.bind(null,e[1]),bl().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=il,a=bl();if(ao){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===_c)throw Error(o(349));30&ll||Sl(r,t,n)}a.memoizedState=n;var l={value:n,getSnapshot:t};return a.queue=l,zl(Cl.bind(null,r,l,e),[e]),r.flags|=2048,Pl(9,Nl.bind(null,r,l,n,t),void 0,null),n},useId:function(){var e=bl(),t=_c.identifierPrefix;if(ao){var n=Xa;t=":"+t+"R"+(n=(Ka&~(1<<32-lt(Ka)-1)).toString(32)+n),0<(n=dl++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=ml++).toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},ei={readContext:Po,useCallback:Wl,useContext:Po,useEffect:Ll,useImperativeHandle:Il,useInsertionEffect:Dl,useLayoutEffect:Rl,useMemo:Hl,useReducer:El,useRef:jl,useState:function(){return El(yl)},useDebugValue:Ul,useDeferredValue:function(e){return $l(Al(),cl.memoizedState,e)},useTransition:function(){return[El(yl)[0],Al().memoizedState]},useMutableSource:xl,useSyncExternalStore:kl,useId:Vl,unstable_isNewReconciler:!1},ti={readContext:Po,useCallback:Wl,useContext:Po,useEffect:Ll,useImperativeHandle:Il,useInsertionEffect:Dl,useLayoutEffect:Rl,useMemo:Hl,useReducer:wl,useRef:jl,useState:function(){return wl(yl)},useDebugValue:Ul,useDeferredValue:function(e){var t=Al();return null===cl?t.memoizedState=e:$l(t,cl.memoizedState,e)},useTransition:function(){return[wl(yl)[0],Al().memoizedState]},useMutableSource:xl,useSyncExternalStore:kl,useId:Vl,unstable_isNewReconciler:!1};function ni(e,t){if(e&&e.defaultProps){for(var n in t=D({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}function ri(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:D({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ai={isMounted:function(e){return!!(e=e._reactInternals)&&We(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=es(),a=ts(e),o=Fo(r,a);o.payload=t,null!=n&&(o.callback=n),null!==(t=Io(e,o,a))&&(ns(t,e,a,r),Uo(t,e,a))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=es(),a=ts(e),o=Fo(r,a);o.tag=1,o.payload=t,null!=n&&(o.callback=n),null!==(t=Io(e,o,a))&&(ns(t,e,a,r),Uo(t,e,a))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=es(),r=ts(e),a=Fo(n,r);a.tag=2,null!=t&&(a.callback=t),null!==(t=Io(e,a,r))&&(ns(t,e,r,n),Uo(t,e,r))}};function oi(e,t,n,r,a,o,l){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,o,l):!(t.prototype&&t.prototype.isPureReactComponent&&cr(n,r)&&cr(a,o))}function li(e,t,n){var r=!1,a=Ca,o=t.contextType;return"object"==typeof o&&null!==o?o=Po(o):(a=ja(t)?Oa:Ba.current,o=(r=null!=(r=t.contextTypes))?Pa(e,a):Ca),t=new t(n,o),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ai,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=a,e.__reactInternalMemoizedMaskedChildContext=o),t}function ii(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ai.enqueueReplaceState(t,t.state,null)}function ci(e,t,n,r){var a=e.stateNode;a.props=n,a.state=e.memoizedState,a.refs={},Do(e);var o=t.contextType;"object"==typeof o&&null!==o?a.context=Po(o):(o=ja(t)?Oa:Ba.current,a.context=Pa(e,o)),a.state=e.memoizedState,"function"==typeof(o=t.getDerivedStateFromProps)&&(ri(e,t,o,n),a.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof a.getSnapshotBeforeUpdate||"function"!=typeof a.UNSAFE_componentWillMount&&"function"!=typeof a.componentWillMount||(t=a.state,"function"==typeof a.componentWillMount&&a.componentWillMount(),"function"==typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount(),t!==a.state&&ai.enqueueReplaceState(a,a.state,null),Ho(e,n,a,r),a.state=e.memoizedState),"function"==typeof a.componentDidMount&&(e.flags|=4194308)}function si(e,t){try{var n="",r=t;do{n+=U(r),r=r.return}while(r);var a=n}catch(e){a="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:t,stack:a,digest:null}}function ui(e,t,n){return{value:e,source:null,stack:null!=n?n:null,digest:null!=t?t:null}}function fi(e,t){try{console.error(t.value)}catch(e){setTimeout(function(){throw e})}}var di="function"==typeof WeakMap?WeakMap:Map;function mi(e,t,n){(n=Fo(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){$c||($c=!0,qc=r),fi(0,t)},n}function pi(e,t,n){(n=Fo(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var a=t.value;n.payload=function(){return r(a)},n.callback=function(){fi(0,t)}}var o=e.stateNode;return null!==o&&"function"==typeof o.componentDidCatch&&(n.callback=function(){fi(0,t),"function"!=typeof r&&(null===Vc?Vc=new Set([this]):Vc.add(this));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}function hi(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new di;var a=new Set;r.set(t,a)}else void 0===(a=r.get(t))&&(a=new Set,r.set(t,a));a.has(n)||(a.add(n),e=Ss.bind(null,e,t,n),t.then(e,e))}function vi(e){do{var t;if((t=13===e.tag)&&(t=null===(t=e.memoizedState)||null!==t.dehydrated),t)return e;e=e.return}while(null!==e);return null}function gi(e,t,n,r,a){return 1&e.mode?(e.flags|=65536,e.lanes=a,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((t=Fo(-1,1)).tag=2,Io(n,t,1))),n.lanes|=1),e)}var bi=y.ReactCurrentOwner,Ai=!1;function yi(e,t,n,r){t.child=null===e?wo(t,null,n,r):Eo(t,e.child,n,r)}function Ei(e,t,n,r,a){n=n.render;var o=t.ref;return Oo(t,a),r=vl(e,t,n,r,o,a),n=gl(),null===e||Ai?(ao&&n&&eo(t),t.flags|=1,yi(e,t,r,a),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~a,$i(e,t,a))}function wi(e,t,n,r,a){if(null===e){var o=n.type;return"function"!=typeof o||js(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Ts(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=o,xi(e,t,o,r,a))}if(o=e.child,0===(e.lanes&a)){var l=o.memoizedProps;if((n=null!==(n=n.compare)?n:cr)(l,r)&&e.ref===t.ref)return $i(e,t,a)}return t.flags|=1,(e=Ms(o,r)).ref=t.ref,e.return=t,t.child=e}function xi(e,t,n,r,a){if(null!==e){var o=e.memoizedProps;if(cr(o,r)&&e.ref===t.ref){if(Ai=!1,t.pendingProps=r=o,0===(e.lanes&a))return t.lanes=e.lanes,$i(e,t,a);131072&e.flags&&(Ai=!0)}}return Ni(e,t,n,r,a)}function ki(e,t,n){var r=t.pendingProps,a=r.children,o=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(1&t.mode){if(!(1073741824&n))return e=null!==o?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,Na(Mc,jc),jc|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==o?o.baseLanes:n,Na(Mc,jc),jc|=r}else t.memoizedState={baseLanes:0,cachePool:null,transitions:null},Na(Mc,jc),jc|=n;else null!==o?(r=o.baseLanes|n,t.memoizedState=null):r=n,Na(Mc,jc),jc|=r;return yi(e,t,a,n),t.child}function Si(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Ni(e,t,n,r,a){var o=ja(n)?Oa:Ba.current;return o=Pa(t,o),Oo(t,a),n=vl(e,t,n,r,o,a),r=gl(),null===e||Ai?(ao&&r&&eo(t),t.flags|=1,yi(e,t,n,a),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~a,$i(e,t,a))}function Ci(e,t,n,r,a){if(ja(n)){var o=!0;La(t)}else o=!1;if(Oo(t,a),null===t.stateNode)Hi(e,t),li(t,n,r),ci(t,n,r,a),r=!0;else if(null===e){var l=t.stateNode,i=t.memoizedProps;l.props=i;var c=l.context,s=n.contextType;s="object"==typeof s&&null!==s?Po(s):Pa(t,s=ja(n)?Oa:Ba.current);var u=n.getDerivedStateFromProps,f="function"==typeof u||"function"==typeof l.getSnapshotBeforeUpdate;f||"function"!=typeof l.UNSAFE_componentWillReceiveProps&&"function"!=typeof l.componentWillReceiveProps||(i!==r||c!==s)&&ii(t,l,r,s),Lo=!1;var d=t.memoizedState;l.state=d,Ho(t,r,l,a),c=t.memoizedState,i!==r||d!==c||_a.current||Lo?("function"==typeof u&&(ri(t,n,u,r),c=t.memoizedState),(i=Lo||oi(t,n,i,r,d,c,s))?(f||"function"!=typeof l.UNSAFE_componentWillMount&&"function"!=typeof l.componentWillMount||("function"==typeof l.componentWillMount&&l.componentWillMount(),"function"==typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount()),"function"==typeof l.componentDidMount&&(t.flags|=4194308)):("function"==typeof l.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=c),l.props=r,l.state=c,l.context=s,r=i):("function"==typeof l.componentDidMount&&(t.flags|=4194308),r=!1)}else{l=t.stateNode,Ro(e,t),i=t.memoizedProps,s=t.type===t.elementType?i:ni(t.type,i),l.props=s,f=t.pendingProps,d=l.context,c="object"==typeof(c=n.contextType)&&null!==c?Po(c):Pa(t,c=ja(n)?Oa:Ba.current);var m=n.getDerivedStateFromProps;(u="function"==typeof m||"function"==typeof l.getSnapshotBeforeUpdate)||"function"!=typeof l.UNSAFE_componentWillReceiveProps&&"function"!=typeof l.componentWillReceiveProps||(i!==f||d!==c)&&ii(t,l,r,c),Lo=!1,d=t.memoizedState,l.state=d,Ho(t,r,l,a);var p=t.memoizedState;i!==f||d!==p||_a.current||Lo?("function"==typeof m&&(ri(t,n,m,r),p=t.memoizedState),(s=Lo||oi(t,n,s,r,d,p,c)||!1)?(u||"function"!=typeof l.UNSAFE_componentWillUpdate&&"function"!=typeof l.componentWillUpdate||("function"==typeof l.componentWillUpdate&&l.componentWillUpdate(r,p,c),"function"==typeof l.UNSAFE_componentWillUpdate&&l.UNSAFE_componentWillUpdate(r,p,c)),"function"==typeof l.componentDidUpdate&&(t.flags|=4),"function"==typeof l.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!=typeof l.componentDidUpdate||i===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!=typeof l.getSnapshotBeforeUpdate||i===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),l.props=r,l.state=p,l.context=c,r=s):("function"!=typeof l.componentDidUpdate||i===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!=typeof l.getSnapshotBeforeUpdate||i===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return Bi(e,t,n,r,o,a)}function Bi(e,t,n,r,a,o){Si(e,t);var l=!!(128&t.flags);if(!r&&!l)return a&&Da(t,n,!1),$i(e,t,o);r=t.stateNode,bi.current=t;var i=l&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&l?(t.child=Eo(t,e.child,null,o),t.child=Eo(t,null,i,o)):yi(e,t,i,o),t.memoizedState=r.state,a&&Da(t,n,!0),t.child}function _i(e){var t=e.stateNode;t.pendingContext?Ta(0,t.pendingContext,t.pendingContext!==t.context):t.context&&Ta(0,t.context,!1),Ko(e,t.containerInfo)}function Oi(e,t,n,r,a){return po(),ho(a),t.flags|=256,yi(e,t,n,r),t.child}var Pi,ji,Mi,Ti,zi={dehydrated:null,treeContext:null,retryLane:0};function Li(e){return{baseLanes:e,cachePool:null,transitions:null}}function Di(e,t,n){var r,a=t.pendingProps,l=el.current,i=!1,c=!!(128&t.flags);if((r=c)||(r=(null===e||null!==e.memoizedState)&&!!(2&l)),r?(i=!0,t.flags&=-129):null!==e&&null===e.memoizedState||(l|=1),Na(el,1&l),null===e)return so(t),null!==(e=t.memoizedState)&&null!==(e=e.dehydrated)?(1&t.mode?"$!"===e.data?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(c=a.children,e=a.fallback,i?(a=t.mode,i=t.child,c={mode:"hidden",children:c},1&a||null===i?i=Ls(c,a,0,null):(i.childLanes=0,i.pendingProps=c),e=zs(e,a,n,null),i.return=t,e.return=t,i.sibling=e,t.child=i,t.child.memoizedState=Li(n),t.memoizedState=zi,e):Ri(t,c));if(null!==(l=e.memoizedState)&&null!==(r=l.dehydrated))return function(e,t,n,r,a,l,i){if(n)return 256&t.flags?(t.flags&=-257,Fi(e,t,i,r=ui(Error(o(422))))):null!==t.memoizedState?(t.child=e.child,t.flags|=128,null):(l=r.fallback,a=t.mode,r=Ls({mode:"visible",children:r.children},a,0,null),(l=zs(l,a,i,null)).flags|=2,r.return=t,l.return=t,r.sibling=l,t.child=r,1&t.mode&&Eo(t,e.child,null,i),t.child.memoizedState=Li(i),t.memoizedState=zi,l);if(!(1&t.mode))return Fi(e,t,i,null);if("$!"===a.data){if(r=a.nextSibling&&a.nextSibling.dataset)var c=r.dgst;return r=c,Fi(e,t,i,r=ui(l=Error(o(419)),r,void 0))}if(c=0!==(i&e.childLanes),Ai||c){if(null!==(r=_c)){switch(i&-i){case 4:a=2;break;case 16:a=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:a=32;break;case 536870912:a=268435456;break;default:a=0}0!==(a=0!==(a&(r.suspendedLanes|i))?0:a)&&a!==l.retryLane&&(l.retryLane=a,zo(e,a),ns(r,e,a,-1))}return hs(),Fi(e,t,i,r=ui(Error(o(421))))}return"$?"===a.data?(t.flags|=128,t.child=e.child,t=Cs.bind(null,e),a._reactRetry=t,null):(e=l.treeContext,ro=sa(a.nextSibling),no=t,ao=!0,oo=null,null!==e&&(Ga[Qa++]=Ka,Ga[Qa++]=Xa,Ga[Qa++]=Ya,Ka=e.id,Xa=e.overflow,Ya=t),(t=Ri(t,r.children)).flags|=4096,t)}(e,t,c,a,r,l,n);if(i){i=a.fallback,c=t.mode,r=(l=e.child).sibling;var s={mode:"hidden",children:a.children};return 1&c||t.child===l?(a=Ms(l,s)).subtreeFlags=14680064&l.subtreeFlags:((a=t.child).childLanes=0,a.pendingProps=s,t.deletions=null),null!==r?i=Ms(r,i):(i=zs(i,c,n,null)).flags|=2,i.return=t,a.return=t,a.sibling=i,t.child=a,a=i,i=t.child,c=null===(c=e.child.memoizedState)?Li(n):{baseLanes:c.baseLanes|n,cachePool:null,transitions:c.transitions},i.memoizedState=c,i.childLanes=e.childLanes&~n,t.memoizedState=zi,a}return e=(i=e.child).sibling,a=Ms(i,{mode:"visible",children:a.children}),!(1&t.mode)&&(a.lanes=n),a.return=t,a.sibling=null,null!==e&&(null===(n=t.deletions)?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=a,t.memoizedState=null,a}function Ri(e,t){return(t=Ls({mode:"visible",children:t},e.mode,0,null)).return=e,e.child=t}function Fi(e,t,n,r){return null!==r&&ho(r),Eo(t,e.child,null,n),(e=Ri(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Ii(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),_o(e.return,t,n)}function Ui(e,t,n,r,a){var o=e.memoizedState;null===o?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:a}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=a)}function Wi(e,t,n){var r=t.pendingProps,a=r.revealOrder,o=r.tail;if(yi(e,t,r.children,n),2&(r=el.current))r=1&r|2,t.flags|=128;else{if(null!==e&&128&e.flags)e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ii(e,n,t);else if(19===e.tag)Ii(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Na(el,r),1&t.mode)switch(a){case"forwards":for(n=t.child,a=null;null!==n;)null!==(e=n.alternate)&&null===tl(e)&&(a=n),n=n.sibling;null===(n=a)?(a=t.child,t.child=null):(a=n.sibling,n.sibling=null),Ui(t,!1,a,n,o);break;case"backwards":for(n=null,a=t.child,t.child=null;null!==a;){if(null!==(e=a.alternate)&&null===tl(e)){t.child=a;break}e=a.sibling,a.sibling=n,n=a,a=e}Ui(t,!0,n,null,o);break;case"together":Ui(t,!1,null,null,void 0);break;default:t.memoizedState=null}else t.memoizedState=null;return t.child}function Hi(e,t){!(1&t.mode)&&null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2)}function $i(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Lc|=t.lanes,0===(n&t.childLanes))return null;if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=Ms(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Ms(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function qi(e,t){if(!ao)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Vi(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=14680064&a.subtreeFlags,r|=14680064&a.flags,a.return=e,a=a.sibling;else for(a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=a.subtreeFlags,r|=a.flags,a.return=e,a=a.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Gi(e,t,n){var r=t.pendingProps;switch(to(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Vi(t),null;case 1:case 17:return ja(t.type)&&Ma(),Vi(t),null;case 3:return r=t.stateNode,Xo(),Sa(_a),Sa(Ba),rl(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(fo(t)?t.flags|=4:null===e||e.memoizedState.isDehydrated&&!(256&t.flags)||(t.flags|=1024,null!==oo&&(ls(oo),oo=null))),ji(e,t),Vi(t),null;case 5:Zo(t);var a=Yo(Qo.current);if(n=t.type,null!==e&&null!=t.stateNode)Mi(e,t,n,r,a),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(null===t.stateNode)throw Error(o(166));return Vi(t),null}if(e=Yo(Vo.current),fo(t)){r=t.stateNode,n=t.type;var l=t.memoizedProps;switch(r[da]=t,r[ma]=l,e=!!(1&t.mode),n){case"dialog":Fr("cancel",r),Fr("close",r);break;case"iframe":case"object":case"embed":Fr("load",r);break;case"video":case"audio":for(a=0;a<zr.length;a++)Fr(zr[a],r);break;case"source":Fr("error",r);break;case"img":case"image":case"link":Fr("error",r),Fr("load",r);break;case"details":Fr("toggle",r);break;case"input":K(r,l),Fr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!l.multiple},Fr("invalid",r);break;case"textarea":ae(r,l),Fr("invalid",r)}for(var c in be(n,l),a=null,l)if(l.hasOwnProperty(c)){var s=l[c];"children"===c?"string"==typeof s?r.textContent!==s&&(!0!==l.suppressHydrationWarning&&Jr(r.textContent,s,e),a=["children",s]):"number"==typeof s&&r.textContent!==""+s&&(!0!==l.suppressHydrationWarning&&Jr(r.textContent,s,e),a=["children",""+s]):i.hasOwnProperty(c)&&null!=s&&"onScroll"===c&&Fr("scroll",r)}switch(n){case"input":V(r),Z(r,l,!0);break;case"textarea":V(r),le(r);break;case"select":case"option":break;default:"function"==typeof l.onClick&&(r.onclick=Zr)}r=a,t.updateQueue=r,null!==r&&(t.flags|=4)}else{c=9===a.nodeType?a:a.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=ie(n)),"http://www.w3.org/1999/xhtml"===e?"script"===n?((e=c.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=c.createElement(n,{is:r.is}):(e=c.createElement(n),"select"===n&&(c=e,r.multiple?c.multiple=!0:r.size&&(c.size=r.size))):e=c.createElementNS(e,n),e[da]=t,e[ma]=r,Pi(e,t,!1,!1),t.stateNode=e;e:{switch(c=Ae(n,r),n){case"dialog":Fr("cancel",e),Fr("close",e),a=r;break;case"iframe":case"object":case"embed":Fr("load",e),a=r;break;case"video":case"audio":for(a=0;a<zr.length;a++)Fr(zr[a],e);a=r;break;case"source":Fr("error",e),a=r;break;case"img":case"image":case"link":Fr("error",e),Fr("load",e),a=r;break;case"details":Fr("toggle",e),a=r;break;case"input":K(e,r),a=Y(e,r),Fr("invalid",e);break;case"option":default:a=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},a=D({},r,{value:void 0}),Fr("invalid",e);break;case"textarea":ae(e,r),a=re(e,r),Fr("invalid",e)}for(l in be(n,a),s=a)if(s.hasOwnProperty(l)){var u=s[l];"style"===l?ve(e,u):"dangerouslySetInnerHTML"===l?null!=(u=u?u.__html:void 0)&&fe(e,u):"children"===l?"string"==typeof u?("textarea"!==n||""!==u)&&de(e,u):"number"==typeof u&&de(e,""+u):"suppressContentEditableWarning"!==l&&"suppressHydrationWarning"!==l&&"autoFocus"!==l&&(i.hasOwnProperty(l)?null!=u&&"onScroll"===l&&Fr("scroll",e):null!=u&&A(e,l,u,c))}switch(n){case"input":V(e),Z(e,r,!1);break;case"textarea":V(e),le(e);break;case"option":null!=r.value&&e.setAttribute("value",""+$(r.value));break;case"select":e.multiple=!!r.multiple,null!=(l=r.value)?ne(e,!!r.multiple,l,!1):null!=r.defaultValue&&ne(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof a.onClick&&(e.onclick=Zr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}null!==t.ref&&(t.flags|=512,t.flags|=2097152)}return Vi(t),null;case 6:if(e&&null!=t.stateNode)Ti(e,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(o(166));if(n=Yo(Qo.current),Yo(Vo.current),fo(t)){if(r=t.stateNode,n=t.memoizedProps,r[da]=t,(l=r.nodeValue!==n)&&null!==(e=no))switch(e.tag){case 3:Jr(r.nodeValue,n,!!(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Jr(r.nodeValue,n,!!(1&e.mode))}l&&(t.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[da]=t,t.stateNode=r}return Vi(t),null;case 13:if(Sa(el),r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(ao&&null!==ro&&1&t.mode&&!(128&t.flags))mo(),po(),t.flags|=98560,l=!1;else if(l=fo(t),null!==r&&null!==r.dehydrated){if(null===e){if(!l)throw Error(o(318));if(!(l=null!==(l=t.memoizedState)?l.dehydrated:null))throw Error(o(317));l[da]=t}else po(),!(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Vi(t),l=!1}else null!==oo&&(ls(oo),oo=null),l=!0;if(!l)return 65536&t.flags?t:null}return 128&t.flags?(t.lanes=n,t):((r=null!==r)!=(null!==e&&null!==e.memoizedState)&&r&&(t.child.flags|=8192,1&t.mode&&(null===e||1&el.current?0===Tc&&(Tc=3):hs())),null!==t.updateQueue&&(t.flags|=4),Vi(t),null);case 4:return Xo(),ji(e,t),null===e&&Wr(t.stateNode.containerInfo),Vi(t),null;case 10:return Bo(t.type._context),Vi(t),null;case 19:if(Sa(el),null===(l=t.memoizedState))return Vi(t),null;if(r=!!(128&t.flags),null===(c=l.rendering))if(r)qi(l,!1);else{if(0!==Tc||null!==e&&128&e.flags)for(e=t.child;null!==e;){if(null!==(c=tl(e))){for(t.flags|=128,qi(l,!1),null!==(r=c.updateQueue)&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;null!==n;)e=r,(l=n).flags&=14680066,null===(c=l.alternate)?(l.childLanes=0,l.lanes=e,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=c.childLanes,l.lanes=c.lanes,l.child=c.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=c.memoizedProps,l.memoizedState=c.memoizedState,l.updateQueue=c.updateQueue,l.type=c.type,e=c.dependencies,l.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return Na(el,1&el.current|2),t.child}e=e.sibling}null!==l.tail&&Xe()>Wc&&(t.flags|=128,r=!0,qi(l,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=tl(c))){if(t.flags|=128,r=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),qi(l,!0),null===l.tail&&"hidden"===l.tailMode&&!c.alternate&&!ao)return Vi(t),null}else 2*Xe()-l.renderingStartTime>Wc&&1073741824!==n&&(t.flags|=128,r=!0,qi(l,!1),t.lanes=4194304);l.isBackwards?(c.sibling=t.child,t.child=c):(null!==(n=l.last)?n.sibling=c:t.child=c,l.last=c)}return null!==l.tail?(t=l.tail,l.rendering=t,l.tail=t.sibling,l.renderingStartTime=Xe(),t.sibling=null,n=el.current,Na(el,r?1&n|2:1&n),t):(Vi(t),null);case 22:case 23:return fs(),r=null!==t.memoizedState,null!==e&&null!==e.memoizedState!==r&&(t.flags|=8192),r&&1&t.mode?!!(1073741824&jc)&&(Vi(t),6&t.subtreeFlags&&(t.flags|=8192)):Vi(t),null;case 24:case 25:return null}throw Error(o(156,t.tag))}function Qi(e,t){switch(to(t),t.tag){case 1:return ja(t.type)&&Ma(),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return Xo(),Sa(_a),Sa(Ba),rl(),65536&(e=t.flags)&&!(128&e)?(t.flags=-65537&e|128,t):null;case 5:return Zo(t),null;case 13:if(Sa(el),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));po()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Sa(el),null;case 4:return Xo(),null;case 10:return Bo(t.type._context),null;case 22:case 23:return fs(),null;default:return null}}Pi=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},ji=function(){},Mi=function(e,t,n,r){var a=e.memoizedProps;if(a!==r){e=t.stateNode,Yo(Vo.current);var o,l=null;switch(n){case"input":a=Y(e,a),r=Y(e,r),l=[];break;case"select":a=D({},a,{value:void 0}),r=D({},r,{value:void 0}),l=[];break;case"textarea":a=re(e,a),r=re(e,r),l=[];break;default:"function"!=typeof a.onClick&&"function"==typeof r.onClick&&(e.onclick=Zr)}for(u in be(n,r),n=null,a)if(!r.hasOwnProperty(u)&&a.hasOwnProperty(u)&&null!=a[u])if("style"===u){var c=a[u];for(o in c)c.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else"dangerouslySetInnerHTML"!==u&&"children"!==u&&"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&"autoFocus"!==u&&(i.hasOwnProperty(u)?l||(l=[]):(l=l||[]).push(u,null));for(u in r){var s=r[u];if(c=null!=a?a[u]:void 0,r.hasOwnProperty(u)&&s!==c&&(null!=s||null!=c))if("style"===u)if(c){for(o in c)!c.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in s)s.hasOwnProperty(o)&&c[o]!==s[o]&&(n||(n={}),n[o]=s[o])}else n||(l||(l=[]),l.push(u,n)),n=s;else"dangerouslySetInnerHTML"===u?(s=s?s.__html:void 0,c=c?c.__html:void 0,null!=s&&c!==s&&(l=l||[]).push(u,s)):"children"===u?"string"!=typeof s&&"number"!=typeof s||(l=l||[]).push(u,""+s):"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&(i.hasOwnProperty(u)?(null!=s&&"onScroll"===u&&Fr("scroll",e),l||c===s||(l=[])):(l=l||[]).push(u,s))}n&&(l=l||[]).push("style",n);var u=l;(t.updateQueue=u)&&(t.flags|=4)}},Ti=function(e,t,n,r){n!==r&&(t.flags|=4)};var Yi=!1,Ki=!1,Xi="function"==typeof WeakSet?WeakSet:Set,Ji=null;function Zi(e,t){var n=e.ref;if(null!==n)if("function"==typeof n)try{n(null)}catch(n){ks(e,t,n)}else n.current=null}function ec(e,t,n){try{n()}catch(n){ks(e,t,n)}}var tc=!1;function nc(e,t,n){var r=t.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var a=r=r.next;do{if((a.tag&e)===e){var o=a.destroy;a.destroy=void 0,void 0!==o&&ec(t,n,o)}a=a.next}while(a!==r)}}function rc(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function ac(e){var t=e.ref;if(null!==t){var n=e.stateNode;e.tag,e=n,"function"==typeof t?t(e):t.current=e}}function oc(e){var t=e.alternate;null!==t&&(e.alternate=null,oc(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&null!==(t=e.stateNode)&&(delete t[da],delete t[ma],delete t[ha],delete t[va],delete t[ga]),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function lc(e){return 5===e.tag||3===e.tag||4===e.tag}function ic(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||lc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function cc(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=Zr));else if(4!==r&&null!==(e=e.child))for(cc(e,t,n),e=e.sibling;null!==e;)cc(e,t,n),e=e.sibling}function sc(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(sc(e,t,n),e=e.sibling;null!==e;)sc(e,t,n),e=e.sibling}var uc=null,fc=!1;function dc(e,t,n){for(n=n.child;null!==n;)mc(e,t,n),n=n.sibling}function mc(e,t,n){if(ot&&"function"==typeof ot.onCommitFiberUnmount)try{ot.onCommitFiberUnmount(at,n)}catch(e){}switch(n.tag){case 5:Ki||Zi(n,t);case 6:var r=uc,a=fc;uc=null,dc(e,t,n),fc=a,null!==(uc=r)&&(fc?(e=uc,n=n.stateNode,8===e.nodeType?e.parentNode.removeChild(n):e.removeChild(n)):uc.removeChild(n.stateNode));break;case 18:null!==uc&&(fc?(e=uc,n=n.stateNode,8===e.nodeType?ca(e.parentNode,n):1===e.nodeType&&ca(e,n),Wt(e)):ca(uc,n.stateNode));break;case 4:r=uc,a=fc,uc=n.stateNode.containerInfo,fc=!0,dc(e,t,n),uc=r,fc=a;break;case 0:case 11:case 14:case 15:if(!Ki&&null!==(r=n.updateQueue)&&null!==(r=r.lastEffect)){a=r=r.next;do{var o=a,l=o.destroy;o=o.tag,void 0!==l&&(2&o||4&o)&&ec(n,t,l),a=a.next}while(a!==r)}dc(e,t,n);break;case 1:if(!Ki&&(Zi(n,t),"function"==typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(e){ks(n,t,e)}dc(e,t,n);break;case 21:dc(e,t,n);break;case 22:1&n.mode?(Ki=(r=Ki)||null!==n.memoizedState,dc(e,t,n),Ki=r):dc(e,t,n);break;default:dc(e,t,n)}}function pc(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new Xi),t.forEach(function(t){var r=Bs.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))})}}function hc(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var a=n[r];try{var l=e,i=t,c=i;e:for(;null!==c;){switch(c.tag){case 5:uc=c.stateNode,fc=!1;break e;case 3:case 4:uc=c.stateNode.containerInfo,fc=!0;break e}c=c.return}if(null===uc)throw Error(o(160));mc(l,i,a),uc=null,fc=!1;var s=a.alternate;null!==s&&(s.return=null),a.return=null}catch(e){ks(a,t,e)}}if(12854&t.subtreeFlags)for(t=t.child;null!==t;)vc(t,e),t=t.sibling}function vc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(hc(t,e),gc(e),4&r){try{nc(3,e,e.return),rc(3,e)}catch(t){ks(e,e.return,t)}try{nc(5,e,e.return)}catch(t){ks(e,e.return,t)}}break;case 1:hc(t,e),gc(e),512&r&&null!==n&&Zi(n,n.return);break;case 5:if(hc(t,e),gc(e),512&r&&null!==n&&Zi(n,n.return),32&e.flags){var a=e.stateNode;try{de(a,"")}catch(t){ks(e,e.return,t)}}if(4&r&&null!=(a=e.stateNode)){var l=e.memoizedProps,i=null!==n?n.memoizedProps:l,c=e.type,s=e.updateQueue;if(e.updateQueue=null,null!==s)try{"input"===c&&"radio"===l.type&&null!=l.name&&X(a,l),Ae(c,i);var u=Ae(c,l);for(i=0;i<s.length;i+=2){var f=s[i],d=s[i+1];"style"===f?ve(a,d):"dangerouslySetInnerHTML"===f?fe(a,d):"children"===f?de(a,d):A(a,f,d,u)}switch(c){case"input":J(a,l);break;case"textarea":oe(a,l);break;case"select":var m=a._wrapperState.wasMultiple;a._wrapperState.wasMultiple=!!l.multiple;var p=l.value;null!=p?ne(a,!!l.multiple,p,!1):m!==!!l.multiple&&(null!=l.defaultValue?ne(a,!!l.multiple,l.defaultValue,!0):ne(a,!!l.multiple,l.multiple?[]:"",!1))}a[ma]=l}catch(t){ks(e,e.return,t)}}break;case 6:if(hc(t,e),gc(e),4&r){if(null===e.stateNode)throw Error(o(162));a=e.stateNode,l=e.memoizedProps;try{a.nodeValue=l}catch(t){ks(e,e.return,t)}}break;case 3:if(hc(t,e),gc(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Wt(t.containerInfo)}catch(t){ks(e,e.return,t)}break;case 4:default:hc(t,e),gc(e);break;case 13:hc(t,e),gc(e),8192&(a=e.child).flags&&(l=null!==a.memoizedState,a.stateNode.isHidden=l,!l||null!==a.alternate&&null!==a.alternate.memoizedState||(Uc=Xe())),4&r&&pc(e);break;case 22:if(f=null!==n&&null!==n.memoizedState,1&e.mode?(Ki=(u=Ki)||f,hc(t,e),Ki=u):hc(t,e),gc(e),8192&r){if(u=null!==e.memoizedState,(e.stateNode.isHidden=u)&&!f&&1&e.mode)for(Ji=e,f=e.child;null!==f;){for(d=Ji=f;null!==Ji;){switch(p=(m=Ji).child,m.tag){case 0:case 11:case 14:case 15:nc(4,m,m.return);break;case 1:Zi(m,m.return);var h=m.stateNode;if("function"==typeof h.componentWillUnmount){r=m,n=m.return;try{t=r,h.props=t.memoizedProps,h.state=t.memoizedState,h.componentWillUnmount()}catch(e){ks(r,n,e)}}break;case 5:Zi(m,m.return);break;case 22:if(null!==m.memoizedState){Ec(d);continue}}null!==p?(p.return=m,Ji=p):Ec(d)}f=f.sibling}e:for(f=null,d=e;;){if(5===d.tag){if(null===f){f=d;try{a=d.stateNode,u?"function"==typeof(l=a.style).setProperty?l.setProperty("display","none","important"):l.display="none":(c=d.stateNode,i=null!=(s=d.memoizedProps.style)&&s.hasOwnProperty("display")?s.display:null,c.style.display=he("display",i))}catch(t){ks(e,e.return,t)}}}else if(6===d.tag){if(null===f)try{d.stateNode.nodeValue=u?"":d.memoizedProps}catch(t){ks(e,e.return,t)}}else if((22!==d.tag&&23!==d.tag||null===d.memoizedState||d===e)&&null!==d.child){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;null===d.sibling;){if(null===d.return||d.return===e)break e;f===d&&(f=null),d=d.return}f===d&&(f=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:hc(t,e),gc(e),4&r&&pc(e);case 21:}}function gc(e){var t=e.flags;if(2&t){try{e:{for(var n=e.return;null!==n;){if(lc(n)){var r=n;break e}n=n.return}throw Error(o(160))}switch(r.tag){case 5:var a=r.stateNode;32&r.flags&&(de(a,""),r.flags&=-33),sc(e,ic(e),a);break;case 3:case 4:var l=r.stateNode.containerInfo;cc(e,ic(e),l);break;default:throw Error(o(161))}}catch(t){ks(e,e.return,t)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function bc(e,t,n){Ji=e,Ac(e,t,n)}function Ac(e,t,n){for(var r=!!(1&e.mode);null!==Ji;){var a=Ji,o=a.child;if(22===a.tag&&r){var l=null!==a.memoizedState||Yi;if(!l){var i=a.alternate,c=null!==i&&null!==i.memoizedState||Ki;i=Yi;var s=Ki;if(Yi=l,(Ki=c)&&!s)for(Ji=a;null!==Ji;)c=(l=Ji).child,22===l.tag&&null!==l.memoizedState?wc(a):null!==c?(c.return=l,Ji=c):wc(a);for(;null!==o;)Ji=o,Ac(o,t,n),o=o.sibling;Ji=a,Yi=i,Ki=s}yc(e)}else 8772&a.subtreeFlags&&null!==o?(o.return=a,Ji=o):yc(e)}}function yc(e){for(;null!==Ji;){var t=Ji;if(8772&t.flags){var n=t.alternate;try{if(8772&t.flags)switch(t.tag){case 0:case 11:case 15:Ki||rc(5,t);break;case 1:var r=t.stateNode;if(4&t.flags&&!Ki)if(null===n)r.componentDidMount();else{var a=t.elementType===t.type?n.memoizedProps:ni(t.type,n.memoizedProps);r.componentDidUpdate(a,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var l=t.updateQueue;null!==l&&$o(t,l,r);break;case 3:var i=t.updateQueue;if(null!==i){if(n=null,null!==t.child)switch(t.child.tag){case 5:case 1:n=t.child.stateNode}$o(t,i,n)}break;case 5:var c=t.stateNode;if(null===n&&4&t.flags){n=c;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===t.memoizedState){var u=t.alternate;if(null!==u){var f=u.memoizedState;if(null!==f){var d=f.dehydrated;null!==d&&Wt(d)}}}break;default:throw Error(o(163))}Ki||512&t.flags&&ac(t)}catch(e){ks(t,t.return,e)}}if(t===e){Ji=null;break}if(null!==(n=t.sibling)){n.return=t.return,Ji=n;break}Ji=t.return}}function Ec(e){for(;null!==Ji;){var t=Ji;if(t===e){Ji=null;break}var n=t.sibling;if(null!==n){n.return=t.return,Ji=n;break}Ji=t.return}}function wc(e){for(;null!==Ji;){var t=Ji;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{rc(4,t)}catch(e){ks(t,n,e)}break;case 1:var r=t.stateNode;if("function"==typeof r.componentDidMount){var a=t.return;try{r.componentDidMount()}catch(e){ks(t,a,e)}}var o=t.return;try{ac(t)}catch(e){ks(t,o,e)}break;case 5:var l=t.return;try{ac(t)}catch(e){ks(t,l,e)}}}catch(e){ks(t,t.return,e)}if(t===e){Ji=null;break}var i=t.sibling;if(null!==i){i.return=t.return,Ji=i;break}Ji=t.return}}var xc,kc=Math.ceil,Sc=y.ReactCurrentDispatcher,Nc=y.ReactCurrentOwner,Cc=y.ReactCurrentBatchConfig,Bc=0,_c=null,Oc=null,Pc=0,jc=0,Mc=ka(0),Tc=0,zc=null,Lc=0,Dc=0,Rc=0,Fc=null,Ic=null,Uc=0,Wc=1/0,Hc=null,$c=!1,qc=null,Vc=null,Gc=!1,Qc=null,Yc=0,Kc=0,Xc=null,Jc=-1,Zc=0;function es(){return 6&Bc?Xe():-1!==Jc?Jc:Jc=Xe()}function ts(e){return 1&e.mode?2&Bc&&0!==Pc?Pc&-Pc:null!==vo.transition?(0===Zc&&(Zc=ht()),Zc):0!==(e=At)?e:e=void 0===(e=window.event)?16:Kt(e.type):1}function ns(e,t,n,r){if(50<Kc)throw Kc=0,Xc=null,Error(o(185));gt(e,n,r),2&Bc&&e===_c||(e===_c&&(!(2&Bc)&&(Dc|=n),4===Tc&&is(e,Pc)),rs(e,r),1===n&&0===Bc&&!(1&t.mode)&&(Wc=Xe()+500,Fa&&Wa()))}function rs(e,t){var n=e.callbackNode;!function(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,a=e.expirationTimes,o=e.pendingLanes;0<o;){var l=31-lt(o),i=1<<l,c=a[l];-1===c?0!==(i&n)&&0===(i&r)||(a[l]=mt(i,t)):c<=t&&(e.expiredLanes|=i),o&=~i}}(e,t);var r=dt(e,e===_c?Pc:0);if(0===r)null!==n&&Qe(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(null!=n&&Qe(n),1===t)0===e.tag?function(e){Fa=!0,Ua(e)}(cs.bind(null,e)):Ua(cs.bind(null,e)),la(function(){!(6&Bc)&&Wa()}),n=null;else{switch(yt(r)){case 1:n=Ze;break;case 4:n=et;break;case 16:default:n=tt;break;case 536870912:n=rt}n=_s(n,as.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function as(e,t){if(Jc=-1,Zc=0,6&Bc)throw Error(o(327));var n=e.callbackNode;if(ws()&&e.callbackNode!==n)return null;var r=dt(e,e===_c?Pc:0);if(0===r)return null;if(30&r||0!==(r&e.expiredLanes)||t)t=vs(e,r);else{t=r;var a=Bc;Bc|=2;var l=ps();for(_c===e&&Pc===t||(Hc=null,Wc=Xe()+500,ds(e,t));;)try{bs();break}catch(t){ms(e,t)}Co(),Sc.current=l,Bc=a,null!==Oc?t=0:(_c=null,Pc=0,t=Tc)}if(0!==t){if(2===t&&0!==(a=pt(e))&&(r=a,t=os(e,a)),1===t)throw n=zc,ds(e,0),is(e,r),rs(e,Xe()),n;if(6===t)is(e,r);else{if(a=e.current.alternate,!(30&r||function(e){for(var t=e;;){if(16384&t.flags){var n=t.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var a=n[r],o=a.getSnapshot;a=a.value;try{if(!ir(o(),a))return!1}catch(e){return!1}}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}(a)||(t=vs(e,r),2===t&&(l=pt(e),0!==l&&(r=l,t=os(e,l))),1!==t)))throw n=zc,ds(e,0),is(e,r),rs(e,Xe()),n;switch(e.finishedWork=a,e.finishedLanes=r,t){case 0:case 1:throw Error(o(345));case 2:case 5:Es(e,Ic,Hc);break;case 3:if(is(e,r),(130023424&r)===r&&10<(t=Uc+500-Xe())){if(0!==dt(e,0))break;if(((a=e.suspendedLanes)&r)!==r){es(),e.pingedLanes|=e.suspendedLanes&a;break}e.timeoutHandle=ra(Es.bind(null,e,Ic,Hc),t);break}Es(e,Ic,Hc);break;case 4:if(is(e,r),(4194240&r)===r)break;for(t=e.eventTimes,a=-1;0<r;){var i=31-lt(r);l=1<<i,(i=t[i])>a&&(a=i),r&=~l}if(r=a,10<(r=(120>(r=Xe()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*kc(r/1960))-r)){e.timeoutHandle=ra(Es.bind(null,e,Ic,Hc),r);break}Es(e,Ic,Hc);break;default:throw Error(o(329))}}}return rs(e,Xe()),e.callbackNode===n?as.bind(null,e):null}function os(e,t){var n=Fc;return e.current.memoizedState.isDehydrated&&(ds(e,t).flags|=256),2!==(e=vs(e,t))&&(t=Ic,Ic=n,null!==t&&ls(t)),e}function ls(e){null===Ic?Ic=e:Ic.push.apply(Ic,e)}function is(e,t){for(t&=~Rc,t&=~Dc,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-lt(t),r=1<<n;e[n]=-1,t&=~r}}function cs(e){if(6&Bc)throw Error(o(327));ws();var t=dt(e,0);if(!(1&t))return rs(e,Xe()),null;var n=vs(e,t);if(0!==e.tag&&2===n){var r=pt(e);0!==r&&(t=r,n=os(e,r))}if(1===n)throw n=zc,ds(e,0),is(e,t),rs(e,Xe()),n;if(6===n)throw Error(o(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Es(e,Ic,Hc),rs(e,Xe()),null}function ss(e,t){var n=Bc;Bc|=1;try{return e(t)}finally{0===(Bc=n)&&(Wc=Xe()+500,Fa&&Wa())}}function us(e){null!==Qc&&0===Qc.tag&&!(6&Bc)&&ws();var t=Bc;Bc|=1;var n=Cc.transition,r=At;try{if(Cc.transition=null,At=1,e)return e()}finally{At=r,Cc.transition=n,!(6&(Bc=t))&&Wa()}}function fs(){jc=Mc.current,Sa(Mc)}function ds(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,aa(n)),null!==Oc)for(n=Oc.return;null!==n;){var r=n;switch(to(r),r.tag){case 1:null!=(r=r.type.childContextTypes)&&Ma();break;case 3:Xo(),Sa(_a),Sa(Ba),rl();break;case 5:Zo(r);break;case 4:Xo();break;case 13:case 19:Sa(el);break;case 10:Bo(r.type._context);break;case 22:case 23:fs()}n=n.return}if(_c=e,Oc=e=Ms(e.current,null),Pc=jc=t,Tc=0,zc=null,Rc=Dc=Lc=0,Ic=Fc=null,null!==jo){for(t=0;t<jo.length;t++)if(null!==(r=(n=jo[t]).interleaved)){n.interleaved=null;var a=r.next,o=n.pending;if(null!==o){var l=o.next;o.next=a,r.next=l}n.pending=r}jo=null}return e}function ms(e,t){for(;;){var n=Oc;try{if(Co(),al.current=Jl,ul){for(var r=il.memoizedState;null!==r;){var a=r.queue;null!==a&&(a.pending=null),r=r.next}ul=!1}if(ll=0,sl=cl=il=null,fl=!1,dl=0,Nc.current=null,null===n||null===n.return){Tc=1,zc=t,Oc=null;break}e:{var l=e,i=n.return,c=n,s=t;if(t=Pc,c.flags|=32768,null!==s&&"object"==typeof s&&"function"==typeof s.then){var u=s,f=c,d=f.tag;if(!(1&f.mode||0!==d&&11!==d&&15!==d)){var m=f.alternate;m?(f.updateQueue=m.updateQueue,f.memoizedState=m.memoizedState,f.lanes=m.lanes):(f.updateQueue=null,f.memoizedState=null)}var p=vi(i);if(null!==p){p.flags&=-257,gi(p,i,c,0,t),1&p.mode&&hi(l,u,t),s=u;var h=(t=p).updateQueue;if(null===h){var v=new Set;v.add(s),t.updateQueue=v}else h.add(s);break e}if(!(1&t)){hi(l,u,t),hs();break e}s=Error(o(426))}else if(ao&&1&c.mode){var g=vi(i);if(null!==g){!(65536&g.flags)&&(g.flags|=256),gi(g,i,c,0,t),ho(si(s,c));break e}}l=s=si(s,c),4!==Tc&&(Tc=2),null===Fc?Fc=[l]:Fc.push(l),l=i;do{switch(l.tag){case 3:l.flags|=65536,t&=-t,l.lanes|=t,Wo(l,mi(0,s,t));break e;case 1:c=s;var b=l.type,A=l.stateNode;if(!(128&l.flags||"function"!=typeof b.getDerivedStateFromError&&(null===A||"function"!=typeof A.componentDidCatch||null!==Vc&&Vc.has(A)))){l.flags|=65536,t&=-t,l.lanes|=t,Wo(l,pi(l,c,t));break e}}l=l.return}while(null!==l)}ys(n)}catch(e){t=e,Oc===n&&null!==n&&(Oc=n=n.return);continue}break}}function ps(){var e=Sc.current;return Sc.current=Jl,null===e?Jl:e}function hs(){0!==Tc&&3!==Tc&&2!==Tc||(Tc=4),null===_c||!(268435455&Lc)&&!(268435455&Dc)||is(_c,Pc)}function vs(e,t){var n=Bc;Bc|=2;var r=ps();for(_c===e&&Pc===t||(Hc=null,ds(e,t));;)try{gs();break}catch(t){ms(e,t)}if(Co(),Bc=n,Sc.current=r,null!==Oc)throw Error(o(261));return _c=null,Pc=0,Tc}function gs(){for(;null!==Oc;)As(Oc)}function bs(){for(;null!==Oc&&!Ye();)As(Oc)}function As(e){var t=xc(e.alternate,e,jc);e.memoizedProps=e.pendingProps,null===t?ys(e):Oc=t,Nc.current=null}function ys(e){var t=e;do{var n=t.alternate;if(e=t.return,32768&t.flags){if(null!==(n=Qi(n,t)))return n.flags&=32767,void(Oc=n);if(null===e)return Tc=6,void(Oc=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}else if(null!==(n=Gi(n,t,jc)))return void(Oc=n);if(null!==(t=t.sibling))return void(Oc=t);Oc=t=e}while(null!==t);0===Tc&&(Tc=5)}function Es(e,t,n){var r=At,a=Cc.transition;try{Cc.transition=null,At=1,function(e,t,n,r){do{ws()}while(null!==Qc);if(6&Bc)throw Error(o(327));n=e.finishedWork;var a=e.finishedLanes;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(o(177));e.callbackNode=null,e.callbackPriority=0;var l=n.lanes|n.childLanes;if(function(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var a=31-lt(n),o=1<<a;t[a]=0,r[a]=-1,e[a]=-1,n&=~o}}(e,l),e===_c&&(Oc=_c=null,Pc=0),!(2064&n.subtreeFlags)&&!(2064&n.flags)||Gc||(Gc=!0,_s(tt,function(){return ws(),null})),l=!!(15990&n.flags),15990&n.subtreeFlags||l){l=Cc.transition,Cc.transition=null;var i=At;At=1;var c=Bc;Bc|=4,Nc.current=null,function(e,t){if(ea=$t,mr(e=dr())){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var a=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch(e){n=null;break e}var i=0,c=-1,s=-1,u=0,f=0,d=e,m=null;t:for(;;){for(var p;d!==n||0!==a&&3!==d.nodeType||(c=i+a),d!==l||0!==r&&3!==d.nodeType||(s=i+r),3===d.nodeType&&(i+=d.nodeValue.length),null!==(p=d.firstChild);)m=d,d=p;for(;;){if(d===e)break t;if(m===n&&++u===a&&(c=i),m===l&&++f===r&&(s=i),null!==(p=d.nextSibling))break;m=(d=m).parentNode}d=p}n=-1===c||-1===s?null:{start:c,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(ta={focusedElem:e,selectionRange:n},$t=!1,Ji=t;null!==Ji;)if(e=(t=Ji).child,1028&t.subtreeFlags&&null!==e)e.return=t,Ji=e;else for(;null!==Ji;){t=Ji;try{var h=t.alternate;if(1024&t.flags)switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==h){var v=h.memoizedProps,g=h.memoizedState,b=t.stateNode,A=b.getSnapshotBeforeUpdate(t.elementType===t.type?v:ni(t.type,v),g);b.__reactInternalSnapshotBeforeUpdate=A}break;case 3:var y=t.stateNode.containerInfo;1===y.nodeType?y.textContent="":9===y.nodeType&&y.documentElement&&y.removeChild(y.documentElement);break;default:throw Error(o(163))}}catch(e){ks(t,t.return,e)}if(null!==(e=t.sibling)){e.return=t.return,Ji=e;break}Ji=t.return}h=tc,tc=!1}(e,n),vc(n,e),pr(ta),$t=!!ea,ta=ea=null,e.current=n,bc(n,e,a),Ke(),Bc=c,At=i,Cc.transition=l}else e.current=n;if(Gc&&(Gc=!1,Qc=e,Yc=a),0===(l=e.pendingLanes)&&(Vc=null),function(e){if(ot&&"function"==typeof ot.onCommitFiberRoot)try{ot.onCommitFiberRoot(at,e,void 0,!(128&~e.current.flags))}catch(e){}}(n.stateNode),rs(e,Xe()),null!==t)for(r=e.onRecoverableError,n=0;n<t.length;n++)r((a=t[n]).value,{componentStack:a.stack,digest:a.digest});if($c)throw $c=!1,e=qc,qc=null,e;!!(1&Yc)&&0!==e.tag&&ws(),1&(l=e.pendingLanes)?e===Xc?Kc++:(Kc=0,Xc=e):Kc=0,Wa()}(e,t,n,r)}finally{Cc.transition=a,At=r}return null}function ws(){if(null!==Qc){var e=yt(Yc),t=Cc.transition,n=At;try{if(Cc.transition=null,At=16>e?16:e,null===Qc)var r=!1;else{if(e=Qc,Qc=null,Yc=0,6&Bc)throw Error(o(331));var a=Bc;for(Bc|=4,Ji=e.current;null!==Ji;){var l=Ji,i=l.child;if(16&Ji.flags){var c=l.deletions;if(null!==c){for(var s=0;s<c.length;s++){var u=c[s];for(Ji=u;null!==Ji;){var f=Ji;switch(f.tag){case 0:case 11:case 15:nc(8,f,l)}var d=f.child;if(null!==d)d.return=f,Ji=d;else for(;null!==Ji;){var m=(f=Ji).sibling,p=f.return;if(oc(f),f===u){Ji=null;break}if(null!==m){m.return=p,Ji=m;break}Ji=p}}}var h=l.alternate;if(null!==h){var v=h.child;if(null!==v){h.child=null;do{var g=v.sibling;v.sibling=null,v=g}while(null!==v)}}Ji=l}}if(2064&l.subtreeFlags&&null!==i)i.return=l,Ji=i;else e:for(;null!==Ji;){if(2048&(l=Ji).flags)switch(l.tag){case 0:case 11:case 15:nc(9,l,l.return)}var b=l.sibling;if(null!==b){b.return=l.return,Ji=b;break e}Ji=l.return}}var A=e.current;for(Ji=A;null!==Ji;){var y=(i=Ji).child;if(2064&i.subtreeFlags&&null!==y)y.return=i,Ji=y;else e:for(i=A;null!==Ji;){if(2048&(c=Ji).flags)try{switch(c.tag){case 0:case 11:case 15:rc(9,c)}}catch(e){ks(c,c.return,e)}if(c===i){Ji=null;break e}var E=c.sibling;if(null!==E){E.return=c.return,Ji=E;break e}Ji=c.return}}if(Bc=a,Wa(),ot&&"function"==typeof ot.onPostCommitFiberRoot)try{ot.onPostCommitFiberRoot(at,e)}catch(e){}r=!0}return r}finally{At=n,Cc.transition=t}}return!1}function xs(e,t,n){e=Io(e,t=mi(0,t=si(n,t),1),1),t=es(),null!==e&&(gt(e,1,t),rs(e,t))}function ks(e,t,n){if(3===e.tag)xs(e,e,n);else for(;null!==t;){if(3===t.tag){xs(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"==typeof t.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Vc||!Vc.has(r))){t=Io(t,e=pi(t,e=si(n,e),1),1),e=es(),null!==t&&(gt(t,1,e),rs(t,e));break}}t=t.return}}function Ss(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=es(),e.pingedLanes|=e.suspendedLanes&n,_c===e&&(Pc&n)===n&&(4===Tc||3===Tc&&(130023424&Pc)===Pc&&500>Xe()-Uc?ds(e,0):Rc|=n),rs(e,t)}function Ns(e,t){0===t&&(1&e.mode?(t=ut,!(130023424&(ut<<=1))&&(ut=4194304)):t=1);var n=es();null!==(e=zo(e,t))&&(gt(e,t,n),rs(e,n))}function Cs(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),Ns(e,n)}function Bs(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,a=e.memoizedState;null!==a&&(n=a.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(o(314))}null!==r&&r.delete(t),Ns(e,n)}function _s(e,t){return Ge(e,t)}function Os(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ps(e,t,n,r){return new Os(e,t,n,r)}function js(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Ms(e,t){var n=e.alternate;return null===n?((n=Ps(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Ts(e,t,n,r,a,l){var i=2;if(r=e,"function"==typeof e)js(e)&&(i=1);else if("string"==typeof e)i=5;else e:switch(e){case x:return zs(n.children,a,l,t);case k:i=8,a|=8;break;case S:return(e=Ps(12,n,t,2|a)).elementType=S,e.lanes=l,e;case _:return(e=Ps(13,n,t,a)).elementType=_,e.lanes=l,e;case O:return(e=Ps(19,n,t,a)).elementType=O,e.lanes=l,e;case M:return Ls(n,a,l,t);default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case N:i=10;break e;case C:i=9;break e;case B:i=11;break e;case P:i=14;break e;case j:i=16,r=null;break e}throw Error(o(130,null==e?e:typeof e,""))}return(t=Ps(i,n,t,a)).elementType=e,t.type=r,t.lanes=l,t}function zs(e,t,n,r){return(e=Ps(7,e,r,t)).lanes=n,e}function Ls(e,t,n,r){return(e=Ps(22,e,r,t)).elementType=M,e.lanes=n,e.stateNode={isHidden:!1},e}function Ds(e,t,n){return(e=Ps(6,e,null,t)).lanes=n,e}function Rs(e,t,n){return(t=Ps(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Fs(e,t,n,r,a){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=vt(0),this.expirationTimes=vt(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=vt(0),this.identifierPrefix=r,this.onRecoverableError=a,this.mutableSourceEagerHydrationData=null}function Is(e,t,n,r,a,o,l,i,c){return e=new Fs(e,t,n,i,c),1===t?(t=1,!0===o&&(t|=8)):t=0,o=Ps(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Do(o),e}function Us(e){if(!e)return Ca;e:{if(We(e=e._reactInternals)!==e||1!==e.tag)throw Error(o(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ja(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(null!==t);throw Error(o(171))}if(1===e.tag){var n=e.type;if(ja(n))return za(e,n,t)}return t}function Ws(e,t,n,r,a,o,l,i,c){return(e=Is(n,r,!0,e,0,o,0,i,c)).context=Us(null),n=e.current,(o=Fo(r=es(),a=ts(n))).callback=null!=t?t:null,Io(n,o,a),e.current.lanes=a,gt(e,a,r),rs(e,r),e}function Hs(e,t,n,r){var a=t.current,o=es(),l=ts(a);return n=Us(n),null===t.context?t.context=n:t.pendingContext=n,(t=Fo(o,l)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),null!==(e=Io(a,t,l))&&(ns(e,a,l,o),Uo(e,a,l)),l}function $s(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function qs(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Vs(e,t){qs(e,t),(e=e.alternate)&&qs(e,t)}xc=function(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps||_a.current)Ai=!0;else{if(0===(e.lanes&n)&&!(128&t.flags))return Ai=!1,function(e,t,n){switch(t.tag){case 3:_i(t),po();break;case 5:Jo(t);break;case 1:ja(t.type)&&La(t);break;case 4:Ko(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,a=t.memoizedProps.value;Na(xo,r._currentValue),r._currentValue=a;break;case 13:if(null!==(r=t.memoizedState))return null!==r.dehydrated?(Na(el,1&el.current),t.flags|=128,null):0!==(n&t.child.childLanes)?Di(e,t,n):(Na(el,1&el.current),null!==(e=$i(e,t,n))?e.sibling:null);Na(el,1&el.current);break;case 19:if(r=0!==(n&t.childLanes),128&e.flags){if(r)return Wi(e,t,n);t.flags|=128}if(null!==(a=t.memoizedState)&&(a.rendering=null,a.tail=null,a.lastEffect=null),Na(el,el.current),r)break;return null;case 22:case 23:return t.lanes=0,ki(e,t,n)}return $i(e,t,n)}(e,t,n);Ai=!!(131072&e.flags)}else Ai=!1,ao&&1048576&t.flags&&Za(t,Va,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Hi(e,t),e=t.pendingProps;var a=Pa(t,Ba.current);Oo(t,n),a=vl(null,t,r,e,a,n);var l=gl();return t.flags|=1,"object"==typeof a&&null!==a&&"function"==typeof a.render&&void 0===a.$$typeof?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ja(r)?(l=!0,La(t)):l=!1,t.memoizedState=null!==a.state&&void 0!==a.state?a.state:null,Do(t),a.updater=ai,t.stateNode=a,a._reactInternals=t,ci(t,r,e,n),t=Bi(null,t,r,!0,l,n)):(t.tag=0,ao&&l&&eo(t),yi(null,t,a,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Hi(e,t),e=t.pendingProps,r=(a=r._init)(r._payload),t.type=r,a=t.tag=function(e){if("function"==typeof e)return js(e)?1:0;if(null!=e){if((e=e.$$typeof)===B)return 11;if(e===P)return 14}return 2}(r),e=ni(r,e),a){case 0:t=Ni(null,t,r,e,n);break e;case 1:t=Ci(null,t,r,e,n);break e;case 11:t=Ei(null,t,r,e,n);break e;case 14:t=wi(null,t,r,ni(r.type,e),n);break e}throw Error(o(306,r,""))}return t;case 0:return r=t.type,a=t.pendingProps,Ni(e,t,r,a=t.elementType===r?a:ni(r,a),n);case 1:return r=t.type,a=t.pendingProps,Ci(e,t,r,a=t.elementType===r?a:ni(r,a),n);case 3:e:{if(_i(t),null===e)throw Error(o(387));r=t.pendingProps,a=(l=t.memoizedState).element,Ro(e,t),Ho(t,r,null,n);var i=t.memoizedState;if(r=i.element,l.isDehydrated){if(l={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=l,t.memoizedState=l,256&t.flags){t=Oi(e,t,r,n,a=si(Error(o(423)),t));break e}if(r!==a){t=Oi(e,t,r,n,a=si(Error(o(424)),t));break e}for(ro=sa(t.stateNode.containerInfo.firstChild),no=t,ao=!0,oo=null,n=wo(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(po(),r===a){t=$i(e,t,n);break e}yi(e,t,r,n)}t=t.child}return t;case 5:return Jo(t),null===e&&so(t),r=t.type,a=t.pendingProps,l=null!==e?e.memoizedProps:null,i=a.children,na(r,a)?i=null:null!==l&&na(r,l)&&(t.flags|=32),Si(e,t),yi(e,t,i,n),t.child;case 6:return null===e&&so(t),null;case 13:return Di(e,t,n);case 4:return Ko(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=Eo(t,null,r,n):yi(e,t,r,n),t.child;case 11:return r=t.type,a=t.pendingProps,Ei(e,t,r,a=t.elementType===r?a:ni(r,a),n);case 7:return yi(e,t,t.pendingProps,n),t.child;case 8:case 12:return yi(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,a=t.pendingProps,l=t.memoizedProps,i=a.value,Na(xo,r._currentValue),r._currentValue=i,null!==l)if(ir(l.value,i)){if(l.children===a.children&&!_a.current){t=$i(e,t,n);break e}}else for(null!==(l=t.child)&&(l.return=t);null!==l;){var c=l.dependencies;if(null!==c){i=l.child;for(var s=c.firstContext;null!==s;){if(s.context===r){if(1===l.tag){(s=Fo(-1,n&-n)).tag=2;var u=l.updateQueue;if(null!==u){var f=(u=u.shared).pending;null===f?s.next=s:(s.next=f.next,f.next=s),u.pending=s}}l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),_o(l.return,n,t),c.lanes|=n;break}s=s.next}}else if(10===l.tag)i=l.type===t.type?null:l.child;else if(18===l.tag){if(null===(i=l.return))throw Error(o(341));i.lanes|=n,null!==(c=i.alternate)&&(c.lanes|=n),_o(i,n,t),i=l.sibling}else i=l.child;if(null!==i)i.return=l;else for(i=l;null!==i;){if(i===t){i=null;break}if(null!==(l=i.sibling)){l.return=i.return,i=l;break}i=i.return}l=i}yi(e,t,a.children,n),t=t.child}return t;case 9:return a=t.type,r=t.pendingProps.children,Oo(t,n),r=r(a=Po(a)),t.flags|=1,yi(e,t,r,n),t.child;case 14:return a=ni(r=t.type,t.pendingProps),wi(e,t,r,a=ni(r.type,a),n);case 15:return xi(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,a=t.pendingProps,a=t.elementType===r?a:ni(r,a),Hi(e,t),t.tag=1,ja(r)?(e=!0,La(t)):e=!1,Oo(t,n),li(t,r,a),ci(t,r,a,n),Bi(null,t,r,!0,e,n);case 19:return Wi(e,t,n);case 22:return ki(e,t,n)}throw Error(o(156,t.tag))};var Gs="function"==typeof reportError?reportError:function(e){console.error(e)};function Qs(e){this._internalRoot=e}function Ys(e){this._internalRoot=e}function Ks(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Xs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Js(){}function Zs(e,t,n,r,a){var o=n._reactRootContainer;if(o){var l=o;if("function"==typeof a){var i=a;a=function(){var e=$s(l);i.call(e)}}Hs(t,l,e,a)}else l=function(e,t,n,r,a){if(a){if("function"==typeof r){var o=r;r=function(){var e=$s(l);o.call(e)}}var l=Ws(t,r,e,0,null,!1,0,"",Js);return e._reactRootContainer=l,e[pa]=l.current,Wr(8===e.nodeType?e.parentNode:e),us(),l}for(;a=e.lastChild;)e.removeChild(a);if("function"==typeof r){var i=r;r=function(){var e=$s(c);i.call(e)}}var c=Is(e,0,!1,null,0,!1,0,"",Js);return e._reactRootContainer=c,e[pa]=c.current,Wr(8===e.nodeType?e.parentNode:e),us(function(){Hs(t,c,n,r)}),c}(n,t,e,a,r);return $s(l)}Ys.prototype.render=Qs.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));Hs(e,t,null,null)},Ys.prototype.unmount=Qs.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;us(function(){Hs(null,e,null,null)}),t[pa]=null}},Ys.prototype.unstable_scheduleHydration=function(e){if(e){var t=kt();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Mt.length&&0!==t&&t<Mt[n].priority;n++);Mt.splice(n,0,e),0===n&&Dt(e)}},Et=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=ft(t.pendingLanes);0!==n&&(bt(t,1|n),rs(t,Xe()),!(6&Bc)&&(Wc=Xe()+500,Wa()))}break;case 13:us(function(){var t=zo(e,1);if(null!==t){var n=es();ns(t,e,1,n)}}),Vs(e,1)}},wt=function(e){if(13===e.tag){var t=zo(e,134217728);null!==t&&ns(t,e,134217728,es()),Vs(e,134217728)}},xt=function(e){if(13===e.tag){var t=ts(e),n=zo(e,t);null!==n&&ns(n,e,t,es()),Vs(e,t)}},kt=function(){return At},St=function(e,t){var n=At;try{return At=e,t()}finally{At=n}},we=function(e,t,n){switch(t){case"input":if(J(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var a=Ea(r);if(!a)throw Error(o(90));G(r),J(r,a)}}}break;case"textarea":oe(e,n);break;case"select":null!=(t=n.value)&&ne(e,!!n.multiple,t,!1)}},Be=ss,_e=us;var eu={usingClientEntryPoint:!1,Events:[Aa,ya,Ea,Ne,Ce,ss]},tu={findFiberByHostInstance:ba,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},nu={bundleType:tu.bundleType,version:tu.version,rendererPackageName:tu.rendererPackageName,rendererConfig:tu.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:y.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=qe(e))?null:e.stateNode},findFiberByHostInstance:tu.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var ru=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ru.isDisabled&&ru.supportsFiber)try{at=ru.inject(nu),ot=ru}catch(ue){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=eu,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Ks(t))throw Error(o(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:w,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.createRoot=function(e,t){if(!Ks(e))throw Error(o(299));var n=!1,r="",a=Gs;return null!=t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onRecoverableError&&(a=t.onRecoverableError)),t=Is(e,1,!1,null,0,n,0,r,a),e[pa]=t.current,Wr(8===e.nodeType?e.parentNode:e),new Qs(t)},t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"==typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return null===(e=qe(t))?null:e.stateNode},t.flushSync=function(e){return us(e)},t.hydrate=function(e,t,n){if(!Xs(t))throw Error(o(200));return Zs(null,e,t,!0,n)},t.hydrateRoot=function(e,t,n){if(!Ks(e))throw Error(o(405));var r=null!=n&&n.hydratedSources||null,a=!1,l="",i=Gs;if(null!=n&&(!0===n.unstable_strictMode&&(a=!0),void 0!==n.identifierPrefix&&(l=n.identifierPrefix),void 0!==n.onRecoverableError&&(i=n.onRecoverableError)),t=Ws(t,null,e,1,null!=n?n:null,a,0,l,i),e[pa]=t.current,Wr(e),r)for(e=0;e<r.length;e++)a=(a=(n=r[e])._getVersion)(n._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[n,a]:t.mutableSourceEagerHydrationData.push(n,a);return new Ys(t)},t.render=function(e,t,n){if(!Xs(t))throw Error(o(200));return Zs(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Xs(e))throw Error(o(40));return!!e._reactRootContainer&&(us(function(){Zs(null,null,e,!1,function(){e._reactRootContainer=null,e[pa]=null})}),!0)},t.unstable_batchedUpdates=ss,t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Xs(n))throw Error(o(200));if(null==e||void 0===e._reactInternals)throw Error(o(38));return Zs(e,t,n,!1,r)},t.version="18.3.1-next-f1338f8080-20240426"},659:e=>{var t={};e.exports=function(e,n){var r=function(e){if(void 0===t[e]){var n=document.querySelector(e);if(window.HTMLIFrameElement&&n instanceof window.HTMLIFrameElement)try{n=n.contentDocument.head}catch(e){n=null}t[e]=n}return t[e]}(e);if(!r)throw new Error("Couldn't find a style target. This probably means that the value for the 'insert' parameter is invalid.");r.appendChild(n)}},825:e=>{e.exports=function(e){if("undefined"==typeof document)return{update:function(){},remove:function(){}};var t=e.insertStyleElement(e);return{update:function(n){!function(e,t,n){var r="";n.supports&&(r+="@supports (".concat(n.supports,") {")),n.media&&(r+="@media ".concat(n.media," {"));var a=void 0!==n.layer;a&&(r+="@layer".concat(n.layer.length>0?" ".concat(n.layer):""," {")),r+=n.css,a&&(r+="}"),n.media&&(r+="}"),n.supports&&(r+="}");var o=n.sourceMap;o&&"undefined"!=typeof btoa&&(r+="\n/*# sourceMappingURL=data:application/json;base64,".concat(btoa(unescape(encodeURIComponent(JSON.stringify(o))))," */")),t.styleTagTransform(r,e,t.options)}(t,e,n)},remove:function(){!function(e){if(null===e.parentNode)return!1;e.parentNode.removeChild(e)}(t)}}}},956:(e,t,n)=>{n.d(t,{A:()=>i});var r=n(354),a=n.n(r),o=n(314),l=n.n(o)()(a());l.push([e.id,"*, ::before, ::after {\n  --tw-border-spacing-x: 0;\n  --tw-border-spacing-y: 0;\n  --tw-translate-x: 0;\n  --tw-translate-y: 0;\n  --tw-rotate: 0;\n  --tw-skew-x: 0;\n  --tw-skew-y: 0;\n  --tw-scale-x: 1;\n  --tw-scale-y: 1;\n  --tw-pan-x:  ;\n  --tw-pan-y:  ;\n  --tw-pinch-zoom:  ;\n  --tw-scroll-snap-strictness: proximity;\n  --tw-gradient-from-position:  ;\n  --tw-gradient-via-position:  ;\n  --tw-gradient-to-position:  ;\n  --tw-ordinal:  ;\n  --tw-slashed-zero:  ;\n  --tw-numeric-figure:  ;\n  --tw-numeric-spacing:  ;\n  --tw-numeric-fraction:  ;\n  --tw-ring-inset:  ;\n  --tw-ring-offset-width: 0px;\n  --tw-ring-offset-color: #fff;\n  --tw-ring-color: rgb(59 130 246 / 0.5);\n  --tw-ring-offset-shadow: 0 0 #0000;\n  --tw-ring-shadow: 0 0 #0000;\n  --tw-shadow: 0 0 #0000;\n  --tw-shadow-colored: 0 0 #0000;\n  --tw-blur:  ;\n  --tw-brightness:  ;\n  --tw-contrast:  ;\n  --tw-grayscale:  ;\n  --tw-hue-rotate:  ;\n  --tw-invert:  ;\n  --tw-saturate:  ;\n  --tw-sepia:  ;\n  --tw-drop-shadow:  ;\n  --tw-backdrop-blur:  ;\n  --tw-backdrop-brightness:  ;\n  --tw-backdrop-contrast:  ;\n  --tw-backdrop-grayscale:  ;\n  --tw-backdrop-hue-rotate:  ;\n  --tw-backdrop-invert:  ;\n  --tw-backdrop-opacity:  ;\n  --tw-backdrop-saturate:  ;\n  --tw-backdrop-sepia:  ;\n  --tw-contain-size:  ;\n  --tw-contain-layout:  ;\n  --tw-contain-paint:  ;\n  --tw-contain-style:  ;\n}\n\n::backdrop {\n  --tw-border-spacing-x: 0;\n  --tw-border-spacing-y: 0;\n  --tw-translate-x: 0;\n  --tw-translate-y: 0;\n  --tw-rotate: 0;\n  --tw-skew-x: 0;\n  --tw-skew-y: 0;\n  --tw-scale-x: 1;\n  --tw-scale-y: 1;\n  --tw-pan-x:  ;\n  --tw-pan-y:  ;\n  --tw-pinch-zoom:  ;\n  --tw-scroll-snap-strictness: proximity;\n  --tw-gradient-from-position:  ;\n  --tw-gradient-via-position:  ;\n  --tw-gradient-to-position:  ;\n  --tw-ordinal:  ;\n  --tw-slashed-zero:  ;\n  --tw-numeric-figure:  ;\n  --tw-numeric-spacing:  ;\n  --tw-numeric-fraction:  ;\n  --tw-ring-inset:  ;\n  --tw-ring-offset-width: 0px;\n  --tw-ring-offset-color: #fff;\n  --tw-ring-color: rgb(59 130 246 / 0.5);\n  --tw-ring-offset-shadow: 0 0 #0000;\n  --tw-ring-shadow: 0 0 #0000;\n  --tw-shadow: 0 0 #0000;\n  --tw-shadow-colored: 0 0 #0000;\n  --tw-blur:  ;\n  --tw-brightness:  ;\n  --tw-contrast:  ;\n  --tw-grayscale:  ;\n  --tw-hue-rotate:  ;\n  --tw-invert:  ;\n  --tw-saturate:  ;\n  --tw-sepia:  ;\n  --tw-drop-shadow:  ;\n  --tw-backdrop-blur:  ;\n  --tw-backdrop-brightness:  ;\n  --tw-backdrop-contrast:  ;\n  --tw-backdrop-grayscale:  ;\n  --tw-backdrop-hue-rotate:  ;\n  --tw-backdrop-invert:  ;\n  --tw-backdrop-opacity:  ;\n  --tw-backdrop-saturate:  ;\n  --tw-backdrop-sepia:  ;\n  --tw-contain-size:  ;\n  --tw-contain-layout:  ;\n  --tw-contain-paint:  ;\n  --tw-contain-style:  ;\n}/*\n! tailwindcss v3.4.19 | MIT License | https://tailwindcss.com\n*//*\n1. Prevent padding and border from affecting element width. (https://github.com/mozdevs/cssremedy/issues/4)\n2. Allow adding a border to an element by just adding a border-width. (https://github.com/tailwindcss/tailwindcss/pull/116)\n*/\n\n*,\n::before,\n::after {\n  box-sizing: border-box; /* 1 */\n  border-width: 0; /* 2 */\n  border-style: solid; /* 2 */\n  border-color: #e5e7eb; /* 2 */\n}\n\n::before,\n::after {\n  --tw-content: '';\n}\n\n/*\n1. Use a consistent sensible line-height in all browsers.\n2. Prevent adjustments of font size after orientation changes in iOS.\n3. Use a more readable tab size.\n4. Use the user's configured `sans` font-family by default.\n5. Use the user's configured `sans` font-feature-settings by default.\n6. Use the user's configured `sans` font-variation-settings by default.\n7. Disable tap highlights on iOS\n*/\n\nhtml,\n:host {\n  line-height: 1.5; /* 1 */\n  -webkit-text-size-adjust: 100%; /* 2 */\n  -moz-tab-size: 4; /* 3 */\n  -o-tab-size: 4;\n     tab-size: 4; /* 3 */\n  font-family: ui-sans-serif, system-ui, sans-serif, \"Apple Color Emoji\", \"Segoe UI Emoji\", \"Segoe UI Symbol\", \"Noto Color Emoji\"; /* 4 */\n  font-feature-settings: normal; /* 5 */\n  font-variation-settings: normal; /* 6 */\n  -webkit-tap-highlight-color: transparent; /* 7 */\n}\n\n/*\n1. Remove the margin in all browsers.\n2. Inherit line-height from `html` so users can set them as a class directly on the `html` element.\n*/\n\nbody {\n  margin: 0; /* 1 */\n  line-height: inherit; /* 2 */\n}\n\n/*\n1. Add the correct height in Firefox.\n2. Correct the inheritance of border color in Firefox. (https://bugzilla.mozilla.org/show_bug.cgi?id=190655)\n3. Ensure horizontal rules are visible by default.\n*/\n\nhr {\n  height: 0; /* 1 */\n  color: inherit; /* 2 */\n  border-top-width: 1px; /* 3 */\n}\n\n/*\nAdd the correct text decoration in Chrome, Edge, and Safari.\n*/\n\nabbr:where([title]) {\n  -webkit-text-decoration: underline dotted;\n          text-decoration: underline dotted;\n}\n\n/*\nRemove the default font size and weight for headings.\n*/\n\nh1,\nh2,\nh3,\nh4,\nh5,\nh6 {\n  font-size: inherit;\n  font-weight: inherit;\n}\n\n/*\nReset links to optimize for opt-in styling instead of opt-out.\n*/\n\na {\n  color: inherit;\n  text-decoration: inherit;\n}\n\n/*\nAdd the correct font weight in Edge and Safari.\n*/\n\nb,\nstrong {\n  font-weight: bolder;\n}\n\n/*\n1. Use the user's configured `mono` font-family by default.\n2. Use the user's configured `mono` font-feature-settings by default.\n3. Use the user's configured `mono` font-variation-settings by default.\n4. Correct the odd `em` font sizing in all browsers.\n*/\n\ncode,\nkbd,\nsamp,\npre {\n  font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, \"Liberation Mono\", \"Courier New\", monospace; /* 1 */\n  font-feature-settings: normal; /* 2 */\n  font-variation-settings: normal; /* 3 */\n  font-size: 1em; /* 4 */\n}\n\n/*\nAdd the correct font size in all browsers.\n*/\n\nsmall {\n  font-size: 80%;\n}\n\n/*\nPrevent `sub` and `sup` elements from affecting the line height in all browsers.\n*/\n\nsub,\nsup {\n  font-size: 75%;\n  line-height: 0;\n  position: relative;\n  vertical-align: baseline;\n}\n\nsub {\n  bottom: -0.25em;\n}\n\nsup {\n  top: -0.5em;\n}\n\n/*\n1. Remove text indentation from table contents in Chrome and Safari. (https://bugs.chromium.org/p/chromium/issues/detail?id=999088, https://bugs.webkit.org/show_bug.cgi?id=201297)\n2. Correct table border color inheritance in all Chrome and Safari. (https://bugs.chromium.org/p/chromium/issues/detail?id=935729, https://bugs.webkit.org/show_bug.cgi?id=195016)\n3. Remove gaps between table borders by default.\n*/\n\ntable {\n  text-indent: 0; /* 1 */\n  border-color: inherit; /* 2 */\n  border-collapse: collapse; /* 3 */\n}\n\n/*\n1. Change the font styles in all browsers.\n2. Remove the margin in Firefox and Safari.\n3. Remove default padding in all browsers.\n*/\n\nbutton,\ninput,\noptgroup,\nselect,\ntextarea {\n  font-family: inherit; /* 1 */\n  font-feature-settings: inherit; /* 1 */\n  font-variation-settings: inherit; /* 1 */\n  font-size: 100%; /* 1 */\n  font-weight: inherit; /* 1 */\n  line-height: inherit; /* 1 */\n  letter-spacing: inherit; /* 1 */\n  color: inherit; /* 1 */\n  margin: 0; /* 2 */\n  padding: 0; /* 3 */\n}\n\n/*\nRemove the inheritance of text transform in Edge and Firefox.\n*/\n\nbutton,\nselect {\n  text-transform: none;\n}\n\n/*\n1. Correct the inability to style clickable types in iOS and Safari.\n2. Remove default button styles.\n*/\n\nbutton,\ninput:where([type='button']),\ninput:where([type='reset']),\ninput:where([type='submit']) {\n  -webkit-appearance: button; /* 1 */\n  background-color: transparent; /* 2 */\n  background-image: none; /* 2 */\n}\n\n/*\nUse the modern Firefox focus style for all focusable elements.\n*/\n\n:-moz-focusring {\n  outline: auto;\n}\n\n/*\nRemove the additional `:invalid` styles in Firefox. (https://github.com/mozilla/gecko-dev/blob/2f9eacd9d3d995c937b4251a5557d95d494c9be1/layout/style/res/forms.css#L728-L737)\n*/\n\n:-moz-ui-invalid {\n  box-shadow: none;\n}\n\n/*\nAdd the correct vertical alignment in Chrome and Firefox.\n*/\n\nprogress {\n  vertical-align: baseline;\n}\n\n/*\nCorrect the cursor style of increment and decrement buttons in Safari.\n*/\n\n::-webkit-inner-spin-button,\n::-webkit-outer-spin-button {\n  height: auto;\n}\n\n/*\n1. Correct the odd appearance in Chrome and Safari.\n2. Correct the outline style in Safari.\n*/\n\n[type='search'] {\n  -webkit-appearance: textfield; /* 1 */\n  outline-offset: -2px; /* 2 */\n}\n\n/*\nRemove the inner padding in Chrome and Safari on macOS.\n*/\n\n::-webkit-search-decoration {\n  -webkit-appearance: none;\n}\n\n/*\n1. Correct the inability to style clickable types in iOS and Safari.\n2. Change font properties to `inherit` in Safari.\n*/\n\n::-webkit-file-upload-button {\n  -webkit-appearance: button; /* 1 */\n  font: inherit; /* 2 */\n}\n\n/*\nAdd the correct display in Chrome and Safari.\n*/\n\nsummary {\n  display: list-item;\n}\n\n/*\nRemoves the default spacing and border for appropriate elements.\n*/\n\nblockquote,\ndl,\ndd,\nh1,\nh2,\nh3,\nh4,\nh5,\nh6,\nhr,\nfigure,\np,\npre {\n  margin: 0;\n}\n\nfieldset {\n  margin: 0;\n  padding: 0;\n}\n\nlegend {\n  padding: 0;\n}\n\nol,\nul,\nmenu {\n  list-style: none;\n  margin: 0;\n  padding: 0;\n}\n\n/*\nReset default styling for dialogs.\n*/\ndialog {\n  padding: 0;\n}\n\n/*\nPrevent resizing textareas horizontally by default.\n*/\n\ntextarea {\n  resize: vertical;\n}\n\n/*\n1. Reset the default placeholder opacity in Firefox. (https://github.com/tailwindlabs/tailwindcss/issues/3300)\n2. Set the default placeholder color to the user's configured gray 400 color.\n*/\n\ninput::-moz-placeholder, textarea::-moz-placeholder {\n  opacity: 1; /* 1 */\n  color: #9ca3af; /* 2 */\n}\n\ninput::placeholder,\ntextarea::placeholder {\n  opacity: 1; /* 1 */\n  color: #9ca3af; /* 2 */\n}\n\n/*\nSet the default cursor for buttons.\n*/\n\nbutton,\n[role=\"button\"] {\n  cursor: pointer;\n}\n\n/*\nMake sure disabled buttons don't get the pointer cursor.\n*/\n:disabled {\n  cursor: default;\n}\n\n/*\n1. Make replaced elements `display: block` by default. (https://github.com/mozdevs/cssremedy/issues/14)\n2. Add `vertical-align: middle` to align replaced elements more sensibly by default. (https://github.com/jensimmons/cssremedy/issues/14#issuecomment-634934210)\n   This can trigger a poorly considered lint error in some tools but is included by design.\n*/\n\nimg,\nsvg,\nvideo,\ncanvas,\naudio,\niframe,\nembed,\nobject {\n  display: block; /* 1 */\n  vertical-align: middle; /* 2 */\n}\n\n/*\nConstrain images and videos to the parent width and preserve their intrinsic aspect ratio. (https://github.com/mozdevs/cssremedy/issues/14)\n*/\n\nimg,\nvideo {\n  max-width: 100%;\n  height: auto;\n}\n\n/* Make elements with the HTML hidden attribute stay hidden by default */\n[hidden]:where(:not([hidden=\"until-found\"])) {\n  display: none;\n}\n\n/* Global styles for Minimal Server Manager */\n\n* {\n  margin: 0;\n  padding: 0;\n  box-sizing: border-box;\n}\n\nbody {\n  -webkit-font-smoothing: antialiased;\n  -moz-osx-font-smoothing: grayscale;\n  background-color: #f8fafc;\n  color: #1e293b;\n}\n\n.app-container {\n  display: flex;\n  flex-direction: column;\n  height: 100vh;\n  width: 100vw;\n}\n\n.main-content {\n  display: flex;\n  flex: 1;\n  overflow: hidden;\n}\n\n.content-area {\n  flex: 1;\n  padding: 1.5rem;\n  overflow-y: auto;\n  background-color: #f8fafc;\n}\n\n/* Navigation styles */\n.navbar {\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n  color: white;\n  padding: 1rem 1.5rem;\n  display: flex;\n  justify-content: between;\n  align-items: center;\n  box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);\n}\n\n.navbar-brand {\n  font-size: 1.5rem;\n  font-weight: bold;\n  color: white;\n  text-decoration: none;\n}\n\n.navbar-actions {\n  display: flex;\n  gap: 1rem;\n  align-items: center;\n}\n\n/* Sidebar styles */\n.sidebar {\n  width: 250px;\n  background-color: #1e293b;\n  color: white;\n  padding: 1.5rem 0;\n  overflow-y: auto;\n  box-shadow: 2px 0 10px rgba(0, 0, 0, 0.1);\n}\n\n.sidebar-nav {\n  list-style: none;\n}\n\n.sidebar-nav li {\n  margin: 0.5rem 0;\n}\n\n.sidebar-nav a {\n  display: flex;\n  align-items: center;\n  padding: 0.75rem 1.5rem;\n  color: #cbd5e1;\n  text-decoration: none;\n  transition: all 0.2s ease;\n}\n\n.sidebar-nav a:hover,\n.sidebar-nav a.active {\n  background-color: #334155;\n  color: white;\n  border-right: 3px solid #667eea;\n}\n\n.sidebar-nav a i {\n  margin-right: 0.75rem;\n  width: 20px;\n  text-align: center;\n}\n\n/* Card styles */\n.card {\n  background: white;\n  border-radius: 0.5rem;\n  box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);\n  padding: 1.5rem;\n  margin-bottom: 1.5rem;\n}\n\n.card-header {\n  display: flex;\n  justify-content: between;\n  align-items: center;\n  margin-bottom: 1rem;\n  padding-bottom: 0.75rem;\n  border-bottom: 1px solid #e2e8f0;\n}\n\n.card-title {\n  font-size: 1.25rem;\n  font-weight: 600;\n  color: #1e293b;\n}\n\n.card-actions {\n  display: flex;\n  gap: 0.5rem;\n}\n\n/* Button styles */\n.btn {\n  display: inline-flex;\n  align-items: center;\n  justify-content: center;\n  padding: 0.5rem 1rem;\n  border-radius: 0.375rem;\n  font-size: 0.875rem;\n  font-weight: 500;\n  text-decoration: none;\n  border: none;\n  cursor: pointer;\n  transition: all 0.2s ease;\n}\n\n.btn-primary {\n  background-color: #667eea;\n  color: white;\n}\n\n.btn-primary:hover {\n  background-color: #5a67d8;\n}\n\n.btn-secondary {\n  background-color: #6b7280;\n  color: white;\n}\n\n.btn-secondary:hover {\n  background-color: #4b5563;\n}\n\n.btn-success {\n  background-color: #10b981;\n  color: white;\n}\n\n.btn-success:hover {\n  background-color: #059669;\n}\n\n.btn-danger {\n  background-color: #ef4444;\n  color: white;\n}\n\n.btn-danger:hover {\n  background-color: #dc2626;\n}\n\n.btn-sm {\n  padding: 0.25rem 0.75rem;\n  font-size: 0.75rem;\n}\n\n.btn-lg {\n  padding: 0.75rem 1.5rem;\n  font-size: 1rem;\n}\n\n/* Form styles */\n.form-group {\n  margin-bottom: 1rem;\n}\n\n.form-label {\n  display: block;\n  margin-bottom: 0.5rem;\n  font-weight: 500;\n  color: #374151;\n}\n\n.form-input {\n  width: 100%;\n  padding: 0.5rem 0.75rem;\n  border: 1px solid #d1d5db;\n  border-radius: 0.375rem;\n  font-size: 0.875rem;\n  transition: border-color 0.2s ease;\n}\n\n.form-input:focus {\n  outline: none;\n  border-color: #667eea;\n  box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);\n}\n\n.form-select {\n  width: 100%;\n  padding: 0.5rem 0.75rem;\n  border: 1px solid #d1d5db;\n  border-radius: 0.375rem;\n  font-size: 0.875rem;\n  background-color: white;\n}\n\n.form-textarea {\n  width: 100%;\n  padding: 0.5rem 0.75rem;\n  border: 1px solid #d1d5db;\n  border-radius: 0.375rem;\n  font-size: 0.875rem;\n  resize: vertical;\n  min-height: 100px;\n}\n\n/* Table styles */\n.table {\n  width: 100%;\n  border-collapse: collapse;\n  margin-top: 1rem;\n}\n\n.table th,\n.table td {\n  padding: 0.75rem;\n  text-align: left;\n  border-bottom: 1px solid #e2e8f0;\n}\n\n.table th {\n  background-color: #f8fafc;\n  font-weight: 600;\n  color: #374151;\n}\n\n.table tbody tr:hover {\n  background-color: #f8fafc;\n}\n\n/* Status badges */\n.status-badge {\n  display: inline-flex;\n  align-items: center;\n  padding: 0.25rem 0.75rem;\n  border-radius: 9999px;\n  font-size: 0.75rem;\n  font-weight: 500;\n}\n\n.status-online {\n  background-color: #dcfce7;\n  color: #166534;\n}\n\n.status-offline {\n  background-color: #fee2e2;\n  color: #991b1b;\n}\n\n.status-active {\n  background-color: #dbeafe;\n  color: #1e40af;\n}\n\n.status-inactive {\n  background-color: #f3f4f6;\n  color: #374151;\n}\n\n/* Alert styles */\n.alert {\n  padding: 1rem;\n  border-radius: 0.375rem;\n  margin-bottom: 1rem;\n}\n\n.alert-success {\n  background-color: #dcfce7;\n  color: #166534;\n  border: 1px solid #bbf7d0;\n}\n\n.alert-error {\n  background-color: #fee2e2;\n  color: #991b1b;\n  border: 1px solid #fecaca;\n}\n\n.alert-warning {\n  background-color: #fef3c7;\n  color: #92400e;\n  border: 1px solid #fde68a;\n}\n\n.alert-info {\n  background-color: #dbeafe;\n  color: #1e40af;\n  border: 1px solid #bfdbfe;\n}\n\n/* Loading spinner */\n.spinner {\n  display: inline-block;\n  width: 20px;\n  height: 20px;\n  border: 3px solid #f3f3f3;\n  border-top: 3px solid #667eea;\n  border-radius: 50%;\n  animation: spin 1s linear infinite;\n}\n\n@keyframes spin {\n  0% { transform: rotate(0deg); }\n  100% { transform: rotate(360deg); }\n}\n\n/* Custom component styles that extend TailwindCSS */\n\n/* Loading spinner animation */\n@keyframes spin {\n  0% { transform: rotate(0deg); }\n  100% { transform: rotate(360deg); }\n}\n\n.spinner {\n  display: inline-block;\n  width: 20px;\n  height: 20px;\n  border: 3px solid #f3f3f3;\n  border-top: 3px solid #667eea;\n  border-radius: 50%;\n  animation: spin 1s linear infinite;\n}\n\n/* Custom gradient backgrounds */\n.gradient-primary {\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n}\n\n.gradient-success {\n  background: linear-gradient(135deg, #10b981 0%, #059669 100%);\n}\n\n.gradient-danger {\n  background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);\n}\n\n/* Custom scrollbar styles */\n.custom-scrollbar::-webkit-scrollbar {\n  width: 6px;\n}\n\n.custom-scrollbar::-webkit-scrollbar-track {\n  background: #f1f5f9;\n}\n\n.custom-scrollbar::-webkit-scrollbar-thumb {\n  background: #cbd5e1;\n  border-radius: 3px;\n}\n\n.custom-scrollbar::-webkit-scrollbar-thumb:hover {\n  background: #94a3b8;\n}","",{version:3,sources:["webpack://./src/styles/global.css"],names:[],mappings:"AAAA;EAAA,wBAAc;EAAd,wBAAc;EAAd,mBAAc;EAAd,mBAAc;EAAd,cAAc;EAAd,cAAc;EAAd,cAAc;EAAd,eAAc;EAAd,eAAc;EAAd,aAAc;EAAd,aAAc;EAAd,kBAAc;EAAd,sCAAc;EAAd,8BAAc;EAAd,6BAAc;EAAd,4BAAc;EAAd,eAAc;EAAd,oBAAc;EAAd,sBAAc;EAAd,uBAAc;EAAd,wBAAc;EAAd,kBAAc;EAAd,2BAAc;EAAd,4BAAc;EAAd,sCAAc;EAAd,kCAAc;EAAd,2BAAc;EAAd,sBAAc;EAAd,8BAAc;EAAd,YAAc;EAAd,kBAAc;EAAd,gBAAc;EAAd,iBAAc;EAAd,kBAAc;EAAd,cAAc;EAAd,gBAAc;EAAd,aAAc;EAAd,mBAAc;EAAd,qBAAc;EAAd,2BAAc;EAAd,yBAAc;EAAd,0BAAc;EAAd,2BAAc;EAAd,uBAAc;EAAd,wBAAc;EAAd,yBAAc;EAAd,sBAAc;EAAd,oBAAc;EAAd,sBAAc;EAAd,qBAAc;EAAd;AAAc;;AAAd;EAAA,wBAAc;EAAd,wBAAc;EAAd,mBAAc;EAAd,mBAAc;EAAd,cAAc;EAAd,cAAc;EAAd,cAAc;EAAd,eAAc;EAAd,eAAc;EAAd,aAAc;EAAd,aAAc;EAAd,kBAAc;EAAd,sCAAc;EAAd,8BAAc;EAAd,6BAAc;EAAd,4BAAc;EAAd,eAAc;EAAd,oBAAc;EAAd,sBAAc;EAAd,uBAAc;EAAd,wBAAc;EAAd,kBAAc;EAAd,2BAAc;EAAd,4BAAc;EAAd,sCAAc;EAAd,kCAAc;EAAd,2BAAc;EAAd,sBAAc;EAAd,8BAAc;EAAd,YAAc;EAAd,kBAAc;EAAd,gBAAc;EAAd,iBAAc;EAAd,kBAAc;EAAd,cAAc;EAAd,gBAAc;EAAd,aAAc;EAAd,mBAAc;EAAd,qBAAc;EAAd,2BAAc;EAAd,yBAAc;EAAd,0BAAc;EAAd,2BAAc;EAAd,uBAAc;EAAd,wBAAc;EAAd,yBAAc;EAAd,sBAAc;EAAd,oBAAc;EAAd,sBAAc;EAAd,qBAAc;EAAd;AAAc,CAAd;;CAAc,CAAd;;;CAAc;;AAAd;;;EAAA,sBAAc,EAAd,MAAc;EAAd,eAAc,EAAd,MAAc;EAAd,mBAAc,EAAd,MAAc;EAAd,qBAAc,EAAd,MAAc;AAAA;;AAAd;;EAAA,gBAAc;AAAA;;AAAd;;;;;;;;CAAc;;AAAd;;EAAA,gBAAc,EAAd,MAAc;EAAd,8BAAc,EAAd,MAAc;EAAd,gBAAc,EAAd,MAAc;EAAd,cAAc;KAAd,WAAc,EAAd,MAAc;EAAd,+HAAc,EAAd,MAAc;EAAd,6BAAc,EAAd,MAAc;EAAd,+BAAc,EAAd,MAAc;EAAd,wCAAc,EAAd,MAAc;AAAA;;AAAd;;;CAAc;;AAAd;EAAA,SAAc,EAAd,MAAc;EAAd,oBAAc,EAAd,MAAc;AAAA;;AAAd;;;;CAAc;;AAAd;EAAA,SAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;EAAd,qBAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,yCAAc;UAAd,iCAAc;AAAA;;AAAd;;CAAc;;AAAd;;;;;;EAAA,kBAAc;EAAd,oBAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,cAAc;EAAd,wBAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,mBAAc;AAAA;;AAAd;;;;;CAAc;;AAAd;;;;EAAA,+GAAc,EAAd,MAAc;EAAd,6BAAc,EAAd,MAAc;EAAd,+BAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,cAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,cAAc;EAAd,cAAc;EAAd,kBAAc;EAAd,wBAAc;AAAA;;AAAd;EAAA,eAAc;AAAA;;AAAd;EAAA,WAAc;AAAA;;AAAd;;;;CAAc;;AAAd;EAAA,cAAc,EAAd,MAAc;EAAd,qBAAc,EAAd,MAAc;EAAd,yBAAc,EAAd,MAAc;AAAA;;AAAd;;;;CAAc;;AAAd;;;;;EAAA,oBAAc,EAAd,MAAc;EAAd,8BAAc,EAAd,MAAc;EAAd,gCAAc,EAAd,MAAc;EAAd,eAAc,EAAd,MAAc;EAAd,oBAAc,EAAd,MAAc;EAAd,oBAAc,EAAd,MAAc;EAAd,uBAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;EAAd,SAAc,EAAd,MAAc;EAAd,UAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,oBAAc;AAAA;;AAAd;;;CAAc;;AAAd;;;;EAAA,0BAAc,EAAd,MAAc;EAAd,6BAAc,EAAd,MAAc;EAAd,sBAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,aAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,gBAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,wBAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,YAAc;AAAA;;AAAd;;;CAAc;;AAAd;EAAA,6BAAc,EAAd,MAAc;EAAd,oBAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,wBAAc;AAAA;;AAAd;;;CAAc;;AAAd;EAAA,0BAAc,EAAd,MAAc;EAAd,aAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,kBAAc;AAAA;;AAAd;;CAAc;;AAAd;;;;;;;;;;;;;EAAA,SAAc;AAAA;;AAAd;EAAA,SAAc;EAAd,UAAc;AAAA;;AAAd;EAAA,UAAc;AAAA;;AAAd;;;EAAA,gBAAc;EAAd,SAAc;EAAd,UAAc;AAAA;;AAAd;;CAAc;AAAd;EAAA,UAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,gBAAc;AAAA;;AAAd;;;CAAc;;AAAd;EAAA,UAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;AAAA;;AAAd;;EAAA,UAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,eAAc;AAAA;;AAAd;;CAAc;AAAd;EAAA,eAAc;AAAA;;AAAd;;;;CAAc;;AAAd;;;;;;;;EAAA,cAAc,EAAd,MAAc;EAAd,sBAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,eAAc;EAAd,YAAc;AAAA;;AAAd,wEAAc;AAAd;EAAA,aAAc;AAAA;;AAId,6CAA6C;;AAE7C;EACE,SAAS;EACT,UAAU;EACV,sBAAsB;AACxB;;AAEA;EACE,mCAAmC;EACnC,kCAAkC;EAClC,yBAAyB;EACzB,cAAc;AAChB;;AAEA;EACE,aAAa;EACb,sBAAsB;EACtB,aAAa;EACb,YAAY;AACd;;AAEA;EACE,aAAa;EACb,OAAO;EACP,gBAAgB;AAClB;;AAEA;EACE,OAAO;EACP,eAAe;EACf,gBAAgB;EAChB,yBAAyB;AAC3B;;AAEA,sBAAsB;AACtB;EACE,6DAA6D;EAC7D,YAAY;EACZ,oBAAoB;EACpB,aAAa;EACb,wBAAwB;EACxB,mBAAmB;EACnB,yCAAyC;AAC3C;;AAEA;EACE,iBAAiB;EACjB,iBAAiB;EACjB,YAAY;EACZ,qBAAqB;AACvB;;AAEA;EACE,aAAa;EACb,SAAS;EACT,mBAAmB;AACrB;;AAEA,mBAAmB;AACnB;EACE,YAAY;EACZ,yBAAyB;EACzB,YAAY;EACZ,iBAAiB;EACjB,gBAAgB;EAChB,yCAAyC;AAC3C;;AAEA;EACE,gBAAgB;AAClB;;AAEA;EACE,gBAAgB;AAClB;;AAEA;EACE,aAAa;EACb,mBAAmB;EACnB,uBAAuB;EACvB,cAAc;EACd,qBAAqB;EACrB,yBAAyB;AAC3B;;AAEA;;EAEE,yBAAyB;EACzB,YAAY;EACZ,+BAA+B;AACjC;;AAEA;EACE,qBAAqB;EACrB,WAAW;EACX,kBAAkB;AACpB;;AAEA,gBAAgB;AAChB;EACE,iBAAiB;EACjB,qBAAqB;EACrB,wCAAwC;EACxC,eAAe;EACf,qBAAqB;AACvB;;AAEA;EACE,aAAa;EACb,wBAAwB;EACxB,mBAAmB;EACnB,mBAAmB;EACnB,uBAAuB;EACvB,gCAAgC;AAClC;;AAEA;EACE,kBAAkB;EAClB,gBAAgB;EAChB,cAAc;AAChB;;AAEA;EACE,aAAa;EACb,WAAW;AACb;;AAEA,kBAAkB;AAClB;EACE,oBAAoB;EACpB,mBAAmB;EACnB,uBAAuB;EACvB,oBAAoB;EACpB,uBAAuB;EACvB,mBAAmB;EACnB,gBAAgB;EAChB,qBAAqB;EACrB,YAAY;EACZ,eAAe;EACf,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,YAAY;AACd;;AAEA;EACE,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,YAAY;AACd;;AAEA;EACE,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,YAAY;AACd;;AAEA;EACE,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,YAAY;AACd;;AAEA;EACE,yBAAyB;AAC3B;;AAEA;EACE,wBAAwB;EACxB,kBAAkB;AACpB;;AAEA;EACE,uBAAuB;EACvB,eAAe;AACjB;;AAEA,gBAAgB;AAChB;EACE,mBAAmB;AACrB;;AAEA;EACE,cAAc;EACd,qBAAqB;EACrB,gBAAgB;EAChB,cAAc;AAChB;;AAEA;EACE,WAAW;EACX,uBAAuB;EACvB,yBAAyB;EACzB,uBAAuB;EACvB,mBAAmB;EACnB,kCAAkC;AACpC;;AAEA;EACE,aAAa;EACb,qBAAqB;EACrB,8CAA8C;AAChD;;AAEA;EACE,WAAW;EACX,uBAAuB;EACvB,yBAAyB;EACzB,uBAAuB;EACvB,mBAAmB;EACnB,uBAAuB;AACzB;;AAEA;EACE,WAAW;EACX,uBAAuB;EACvB,yBAAyB;EACzB,uBAAuB;EACvB,mBAAmB;EACnB,gBAAgB;EAChB,iBAAiB;AACnB;;AAEA,iBAAiB;AACjB;EACE,WAAW;EACX,yBAAyB;EACzB,gBAAgB;AAClB;;AAEA;;EAEE,gBAAgB;EAChB,gBAAgB;EAChB,gCAAgC;AAClC;;AAEA;EACE,yBAAyB;EACzB,gBAAgB;EAChB,cAAc;AAChB;;AAEA;EACE,yBAAyB;AAC3B;;AAEA,kBAAkB;AAClB;EACE,oBAAoB;EACpB,mBAAmB;EACnB,wBAAwB;EACxB,qBAAqB;EACrB,kBAAkB;EAClB,gBAAgB;AAClB;;AAEA;EACE,yBAAyB;EACzB,cAAc;AAChB;;AAEA;EACE,yBAAyB;EACzB,cAAc;AAChB;;AAEA;EACE,yBAAyB;EACzB,cAAc;AAChB;;AAEA;EACE,yBAAyB;EACzB,cAAc;AAChB;;AAEA,iBAAiB;AACjB;EACE,aAAa;EACb,uBAAuB;EACvB,mBAAmB;AACrB;;AAEA;EACE,yBAAyB;EACzB,cAAc;EACd,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,cAAc;EACd,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,cAAc;EACd,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,cAAc;EACd,yBAAyB;AAC3B;;AAEA,oBAAoB;AACpB;EACE,qBAAqB;EACrB,WAAW;EACX,YAAY;EACZ,yBAAyB;EACzB,6BAA6B;EAC7B,kBAAkB;EAClB,kCAAkC;AACpC;;AAEA;EACE,KAAK,uBAAuB,EAAE;EAC9B,OAAO,yBAAyB,EAAE;AACpC;;AAEA,oDAAoD;;AAEpD,8BAA8B;AAC9B;EACE,KAAK,uBAAuB,EAAE;EAC9B,OAAO,yBAAyB,EAAE;AACpC;;AAEA;EACE,qBAAqB;EACrB,WAAW;EACX,YAAY;EACZ,yBAAyB;EACzB,6BAA6B;EAC7B,kBAAkB;EAClB,kCAAkC;AACpC;;AAEA,gCAAgC;AAChC;EACE,6DAA6D;AAC/D;;AAEA;EACE,6DAA6D;AAC/D;;AAEA;EACE,6DAA6D;AAC/D;;AAEA,4BAA4B;AAC5B;EACE,UAAU;AACZ;;AAEA;EACE,mBAAmB;AACrB;;AAEA;EACE,mBAAmB;EACnB,kBAAkB;AACpB;;AAEA;EACE,mBAAmB;AACrB",sourcesContent:["@tailwind base;\r\n@tailwind components;\r\n@tailwind utilities;\r\n\r\n/* Global styles for Minimal Server Manager */\r\n\r\n* {\r\n  margin: 0;\r\n  padding: 0;\r\n  box-sizing: border-box;\r\n}\r\n\r\nbody {\r\n  -webkit-font-smoothing: antialiased;\r\n  -moz-osx-font-smoothing: grayscale;\r\n  background-color: #f8fafc;\r\n  color: #1e293b;\r\n}\r\n\r\n.app-container {\r\n  display: flex;\r\n  flex-direction: column;\r\n  height: 100vh;\r\n  width: 100vw;\r\n}\r\n\r\n.main-content {\r\n  display: flex;\r\n  flex: 1;\r\n  overflow: hidden;\r\n}\r\n\r\n.content-area {\r\n  flex: 1;\r\n  padding: 1.5rem;\r\n  overflow-y: auto;\r\n  background-color: #f8fafc;\r\n}\r\n\r\n/* Navigation styles */\r\n.navbar {\r\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\r\n  color: white;\r\n  padding: 1rem 1.5rem;\r\n  display: flex;\r\n  justify-content: between;\r\n  align-items: center;\r\n  box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);\r\n}\r\n\r\n.navbar-brand {\r\n  font-size: 1.5rem;\r\n  font-weight: bold;\r\n  color: white;\r\n  text-decoration: none;\r\n}\r\n\r\n.navbar-actions {\r\n  display: flex;\r\n  gap: 1rem;\r\n  align-items: center;\r\n}\r\n\r\n/* Sidebar styles */\r\n.sidebar {\r\n  width: 250px;\r\n  background-color: #1e293b;\r\n  color: white;\r\n  padding: 1.5rem 0;\r\n  overflow-y: auto;\r\n  box-shadow: 2px 0 10px rgba(0, 0, 0, 0.1);\r\n}\r\n\r\n.sidebar-nav {\r\n  list-style: none;\r\n}\r\n\r\n.sidebar-nav li {\r\n  margin: 0.5rem 0;\r\n}\r\n\r\n.sidebar-nav a {\r\n  display: flex;\r\n  align-items: center;\r\n  padding: 0.75rem 1.5rem;\r\n  color: #cbd5e1;\r\n  text-decoration: none;\r\n  transition: all 0.2s ease;\r\n}\r\n\r\n.sidebar-nav a:hover,\r\n.sidebar-nav a.active {\r\n  background-color: #334155;\r\n  color: white;\r\n  border-right: 3px solid #667eea;\r\n}\r\n\r\n.sidebar-nav a i {\r\n  margin-right: 0.75rem;\r\n  width: 20px;\r\n  text-align: center;\r\n}\r\n\r\n/* Card styles */\r\n.card {\r\n  background: white;\r\n  border-radius: 0.5rem;\r\n  box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);\r\n  padding: 1.5rem;\r\n  margin-bottom: 1.5rem;\r\n}\r\n\r\n.card-header {\r\n  display: flex;\r\n  justify-content: between;\r\n  align-items: center;\r\n  margin-bottom: 1rem;\r\n  padding-bottom: 0.75rem;\r\n  border-bottom: 1px solid #e2e8f0;\r\n}\r\n\r\n.card-title {\r\n  font-size: 1.25rem;\r\n  font-weight: 600;\r\n  color: #1e293b;\r\n}\r\n\r\n.card-actions {\r\n  display: flex;\r\n  gap: 0.5rem;\r\n}\r\n\r\n/* Button styles */\r\n.btn {\r\n  display: inline-flex;\r\n  align-items: center;\r\n  justify-content: center;\r\n  padding: 0.5rem 1rem;\r\n  border-radius: 0.375rem;\r\n  font-size: 0.875rem;\r\n  font-weight: 500;\r\n  text-decoration: none;\r\n  border: none;\r\n  cursor: pointer;\r\n  transition: all 0.2s ease;\r\n}\r\n\r\n.btn-primary {\r\n  background-color: #667eea;\r\n  color: white;\r\n}\r\n\r\n.btn-primary:hover {\r\n  background-color: #5a67d8;\r\n}\r\n\r\n.btn-secondary {\r\n  background-color: #6b7280;\r\n  color: white;\r\n}\r\n\r\n.btn-secondary:hover {\r\n  background-color: #4b5563;\r\n}\r\n\r\n.btn-success {\r\n  background-color: #10b981;\r\n  color: white;\r\n}\r\n\r\n.btn-success:hover {\r\n  background-color: #059669;\r\n}\r\n\r\n.btn-danger {\r\n  background-color: #ef4444;\r\n  color: white;\r\n}\r\n\r\n.btn-danger:hover {\r\n  background-color: #dc2626;\r\n}\r\n\r\n.btn-sm {\r\n  padding: 0.25rem 0.75rem;\r\n  font-size: 0.75rem;\r\n}\r\n\r\n.btn-lg {\r\n  padding: 0.75rem 1.5rem;\r\n  font-size: 1rem;\r\n}\r\n\r\n/* Form styles */\r\n.form-group {\r\n  margin-bottom: 1rem;\r\n}\r\n\r\n.form-label {\r\n  display: block;\r\n  margin-bottom: 0.5rem;\r\n  font-weight: 500;\r\n  color: #374151;\r\n}\r\n\r\n.form-input {\r\n  width: 100%;\r\n  padding: 0.5rem 0.75rem;\r\n  border: 1px solid #d1d5db;\r\n  border-radius: 0.375rem;\r\n  font-size: 0.875rem;\r\n  transition: border-color 0.2s ease;\r\n}\r\n\r\n.form-input:focus {\r\n  outline: none;\r\n  border-color: #667eea;\r\n  box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);\r\n}\r\n\r\n.form-select {\r\n  width: 100%;\r\n  padding: 0.5rem 0.75rem;\r\n  border: 1px solid #d1d5db;\r\n  border-radius: 0.375rem;\r\n  font-size: 0.875rem;\r\n  background-color: white;\r\n}\r\n\r\n.form-textarea {\r\n  width: 100%;\r\n  padding: 0.5rem 0.75rem;\r\n  border: 1px solid #d1d5db;\r\n  border-radius: 0.375rem;\r\n  font-size: 0.875rem;\r\n  resize: vertical;\r\n  min-height: 100px;\r\n}\r\n\r\n/* Table styles */\r\n.table {\r\n  width: 100%;\r\n  border-collapse: collapse;\r\n  margin-top: 1rem;\r\n}\r\n\r\n.table th,\r\n.table td {\r\n  padding: 0.75rem;\r\n  text-align: left;\r\n  border-bottom: 1px solid #e2e8f0;\r\n}\r\n\r\n.table th {\r\n  background-color: #f8fafc;\r\n  font-weight: 600;\r\n  color: #374151;\r\n}\r\n\r\n.table tbody tr:hover {\r\n  background-color: #f8fafc;\r\n}\r\n\r\n/* Status badges */\r\n.status-badge {\r\n  display: inline-flex;\r\n  align-items: center;\r\n  padding: 0.25rem 0.75rem;\r\n  border-radius: 9999px;\r\n  font-size: 0.75rem;\r\n  font-weight: 500;\r\n}\r\n\r\n.status-online {\r\n  background-color: #dcfce7;\r\n  color: #166534;\r\n}\r\n\r\n.status-offline {\r\n  background-color: #fee2e2;\r\n  color: #991b1b;\r\n}\r\n\r\n.status-active {\r\n  background-color: #dbeafe;\r\n  color: #1e40af;\r\n}\r\n\r\n.status-inactive {\r\n  background-color: #f3f4f6;\r\n  color: #374151;\r\n}\r\n\r\n/* Alert styles */\r\n.alert {\r\n  padding: 1rem;\r\n  border-radius: 0.375rem;\r\n  margin-bottom: 1rem;\r\n}\r\n\r\n.alert-success {\r\n  background-color: #dcfce7;\r\n  color: #166534;\r\n  border: 1px solid #bbf7d0;\r\n}\r\n\r\n.alert-error {\r\n  background-color: #fee2e2;\r\n  color: #991b1b;\r\n  border: 1px solid #fecaca;\r\n}\r\n\r\n.alert-warning {\r\n  background-color: #fef3c7;\r\n  color: #92400e;\r\n  border: 1px solid #fde68a;\r\n}\r\n\r\n.alert-info {\r\n  background-color: #dbeafe;\r\n  color: #1e40af;\r\n  border: 1px solid #bfdbfe;\r\n}\r\n\r\n/* Loading spinner */\r\n.spinner {\r\n  display: inline-block;\r\n  width: 20px;\r\n  height: 20px;\r\n  border: 3px solid #f3f3f3;\r\n  border-top: 3px solid #667eea;\r\n  border-radius: 50%;\r\n  animation: spin 1s linear infinite;\r\n}\r\n\r\n@keyframes spin {\r\n  0% { transform: rotate(0deg); }\r\n  100% { transform: rotate(360deg); }\r\n}\r\n\r\n/* Custom component styles that extend TailwindCSS */\r\n\r\n/* Loading spinner animation */\r\n@keyframes spin {\r\n  0% { transform: rotate(0deg); }\r\n  100% { transform: rotate(360deg); }\r\n}\r\n\r\n.spinner {\r\n  display: inline-block;\r\n  width: 20px;\r\n  height: 20px;\r\n  border: 3px solid #f3f3f3;\r\n  border-top: 3px solid #667eea;\r\n  border-radius: 50%;\r\n  animation: spin 1s linear infinite;\r\n}\r\n\r\n/* Custom gradient backgrounds */\r\n.gradient-primary {\r\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\r\n}\r\n\r\n.gradient-success {\r\n  background: linear-gradient(135deg, #10b981 0%, #059669 100%);\r\n}\r\n\r\n.gradient-danger {\r\n  background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);\r\n}\r\n\r\n/* Custom scrollbar styles */\r\n.custom-scrollbar::-webkit-scrollbar {\r\n  width: 6px;\r\n}\r\n\r\n.custom-scrollbar::-webkit-scrollbar-track {\r\n  background: #f1f5f9;\r\n}\r\n\r\n.custom-scrollbar::-webkit-scrollbar-thumb {\r\n  background: #cbd5e1;\r\n  border-radius: 3px;\r\n}\r\n\r\n.custom-scrollbar::-webkit-scrollbar-thumb:hover {\r\n  background: #94a3b8;\r\n}"],sourceRoot:""}]);const i=l},961:(e,t,n)=>{!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(551)},982:(e,t,n)=>{e.exports=n(463)}},r={};function a(e){var t=r[e];if(void 0!==t)return t.exports;var o=r[e]={id:e,exports:{}};return n[e](o,o.exports,a),o.exports}a.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return a.d(t,{a:t}),t},t=Object.getPrototypeOf?e=>Object.getPrototypeOf(e):e=>e.__proto__,a.t=function(n,r){if(1&r&&(n=this(n)),8&r)return n;if("object"==typeof n&&n){if(4&r&&n.__esModule)return n;if(16&r&&"function"==typeof n.then)return n}var o=Object.create(null);a.r(o);var l={};e=e||[null,t({}),t([]),t(t)];for(var i=2&r&&n;("object"==typeof i||"function"==typeof i)&&!~e.indexOf(i);i=t(i))Object.getOwnPropertyNames(i).forEach(e=>l[e]=()=>n[e]);return l.default=()=>n,a.d(o,l),o},a.d=(e,t)=>{for(var n in t)a.o(t,n)&&!a.o(e,n)&&Object.defineProperty(e,n,{enumerable:!0,get:t[n]})},a.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),a.r=e=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},a.nc=void 0;var o,l=a(540),i=a.t(l,2),c=a(338),s=a(961),u=a.t(s,2);function f(){return f=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},f.apply(this,arguments)}!function(e){e.Pop="POP",e.Push="PUSH",e.Replace="REPLACE"}(o||(o={}));const d="popstate";function m(e,t){if(!1===e||null==e)throw new Error(t)}function p(e,t){if(!e){"undefined"!=typeof console&&console.warn(t);try{throw new Error(t)}catch(e){}}}function h(e,t){return{usr:e.state,key:e.key,idx:t}}function v(e,t,n,r){return void 0===n&&(n=null),f({pathname:"string"==typeof e?e:e.pathname,search:"",hash:""},"string"==typeof t?b(t):t,{state:n,key:t&&t.key||r||Math.random().toString(36).substr(2,8)})}function g(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function b(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substr(n),e=e.substr(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substr(r),e=e.substr(0,r)),e&&(t.pathname=e)}return t}var A;function y(e,t,n){return void 0===n&&(n="/"),function(e,t,n,r){let a=T(("string"==typeof t?b(t):t).pathname||"/",n);if(null==a)return null;let o=E(e);!function(e){e.sort((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){return e.length===t.length&&e.slice(0,-1).every((e,n)=>e===t[n])?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map(e=>e.childrenIndex),t.routesMeta.map(e=>e.childrenIndex)))}(o);let l=null;for(let e=0;null==l&&e<o.length;++e){let t=M(a);l=P(o[e],t,r)}return l}(e,t,n,!1)}function E(e,t,n,r){void 0===t&&(t=[]),void 0===n&&(n=[]),void 0===r&&(r="");let a=(e,a,o)=>{let l={relativePath:void 0===o?e.path||"":o,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};l.relativePath.startsWith("/")&&(m(l.relativePath.startsWith(r),'Absolute route path "'+l.relativePath+'" nested under path "'+r+'" is not valid. An absolute child route path must start with the combined path of all its parent routes.'),l.relativePath=l.relativePath.slice(r.length));let i=I([r,l.relativePath]),c=n.concat(l);e.children&&e.children.length>0&&(m(!0!==e.index,'Index routes must not have child routes. Please remove all child routes from route path "'+i+'".'),E(e.children,t,c,i)),(null!=e.path||e.index)&&t.push({path:i,score:O(i,e.index),routesMeta:c})};return e.forEach((e,t)=>{var n;if(""!==e.path&&null!=(n=e.path)&&n.includes("?"))for(let n of w(e.path))a(e,t,n);else a(e,t)}),t}function w(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,a=n.endsWith("?"),o=n.replace(/\?$/,"");if(0===r.length)return a?[o,""]:[o];let l=w(r.join("/")),i=[];return i.push(...l.map(e=>""===e?o:[o,e].join("/"))),a&&i.push(...l),i.map(t=>e.startsWith("/")&&""===t?"/":t)}!function(e){e.data="data",e.deferred="deferred",e.redirect="redirect",e.error="error"}(A||(A={})),new Set(["lazy","caseSensitive","path","id","index","children"]);const x=/^:[\w-]+$/,k=3,S=2,N=1,C=10,B=-2,_=e=>"*"===e;function O(e,t){let n=e.split("/"),r=n.length;return n.some(_)&&(r+=B),t&&(r+=S),n.filter(e=>!_(e)).reduce((e,t)=>e+(x.test(t)?k:""===t?N:C),r)}function P(e,t,n){void 0===n&&(n=!1);let{routesMeta:r}=e,a={},o="/",l=[];for(let e=0;e<r.length;++e){let i=r[e],c=e===r.length-1,s="/"===o?t:t.slice(o.length)||"/",u=j({path:i.relativePath,caseSensitive:i.caseSensitive,end:c},s),f=i.route;if(!u&&c&&n&&!r[r.length-1].route.index&&(u=j({path:i.relativePath,caseSensitive:i.caseSensitive,end:!1},s)),!u)return null;Object.assign(a,u.params),l.push({params:a,pathname:I([o,u.pathname]),pathnameBase:U(I([o,u.pathnameBase])),route:f}),"/"!==u.pathnameBase&&(o=I([o,u.pathnameBase]))}return l}function j(e,t){"string"==typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=function(e,t,n){void 0===t&&(t=!1),void 0===n&&(n=!0),p("*"===e||!e.endsWith("*")||e.endsWith("/*"),'Route path "'+e+'" will be treated as if it were "'+e.replace(/\*$/,"/*")+'" because the `*` character must always follow a `/` in the pattern. To get rid of this warning, please change the route path to "'+e.replace(/\*$/,"/*")+'".');let r=[],a="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)"));return e.endsWith("*")?(r.push({paramName:"*"}),a+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?a+="\\/*$":""!==e&&"/"!==e&&(a+="(?:(?=\\/|$))"),[new RegExp(a,t?void 0:"i"),r]}(e.path,e.caseSensitive,e.end),a=t.match(n);if(!a)return null;let o=a[0],l=o.replace(/(.)\/+$/,"$1"),i=a.slice(1);return{params:r.reduce((e,t,n)=>{let{paramName:r,isOptional:a}=t;if("*"===r){let e=i[n]||"";l=o.slice(0,o.length-e.length).replace(/(.)\/+$/,"$1")}const c=i[n];return e[r]=a&&!c?void 0:(c||"").replace(/%2F/g,"/"),e},{}),pathname:o,pathnameBase:l,pattern:e}}function M(e){try{return e.split("/").map(e=>decodeURIComponent(e).replace(/\//g,"%2F")).join("/")}catch(t){return p(!1,'The URL path "'+e+'" could not be decoded because it is is a malformed URL segment. This is probably due to a bad percent encoding ('+t+")."),e}}function T(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}const z=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i;function L(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)}),n.length>1?n.join("/"):"/"}function D(e,t,n,r){return"Cannot include a '"+e+"' character in a manually specified `to."+t+"` field ["+JSON.stringify(r)+"].  Please separate it out to the `to."+n+'` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.'}function R(e,t){let n=function(e){return e.filter((e,t)=>0===t||e.route.path&&e.route.path.length>0)}(e);return t?n.map((e,t)=>t===n.length-1?e.pathname:e.pathnameBase):n.map(e=>e.pathnameBase)}function F(e,t,n,r){let a;void 0===r&&(r=!1),"string"==typeof e?a=b(e):(a=f({},e),m(!a.pathname||!a.pathname.includes("?"),D("?","pathname","search",a)),m(!a.pathname||!a.pathname.includes("#"),D("#","pathname","hash",a)),m(!a.search||!a.search.includes("#"),D("#","search","hash",a)));let o,l=""===e||""===a.pathname,i=l?"/":a.pathname;if(null==i)o=n;else{let e=t.length-1;if(!r&&i.startsWith("..")){let t=i.split("/");for(;".."===t[0];)t.shift(),e-=1;a.pathname=t.join("/")}o=e>=0?t[e]:"/"}let c=function(e,t){void 0===t&&(t="/");let n,{pathname:r,search:a="",hash:o=""}="string"==typeof e?b(e):e;if(r)if(l=r,z.test(l))n=r;else{if(r.includes("//")){let e=r;r=r.replace(/\/\/+/g,"/"),p(!1,"Pathnames cannot have embedded double slashes - normalizing "+e+" -> "+r)}n=r.startsWith("/")?L(r.substring(1),"/"):L(r,t)}else n=t;var l;return{pathname:n,search:W(a),hash:H(o)}}(a,o),s=i&&"/"!==i&&i.endsWith("/"),u=(l||"."===i)&&n.endsWith("/");return c.pathname.endsWith("/")||!s&&!u||(c.pathname+="/"),c}const I=e=>e.join("/").replace(/\/\/+/g,"/"),U=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),W=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",H=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";Error;const $=["post","put","patch","delete"],q=(new Set($),["get",...$]);function V(){return V=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},V.apply(this,arguments)}new Set(q),new Set([301,302,303,307,308]),new Set([307,308]),Symbol("deferred");const G=l.createContext(null),Q=l.createContext(null),Y=l.createContext(null),K=l.createContext(null),X=l.createContext({outlet:null,matches:[],isDataRoute:!1}),J=l.createContext(null);function Z(){return null!=l.useContext(K)}function ee(){return Z()||m(!1),l.useContext(K).location}function te(e){l.useContext(Y).static||l.useLayoutEffect(e)}function ne(){let{isDataRoute:e}=l.useContext(X);return e?function(){let{router:e}=function(){let e=l.useContext(G);return e||m(!1),e}(se.UseNavigateStable),t=fe(ue.UseNavigateStable),n=l.useRef(!1);te(()=>{n.current=!0});let r=l.useCallback(function(r,a){void 0===a&&(a={}),n.current&&("number"==typeof r?e.navigate(r):e.navigate(r,V({fromRouteId:t},a)))},[e,t]);return r}():function(){Z()||m(!1);let e=l.useContext(G),{basename:t,future:n,navigator:r}=l.useContext(Y),{matches:a}=l.useContext(X),{pathname:o}=ee(),i=JSON.stringify(R(a,n.v7_relativeSplatPath)),c=l.useRef(!1);te(()=>{c.current=!0});let s=l.useCallback(function(n,a){if(void 0===a&&(a={}),!c.current)return;if("number"==typeof n)return void r.go(n);let l=F(n,JSON.parse(i),o,"path"===a.relative);null==e&&"/"!==t&&(l.pathname="/"===l.pathname?t:I([t,l.pathname])),(a.replace?r.replace:r.push)(l,a.state,a)},[t,r,i,o,e]);return s}()}function re(e,t){let{relative:n}=void 0===t?{}:t,{future:r}=l.useContext(Y),{matches:a}=l.useContext(X),{pathname:o}=ee(),i=JSON.stringify(R(a,r.v7_relativeSplatPath));return l.useMemo(()=>F(e,JSON.parse(i),o,"path"===n),[e,i,o,n])}function ae(e,t,n,r){Z()||m(!1);let{navigator:a}=l.useContext(Y),{matches:i}=l.useContext(X),c=i[i.length-1],s=c?c.params:{},u=(c&&c.pathname,c?c.pathnameBase:"/");c&&c.route;let f,d=ee();if(t){var p;let e="string"==typeof t?b(t):t;"/"===u||(null==(p=e.pathname)?void 0:p.startsWith(u))||m(!1),f=e}else f=d;let h=f.pathname||"/",v=h;if("/"!==u){let e=u.replace(/^\//,"").split("/");v="/"+h.replace(/^\//,"").split("/").slice(e.length).join("/")}let g=y(e,{pathname:v}),A=function(e,t,n,r){var a;if(void 0===t&&(t=[]),void 0===n&&(n=null),void 0===r&&(r=null),null==e){var o;if(!n)return null;if(n.errors)e=n.matches;else{if(!(null!=(o=r)&&o.v7_partialHydration&&0===t.length&&!n.initialized&&n.matches.length>0))return null;e=n.matches}}let i=e,c=null==(a=n)?void 0:a.errors;if(null!=c){let e=i.findIndex(e=>e.route.id&&void 0!==(null==c?void 0:c[e.route.id]));e>=0||m(!1),i=i.slice(0,Math.min(i.length,e+1))}let s=!1,u=-1;if(n&&r&&r.v7_partialHydration)for(let e=0;e<i.length;e++){let t=i[e];if((t.route.HydrateFallback||t.route.hydrateFallbackElement)&&(u=e),t.route.id){let{loaderData:e,errors:r}=n,a=t.route.loader&&void 0===e[t.route.id]&&(!r||void 0===r[t.route.id]);if(t.route.lazy||a){s=!0,i=u>=0?i.slice(0,u+1):[i[0]];break}}}return i.reduceRight((e,r,a)=>{let o,f=!1,d=null,m=null;var p;n&&(o=c&&r.route.id?c[r.route.id]:void 0,d=r.route.errorElement||le,s&&(u<0&&0===a?(de[p="route-fallback"]||(de[p]=!0),f=!0,m=null):u===a&&(f=!0,m=r.route.hydrateFallbackElement||null)));let h=t.concat(i.slice(0,a+1)),v=()=>{let t;return t=o?d:f?m:r.route.Component?l.createElement(r.route.Component,null):r.route.element?r.route.element:e,l.createElement(ce,{match:r,routeContext:{outlet:e,matches:h,isDataRoute:null!=n},children:t})};return n&&(r.route.ErrorBoundary||r.route.errorElement||0===a)?l.createElement(ie,{location:n.location,revalidation:n.revalidation,component:d,error:o,children:v(),routeContext:{outlet:null,matches:h,isDataRoute:!0}}):v()},null)}(g&&g.map(e=>Object.assign({},e,{params:Object.assign({},s,e.params),pathname:I([u,a.encodeLocation?a.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?u:I([u,a.encodeLocation?a.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])})),i,n,r);return t&&A?l.createElement(K.Provider,{value:{location:V({pathname:"/",search:"",hash:"",state:null,key:"default"},f),navigationType:o.Pop}},A):A}function oe(){let e=function(){var e;let t=l.useContext(J),n=function(){let e=l.useContext(Q);return e||m(!1),e}(ue.UseRouteError),r=fe(ue.UseRouteError);return void 0!==t?t:null==(e=n.errors)?void 0:e[r]}(),t=function(e){return null!=e&&"number"==typeof e.status&&"string"==typeof e.statusText&&"boolean"==typeof e.internal&&"data"in e}(e)?e.status+" "+e.statusText:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r={padding:"0.5rem",backgroundColor:"rgba(200,200,200, 0.5)"};return l.createElement(l.Fragment,null,l.createElement("h2",null,"Unexpected Application Error!"),l.createElement("h3",{style:{fontStyle:"italic"}},t),n?l.createElement("pre",{style:r},n):null,null)}const le=l.createElement(oe,null);class ie extends l.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return void 0!==this.state.error?l.createElement(X.Provider,{value:this.props.routeContext},l.createElement(J.Provider,{value:this.state.error,children:this.props.component})):this.props.children}}function ce(e){let{routeContext:t,match:n,children:r}=e,a=l.useContext(G);return a&&a.static&&a.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(a.staticContext._deepestRenderedBoundaryId=n.route.id),l.createElement(X.Provider,{value:t},r)}var se=function(e){return e.UseBlocker="useBlocker",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e}(se||{}),ue=function(e){return e.UseBlocker="useBlocker",e.UseLoaderData="useLoaderData",e.UseActionData="useActionData",e.UseRouteError="useRouteError",e.UseNavigation="useNavigation",e.UseRouteLoaderData="useRouteLoaderData",e.UseMatches="useMatches",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e.UseRouteId="useRouteId",e}(ue||{});function fe(e){let t=function(){let e=l.useContext(X);return e||m(!1),e}(),n=t.matches[t.matches.length-1];return n.route.id||m(!1),n.route.id}const de={};function me(e){m(!1)}function pe(e){let{basename:t="/",children:n=null,location:r,navigationType:a=o.Pop,navigator:i,static:c=!1,future:s}=e;Z()&&m(!1);let u=t.replace(/^\/*/,"/"),f=l.useMemo(()=>({basename:u,navigator:i,static:c,future:V({v7_relativeSplatPath:!1},s)}),[u,s,i,c]);"string"==typeof r&&(r=b(r));let{pathname:d="/",search:p="",hash:h="",state:v=null,key:g="default"}=r,A=l.useMemo(()=>{let e=T(d,u);return null==e?null:{location:{pathname:e,search:p,hash:h,state:v,key:g},navigationType:a}},[u,d,p,h,v,g,a]);return null==A?null:l.createElement(Y.Provider,{value:f},l.createElement(K.Provider,{children:n,value:A}))}function he(e){let{children:t,location:n}=e;return ae(ve(t),n)}function ve(e,t){void 0===t&&(t=[]);let n=[];return l.Children.forEach(e,(e,r)=>{if(!l.isValidElement(e))return;let a=[...t,r];if(e.type===l.Fragment)return void n.push.apply(n,ve(e.props.children,a));e.type!==me&&m(!1),e.props.index&&e.props.children&&m(!1);let o={id:e.props.id||a.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(o.children=ve(e.props.children,a)),n.push(o)}),n}function ge(){return ge=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ge.apply(this,arguments)}i.startTransition,new Promise(()=>{}),l.Component,new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);const be=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"];try{window.__reactRouterVersion="6"}catch(e){}new Map;const Ae=i.startTransition;function ye(e){let{basename:t,children:n,future:r,window:a}=e,i=l.useRef();null==i.current&&(i.current=function(e){return void 0===e&&(e={}),function(e,t,n,r){void 0===r&&(r={});let{window:a=document.defaultView,v5Compat:l=!1}=r,i=a.history,c=o.Pop,s=null,u=p();function p(){return(i.state||{idx:null}).idx}function b(){c=o.Pop;let e=p(),t=null==e?null:e-u;u=e,s&&s({action:c,location:y.location,delta:t})}function A(e){let t="null"!==a.location.origin?a.location.origin:a.location.href,n="string"==typeof e?e:g(e);return n=n.replace(/ $/,"%20"),m(t,"No window.location.(origin|href) available to create URL for href: "+n),new URL(n,t)}null==u&&(u=0,i.replaceState(f({},i.state,{idx:u}),""));let y={get action(){return c},get location(){return e(a,i)},listen(e){if(s)throw new Error("A history only accepts one active listener");return a.addEventListener(d,b),s=e,()=>{a.removeEventListener(d,b),s=null}},createHref:e=>t(a,e),createURL:A,encodeLocation(e){let t=A(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){c=o.Push;let r=v(y.location,e,t);n&&n(r,e),u=p()+1;let f=h(r,u),d=y.createHref(r);try{i.pushState(f,"",d)}catch(e){if(e instanceof DOMException&&"DataCloneError"===e.name)throw e;a.location.assign(d)}l&&s&&s({action:c,location:y.location,delta:1})},replace:function(e,t){c=o.Replace;let r=v(y.location,e,t);n&&n(r,e),u=p();let a=h(r,u),f=y.createHref(r);i.replaceState(a,"",f),l&&s&&s({action:c,location:y.location,delta:0})},go:e=>i.go(e)};return y}(function(e,t){let{pathname:n,search:r,hash:a}=e.location;return v("",{pathname:n,search:r,hash:a},t.state&&t.state.usr||null,t.state&&t.state.key||"default")},function(e,t){return"string"==typeof t?t:g(t)},null,e)}({window:a,v5Compat:!0}));let c=i.current,[s,u]=l.useState({action:c.action,location:c.location}),{v7_startTransition:p}=r||{},b=l.useCallback(e=>{p&&Ae?Ae(()=>u(e)):u(e)},[u,p]);return l.useLayoutEffect(()=>c.listen(b),[c,b]),l.useEffect(()=>{return null==(e=r)||e.v7_startTransition,void 0===(null==e?void 0:e.v7_relativeSplatPath)&&(!t||t.v7_relativeSplatPath),void(t&&(t.v7_fetcherPersist,t.v7_normalizeFormMethod,t.v7_partialHydration,t.v7_skipActionErrorRevalidation));var e,t},[r]),l.createElement(pe,{basename:t,children:n,location:s.location,navigationType:s.action,navigator:c,future:r})}u.flushSync,i.useId;const Ee="undefined"!=typeof window&&void 0!==window.document&&void 0!==window.document.createElement,we=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,xe=l.forwardRef(function(e,t){let n,{onClick:r,relative:a,reloadDocument:o,replace:i,state:c,target:s,to:u,preventScrollReset:f,viewTransition:d}=e,p=function(e,t){if(null==e)return{};var n,r,a={},o=Object.keys(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)>=0||(a[n]=e[n]);return a}(e,be),{basename:h}=l.useContext(Y),v=!1;if("string"==typeof u&&we.test(u)&&(n=u,Ee))try{let e=new URL(window.location.href),t=u.startsWith("//")?new URL(e.protocol+u):new URL(u),n=T(t.pathname,h);t.origin===e.origin&&null!=n?u=n+t.search+t.hash:v=!0}catch(e){}let b=function(e,t){let{relative:n}=void 0===t?{}:t;Z()||m(!1);let{basename:r,navigator:a}=l.useContext(Y),{hash:o,pathname:i,search:c}=re(e,{relative:n}),s=i;return"/"!==r&&(s="/"===i?r:I([r,i])),a.createHref({pathname:s,search:c,hash:o})}(u,{relative:a}),A=function(e,t){let{target:n,replace:r,state:a,preventScrollReset:o,relative:i,viewTransition:c}=void 0===t?{}:t,s=ne(),u=ee(),f=re(e,{relative:i});return l.useCallback(t=>{if(function(e,t){return!(0!==e.button||t&&"_self"!==t||function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e))}(t,n)){t.preventDefault();let n=void 0!==r?r:g(u)===g(f);s(e,{replace:n,state:a,preventScrollReset:o,relative:i,viewTransition:c})}},[u,s,f,r,a,n,e,o,i,c])}(u,{replace:i,state:c,target:s,preventScrollReset:f,relative:a,viewTransition:d});return l.createElement("a",ge({},p,{href:n||b,onClick:v||o?r:function(e){r&&r(e),e.defaultPrevented||A(e)},ref:t,target:s}))});var ke,Se;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(ke||(ke={})),function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"}(Se||(Se={}));var Ne=a(72),Ce=a.n(Ne),Be=a(825),_e=a.n(Be),Oe=a(659),Pe=a.n(Oe),je=a(56),Me=a.n(je),Te=a(159),ze=a.n(Te),Le=a(113),De=a.n(Le),Re=a(956),Fe={};function Ie(e){return Ie="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ie(e)}function Ue(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return We(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(We(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,We(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,We(f,"constructor",s),We(s,"constructor",c),c.displayName="GeneratorFunction",We(s,a,"GeneratorFunction"),We(f),We(f,a,"Generator"),We(f,r,function(){return this}),We(f,"toString",function(){return"[object Generator]"}),(Ue=function(){return{w:o,m:d}})()}function We(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}We=function(e,t,n,r){function o(t,n){We(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},We(e,t,n,r)}function He(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function $e(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?He(Object(n),!0).forEach(function(t){qe(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):He(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function qe(e,t,n){return(t=Ye(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ve(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Ge(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Ve(o,r,a,l,i,"next",e)}function i(e){Ve(o,r,a,l,i,"throw",e)}l(void 0)})}}function Qe(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Ye(r.key),r)}}function Ye(e){var t=function(e){if("object"!=Ie(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=Ie(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==Ie(t)?t:t+""}Fe.styleTagTransform=De(),Fe.setAttributes=Me(),Fe.insert=Pe().bind(null,"head"),Fe.domAPI=_e(),Fe.insertStyleElement=ze(),Ce()(Re.A,Fe),Re.A&&Re.A.locals&&Re.A.locals;var Ke=function(){return e=function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.baseURL="http://localhost:8000",this.retryAttempts=3,this.retryDelay=1e3},t=[{key:"request",value:(P=Ge(Ue().m(function e(t){var n,r,a,o,l,i,c,s,u,f,d=arguments;return Ue().w(function(e){for(;;)switch(e.p=e.n){case 0:n=d.length>1&&void 0!==d[1]?d[1]:{},r="".concat(this.baseURL).concat(t),a=$e({headers:$e({"Content-Type":"application/json"},n.headers)},n),l=1;case 1:if(!(l<=this.retryAttempts)){e.n=16;break}return e.p=2,e.n=3,fetch(r,a);case 3:if((i=e.v).ok){e.n=8;break}return e.n=4,i.json().catch(function(){return{}});case 4:if(c=e.v,s=c.detail||c.message||"HTTP error! status: ".concat(i.status),!(i.status>=400&&i.status<500)){e.n=5;break}throw new Error(s);case 5:if(!(l<this.retryAttempts)){e.n=7;break}return console.warn("Request failed (attempt ".concat(l,"/").concat(this.retryAttempts,"):"),s),e.n=6,this.delay(this.retryDelay*l);case 6:return e.a(3,15);case 7:throw new Error(s);case 8:if(!(u=i.headers.get("content-type"))||!u.includes("application/json")){e.n=10;break}return e.n=9,i.json();case 9:return e.a(2,e.v);case 10:return e.n=11,i.text();case 11:return e.a(2,e.v);case 12:if(e.p=12,f=e.v,o=f,console.error("API request failed (attempt ".concat(l,"/").concat(this.retryAttempts,"):"),f),"TypeError"!==f.name||!f.message.includes("fetch")){e.n=14;break}if(!(l<this.retryAttempts)){e.n=14;break}return e.n=13,this.delay(this.retryDelay*l);case 13:return e.a(3,15);case 14:return e.a(3,16);case 15:l++,e.n=1;break;case 16:throw console.error("All retry attempts failed"),o;case 17:return e.a(2)}},e,this,[[2,12]])})),function(e){return P.apply(this,arguments)})},{key:"delay",value:function(e){return new Promise(function(t){return setTimeout(t,e)})}},{key:"getServers",value:(O=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/"))},e,this)})),function(){return O.apply(this,arguments)})},{key:"getServer",value:(_=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t)))},e,this)})),function(e){return _.apply(this,arguments)})},{key:"createServer",value:(B=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/",{method:"POST",body:JSON.stringify(t)}))},e,this)})),function(e){return B.apply(this,arguments)})},{key:"updateServer",value:(C=Ge(Ue().m(function e(t,n){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t),{method:"PUT",body:JSON.stringify(n)}))},e,this)})),function(e,t){return C.apply(this,arguments)})},{key:"deleteServer",value:(N=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t),{method:"DELETE"}))},e,this)})),function(e){return N.apply(this,arguments)})},{key:"toggleServerStatus",value:(S=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/toggle"),{method:"POST"}))},e,this)})),function(e){return S.apply(this,arguments)})},{key:"startMonitoring",value:(k=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/monitor/start"),{method:"POST"}))},e,this)})),function(e){return k.apply(this,arguments)})},{key:"stopMonitoring",value:(x=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/monitor/stop"),{method:"POST"}))},e,this)})),function(e){return x.apply(this,arguments)})},{key:"getServerMetrics",value:(w=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/metrics")))},e,this)})),function(e){return w.apply(this,arguments)})},{key:"getServerSpecs",value:(E=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/specs")))},e,this)})),function(e){return E.apply(this,arguments)})},{key:"getAlerts",value:(y=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/"))},e,this)})),function(){return y.apply(this,arguments)})},{key:"getActiveAlerts",value:(A=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/active/"))},e,this)})),function(){return A.apply(this,arguments)})},{key:"createAlert",value:(b=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/",{method:"POST",body:JSON.stringify(t)}))},e,this)})),function(e){return b.apply(this,arguments)})},{key:"getAlertHistory",value:(g=Ge(Ue().m(function e(){var t,n=arguments;return Ue().w(function(e){for(;;)if(0===e.n)return t=n.length>0&&void 0!==n[0]?n[0]:100,e.a(2,this.request("/alerts/history/?limit=".concat(t)))},e,this)})),function(){return g.apply(this,arguments)})},{key:"resolveAlert",value:(v=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/".concat(t,"/resolve"),{method:"POST"}))},e,this)})),function(e){return v.apply(this,arguments)})},{key:"acknowledgeAlert",value:(h=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/".concat(t,"/acknowledge"),{method:"POST"}))},e,this)})),function(e){return h.apply(this,arguments)})},{key:"deleteAlert",value:(p=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/".concat(t),{method:"DELETE"}))},e,this)})),function(e){return p.apply(this,arguments)})},{key:"getServerStatus",value:(m=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/status")))},e,this)})),function(e){return m.apply(this,arguments)})},{key:"getAllServerStatuses",value:(d=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/status/"))},e,this)})),function(){return d.apply(this,arguments)})},{key:"getRealtimeMetrics",value:(f=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/metrics/realtime")))},e,this)})),function(e){return f.apply(this,arguments)})},{key:"getMetricsHistory",value:(u=Ge(Ue().m(function e(t){var n,r=arguments;return Ue().w(function(e){for(;;)if(0===e.n)return n=r.length>1&&void 0!==r[1]?r[1]:"1h",e.a(2,this.request("/servers/".concat(t,"/metrics/history?range=").concat(n)))},e,this)})),function(e){return u.apply(this,arguments)})},{key:"getSubscriptionStatus",value:(s=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/ws/subscriptions/"))},e,this)})),function(){return s.apply(this,arguments)})},{key:"getSystemHealth",value:(c=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/health/detailed"))},e,this)})),function(){return c.apply(this,arguments)})},{key:"getMonitoringStatus",value:(i=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/monitoring/status/"))},e,this)})),function(){return i.apply(this,arguments)})},{key:"getLogSources",value:(l=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/logs/sources/"))},e,this)})),function(){return l.apply(this,arguments)})},{key:"createLogSource",value:(o=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/logs/sources/",{method:"POST",body:JSON.stringify(t)}))},e,this)})),function(e){return o.apply(this,arguments)})},{key:"analyzeLogs",value:(a=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/logs/analyze/".concat(t)))},e,this)})),function(e){return a.apply(this,arguments)})},{key:"getRecentLogs",value:(r=Ge(Ue().m(function e(t){var n,r=arguments;return Ue().w(function(e){for(;;)if(0===e.n)return n=r.length>1&&void 0!==r[1]?r[1]:50,e.a(2,this.request("/logs/recent/".concat(t,"?limit=").concat(n)))},e,this)})),function(e){return r.apply(this,arguments)})},{key:"healthCheck",value:(n=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/health"))},e,this)})),function(){return n.apply(this,arguments)})}],t&&Qe(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,t,n,r,a,o,l,i,c,s,u,f,d,m,p,h,v,g,b,A,y,E,w,x,k,S,N,C,B,_,O,P}();const Xe=new Ke;function Je(e){return Je="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Je(e)}function Ze(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}function et(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,tt(r.key),r)}}function tt(e){var t=function(e){if("object"!=Je(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=Je(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==Je(t)?t:t+""}const nt=new(function(){return e=function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.socket=null,this.reconnectInterval=5e3,this.maxReconnectAttempts=10,this.reconnectAttempts=0,this.messageHandlers={},this.isConnected=!1,this.connectionPromise=null,this.connectionResolve=null,this.subscriptions=new Set,this.heartbeatInterval=null,this.lastPingTime=null,this.backendUrl="ws://localhost:8000/ws"},t=[{key:"connect",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null;return t&&(this.backendUrl=t),this.socket&&this.socket.readyState===WebSocket.OPEN?(console.log("WebSocket already connected"),Promise.resolve()):(this.connectionPromise=new Promise(function(t){e.connectionResolve=t}),this.socket=new WebSocket(this.backendUrl),this.socket.onopen=function(){console.log("WebSocket connected successfully"),e.isConnected=!0,e.reconnectAttempts=0,e.startHeartbeat(),e.resubscribeAll(),e.connectionResolve&&(e.connectionResolve(),e.connectionResolve=null)},this.socket.onmessage=function(t){try{var n=JSON.parse(t.data);console.log("WebSocket message received:",n),e.handleMessage(n)}catch(e){console.error("Error parsing WebSocket message:",e)}},this.socket.onclose=function(t){console.log("WebSocket disconnected:",t.code,t.reason),e.isConnected=!1,e.stopHeartbeat(),e.reconnectAttempts<e.maxReconnectAttempts?(e.reconnectAttempts++,console.log("Attempting to reconnect (".concat(e.reconnectAttempts,"/").concat(e.maxReconnectAttempts,")...")),setTimeout(function(){return e.connect()},e.reconnectInterval)):(console.error("Max reconnection attempts reached"),e.handleMessage({type:"connection_failed",data:{attempts:e.reconnectAttempts}}))},this.socket.onerror=function(e){console.error("WebSocket error:",e)},this.connectionPromise)}},{key:"disconnect",value:function(){this.stopHeartbeat(),this.socket&&(this.socket.close(),this.socket=null,this.isConnected=!1,this.reconnectAttempts=0,this.subscriptions.clear())}},{key:"startHeartbeat",value:function(){var e=this;this.stopHeartbeat(),this.heartbeatInterval=setInterval(function(){e.isConnected&&e.ping()},3e4)}},{key:"stopHeartbeat",value:function(){this.heartbeatInterval&&(clearInterval(this.heartbeatInterval),this.heartbeatInterval=null)}},{key:"subscribe",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,n=t?"".concat(e,":").concat(t):e;this.subscriptions.add(n),this.isConnected&&this.sendMessage({type:"subscribe",subscription:e,server_id:t}),console.log("Subscribed to: ".concat(n))}},{key:"unsubscribe",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,n=t?"".concat(e,":").concat(t):e;this.subscriptions.delete(n),this.isConnected&&this.sendMessage({type:"unsubscribe",subscription:e,server_id:t}),console.log("Unsubscribed from: ".concat(n))}},{key:"resubscribeAll",value:function(){var e=this;this.subscriptions.forEach(function(t){var n=function(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return Ze(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Ze(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}(t.split(":"),2),r=n[0],a=n[1];e.sendMessage({type:"subscribe",subscription:r,server_id:a===r?null:a})})}},{key:"sendMessage",value:function(e){if(!this.socket||this.socket.readyState!==WebSocket.OPEN)return console.warn("WebSocket not connected. Message not sent:",e),!1;try{var t="string"==typeof e?e:JSON.stringify(e);return this.socket.send(t),console.log("WebSocket message sent:",e),!0}catch(e){return console.error("Error sending WebSocket message:",e),!1}}},{key:"onMessage",value:function(e,t){this.messageHandlers[e]||(this.messageHandlers[e]=[]),this.messageHandlers[e].push(t)}},{key:"offMessage",value:function(e,t){this.messageHandlers[e]&&(this.messageHandlers[e]=this.messageHandlers[e].filter(function(e){return e!==t}))}},{key:"handleMessage",value:function(e){if(e&&e.type){switch(console.log("WebSocket message received:",e),e.type){case"pong":console.log("Received pong from server"),this.lastPingTime=Date.now();break;case"subscribed":console.log("Successfully subscribed to:",e.subscription);break;case"unsubscribed":console.log("Successfully unsubscribed from:",e.subscription);break;case"error":console.error("Server error:",e.data),this.messageHandlers.error&&this.messageHandlers.error.forEach(function(t){try{t(e)}catch(e){console.error("Error in error handler:",e)}});break;case"connection_failed":console.error("WebSocket connection failed after",e.data.attempts,"attempts")}switch(e.type){case"server_status_update":this.handleServerStatusUpdate(e.data);break;case"server_metrics_update":this.handleServerMetricsUpdate(e.data);break;case"alert_created":this.handleAlertCreated(e.data);break;case"alert_resolved":this.handleAlertResolved(e.data);break;case"server_created":case"server_updated":case"server_deleted":this.handleServerChange(e)}this.messageHandlers[e.type]&&this.messageHandlers[e.type].forEach(function(t){try{t(e)}catch(e){console.error("Error in message handler:",e)}})}else console.warn("Invalid message format:",e)}},{key:"handleServerStatusUpdate",value:function(e){console.log("Server status update:",e),this.messageHandlers.server_status_update&&this.messageHandlers.server_status_update.forEach(function(t){try{t(e)}catch(e){console.error("Error in server status handler:",e)}})}},{key:"handleServerMetricsUpdate",value:function(e){console.log("Server metrics update:",e),this.messageHandlers.server_metrics_update&&this.messageHandlers.server_metrics_update.forEach(function(t){try{t(e)}catch(e){console.error("Error in server metrics handler:",e)}})}},{key:"handleAlertCreated",value:function(e){console.log("New alert created:",e),this.messageHandlers.alert_created&&this.messageHandlers.alert_created.forEach(function(t){try{t(e)}catch(e){console.error("Error in alert created handler:",e)}})}},{key:"handleAlertResolved",value:function(e){console.log("Alert resolved:",e),this.messageHandlers.alert_resolved&&this.messageHandlers.alert_resolved.forEach(function(t){try{t(e)}catch(e){console.error("Error in alert resolved handler:",e)}})}},{key:"handleServerChange",value:function(e){console.log("Server change:",e.type,e.data),this.messageHandlers[e.type]&&this.messageHandlers[e.type].forEach(function(t){try{t(e.data)}catch(e){console.error("Error in server change handler:",e)}})}},{key:"ping",value:function(){return this.sendMessage({type:"ping",timestamp:(new Date).toISOString()})}},{key:"getStatus",value:function(){return{isConnected:this.isConnected,reconnectAttempts:this.reconnectAttempts,maxReconnectAttempts:this.maxReconnectAttempts}}}],t&&et(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,t}());function rt(e){return rt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},rt(e)}function at(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ot(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?at(Object(n),!0).forEach(function(t){lt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):at(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function lt(e,t,n){return(t=function(e){var t=function(e){if("object"!=rt(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=rt(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==rt(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function it(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return ct(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(ct(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,ct(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,ct(f,"constructor",s),ct(s,"constructor",c),c.displayName="GeneratorFunction",ct(s,a,"GeneratorFunction"),ct(f),ct(f,a,"Generator"),ct(f,r,function(){return this}),ct(f,"toString",function(){return"[object Generator]"}),(it=function(){return{w:o,m:d}})()}function ct(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}ct=function(e,t,n,r){function o(t,n){ct(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},ct(e,t,n,r)}function st(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function ut(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){st(o,r,a,l,i,"next",e)}function i(e){st(o,r,a,l,i,"throw",e)}l(void 0)})}}function ft(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return dt(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?dt(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function dt(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const mt=function(){var e=ft((0,l.useState)([]),2),t=e[0],n=e[1],r=ft((0,l.useState)(!0),2),a=r[0],o=r[1],i=ft((0,l.useState)(""),2),c=i[0],s=i[1],u=ft((0,l.useState)("all"),2),f=u[0],d=u[1],m=ft((0,l.useState)("disconnected"),2),p=m[0],h=m[1],v=ft((0,l.useState)(null),2),g=v[0],b=v[1],A=ft((0,l.useState)(!0),2),y=A[0],E=A[1];(0,l.useEffect)(function(){B(),w();var e=setInterval(function(){y&&B()},3e4);return function(){clearInterval(e),x()}},[y]);var w=function(){var e=ut(it().m(function e(){var t;return it().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,h("connecting"),e.n=1,nt.connect();case 1:h("connected"),nt.subscribe("server_status"),nt.subscribe("server_metrics"),nt.onMessage("server_status_update",k),nt.onMessage("server_metrics_update",S),nt.onMessage("server_created",C),nt.onMessage("server_updated",C),nt.onMessage("server_deleted",C),nt.onMessage("connection_failed",N),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to connect to WebSocket:",t),h("error");case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),x=function(){nt.offMessage("server_status_update",k),nt.offMessage("server_metrics_update",S),nt.offMessage("server_created",C),nt.offMessage("server_updated",C),nt.offMessage("server_deleted",C),nt.offMessage("connection_failed",N)},k=function(e){console.log("Server status updated:",e),b(new Date),n(function(t){return t.map(function(t){return t.id===e.server_id?ot(ot({},t),{},{status:e.status,updated_at:e.timestamp}):t})})},S=function(e){console.log("Server metrics updated:",e),b(new Date),n(function(t){return t.map(function(t){return t.id===e.server_id?ot(ot({},t),{},{last_metrics:e.metrics,updated_at:e.timestamp}):t})})},N=function(){h("error")},C=function(){B()},B=function(){var e=ut(it().m(function e(){var t,r;return it().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,o(!0),e.n=1,Xe.getServers();case 1:t=e.v,n(t),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error fetching servers:",r);case 3:return e.p=3,o(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),_=function(){var e=ut(it().m(function e(t){var n;return it().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.toggleServerStatus(t);case 1:e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error toggling server status:",n);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(t){return e.apply(this,arguments)}}(),O=function(){var e=ut(it().m(function e(t){var n;return it().w(function(e){for(;;)switch(e.p=e.n){case 0:if(!window.confirm("Are you sure you want to delete this server?")){e.n=4;break}return e.p=1,e.n=2,Xe.deleteServer(t);case 2:e.n=4;break;case 3:e.p=3,n=e.v,console.error("Error deleting server:",n);case 4:return e.a(2)}},e,null,[[1,3]])}));return function(t){return e.apply(this,arguments)}}(),P=t.filter(function(e){var t=e.name.toLowerCase().includes(c.toLowerCase())||e.ip.includes(c),n="all"===f||e.status===f;return t&&n});return a?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading servers..."))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900 mb-2"},"Servers"),l.createElement("p",{className:"text-gray-600"},"Manage your server infrastructure")),l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("div",{className:"w-3 h-3 rounded-full ".concat("connected"===p?"bg-green-500":"connecting"===p?"bg-yellow-500 animate-pulse":"error"===p?"bg-red-500":"bg-gray-400")}),l.createElement("span",{className:"text-sm text-gray-600 capitalize"},p)),l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("input",{type:"checkbox",id:"autoRefresh",checked:y,onChange:function(e){return E(e.target.checked)},className:"form-checkbox"}),l.createElement("label",{htmlFor:"autoRefresh",className:"text-sm text-gray-600"},"Auto-refresh")),g&&l.createElement("div",{className:"text-sm text-gray-500"},"Updated: ",g.toLocaleTimeString()),l.createElement(xe,{to:"/servers/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Add Server"))),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"flex flex-col md:flex-row gap-4"},l.createElement("div",{className:"flex-1"},l.createElement("input",{type:"text",placeholder:"Search servers by name or IP...",className:"form-input",value:c,onChange:function(e){return s(e.target.value)}})),l.createElement("div",{className:"md:w-48"},l.createElement("select",{className:"form-select",value:f,onChange:function(e){return d(e.target.value)}},l.createElement("option",{value:"all"},"All Status"),l.createElement("option",{value:"active"},"Active"),l.createElement("option",{value:"inactive"},"Inactive"))))),l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Server List (",P.length," of ",t.length,")")),0===P.length?l.createElement("div",{className:"text-center py-12"},0===t.length?l.createElement(l.Fragment,null,l.createElement("i",{className:"fas fa-server text-6xl text-gray-300 mb-4"}),l.createElement("h3",{className:"text-xl font-semibold text-gray-600 mb-2"},"No servers configured"),l.createElement("p",{className:"text-gray-500 mb-6"},"Get started by adding your first server"),l.createElement(xe,{to:"/servers/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Add Your First Server")):l.createElement(l.Fragment,null,l.createElement("i",{className:"fas fa-search text-4xl text-gray-300 mb-4"}),l.createElement("h3",{className:"text-lg font-semibold text-gray-600 mb-2"},"No servers found"),l.createElement("p",{className:"text-gray-500"},"Try adjusting your search or filter criteria"))):l.createElement("div",{className:"overflow-x-auto"},l.createElement("table",{className:"table"},l.createElement("thead",null,l.createElement("tr",null,l.createElement("th",null,"Name"),l.createElement("th",null,"IP Address"),l.createElement("th",null,"Port"),l.createElement("th",null,"User"),l.createElement("th",null,"Status"),l.createElement("th",null,"Created"),l.createElement("th",null,"Actions"))),l.createElement("tbody",null,P.map(function(e){return l.createElement("tr",{key:e.id},l.createElement("td",null,l.createElement(xe,{to:"/servers/".concat(e.id),className:"text-blue-600 hover:text-blue-800 font-medium"},e.name)),l.createElement("td",{className:"text-gray-600 font-mono"},e.ip),l.createElement("td",{className:"text-gray-600"},e.port),l.createElement("td",{className:"text-gray-600"},e.user),l.createElement("td",null,l.createElement("span",{className:"status-badge ".concat("active"===e.status?"status-online":"status-offline")},e.status)),l.createElement("td",{className:"text-gray-600"},new Date(e.created_at).toLocaleDateString()),l.createElement("td",null,l.createElement("div",{className:"flex space-x-2"},l.createElement(xe,{to:"/servers/".concat(e.id),className:"btn btn-sm btn-secondary",title:"View Details"},l.createElement("i",{className:"fas fa-eye"})),l.createElement("button",{className:"btn btn-sm ".concat("active"===e.status?"btn-warning":"btn-success"),title:"active"===e.status?"Deactivate":"Activate",onClick:function(){return _(e.id)}},l.createElement("i",{className:"fas ".concat("active"===e.status?"fa-pause":"fa-play")})),l.createElement("button",{className:"btn btn-sm btn-danger",title:"Delete Server",onClick:function(){return O(e.id)}},l.createElement("i",{className:"fas fa-trash"})))))}))))),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mt-6"},l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-server text-3xl text-blue-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.length),l.createElement("div",{className:"text-gray-600"},"Total Servers")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-check-circle text-3xl text-green-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return"active"===e.status}).length),l.createElement("div",{className:"text-gray-600"},"Active Servers")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-times-circle text-3xl text-red-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return"inactive"===e.status}).length),l.createElement("div",{className:"text-gray-600"},"Inactive Servers"))))};function pt(e){return pt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},pt(e)}function ht(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function vt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ht(Object(n),!0).forEach(function(t){gt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ht(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function gt(e,t,n){return(t=function(e){var t=function(e){if("object"!=pt(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=pt(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==pt(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function bt(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return At(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(At(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,At(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,At(f,"constructor",s),At(s,"constructor",c),c.displayName="GeneratorFunction",At(s,a,"GeneratorFunction"),At(f),At(f,a,"Generator"),At(f,r,function(){return this}),At(f,"toString",function(){return"[object Generator]"}),(bt=function(){return{w:o,m:d}})()}function At(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}At=function(e,t,n,r){function o(t,n){At(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},At(e,t,n,r)}function yt(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Et(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){yt(o,r,a,l,i,"next",e)}function i(e){yt(o,r,a,l,i,"throw",e)}l(void 0)})}}function wt(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return xt(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?xt(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function xt(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const kt=function(){var e,t,n,r,a,o,i,c,s=function(){let{matches:e}=l.useContext(X),t=e[e.length-1];return t?t.params:{}}().id,u=ne(),f=wt((0,l.useState)(null),2),d=f[0],m=f[1],p=wt((0,l.useState)(null),2),h=p[0],v=p[1],g=wt((0,l.useState)(null),2),b=g[0],A=g[1],y=wt((0,l.useState)(null),2),E=y[0],w=y[1],x=wt((0,l.useState)(!0),2),k=x[0],S=x[1],N=wt((0,l.useState)(!1),2),C=N[0],B=N[1],_=wt((0,l.useState)(!1),2),O=_[0],P=_[1],j=wt((0,l.useState)("overview"),2),M=j[0],T=j[1],z=wt((0,l.useState)("disconnected"),2),L=z[0],D=z[1],R=wt((0,l.useState)(null),2),F=R[0],I=R[1],U=wt((0,l.useState)(!1),2),W=U[0],H=U[1];(0,l.useEffect)(function(){return s&&(Y(),K(),$()),function(){q()}},[s]);var $=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,D("connecting"),e.n=1,nt.connect();case 1:D("connected"),nt.subscribe("server_status",s),nt.subscribe("server_metrics",s),nt.onMessage("server_status_update",V),nt.onMessage("server_metrics_update",G),nt.onMessage("connection_failed",Q),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to connect to WebSocket:",t),D("error");case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),q=function(){nt.offMessage("server_status_update",V),nt.offMessage("server_metrics_update",G),nt.offMessage("connection_failed",Q),nt.unsubscribe("server_status",s),nt.unsubscribe("server_metrics",s)},V=function(e){console.log("Server status updated:",e),e.server_id===parseInt(s)&&(m(function(t){return t?vt(vt({},t),{},{status:e.status,updated_at:e.timestamp}):null}),I(new Date))},G=function(e){console.log("Server metrics updated:",e),e.server_id===parseInt(s)&&(A(e.metrics),I(new Date))},Q=function(){D("error")},Y=function(){var e=Et(bt().m(function e(){var t,n;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,S(!0),e.n=1,Xe.getServer(s);case 1:t=e.v,m(t),H(t.monitoring_enabled||!1),e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error fetching server details:",n);case 3:return e.p=3,S(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),K=function(){var e=Et(bt().m(function e(){var t,n;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,P(!0),e.n=1,Xe.getServerSpecs(s);case 1:t=e.v,w(t),e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error fetching server specs:",n),w(null);case 3:return e.p=3,P(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),J=function(){var e=Et(bt().m(function e(){var t,n;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,B(!0),e.n=1,Xe.getServerMetrics(s);case 1:t=e.v,v(t),e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error fetching metrics:",n),v(null);case 3:return e.p=3,B(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),Z=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.toggleServerStatus(s);case 1:Y(),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Error toggling server status:",t);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),ee=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:if(!window.confirm("Are you sure you want to delete this server?")){e.n=4;break}return e.p=1,e.n=2,Xe.deleteServer(s);case 2:u("/servers"),e.n=4;break;case 3:e.p=3,t=e.v,console.error("Error deleting server:",t);case 4:return e.a(2)}},e,null,[[1,3]])}));return function(){return e.apply(this,arguments)}}(),te=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.startMonitoring(s);case 1:H(!0),alert("Monitoring started successfully"),nt.subscribe("server_metrics",s),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Error starting monitoring:",t),alert("Failed to start monitoring: "+t.message);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),re=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.stopMonitoring(s);case 1:H(!1),A(null),alert("Monitoring stopped successfully"),nt.unsubscribe("server_metrics",s),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Error stopping monitoring:",t),alert("Failed to stop monitoring: "+t.message);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),ae=function(){var e=Et(bt().m(function e(){var t,n;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,B(!0),e.n=1,Xe.getRealtimeMetrics(s);case 1:t=e.v,A(t),I(new Date),e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error fetching realtime metrics:",n);case 3:return e.p=3,B(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}();return k?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading server details..."))):d?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",{className:"flex items-center space-x-4"},l.createElement(xe,{to:"/servers",className:"btn btn-secondary btn-sm"},l.createElement("i",{className:"fas fa-arrow-left mr-2"}),"Back"),l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900"},d.name),l.createElement("p",{className:"text-gray-600"},d.ip,":",d.port))),l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("div",{className:"w-3 h-3 rounded-full ".concat("connected"===L?"bg-green-500":"connecting"===L?"bg-yellow-500 animate-pulse":"error"===L?"bg-red-500":"bg-gray-400")}),l.createElement("span",{className:"text-sm text-gray-600 capitalize"},L)),F&&l.createElement("div",{className:"text-sm text-gray-500"},"Updated: ",F.toLocaleTimeString()),l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("div",{className:"w-3 h-3 rounded-full ".concat(W?"bg-green-500":"bg-gray-400")}),l.createElement("span",{className:"text-sm text-gray-600"},W?"Monitoring":"Not Monitoring")),l.createElement("button",{className:"btn ".concat("active"===d.status?"btn-warning":"btn-success"),onClick:Z},l.createElement("i",{className:"fas ".concat("active"===d.status?"fa-pause":"fa-play"," mr-2")}),"active"===d.status?"Deactivate":"Activate"),l.createElement("button",{className:"btn btn-danger",onClick:ee},l.createElement("i",{className:"fas fa-trash mr-2"}),"Delete"))),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"flex justify-between items-center"},l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"w-4 h-4 rounded-full ".concat("active"===d.status?"bg-green-500":"bg-red-500")}),l.createElement("div",null,l.createElement("h3",{className:"text-lg font-semibold"},"Server Status"),l.createElement("p",{className:"text-gray-600"},"Last updated: ",new Date(d.updated_at).toLocaleString()))),l.createElement("div",{className:"text-right"},l.createElement("span",{className:"status-badge ".concat("active"===d.status?"status-online":"status-offline"," text-lg px-4 py-2")},d.status)))),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"border-b border-gray-200"},l.createElement("nav",{className:"-mb-px flex space-x-8"},[{id:"overview",label:"Overview",icon:"fas fa-info-circle"},{id:"metrics",label:"Metrics",icon:"fas fa-chart-line"},{id:"monitoring",label:"Monitoring",icon:"fas fa-eye"},{id:"logs",label:"Logs",icon:"fas fa-file-alt"}].map(function(e){return l.createElement("button",{key:e.id,className:"py-4 px-1 border-b-2 font-medium text-sm ".concat(M===e.id?"border-blue-500 text-blue-600":"border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300"),onClick:function(){return T(e.id)}},l.createElement("i",{className:"".concat(e.icon," mr-2")}),e.label)}))),l.createElement("div",{className:"p-6"},"overview"===M&&l.createElement("div",{className:"space-y-6"},l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Server Information"),l.createElement("div",{className:"space-y-3"},l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Name:"),l.createElement("span",{className:"font-medium"},d.name)),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"IP Address:"),l.createElement("span",{className:"font-mono"},d.ip)),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Port:"),l.createElement("span",{className:"font-medium"},d.port)),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"User:"),l.createElement("span",{className:"font-medium"},d.user)),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Status:"),l.createElement("span",{className:"status-badge ".concat("active"===d.status?"status-online":"status-offline")},d.status)))),l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Timestamps"),l.createElement("div",{className:"space-y-3"},l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Created:"),l.createElement("span",{className:"font-medium"},new Date(d.created_at).toLocaleString())),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Last Updated:"),l.createElement("span",{className:"font-medium"},new Date(d.updated_at).toLocaleString()))))),l.createElement("div",null,l.createElement("div",{className:"flex justify-between items-center mb-4"},l.createElement("h4",{className:"text-lg font-semibold"},"Hardware Specifications"),l.createElement("button",{className:"btn btn-secondary btn-sm",onClick:K,disabled:O,title:"Refresh hardware specifications"},O?l.createElement("div",{className:"spinner mr-2"}):l.createElement("i",{className:"fas fa-sync-alt mr-2"}),"Refresh")),E&&E.cpu_model?l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4"},l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-microchip mr-2 text-blue-500"}),"CPU"),l.createElement("div",{className:"space-y-2 text-sm"},l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Model:"),l.createElement("div",{className:"font-medium"},E.cpu_model)),l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Cores:"),l.createElement("div",{className:"font-medium"},E.cpu_cores||"Unknown")),E.cpu_threads&&l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Threads:"),l.createElement("div",{className:"font-medium"},E.cpu_threads)))),l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-memory mr-2 text-green-500"}),"Memory"),l.createElement("div",{className:"space-y-2 text-sm"},l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Total RAM:"),l.createElement("div",{className:"font-medium"},E.total_ram||"Unknown")))),l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-hdd mr-2 text-purple-500"}),"Storage"),l.createElement("div",{className:"space-y-2 text-sm"},E.disk_info&&E.disk_info.length>0?l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Disks:"),l.createElement("div",{className:"font-medium"},E.disk_info.length," device(s)")):l.createElement("div",{className:"text-gray-500"},"No disk information available"))),l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-desktop mr-2 text-orange-500"}),"Operating System"),l.createElement("div",{className:"space-y-2 text-sm"},l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"OS:"),l.createElement("div",{className:"font-medium"},E.os_info||"Unknown")))),E.last_updated&&l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-clock mr-2 text-gray-500"}),"Last Updated"),l.createElement("div",{className:"space-y-2 text-sm"},l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Updated:"),l.createElement("div",{className:"font-medium"},new Date(E.last_updated).toLocaleString()))))):l.createElement("div",{className:"text-center py-8"},l.createElement("i",{className:"fas fa-info-circle text-4xl text-gray-300 mb-4"}),l.createElement("p",{className:"text-gray-500 mb-4"},O?"Loading hardware specifications...":"No hardware specifications available"),!O&&l.createElement("button",{className:"btn btn-primary btn-sm",onClick:K},l.createElement("i",{className:"fas fa-download mr-2"}),"Fetch Specifications")))),"metrics"===M&&l.createElement("div",null,l.createElement("div",{className:"flex justify-between items-center mb-4"},l.createElement("h4",{className:"text-lg font-semibold"},"Performance Metrics"),l.createElement("div",{className:"flex space-x-2"},l.createElement("button",{className:"btn btn-secondary btn-sm",onClick:ae,disabled:C||!W,title:W?"Fetch latest metrics":"Start monitoring to enable real-time metrics"},C?l.createElement("div",{className:"spinner mr-2"}):l.createElement("i",{className:"fas fa-bolt mr-2"}),"Real-time"),l.createElement("button",{className:"btn btn-primary btn-sm",onClick:J,disabled:C},C?l.createElement("div",{className:"spinner mr-2"}):l.createElement("i",{className:"fas fa-sync-alt mr-2"}),"Refresh"))),W&&b&&l.createElement("div",{className:"mb-6 p-4 bg-green-50 border border-green-200 rounded-lg"},l.createElement("div",{className:"flex items-center justify-between mb-3"},l.createElement("h5",{className:"font-semibold text-green-800"},l.createElement("i",{className:"fas fa-circle text-green-500 mr-2"}),"Live Metrics"),l.createElement("span",{className:"text-sm text-green-600"},"Last update: ",null==F?void 0:F.toLocaleTimeString())),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4"},b.cpu_usage&&l.createElement("div",{className:"bg-white p-3 rounded border"},l.createElement("div",{className:"text-sm text-gray-600"},"CPU Usage"),l.createElement("div",{className:"text-xl font-bold text-blue-600"},null===(e=b.cpu_usage.totalUsage)||void 0===e?void 0:e.toFixed(1),"%"),l.createElement("div",{className:"text-xs text-gray-500"},"User: ",null===(t=b.cpu_usage.user)||void 0===t?void 0:t.toFixed(1),"% | System: ",null===(n=b.cpu_usage.system)||void 0===n?void 0:n.toFixed(1),"%")),b.memory_usage&&l.createElement("div",{className:"bg-white p-3 rounded border"},l.createElement("div",{className:"text-sm text-gray-600"},"Memory Usage"),l.createElement("div",{className:"text-xl font-bold text-green-600"},null===(r=b.memory_usage.usage_percent)||void 0===r?void 0:r.toFixed(1),"%"),l.createElement("div",{className:"text-xs text-gray-500"},b.memory_usage.used_mb,"MB / ",b.memory_usage.total_mb,"MB")),b.network&&l.createElement("div",{className:"bg-white p-3 rounded border"},l.createElement("div",{className:"text-sm text-gray-600"},"Network I/O"),l.createElement("div",{className:"text-sm"},l.createElement("div",null,"In: ",(b.network.bytes_recv/1024/1024).toFixed(1)," MB"),l.createElement("div",null,"Out: ",(b.network.bytes_sent/1024/1024).toFixed(1)," MB"))))),!h&&!C&&!b&&l.createElement("div",{className:"text-center py-8"},l.createElement("i",{className:"fas fa-chart-line text-4xl text-gray-300 mb-4"}),l.createElement("p",{className:"text-gray-500 mb-4"},W?'Click "Refresh" to load historical performance data':"Start monitoring to see real-time metrics")),h&&l.createElement("div",null,l.createElement("h5",{className:"font-semibold mb-4"},"Historical Metrics"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6"},h.cpu_usage&&l.createElement("div",{className:"card"},l.createElement("h6",{className:"font-semibold mb-2"},"CPU Usage"),l.createElement("div",{className:"text-2xl font-bold text-blue-600"},null===(a=h.cpu_usage.totalUsage)||void 0===a?void 0:a.toFixed(1),"%"),l.createElement("div",{className:"text-sm text-gray-600 mt-2"},"User: ",null===(o=h.cpu_usage.user)||void 0===o?void 0:o.toFixed(1),"% | System: ",null===(i=h.cpu_usage.system)||void 0===i?void 0:i.toFixed(1),"%")),h.memory_usage&&l.createElement("div",{className:"card"},l.createElement("h6",{className:"font-semibold mb-2"},"Memory Usage"),l.createElement("div",{className:"text-2xl font-bold text-green-600"},null===(c=h.memory_usage.usage_percent)||void 0===c?void 0:c.toFixed(1),"%"),l.createElement("div",{className:"text-sm text-gray-600 mt-2"},h.memory_usage.used_mb,"MB / ",h.memory_usage.total_mb,"MB")),h.disk_usage&&l.createElement("div",{className:"card"},l.createElement("h6",{className:"font-semibold mb-2"},"Disk Usage"),l.createElement("div",{className:"space-y-2"},h.disk_usage.slice(0,3).map(function(e,t){var n;return l.createElement("div",{key:t,className:"flex justify-between text-sm"},l.createElement("span",{className:"text-gray-600"},e.mount_point),l.createElement("span",{className:"font-medium"},null===(n=e.usage_percent)||void 0===n?void 0:n.toFixed(1),"%"))})))))),"monitoring"===M&&l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Monitoring Control"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2"},"Start Monitoring"),l.createElement("p",{className:"text-gray-600 mb-4"},"Begin collecting real-time metrics and performance data for this server."),l.createElement("button",{className:"btn btn-success",onClick:te},l.createElement("i",{className:"fas fa-play mr-2"}),"Start Monitoring")),l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2"},"Stop Monitoring"),l.createElement("p",{className:"text-gray-600 mb-4"},"Stop collecting metrics for this server. Existing data will be preserved."),l.createElement("button",{className:"btn btn-warning",onClick:re},l.createElement("i",{className:"fas fa-stop mr-2"}),"Stop Monitoring")))),"logs"===M&&l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Server Logs"),l.createElement("div",{className:"text-center py-8"},l.createElement("i",{className:"fas fa-file-alt text-4xl text-gray-300 mb-4"}),l.createElement("p",{className:"text-gray-500"},"Log viewing functionality will be implemented in the next phase")))))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"text-center py-12"},l.createElement("i",{className:"fas fa-exclamation-triangle text-4xl text-yellow-500 mb-4"}),l.createElement("h3",{className:"text-xl font-semibold text-gray-600 mb-2"},"Server not found"),l.createElement("p",{className:"text-gray-500 mb-6"},"The server you're looking for doesn't exist"),l.createElement(xe,{to:"/servers",className:"btn btn-primary"},"Back to Servers")))};function St(e){return St="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},St(e)}function Nt(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return Ct(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(Ct(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,Ct(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,Ct(f,"constructor",s),Ct(s,"constructor",c),c.displayName="GeneratorFunction",Ct(s,a,"GeneratorFunction"),Ct(f),Ct(f,a,"Generator"),Ct(f,r,function(){return this}),Ct(f,"toString",function(){return"[object Generator]"}),(Nt=function(){return{w:o,m:d}})()}function Ct(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}Ct=function(e,t,n,r){function o(t,n){Ct(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},Ct(e,t,n,r)}function Bt(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function _t(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Bt(o,r,a,l,i,"next",e)}function i(e){Bt(o,r,a,l,i,"throw",e)}l(void 0)})}}function Ot(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Pt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Ot(Object(n),!0).forEach(function(t){jt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ot(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function jt(e,t,n){return(t=function(e){var t=function(e){if("object"!=St(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=St(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==St(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Mt(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return Tt(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Tt(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Tt(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const zt=function(){var e=ne(),t=Mt((0,l.useState)({name:"",ip:"",port:22,user:"",ssh_key_path:"",password:""}),2),n=t[0],r=t[1],a=Mt((0,l.useState)(!1),2),o=a[0],i=a[1],c=Mt((0,l.useState)(!1),2),s=c[0],u=c[1],f=Mt((0,l.useState)(null),2),d=f[0],m=f[1],p=function(e){var t=e.target,n=t.name,a=t.value;r(function(e){return Pt(Pt({},e),{},jt({},n,a))})},h=function(){var e=_t(Nt().m(function e(){var t,r,a,o,l;return Nt().w(function(e){for(;;)switch(e.p=e.n){case 0:if(n.ip&&n.user){e.n=1;break}return alert("Please fill in IP address and username before testing connection"),e.a(2);case 1:return u(!0),m(null),e.p=2,t={name:"Test Connection",ip:n.ip,port:parseInt(n.port),user:n.user,ssh_key_path:n.ssh_key_path||null,password:n.password||null},e.n=3,Xe.createServer(t);case 3:return r=e.v,e.p=4,e.n=5,Xe.getServerMetrics(r.id);case 5:a=e.v,m({success:!0,message:"Connection successful! Server is reachable.",data:a}),e.n=7;break;case 6:e.p=6,o=e.v,m({success:!1,message:"Server created but connection test failed. Please check credentials.",error:o.message});case 7:return e.n=8,Xe.deleteServer(r.id);case 8:e.n=10;break;case 9:e.p=9,l=e.v,m({success:!1,message:"Connection test failed",error:l.message});case 10:return e.p=10,u(!1),e.f(10);case 11:return e.a(2)}},e,null,[[4,6],[2,9,10,11]])}));return function(){return e.apply(this,arguments)}}(),v=function(){var t=_t(Nt().m(function t(r){var a,o;return Nt().w(function(t){for(;;)switch(t.p=t.n){case 0:if(r.preventDefault(),n.name&&n.ip&&n.user){t.n=1;break}return alert("Please fill in all required fields"),t.a(2);case 1:return i(!0),t.p=2,a={name:n.name,ip:n.ip,port:parseInt(n.port),user:n.user,ssh_key_path:n.ssh_key_path||null,password:n.password||null},t.n=3,Xe.createServer(a);case 3:e("/servers"),t.n=5;break;case 4:t.p=4,o=t.v,console.error("Error creating server:",o),alert("Failed to create server: "+o.message);case 5:return t.p=5,i(!1),t.f(5);case 6:return t.a(2)}},t,null,[[2,4,5,6]])}));return function(e){return t.apply(this,arguments)}}();return l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",{className:"flex items-center space-x-4"},l.createElement(xe,{to:"/servers",className:"btn btn-secondary btn-sm"},l.createElement("i",{className:"fas fa-arrow-left mr-2"}),"Back to Servers"),l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900"},"Add New Server"),l.createElement("p",{className:"text-gray-600"},"Configure a new server for monitoring")))),l.createElement("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-6"},l.createElement("div",{className:"lg:col-span-2"},l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Server Configuration")),l.createElement("form",{onSubmit:v,className:"p-6"},l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",null,l.createElement("label",{className:"form-label"},"Server Name *"),l.createElement("input",{type:"text",name:"name",className:"form-input",value:n.name,onChange:p,placeholder:"e.g., Web Server 1",required:!0})),l.createElement("div",null,l.createElement("label",{className:"form-label"},"IP Address *"),l.createElement("input",{type:"text",name:"ip",className:"form-input",value:n.ip,onChange:p,placeholder:"192.168.1.100",required:!0})),l.createElement("div",null,l.createElement("label",{className:"form-label"},"SSH Port"),l.createElement("input",{type:"number",name:"port",className:"form-input",value:n.port,onChange:p,min:"1",max:"65535"})),l.createElement("div",null,l.createElement("label",{className:"form-label"},"Username *"),l.createElement("input",{type:"text",name:"user",className:"form-input",value:n.user,onChange:p,placeholder:"e.g., ubuntu, root",required:!0})),l.createElement("div",{className:"md:col-span-2"},l.createElement("label",{className:"form-label"},"SSH Key Path (optional)"),l.createElement("input",{type:"text",name:"ssh_key_path",className:"form-input",value:n.ssh_key_path,onChange:p,placeholder:"/path/to/private/key"}),l.createElement("p",{className:"text-sm text-gray-500 mt-1"},"Leave empty to use password authentication")),l.createElement("div",{className:"md:col-span-2"},l.createElement("label",{className:"form-label"},"Password (optional)"),l.createElement("input",{type:"password",name:"password",className:"form-input",value:n.password,onChange:p,placeholder:"Enter password if not using SSH keys"}),l.createElement("p",{className:"text-sm text-gray-500 mt-1"},"Leave empty if using SSH key authentication"))),l.createElement("div",{className:"flex justify-between items-center mt-8"},l.createElement("button",{type:"button",className:"btn btn-secondary",onClick:function(){return e("/servers")}},"Cancel"),l.createElement("div",{className:"flex space-x-3"},l.createElement("button",{type:"button",className:"btn btn-info",onClick:h,disabled:s||!n.ip||!n.user},s?l.createElement(l.Fragment,null,l.createElement("div",{className:"spinner mr-2"}),"Testing..."):l.createElement(l.Fragment,null,l.createElement("i",{className:"fas fa-plug mr-2"}),"Test Connection")),l.createElement("button",{type:"submit",className:"btn btn-primary",disabled:o},o?l.createElement(l.Fragment,null,l.createElement("div",{className:"spinner mr-2"}),"Creating..."):l.createElement(l.Fragment,null,l.createElement("i",{className:"fas fa-plus mr-2"}),"Create Server"))))))),l.createElement("div",{className:"space-y-6"},d&&l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Connection Test")),l.createElement("div",{className:"p-4"},l.createElement("div",{className:"flex items-center mb-3 ".concat(d.success?"text-green-600":"text-red-600")},l.createElement("i",{className:"fas ".concat(d.success?"fa-check-circle":"fa-times-circle"," mr-2")}),l.createElement("span",{className:"font-medium"},d.success?"Success":"Failed")),l.createElement("p",{className:"text-sm text-gray-600 mb-2"},d.message),d.error&&l.createElement("p",{className:"text-xs text-red-500"},"Error: ",d.error))),l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Connection Help")),l.createElement("div",{className:"p-4 text-sm text-gray-600"},l.createElement("div",{className:"space-y-3"},l.createElement("div",null,l.createElement("h4",{className:"font-medium text-gray-900"},"SSH Key Authentication"),l.createElement("p",null,"Recommended for better security. Provide the path to your private key file.")),l.createElement("div",null,l.createElement("h4",{className:"font-medium text-gray-900"},"Password Authentication"),l.createElement("p",null,"Simpler setup but less secure. Use strong passwords.")),l.createElement("div",null,l.createElement("h4",{className:"font-medium text-gray-900"},"Port"),l.createElement("p",null,"Default SSH port is 22. Change if your server uses a different port."))))))))};function Lt(e){return Lt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Lt(e)}function Dt(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Rt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Dt(Object(n),!0).forEach(function(t){Ft(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Dt(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ft(e,t,n){return(t=function(e){var t=function(e){if("object"!=Lt(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=Lt(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==Lt(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function It(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return Ut(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(Ut(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,Ut(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,Ut(f,"constructor",s),Ut(s,"constructor",c),c.displayName="GeneratorFunction",Ut(s,a,"GeneratorFunction"),Ut(f),Ut(f,a,"Generator"),Ut(f,r,function(){return this}),Ut(f,"toString",function(){return"[object Generator]"}),(It=function(){return{w:o,m:d}})()}function Ut(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}Ut=function(e,t,n,r){function o(t,n){Ut(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},Ut(e,t,n,r)}function Wt(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Ht(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Wt(o,r,a,l,i,"next",e)}function i(e){Wt(o,r,a,l,i,"throw",e)}l(void 0)})}}function $t(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return qt(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?qt(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function qt(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const Vt=function(){var e=$t((0,l.useState)({telegram:{bot_token:"",chat_id:"",enabled:!1},monitoring:{interval:60,retention_days:30},alerts:{default_cooldown:10,email_notifications:!0}}),2),t=e[0],n=e[1],r=$t((0,l.useState)(!0),2),a=r[0],o=r[1],i=$t((0,l.useState)(!1),2),c=i[0],s=i[1],u=$t((0,l.useState)("general"),2),f=u[0],d=u[1];(0,l.useEffect)(function(){m()},[]);var m=function(){var e=Ht(It().m(function e(){return It().w(function(e){for(;;)switch(e.n){case 0:try{o(!0)}catch(e){console.error("Error fetching settings:",e)}finally{o(!1)}case 1:return e.a(2)}},e)}));return function(){return e.apply(this,arguments)}}(),p=function(){var e=Ht(It().m(function e(){return It().w(function(e){for(;;)switch(e.n){case 0:try{s(!0),alert("Settings saved successfully!")}catch(e){console.error("Error saving settings:",e),alert("Error saving settings")}finally{s(!1)}case 1:return e.a(2)}},e)}));return function(){return e.apply(this,arguments)}}(),h=function(){var e=Ht(It().m(function e(){return It().w(function(e){for(;;)switch(e.n){case 0:try{alert("Telegram test functionality will be implemented")}catch(e){console.error("Error testing Telegram connection:",e)}case 1:return e.a(2)}},e)}));return function(){return e.apply(this,arguments)}}();return a?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading settings..."))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900 mb-2"},"Settings"),l.createElement("p",{className:"text-gray-600"},"Configure your server manager preferences")),l.createElement("button",{className:"btn btn-primary",onClick:p,disabled:c},c?l.createElement("div",{className:"spinner mr-2"}):l.createElement("i",{className:"fas fa-save mr-2"}),"Save Settings")),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"border-b border-gray-200"},l.createElement("nav",{className:"-mb-px flex space-x-8"},[{id:"general",label:"General",icon:"fas fa-cog"},{id:"monitoring",label:"Monitoring",icon:"fas fa-chart-line"},{id:"alerts",label:"Alerts",icon:"fas fa-bell"},{id:"notifications",label:"Notifications",icon:"fas fa-envelope"}].map(function(e){return l.createElement("button",{key:e.id,className:"py-4 px-1 border-b-2 font-medium text-sm ".concat(f===e.id?"border-blue-500 text-blue-600":"border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300"),onClick:function(){return d(e.id)}},l.createElement("i",{className:"".concat(e.icon," mr-2")}),e.label)}))),l.createElement("div",{className:"p-6"},"general"===f&&l.createElement("div",{className:"space-y-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Application Settings"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Application Name"),l.createElement("input",{type:"text",className:"form-input",defaultValue:"Minimal Server Manager",readOnly:!0})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Version"),l.createElement("input",{type:"text",className:"form-input",defaultValue:"1.0.0",readOnly:!0})))),l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Database Settings"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Database Path"),l.createElement("input",{type:"text",className:"form-input",defaultValue:"./data/app.db",readOnly:!0})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Database Type"),l.createElement("select",{className:"form-select",defaultValue:"sqlite",readOnly:!0},l.createElement("option",{value:"sqlite"},"SQLite")))))),"monitoring"===f&&l.createElement("div",{className:"space-y-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Monitoring Configuration"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Monitoring Interval (seconds)"),l.createElement("input",{type:"number",className:"form-input",value:t.monitoring.interval,onChange:function(e){return n(Rt(Rt({},t),{},{monitoring:Rt(Rt({},t.monitoring),{},{interval:parseInt(e.target.value)})}))},min:"10",max:"3600"}),l.createElement("small",{className:"text-gray-500"},"How often to collect metrics (10-3600 seconds)")),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Data Retention (days)"),l.createElement("input",{type:"number",className:"form-input",value:t.monitoring.retention_days,onChange:function(e){return n(Rt(Rt({},t),{},{monitoring:Rt(Rt({},t.monitoring),{},{retention_days:parseInt(e.target.value)})}))},min:"1",max:"365"}),l.createElement("small",{className:"text-gray-500"},"How long to keep historical data (1-365 days)")))),l.createElement("div",{className:"alert alert-info"},l.createElement("i",{className:"fas fa-info-circle mr-2"}),l.createElement("strong",null,"Note:")," Changes to monitoring settings will affect all servers. Existing data will be preserved.")),"alerts"===f&&l.createElement("div",{className:"space-y-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Alert Configuration"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Default Cooldown (minutes)"),l.createElement("input",{type:"number",className:"form-input",value:t.alerts.default_cooldown,onChange:function(e){return n(Rt(Rt({},t),{},{alerts:Rt(Rt({},t.alerts),{},{default_cooldown:parseInt(e.target.value)})}))},min:"1",max:"60"}),l.createElement("small",{className:"text-gray-500"},"Minimum time between alert notifications")),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Email Notifications"),l.createElement("div",{className:"flex items-center mt-2"},l.createElement("input",{type:"checkbox",className:"mr-2",checked:t.alerts.email_notifications,onChange:function(e){return n(Rt(Rt({},t),{},{alerts:Rt(Rt({},t.alerts),{},{email_notifications:e.target.checked})}))}}),l.createElement("span",{className:"text-gray-700"},"Enable email notifications"))))),l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Default Alert Thresholds"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"CPU Usage (%)"),l.createElement("input",{type:"number",className:"form-input",defaultValue:"80",min:"0",max:"100"})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Memory Usage (%)"),l.createElement("input",{type:"number",className:"form-input",defaultValue:"85",min:"0",max:"100"})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Disk Usage (%)"),l.createElement("input",{type:"number",className:"form-input",defaultValue:"90",min:"0",max:"100"}))))),"notifications"===f&&l.createElement("div",{className:"space-y-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Telegram Configuration"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Bot Token"),l.createElement("input",{type:"password",className:"form-input",value:t.telegram.bot_token,onChange:function(e){return n(Rt(Rt({},t),{},{telegram:Rt(Rt({},t.telegram),{},{bot_token:e.target.value})}))},placeholder:"Enter your Telegram bot token"})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Chat ID"),l.createElement("input",{type:"text",className:"form-input",value:t.telegram.chat_id,onChange:function(e){return n(Rt(Rt({},t),{},{telegram:Rt(Rt({},t.telegram),{},{chat_id:e.target.value})}))},placeholder:"Enter your Telegram chat ID"}))),l.createElement("div",{className:"flex items-center mt-4"},l.createElement("input",{type:"checkbox",className:"mr-2",checked:t.telegram.enabled,onChange:function(e){return n(Rt(Rt({},t),{},{telegram:Rt(Rt({},t.telegram),{},{enabled:e.target.checked})}))}}),l.createElement("span",{className:"text-gray-700"},"Enable Telegram notifications")),l.createElement("div",{className:"mt-4"},l.createElement("button",{className:"btn btn-secondary btn-sm",onClick:h},l.createElement("i",{className:"fas fa-paper-plane mr-2"}),"Test Connection"))),l.createElement("div",{className:"alert alert-warning"},l.createElement("i",{className:"fas fa-exclamation-triangle mr-2"}),l.createElement("strong",null,"Security Note:")," Bot tokens are sensitive information. Keep them secure and never share them publicly.")))))};function Gt(e){return Gt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Gt(e)}function Qt(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Yt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Qt(Object(n),!0).forEach(function(t){Kt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Qt(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Kt(e,t,n){return(t=function(e){var t=function(e){if("object"!=Gt(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=Gt(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==Gt(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Xt(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return Jt(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(Jt(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,Jt(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,Jt(f,"constructor",s),Jt(s,"constructor",c),c.displayName="GeneratorFunction",Jt(s,a,"GeneratorFunction"),Jt(f),Jt(f,a,"Generator"),Jt(f,r,function(){return this}),Jt(f,"toString",function(){return"[object Generator]"}),(Xt=function(){return{w:o,m:d}})()}function Jt(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}Jt=function(e,t,n,r){function o(t,n){Jt(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},Jt(e,t,n,r)}function Zt(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function en(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Zt(o,r,a,l,i,"next",e)}function i(e){Zt(o,r,a,l,i,"throw",e)}l(void 0)})}}function tn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||nn(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function nn(e,t){if(e){if("string"==typeof e)return rn(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?rn(e,t):void 0}}function rn(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const an=function(){var e=tn((0,l.useState)({totalServers:0,onlineServers:0,offlineServers:0,activeAlerts:0}),2),t=e[0],n=e[1],r=tn((0,l.useState)([]),2),a=r[0],o=r[1],i=tn((0,l.useState)([]),2),c=i[0],s=i[1],u=tn((0,l.useState)(!0),2),f=u[0],d=u[1],m=tn((0,l.useState)("disconnected"),2),p=m[0],h=m[1],v=tn((0,l.useState)(null),2),g=v[0],b=v[1];(0,l.useEffect)(function(){B(),A();var e=setInterval(function(){B()},3e4);return function(){clearInterval(e),y()}},[]);var A=function(){var e=en(Xt().m(function e(){var t;return Xt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,h("connecting"),e.n=1,nt.connect();case 1:h("connected"),nt.subscribe("server_status"),nt.subscribe("server_metrics"),nt.subscribe("alerts"),nt.onMessage("server_status_update",E),nt.onMessage("server_metrics_update",w),nt.onMessage("alert_created",x),nt.onMessage("alert_resolved",k),nt.onMessage("server_created",C),nt.onMessage("server_updated",C),nt.onMessage("server_deleted",C),nt.onMessage("connection_failed",S),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to connect to WebSocket:",t),h("error");case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),y=function(){nt.offMessage("server_status_update",E),nt.offMessage("server_metrics_update",w),nt.offMessage("alert_created",x),nt.offMessage("alert_resolved",k),nt.offMessage("server_created",C),nt.offMessage("server_updated",C),nt.offMessage("server_deleted",C),nt.offMessage("connection_failed",S)},E=function(e){console.log("Server status updated:",e),b(new Date),N(e)},w=function(e){console.log("Server metrics updated:",e),b(new Date)},x=function(e){console.log("New alert:",e),s(function(t){return[e].concat((n=t,function(e){if(Array.isArray(e))return rn(e)}(n)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(n)||nn(n)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}())).slice(0,5);var n}),n(function(e){return Yt(Yt({},e),{},{activeAlerts:e.activeAlerts+1})}),b(new Date)},k=function(e){console.log("Alert resolved:",e),s(function(t){return t.filter(function(t){return t.id!==e.id})}),n(function(e){return Yt(Yt({},e),{},{activeAlerts:Math.max(0,e.activeAlerts-1)})}),b(new Date)},S=function(){h("error")},N=function(e){n(function(t){var n=Yt({},t);return"active"===e.status?(n.onlineServers+=1,n.offlineServers=Math.max(0,n.offlineServers-1)):(n.offlineServers+=1,n.onlineServers=Math.max(0,n.onlineServers-1)),n})},C=function(){B()},B=function(){var e=en(Xt().m(function e(){var t,r,a,l,i,c,u;return Xt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,d(!0),e.n=1,Promise.all([Xe.getServers(),Xe.getActiveAlerts().catch(function(){return[]})]);case 1:t=e.v,r=tn(t,2),a=r[0],l=r[1],i=a.filter(function(e){return"active"===e.status}).length,c=a.filter(function(e){return"inactive"===e.status}).length,n({totalServers:a.length,onlineServers:i,offlineServers:c,activeAlerts:l.length||0}),o(a.slice(-5).reverse()),s(l.slice(0,5)),b(new Date),e.n=3;break;case 2:e.p=2,u=e.v,console.error("Error fetching dashboard data:",u);case 3:return e.p=3,d(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),_=function(e){var t=e.title,n=e.value,r=e.icon,a=e.color,o=e.link;return l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},t),l.createElement("i",{className:"".concat(r," text-2xl ").concat(a)})),l.createElement("div",{className:"text-center"},l.createElement("div",{className:"text-3xl font-bold text-gray-900 mb-2"},n),o&&l.createElement(xe,{to:o,className:"btn btn-primary btn-sm"},"View Details")))};return f?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading dashboard..."))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"mb-6"},l.createElement("div",{className:"flex justify-between items-start"},l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900 mb-2"},"Dashboard"),l.createElement("p",{className:"text-gray-600"},"Overview of your server infrastructure")),l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("div",{className:"w-3 h-3 rounded-full ".concat("connected"===p?"bg-green-500":"connecting"===p?"bg-yellow-500 animate-pulse":"error"===p?"bg-red-500":"bg-gray-400")}),l.createElement("span",{className:"text-sm text-gray-600 capitalize"},p)),g&&l.createElement("div",{className:"text-sm text-gray-500"},"Last updated: ",g.toLocaleTimeString())))),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8"},l.createElement(_,{title:"Total Servers",value:t.totalServers,icon:"fas fa-server",color:"text-blue-500",link:"/servers"}),l.createElement(_,{title:"Online Servers",value:t.onlineServers,icon:"fas fa-check-circle",color:"text-green-500",link:"/servers"}),l.createElement(_,{title:"Offline Servers",value:t.offlineServers,icon:"fas fa-times-circle",color:"text-red-500",link:"/servers"}),l.createElement(_,{title:"Active Alerts",value:t.activeAlerts,icon:"fas fa-bell",color:"text-yellow-500",link:"/alerts"})),l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Recent Servers"),l.createElement(xe,{to:"/servers",className:"btn btn-primary btn-sm"},"View All")),0===a.length?l.createElement("div",{className:"text-center py-8"},l.createElement("i",{className:"fas fa-server text-4xl text-gray-300 mb-4"}),l.createElement("p",{className:"text-gray-500 mb-4"},"No servers configured yet"),l.createElement(xe,{to:"/servers/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Add Your First Server")):l.createElement("div",{className:"overflow-x-auto"},l.createElement("table",{className:"table"},l.createElement("thead",null,l.createElement("tr",null,l.createElement("th",null,"Name"),l.createElement("th",null,"IP Address"),l.createElement("th",null,"Status"),l.createElement("th",null,"User"),l.createElement("th",null,"Actions"))),l.createElement("tbody",null,a.map(function(e){return l.createElement("tr",{key:e.id},l.createElement("td",null,l.createElement(xe,{to:"/servers/".concat(e.id),className:"text-blue-600 hover:text-blue-800 font-medium"},e.name)),l.createElement("td",{className:"text-gray-600"},e.ip,":",e.port),l.createElement("td",null,l.createElement("span",{className:"status-badge ".concat("active"===e.status?"status-online":"status-offline")},e.status)),l.createElement("td",{className:"text-gray-600"},e.user),l.createElement("td",null,l.createElement("div",{className:"flex space-x-2"},l.createElement(xe,{to:"/servers/".concat(e.id),className:"btn btn-sm btn-secondary"},l.createElement("i",{className:"fas fa-eye"})),l.createElement("button",{className:"btn btn-sm btn-primary"},l.createElement("i",{className:"fas fa-play"})))))}))))),c.length>0&&l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Recent Alerts"),l.createElement(xe,{to:"/alerts",className:"btn btn-warning btn-sm"},"View All Alerts")),l.createElement("div",{className:"space-y-3"},c.map(function(e){return l.createElement("div",{key:e.id,className:"flex items-center justify-between p-3 bg-yellow-50 border border-yellow-200 rounded-lg"},l.createElement("div",{className:"flex items-center space-x-3"},l.createElement("i",{className:"fas fa-exclamation-triangle text-yellow-600"}),l.createElement("div",null,l.createElement("div",{className:"font-medium text-gray-900"},e.title||e.message),l.createElement("div",{className:"text-sm text-gray-600"},e.server_name&&"Server: ".concat(e.server_name),e.severity&&" • Severity: ".concat(e.severity),e.created_at&&" • ".concat(new Date(e.created_at).toLocaleString())))),l.createElement("div",{className:"flex space-x-2"},l.createElement("button",{className:"btn btn-sm btn-secondary",onClick:function(){return Xe.acknowledgeAlert(e.id).catch(console.error)},title:"Acknowledge Alert"},l.createElement("i",{className:"fas fa-check"}))))}))),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mt-8"},l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-plus-circle text-4xl text-blue-500 mb-4"}),l.createElement("h3",{className:"text-lg font-semibold mb-2"},"Add Server"),l.createElement("p",{className:"text-gray-600 mb-4"},"Connect a new server to start monitoring"),l.createElement(xe,{to:"/servers/new",className:"btn btn-primary"},"Add Server")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-chart-line text-4xl text-green-500 mb-4"}),l.createElement("h3",{className:"text-lg font-semibold mb-2"},"View Monitoring"),l.createElement("p",{className:"text-gray-600 mb-4"},"Check real-time performance metrics"),l.createElement(xe,{to:"/monitoring",className:"btn btn-success"},"View Metrics")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-cog text-4xl text-gray-500 mb-4"}),l.createElement("h3",{className:"text-lg font-semibold mb-2"},"Configure Alerts"),l.createElement("p",{className:"text-gray-600 mb-4"},"Set up notifications and thresholds"),l.createElement(xe,{to:"/alerts",className:"btn btn-secondary"},"Configure"))))};function on(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||ln(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ln(e,t){if(e){if("string"==typeof e)return cn(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?cn(e,t):void 0}}function cn(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const sn=function(){var e=on((0,l.useState)("disconnected"),2),t=e[0],n=e[1],r=on((0,l.useState)([]),2),a=r[0],o=r[1],i=on((0,l.useState)(""),2),c=i[0],s=i[1],u=on((0,l.useState)({}),2),f=u[0],d=u[1];(0,l.useEffect)(function(){var e=function(e){n("connected"),m("System","WebSocket connected successfully")},t=function(e){n("disconnected"),m("System","WebSocket disconnected: ".concat(e.reason))},r=function(e){m("Server",JSON.stringify(e,null,2))},a=function(e){m("Server","Pong received: ".concat(e.timestamp))},o=function(e){m("Error",e.error||"Unknown error")};nt.onMessage("connected",e),nt.onMessage("disconnected",t),nt.onMessage("message",r),nt.onMessage("pong",a),nt.onMessage("error",o),nt.connect();var l=setInterval(function(){d(nt.getStatus())},1e3);return function(){nt.offMessage("connected",e),nt.offMessage("disconnected",t),nt.offMessage("message",r),nt.offMessage("pong",a),nt.offMessage("error",o),clearInterval(l),nt.disconnect()}},[]);var m=function(e,t){o(function(n){return[].concat(function(e){if(Array.isArray(e))return cn(e)}(r=n)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(r)||ln(r)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}(),[{sender:e,message:t,timestamp:(new Date).toISOString()}]);var r})};return l.createElement("div",{className:"websocket-test-container"},l.createElement("h2",null,"WebSocket Test"),l.createElement("div",{className:"status-bar"},l.createElement("span",{className:"status-indicator ".concat(t)},t),l.createElement("div",{className:"connection-info"},l.createElement("span",null,"Attempts: ",f.reconnectAttempts||0,"/",f.maxReconnectAttempts||0))),l.createElement("div",{className:"controls"},l.createElement("button",{onClick:function(){nt.ping()?m("Client","Ping sent"):m("System","Failed to send ping - WebSocket not connected")},disabled:"connected"!==t},"Send Ping"),l.createElement("div",{className:"message-input"},l.createElement("input",{type:"text",value:c,onChange:function(e){return s(e.target.value)},placeholder:"Type a message...",disabled:"connected"!==t}),l.createElement("button",{onClick:function(){if(c.trim()){var e={type:"custom",content:c,timestamp:(new Date).toISOString()};nt.sendMessage(e)?(m("Client",c),s("")):m("System","Failed to send message - WebSocket not connected")}},disabled:"connected"!==t||!c.trim()},"Send"))),l.createElement("div",{className:"message-log"},l.createElement("h3",null,"Message Log"),l.createElement("div",{className:"messages"},0===a.length?l.createElement("p",{className:"no-messages"},"No messages yet"):a.map(function(e,t){return l.createElement("div",{key:t,className:"message ".concat(e.sender.toLowerCase())},l.createElement("div",{className:"message-header"},l.createElement("span",{className:"sender"},e.sender),l.createElement("span",{className:"timestamp"},new Date(e.timestamp).toLocaleTimeString())),l.createElement("div",{className:"message-content"},l.createElement("pre",null,e.message)))}))),l.createElement("style",{jsx:!0},"\n        .websocket-test-container {\n          max-width: 800px;\n          margin: 0 auto;\n          padding: 20px;\n          font-family: Arial, sans-serif;\n        }\n\n        .status-bar {\n          display: flex;\n          align-items: center;\n          gap: 10px;\n          margin-bottom: 20px;\n          padding: 10px;\n          background-color: #f5f5f5;\n          border-radius: 5px;\n        }\n\n        .status-indicator {\n          padding: 5px 10px;\n          border-radius: 15px;\n          font-weight: bold;\n          font-size: 12px;\n        }\n\n        .status-indicator.connected {\n          background-color: #4CAF50;\n          color: white;\n        }\n\n        .status-indicator.disconnected {\n          background-color: #F44336;\n          color: white;\n        }\n\n        .connection-info {\n          font-size: 12px;\n          color: #666;\n        }\n\n        .controls {\n          display: flex;\n          gap: 10px;\n          margin-bottom: 20px;\n        }\n\n        button {\n          padding: 8px 16px;\n          background-color: #4CAF50;\n          color: white;\n          border: none;\n          border-radius: 4px;\n          cursor: pointer;\n        }\n\n        button:disabled {\n          background-color: #cccccc;\n          cursor: not-allowed;\n        }\n\n        .message-input {\n          display: flex;\n          gap: 5px;\n          flex-grow: 1;\n        }\n\n        input {\n          flex-grow: 1;\n          padding: 8px;\n          border: 1px solid #ddd;\n          border-radius: 4px;\n        }\n\n        .message-log {\n          border: 1px solid #ddd;\n          border-radius: 5px;\n          padding: 15px;\n          max-height: 400px;\n          overflow-y: auto;\n        }\n\n        .messages {\n          display: flex;\n          flex-direction: column;\n          gap: 10px;\n        }\n\n        .message {\n          padding: 10px;\n          border-radius: 5px;\n          border-left: 3px solid #ddd;\n        }\n\n        .message.system {\n          border-left-color: #666;\n          background-color: #f9f9f9;\n        }\n\n        .message.client {\n          border-left-color: #4CAF50;\n          background-color: #f0fff0;\n          margin-left: 20px;\n        }\n\n        .message.server {\n          border-left-color: #2196F3;\n          background-color: #f0f7ff;\n          margin-left: 40px;\n        }\n\n        .message.error {\n          border-left-color: #F44336;\n          background-color: #fff0f0;\n        }\n\n        .message-header {\n          display: flex;\n          justify-content: space-between;\n          margin-bottom: 5px;\n          font-size: 12px;\n          color: #666;\n        }\n\n        .message-content {\n          font-size: 14px;\n        }\n\n        .message-content pre {\n          margin: 0;\n          white-space: pre-wrap;\n          word-wrap: break-word;\n        }\n\n        .no-messages {\n          color: #999;\n          text-align: center;\n          padding: 20px;\n        }\n      "))},un=function(){return l.createElement("nav",{className:"navbar"},l.createElement(xe,{to:"/",className:"navbar-brand"},l.createElement("i",{className:"fas fa-server mr-2"}),"Minimal Server Manager"),l.createElement("div",{className:"navbar-actions"},l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"text-sm"},l.createElement("span",{className:"text-gray-200"},"Status: "),l.createElement("span",{className:"status-badge status-online"},"Connected")),l.createElement("button",{className:"btn btn-sm btn-secondary"},l.createElement("i",{className:"fas fa-cog mr-1"}),"Settings"),l.createElement("button",{className:"btn btn-sm btn-secondary"},l.createElement("i",{className:"fas fa-question-circle mr-1"}),"Help"))))},fn=function(){var e=ee();return l.createElement("aside",{className:"sidebar"},l.createElement("nav",null,l.createElement("ul",{className:"sidebar-nav"},[{path:"/",icon:"fas fa-tachometer-alt",label:"Dashboard"},{path:"/servers",icon:"fas fa-server",label:"Servers"},{path:"/monitoring",icon:"fas fa-chart-line",label:"Monitoring"},{path:"/alerts",icon:"fas fa-bell",label:"Alerts"},{path:"/logs",icon:"fas fa-file-alt",label:"Logs"},{path:"/settings",icon:"fas fa-cog",label:"Settings"}].map(function(t){return l.createElement("li",{key:t.path},l.createElement(xe,{to:t.path,className:(n=t.path,("/"===n?"/"===e.pathname:e.pathname.startsWith(n))?"active":"")},l.createElement("i",{className:t.icon}),t.label));var n}))),l.createElement("div",{className:"mt-8 px-4"},l.createElement("div",{className:"text-xs text-gray-400 uppercase tracking-wide mb-2"},"Quick Actions"),l.createElement("div",{className:"space-y-2"},l.createElement(xe,{to:"/servers/new",className:"block w-full btn btn-primary btn-sm text-center"},l.createElement("i",{className:"fas fa-plus mr-1"}),"Add Server"),l.createElement(xe,{to:"/websocket-test",className:"block w-full btn btn-secondary btn-sm text-center"},l.createElement("i",{className:"fas fa-plug mr-1"}),"Test Connection"))))};function dn(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return mn(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(mn(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,mn(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,mn(f,"constructor",s),mn(s,"constructor",c),c.displayName="GeneratorFunction",mn(s,a,"GeneratorFunction"),mn(f),mn(f,a,"Generator"),mn(f,r,function(){return this}),mn(f,"toString",function(){return"[object Generator]"}),(dn=function(){return{w:o,m:d}})()}function mn(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}mn=function(e,t,n,r){function o(t,n){mn(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},mn(e,t,n,r)}function pn(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function hn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return vn(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?vn(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function vn(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const gn=function(e){var t=e.alert,n=e.onAcknowledge,r=e.onDismiss,a=hn((0,l.useState)(!0),2),o=a[0],i=a[1],c=hn((0,l.useState)(!1),2),s=c[0],u=c[1],f=function(){var e,r=(e=dn().m(function e(){var r;return dn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,u(!0),e.n=1,Xe.acknowledgeAlert(t.id);case 1:null==n||n(t),i(!1),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error acknowledging alert:",r);case 3:return e.p=3,u(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}),function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){pn(o,r,a,l,i,"next",e)}function i(e){pn(o,r,a,l,i,"throw",e)}l(void 0)})});return function(){return r.apply(this,arguments)}}();return o?l.createElement("div",{className:"fixed top-4 right-4 max-w-md p-4 border-l-4 rounded-lg shadow-lg z-50 ".concat(function(e){switch(null==e?void 0:e.toLowerCase()){case"critical":return"bg-red-100 border-red-500 text-red-800";case"warning":return"bg-yellow-100 border-yellow-500 text-yellow-800";case"info":return"bg-blue-100 border-blue-500 text-blue-800";default:return"bg-gray-100 border-gray-500 text-gray-800"}}(t.severity))},l.createElement("div",{className:"flex items-start"},l.createElement("div",{className:"flex-shrink-0"},l.createElement("i",{className:"".concat(function(e){switch(null==e?void 0:e.toLowerCase()){case"critical":return"fas fa-exclamation-triangle";case"warning":return"fas fa-exclamation-circle";case"info":return"fas fa-info-circle";default:return"fas fa-bell"}}(t.severity)," text-lg")})),l.createElement("div",{className:"ml-3 flex-1"},l.createElement("div",{className:"flex items-center justify-between"},l.createElement("h3",{className:"text-sm font-medium"},t.title||"Server Alert"),l.createElement("button",{onClick:function(){i(!1),null==r||r(t)},className:"ml-2 text-gray-400 hover:text-gray-600"},l.createElement("i",{className:"fas fa-times"}))),l.createElement("div",{className:"mt-1 text-sm"},l.createElement("p",null,t.message),t.server_name&&l.createElement("p",{className:"mt-1 text-xs opacity-75"},"Server: ",t.server_name),t.created_at&&l.createElement("p",{className:"mt-1 text-xs opacity-75"},new Date(t.created_at).toLocaleString())),l.createElement("div",{className:"mt-3 flex space-x-2"},l.createElement("button",{onClick:f,disabled:s,className:"text-xs bg-white bg-opacity-50 hover:bg-opacity-75 px-3 py-1 rounded border"},s?l.createElement("div",{className:"spinner mr-1"}):l.createElement("i",{className:"fas fa-check mr-1"}),"Acknowledge"))))):null};function bn(e){return bn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},bn(e)}function An(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function yn(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?An(Object(n),!0).forEach(function(t){En(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):An(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function En(e,t,n){return(t=function(e){var t=function(e){if("object"!=bn(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=bn(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==bn(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function wn(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return xn(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(xn(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,xn(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,xn(f,"constructor",s),xn(s,"constructor",c),c.displayName="GeneratorFunction",xn(s,a,"GeneratorFunction"),xn(f),xn(f,a,"Generator"),xn(f,r,function(){return this}),xn(f,"toString",function(){return"[object Generator]"}),(wn=function(){return{w:o,m:d}})()}function xn(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}xn=function(e,t,n,r){function o(t,n){xn(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},xn(e,t,n,r)}function kn(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Sn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||Nn(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Nn(e,t){if(e){if("string"==typeof e)return Cn(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Cn(e,t):void 0}}function Cn(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const Bn=function(){var e=Sn((0,l.useState)([]),2),t=e[0],n=e[1],r=Sn((0,l.useState)(!1),2),a=(r[0],r[1]);(0,l.useEffect)(function(){return o(),function(){i()}},[]);var o=function(){var e,t=(e=wn().m(function e(){var t;return wn().w(function(e){for(;;)switch(e.p=e.n){case 0:if(e.p=0,nt.getStatus().isConnected){e.n=1;break}return e.n=1,nt.connect();case 1:a(!0),nt.subscribe("alerts"),nt.onMessage("alert_created",c),nt.onMessage("alert_resolved",s),nt.onMessage("alert_updated",u),console.log("AlertManager initialized"),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to initialize AlertManager:",t),a(!1);case 3:return e.a(2)}},e,null,[[0,2]])}),function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){kn(o,r,a,l,i,"next",e)}function i(e){kn(o,r,a,l,i,"throw",e)}l(void 0)})});return function(){return t.apply(this,arguments)}}(),i=function(){nt.offMessage("alert_created",c),nt.offMessage("alert_resolved",s),nt.offMessage("alert_updated",u)},c=function(e){console.log("New alert received:",e);var t={id:e.id||Date.now(),title:e.title||"Server Alert",message:e.message||"A new alert has been triggered",severity:e.severity||"info",server_name:e.server_name,server_id:e.server_id,created_at:e.created_at||(new Date).toISOString(),acknowledged:!1,status:"active"};n(function(e){return[t].concat((n=e,function(e){if(Array.isArray(e))return Cn(e)}(n)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(n)||Nn(n)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}())).slice(0,10);var n}),"granted"===Notification.permission&&new Notification("Alert: ".concat(t.title),{body:t.message,icon:"/favicon.ico",tag:t.id})},s=function(e){console.log("Alert resolved:",e),n(function(t){return t.map(function(t){return t.id===e.id?yn(yn({},t),{},{status:"resolved",resolved_at:e.resolved_at}):t})})},u=function(e){console.log("Alert updated:",e),n(function(t){return t.map(function(t){return t.id===e.id?yn(yn({},t),e):t})})},f=function(e){console.log("Alert acknowledged:",e),n(function(t){return t.map(function(t){return t.id===e.id?yn(yn({},t),{},{acknowledged:!0,acknowledged_at:(new Date).toISOString()}):t})})},d=function(e){console.log("Alert dismissed:",e),n(function(t){return t.filter(function(t){return t.id!==e.id})})};return(0,l.useEffect)(function(){"Notification"in window&&"default"===Notification.permission&&Notification.requestPermission().then(function(e){"granted"===e&&console.log("Notification permission granted")})},[]),(0,l.useEffect)(function(){var e=setInterval(function(){n(function(e){return e.filter(function(e){if("resolved"===e.status){var t=new Date(e.resolved_at||e.updated_at);return new Date-t<3e4}return!0})})},5e3);return function(){return clearInterval(e)}},[]),l.createElement(l.Fragment,null,t.map(function(e){return l.createElement(gn,{key:e.id,alert:e,onAcknowledge:f,onDismiss:d})}),!1)};function _n(e){return _n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},_n(e)}function On(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Pn(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?On(Object(n),!0).forEach(function(t){jn(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):On(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function jn(e,t,n){return(t=function(e){var t=function(e){if("object"!=_n(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=_n(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==_n(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Mn(e){return function(e){if(Array.isArray(e))return In(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||Fn(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Tn(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return zn(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(zn(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,zn(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,zn(f,"constructor",s),zn(s,"constructor",c),c.displayName="GeneratorFunction",zn(s,a,"GeneratorFunction"),zn(f),zn(f,a,"Generator"),zn(f,r,function(){return this}),zn(f,"toString",function(){return"[object Generator]"}),(Tn=function(){return{w:o,m:d}})()}function zn(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}zn=function(e,t,n,r){function o(t,n){zn(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},zn(e,t,n,r)}function Ln(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Dn(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Ln(o,r,a,l,i,"next",e)}function i(e){Ln(o,r,a,l,i,"throw",e)}l(void 0)})}}function Rn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||Fn(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Fn(e,t){if(e){if("string"==typeof e)return In(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?In(e,t):void 0}}function In(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const Un=function(){var e=Rn((0,l.useState)([]),2),t=e[0],n=e[1],r=Rn((0,l.useState)(!0),2),a=r[0],o=r[1],i=Rn((0,l.useState)("all"),2),c=i[0],s=i[1],u=Rn((0,l.useState)("created_at"),2),f=u[0],d=u[1],m=Rn((0,l.useState)("desc"),2),p=m[0],h=m[1];(0,l.useEffect)(function(){return E(),v(),function(){g()}},[]);var v=function(){var e=Dn(Tn().m(function e(){var t;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,nt.connect();case 1:nt.subscribe("alerts"),nt.onMessage("alert_created",b),nt.onMessage("alert_resolved",A),nt.onMessage("alert_updated",y),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to connect to WebSocket:",t);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),g=function(){nt.offMessage("alert_created",b),nt.offMessage("alert_resolved",A),nt.offMessage("alert_updated",y)},b=function(e){n(function(t){return[e].concat(Mn(t))})},A=function(e){n(function(t){return t.map(function(t){return t.id===e.id?Pn(Pn({},t),{},{status:"resolved",resolved_at:e.resolved_at}):t})})},y=function(e){n(function(t){return t.map(function(t){return t.id===e.id?Pn(Pn({},t),e):t})})},E=function(){var e=Dn(Tn().m(function e(){var t,r;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,o(!0),e.n=1,Xe.getAlerts();case 1:t=e.v,n(t),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error fetching alerts:",r);case 3:return e.p=3,o(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),w=function(){var e=Dn(Tn().m(function e(t){var r;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.acknowledgeAlert(t);case 1:n(function(e){return e.map(function(e){return e.id===t?Pn(Pn({},e),{},{acknowledged:!0,acknowledged_at:(new Date).toISOString()}):e})}),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error acknowledging alert:",r);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(t){return e.apply(this,arguments)}}(),x=function(){var e=Dn(Tn().m(function e(t){var r;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.resolveAlert(t);case 1:n(function(e){return e.map(function(e){return e.id===t?Pn(Pn({},e),{},{status:"resolved",resolved_at:(new Date).toISOString()}):e})}),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error resolving alert:",r);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(t){return e.apply(this,arguments)}}(),k=function(){var e=Dn(Tn().m(function e(t){var r;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:if(!window.confirm("Are you sure you want to delete this alert?")){e.n=4;break}return e.p=1,e.n=2,Xe.deleteAlert(t);case 2:n(function(e){return e.filter(function(e){return e.id!==t})}),e.n=4;break;case 3:e.p=3,r=e.v,console.error("Error deleting alert:",r);case 4:return e.a(2)}},e,null,[[1,3]])}));return function(t){return e.apply(this,arguments)}}(),S=function(e){switch(null==e?void 0:e.toLowerCase()){case"critical":return"text-red-600 bg-red-100";case"warning":return"text-yellow-600 bg-yellow-100";case"info":return"text-blue-600 bg-blue-100";default:return"text-gray-600 bg-gray-100"}},N=function(e){switch(null==e?void 0:e.toLowerCase()){case"resolved":return"text-green-600 bg-green-100";case"acknowledged":return"text-blue-600 bg-blue-100";case"active":return"text-red-600 bg-red-100";default:return"text-gray-600 bg-gray-100"}},C=Mn(t.filter(function(e){return"all"===c||("active"===c?"active"===e.status:"acknowledged"===c?e.acknowledged&&"resolved"!==e.status:"resolved"!==c||"resolved"===e.status)})).sort(function(e,t){var n=e[f],r=t[f];return"created_at"!==f&&"acknowledged_at"!==f&&"resolved_at"!==f||(n=new Date(n),r=new Date(r)),"asc"===p?n>r?1:-1:n<r?1:-1});return a?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading alerts..."))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900 mb-2"},"Alerts"),l.createElement("p",{className:"text-gray-600"},"Monitor and manage system alerts")),l.createElement(xe,{to:"/alerts/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Create Alert")),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"flex flex-col md:flex-row gap-4"},l.createElement("div",{className:"flex-1"},l.createElement("select",{className:"form-select",value:c,onChange:function(e){return s(e.target.value)}},l.createElement("option",{value:"all"},"All Alerts"),l.createElement("option",{value:"active"},"Active"),l.createElement("option",{value:"acknowledged"},"Acknowledged"),l.createElement("option",{value:"resolved"},"Resolved"))),l.createElement("div",{className:"flex gap-2"},l.createElement("select",{className:"form-select",value:f,onChange:function(e){return d(e.target.value)}},l.createElement("option",{value:"created_at"},"Sort by Date"),l.createElement("option",{value:"severity"},"Sort by Severity"),l.createElement("option",{value:"status"},"Sort by Status")),l.createElement("button",{className:"btn btn-secondary",onClick:function(){return h("asc"===p?"desc":"asc")}},l.createElement("i",{className:"fas ".concat("asc"===p?"fa-arrow-up":"fa-arrow-down")}))))),l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Alert List (",C.length," of ",t.length,")")),0===C.length?l.createElement("div",{className:"text-center py-12"},l.createElement("i",{className:"fas fa-bell text-6xl text-gray-300 mb-4"}),l.createElement("h3",{className:"text-xl font-semibold text-gray-600 mb-2"},"No alerts found"),l.createElement("p",{className:"text-gray-500 mb-6"},"all"===c?"No alerts have been created yet":"No ".concat(c," alerts found")),l.createElement(xe,{to:"/alerts/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Create Your First Alert")):l.createElement("div",{className:"overflow-x-auto"},l.createElement("table",{className:"table"},l.createElement("thead",null,l.createElement("tr",null,l.createElement("th",null,"Severity"),l.createElement("th",null,"Title"),l.createElement("th",null,"Server"),l.createElement("th",null,"Status"),l.createElement("th",null,"Created"),l.createElement("th",null,"Actions"))),l.createElement("tbody",null,C.map(function(e){return l.createElement("tr",{key:e.id},l.createElement("td",null,l.createElement("span",{className:"px-2 py-1 rounded-full text-xs font-medium ".concat(S(e.severity))},e.severity||"Unknown")),l.createElement("td",null,l.createElement("div",null,l.createElement("div",{className:"font-medium"},e.title||"Alert"),l.createElement("div",{className:"text-sm text-gray-600"},e.message))),l.createElement("td",{className:"text-gray-600"},e.server_name||"N/A"),l.createElement("td",null,l.createElement("span",{className:"px-2 py-1 rounded-full text-xs font-medium ".concat(N(e.status))},e.status||"active",e.acknowledged&&!e.resolved_at&&" (Ack)")),l.createElement("td",{className:"text-gray-600"},new Date(e.created_at).toLocaleString()),l.createElement("td",null,l.createElement("div",{className:"flex space-x-2"},!e.acknowledged&&l.createElement("button",{className:"btn btn-sm btn-secondary",onClick:function(){return w(e.id)},title:"Acknowledge Alert"},l.createElement("i",{className:"fas fa-check"})),"resolved"!==e.status&&l.createElement("button",{className:"btn btn-sm btn-success",onClick:function(){return x(e.id)},title:"Resolve Alert"},l.createElement("i",{className:"fas fa-check-double"})),l.createElement("button",{className:"btn btn-sm btn-danger",onClick:function(){return k(e.id)},title:"Delete Alert"},l.createElement("i",{className:"fas fa-trash"})))))}))))),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-4 gap-6 mt-6"},l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-bell text-3xl text-blue-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.length),l.createElement("div",{className:"text-gray-600"},"Total Alerts")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-exclamation-circle text-3xl text-red-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return"active"===e.status}).length),l.createElement("div",{className:"text-gray-600"},"Active")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-check-circle text-3xl text-yellow-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return e.acknowledged&&"resolved"!==e.status}).length),l.createElement("div",{className:"text-gray-600"},"Acknowledged")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-check-double text-3xl text-green-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return"resolved"===e.status}).length),l.createElement("div",{className:"text-gray-600"},"Resolved"))))},Wn=function(){return l.createElement(ye,null,l.createElement("div",{className:"app-container"},l.createElement(un,null),l.createElement("div",{className:"main-content"},l.createElement(fn,null),l.createElement("div",{className:"content-area"},l.createElement(he,null,l.createElement(me,{path:"/",element:l.createElement(an,null)}),l.createElement(me,{path:"/servers",element:l.createElement(mt,null)}),l.createElement(me,{path:"/servers/new",element:l.createElement(zt,null)}),l.createElement(me,{path:"/servers/:id",element:l.createElement(kt,null)}),l.createElement(me,{path:"/alerts",element:l.createElement(Un,null)}),l.createElement(me,{path:"/settings",element:l.createElement(Vt,null)}),l.createElement(me,{path:"/websocket-test",element:l.createElement(sn,null)})))),l.createElement(Bn,null)))};c.createRoot(document.getElementById("root")).render(l.createElement(l.StrictMode,null,l.createElement(Wn,null)))})();
+(()=>{"use strict";var e,t,n={56:(e,t,n)=>{e.exports=function(e){var t=n.nc;t&&e.setAttribute("nonce",t)}},72:e=>{var t=[];function n(e){for(var n=-1,r=0;r<t.length;r++)if(t[r].identifier===e){n=r;break}return n}function r(e,r){for(var o={},l=[],i=0;i<e.length;i++){var c=e[i],s=r.base?c[0]+r.base:c[0],u=o[s]||0,f="".concat(s," ").concat(u);o[s]=u+1;var d=n(f),m={css:c[1],media:c[2],sourceMap:c[3],supports:c[4],layer:c[5]};if(-1!==d)t[d].references++,t[d].updater(m);else{var p=a(m,r);r.byIndex=i,t.splice(i,0,{identifier:f,updater:p,references:1})}l.push(f)}return l}function a(e,t){var n=t.domAPI(t);return n.update(e),function(t){if(t){if(t.css===e.css&&t.media===e.media&&t.sourceMap===e.sourceMap&&t.supports===e.supports&&t.layer===e.layer)return;n.update(e=t)}else n.remove()}}e.exports=function(e,a){var o=r(e=e||[],a=a||{});return function(e){e=e||[];for(var l=0;l<o.length;l++){var i=n(o[l]);t[i].references--}for(var c=r(e,a),s=0;s<o.length;s++){var u=n(o[s]);0===t[u].references&&(t[u].updater(),t.splice(u,1))}o=c}}},113:e=>{e.exports=function(e,t){if(t.styleSheet)t.styleSheet.cssText=e;else{for(;t.firstChild;)t.removeChild(t.firstChild);t.appendChild(document.createTextNode(e))}}},159:e=>{e.exports=function(e){var t=document.createElement("style");return e.setAttributes(t,e.attributes),e.insert(t,e.options),t}},287:(e,t)=>{var n=Symbol.for("react.element"),r=Symbol.for("react.portal"),a=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),l=Symbol.for("react.profiler"),i=Symbol.for("react.provider"),c=Symbol.for("react.context"),s=Symbol.for("react.forward_ref"),u=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),m=Symbol.iterator,p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h=Object.assign,v={};function g(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||p}function b(){}function A(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||p}g.prototype.isReactComponent={},g.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},g.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},b.prototype=g.prototype;var y=A.prototype=new b;y.constructor=A,h(y,g.prototype),y.isPureReactComponent=!0;var E=Array.isArray,w=Object.prototype.hasOwnProperty,x={current:null},k={key:!0,ref:!0,__self:!0,__source:!0};function S(e,t,r){var a,o={},l=null,i=null;if(null!=t)for(a in void 0!==t.ref&&(i=t.ref),void 0!==t.key&&(l=""+t.key),t)w.call(t,a)&&!k.hasOwnProperty(a)&&(o[a]=t[a]);var c=arguments.length-2;if(1===c)o.children=r;else if(1<c){for(var s=Array(c),u=0;u<c;u++)s[u]=arguments[u+2];o.children=s}if(e&&e.defaultProps)for(a in c=e.defaultProps)void 0===o[a]&&(o[a]=c[a]);return{$$typeof:n,type:e,key:l,ref:i,props:o,_owner:x.current}}function N(e){return"object"==typeof e&&null!==e&&e.$$typeof===n}var C=/\/+/g;function B(e,t){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return t[e]})}(""+e.key):t.toString(36)}function _(e,t,a,o,l){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var c=!1;if(null===e)c=!0;else switch(i){case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case n:case r:c=!0}}if(c)return l=l(c=e),e=""===o?"."+B(c,0):o,E(l)?(a="",null!=e&&(a=e.replace(C,"$&/")+"/"),_(l,t,a,"",function(e){return e})):null!=l&&(N(l)&&(l=function(e,t){return{$$typeof:n,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(l,a+(!l.key||c&&c.key===l.key?"":(""+l.key).replace(C,"$&/")+"/")+e)),t.push(l)),1;if(c=0,o=""===o?".":o+":",E(e))for(var s=0;s<e.length;s++){var u=o+B(i=e[s],s);c+=_(i,t,a,u,l)}else if(u=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=m&&e[m]||e["@@iterator"])?e:null}(e),"function"==typeof u)for(e=u.call(e),s=0;!(i=e.next()).done;)c+=_(i=i.value,t,a,u=o+B(i,s++),l);else if("object"===i)throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return c}function O(e,t,n){if(null==e)return e;var r=[],a=0;return _(e,r,"","",function(e){return t.call(n,e,a++)}),r}function P(e){if(-1===e._status){var t=e._result;(t=t()).then(function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)},function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)}),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var j={current:null},M={transition:null},T={ReactCurrentDispatcher:j,ReactCurrentBatchConfig:M,ReactCurrentOwner:x};function z(){throw Error("act(...) is not supported in production builds of React.")}t.Children={map:O,forEach:function(e,t,n){O(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return O(e,function(){t++}),t},toArray:function(e){return O(e,function(e){return e})||[]},only:function(e){if(!N(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=g,t.Fragment=a,t.Profiler=l,t.PureComponent=A,t.StrictMode=o,t.Suspense=u,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=T,t.act=z,t.cloneElement=function(e,t,r){if(null==e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var a=h({},e.props),o=e.key,l=e.ref,i=e._owner;if(null!=t){if(void 0!==t.ref&&(l=t.ref,i=x.current),void 0!==t.key&&(o=""+t.key),e.type&&e.type.defaultProps)var c=e.type.defaultProps;for(s in t)w.call(t,s)&&!k.hasOwnProperty(s)&&(a[s]=void 0===t[s]&&void 0!==c?c[s]:t[s])}var s=arguments.length-2;if(1===s)a.children=r;else if(1<s){c=Array(s);for(var u=0;u<s;u++)c[u]=arguments[u+2];a.children=c}return{$$typeof:n,type:e.type,key:o,ref:l,props:a,_owner:i}},t.createContext=function(e){return(e={$$typeof:c,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:i,_context:e},e.Consumer=e},t.createElement=S,t.createFactory=function(e){var t=S.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:s,render:e}},t.isValidElement=N,t.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:P}},t.memo=function(e,t){return{$$typeof:f,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=M.transition;M.transition={};try{e()}finally{M.transition=t}},t.unstable_act=z,t.useCallback=function(e,t){return j.current.useCallback(e,t)},t.useContext=function(e){return j.current.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e){return j.current.useDeferredValue(e)},t.useEffect=function(e,t){return j.current.useEffect(e,t)},t.useId=function(){return j.current.useId()},t.useImperativeHandle=function(e,t,n){return j.current.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return j.current.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return j.current.useLayoutEffect(e,t)},t.useMemo=function(e,t){return j.current.useMemo(e,t)},t.useReducer=function(e,t,n){return j.current.useReducer(e,t,n)},t.useRef=function(e){return j.current.useRef(e)},t.useState=function(e){return j.current.useState(e)},t.useSyncExternalStore=function(e,t,n){return j.current.useSyncExternalStore(e,t,n)},t.useTransition=function(){return j.current.useTransition()},t.version="18.3.1"},314:e=>{e.exports=function(e){var t=[];return t.toString=function(){return this.map(function(t){var n="",r=void 0!==t[5];return t[4]&&(n+="@supports (".concat(t[4],") {")),t[2]&&(n+="@media ".concat(t[2]," {")),r&&(n+="@layer".concat(t[5].length>0?" ".concat(t[5]):""," {")),n+=e(t),r&&(n+="}"),t[2]&&(n+="}"),t[4]&&(n+="}"),n}).join("")},t.i=function(e,n,r,a,o){"string"==typeof e&&(e=[[null,e,void 0]]);var l={};if(r)for(var i=0;i<this.length;i++){var c=this[i][0];null!=c&&(l[c]=!0)}for(var s=0;s<e.length;s++){var u=[].concat(e[s]);r&&l[u[0]]||(void 0!==o&&(void 0===u[5]||(u[1]="@layer".concat(u[5].length>0?" ".concat(u[5]):""," {").concat(u[1],"}")),u[5]=o),n&&(u[2]?(u[1]="@media ".concat(u[2]," {").concat(u[1],"}"),u[2]=n):u[2]=n),a&&(u[4]?(u[1]="@supports (".concat(u[4],") {").concat(u[1],"}"),u[4]=a):u[4]="".concat(a)),t.push(u))}},t}},338:(e,t,n)=>{var r=n(961);t.createRoot=r.createRoot,t.hydrateRoot=r.hydrateRoot},354:e=>{e.exports=function(e){var t=e[1],n=e[3];if(!n)return t;if("function"==typeof btoa){var r=btoa(unescape(encodeURIComponent(JSON.stringify(n)))),a="sourceMappingURL=data:application/json;charset=utf-8;base64,".concat(r),o="/*# ".concat(a," */");return[t].concat([o]).join("\n")}return[t].join("\n")}},463:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,a=e[r];if(!(0<o(a,t)))break e;e[r]=t,e[n]=a,n=r}}function r(e){return 0===e.length?null:e[0]}function a(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,a=e.length,l=a>>>1;r<l;){var i=2*(r+1)-1,c=e[i],s=i+1,u=e[s];if(0>o(c,n))s<a&&0>o(u,c)?(e[r]=u,e[s]=n,r=s):(e[r]=c,e[i]=n,r=i);else{if(!(s<a&&0>o(u,n)))break e;e[r]=u,e[s]=n,r=s}}}return t}function o(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if("object"==typeof performance&&"function"==typeof performance.now){var l=performance;t.unstable_now=function(){return l.now()}}else{var i=Date,c=i.now();t.unstable_now=function(){return i.now()-c}}var s=[],u=[],f=1,d=null,m=3,p=!1,h=!1,v=!1,g="function"==typeof setTimeout?setTimeout:null,b="function"==typeof clearTimeout?clearTimeout:null,A="undefined"!=typeof setImmediate?setImmediate:null;function y(e){for(var t=r(u);null!==t;){if(null===t.callback)a(u);else{if(!(t.startTime<=e))break;a(u),t.sortIndex=t.expirationTime,n(s,t)}t=r(u)}}function E(e){if(v=!1,y(e),!h)if(null!==r(s))h=!0,M(w);else{var t=r(u);null!==t&&T(E,t.startTime-e)}}function w(e,n){h=!1,v&&(v=!1,b(N),N=-1),p=!0;var o=m;try{for(y(n),d=r(s);null!==d&&(!(d.expirationTime>n)||e&&!_());){var l=d.callback;if("function"==typeof l){d.callback=null,m=d.priorityLevel;var i=l(d.expirationTime<=n);n=t.unstable_now(),"function"==typeof i?d.callback=i:d===r(s)&&a(s),y(n)}else a(s);d=r(s)}if(null!==d)var c=!0;else{var f=r(u);null!==f&&T(E,f.startTime-n),c=!1}return c}finally{d=null,m=o,p=!1}}"undefined"!=typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var x,k=!1,S=null,N=-1,C=5,B=-1;function _(){return!(t.unstable_now()-B<C)}function O(){if(null!==S){var e=t.unstable_now();B=e;var n=!0;try{n=S(!0,e)}finally{n?x():(k=!1,S=null)}}else k=!1}if("function"==typeof A)x=function(){A(O)};else if("undefined"!=typeof MessageChannel){var P=new MessageChannel,j=P.port2;P.port1.onmessage=O,x=function(){j.postMessage(null)}}else x=function(){g(O,0)};function M(e){S=e,k||(k=!0,x())}function T(e,n){N=g(function(){e(t.unstable_now())},n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){h||p||(h=!0,M(w))},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):C=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return m},t.unstable_getFirstCallbackNode=function(){return r(s)},t.unstable_next=function(e){switch(m){case 1:case 2:case 3:var t=3;break;default:t=m}var n=m;m=t;try{return e()}finally{m=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=function(){},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=m;m=e;try{return t()}finally{m=n}},t.unstable_scheduleCallback=function(e,a,o){var l=t.unstable_now();switch(o="object"==typeof o&&null!==o&&"number"==typeof(o=o.delay)&&0<o?l+o:l,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:f++,callback:a,priorityLevel:e,startTime:o,expirationTime:i=o+i,sortIndex:-1},o>l?(e.sortIndex=o,n(u,e),null===r(s)&&e===r(u)&&(v?(b(N),N=-1):v=!0,T(E,o-l))):(e.sortIndex=i,n(s,e),h||p||(h=!0,M(w))),e},t.unstable_shouldYield=_,t.unstable_wrapCallback=function(e){var t=m;return function(){var n=m;m=t;try{return e.apply(this,arguments)}finally{m=n}}}},540:(e,t,n)=>{e.exports=n(287)},551:(e,t,n)=>{var r=n(540),a=n(982);function o(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var l=new Set,i={};function c(e,t){s(e,t),s(e+"Capture",t)}function s(e,t){for(i[e]=t,e=0;e<t.length;e++)l.add(t[e])}var u=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),f=Object.prototype.hasOwnProperty,d=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,m={},p={};function h(e,t,n,r,a,o,l){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=a,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=l}var v={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){v[e]=new h(e,0,!1,e,null,!1,!1)}),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];v[t]=new h(t,1,!1,e[1],null,!1,!1)}),["contentEditable","draggable","spellCheck","value"].forEach(function(e){v[e]=new h(e,2,!1,e.toLowerCase(),null,!1,!1)}),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){v[e]=new h(e,2,!1,e,null,!1,!1)}),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){v[e]=new h(e,3,!1,e.toLowerCase(),null,!1,!1)}),["checked","multiple","muted","selected"].forEach(function(e){v[e]=new h(e,3,!0,e,null,!1,!1)}),["capture","download"].forEach(function(e){v[e]=new h(e,4,!1,e,null,!1,!1)}),["cols","rows","size","span"].forEach(function(e){v[e]=new h(e,6,!1,e,null,!1,!1)}),["rowSpan","start"].forEach(function(e){v[e]=new h(e,5,!1,e.toLowerCase(),null,!1,!1)});var g=/[\-:]([a-z])/g;function b(e){return e[1].toUpperCase()}function A(e,t,n,r){var a=v.hasOwnProperty(t)?v[t]:null;(null!==a?0!==a.type:r||!(2<t.length)||"o"!==t[0]&&"O"!==t[0]||"n"!==t[1]&&"N"!==t[1])&&(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,a,r)&&(n=null),r||null===a?function(e){return!!f.call(p,e)||!f.call(m,e)&&(d.test(e)?p[e]=!0:(m[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):a.mustUseProperty?e[a.propertyName]=null===n?3!==a.type&&"":n:(t=a.attributeName,r=a.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(a=a.type)||4===a&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,null,!1,!1)}),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)}),["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)}),["tabIndex","crossOrigin"].forEach(function(e){v[e]=new h(e,1,!1,e.toLowerCase(),null,!1,!1)}),v.xlinkHref=new h("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach(function(e){v[e]=new h(e,1,!1,e.toLowerCase(),null,!0,!0)});var y=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,E=Symbol.for("react.element"),w=Symbol.for("react.portal"),x=Symbol.for("react.fragment"),k=Symbol.for("react.strict_mode"),S=Symbol.for("react.profiler"),N=Symbol.for("react.provider"),C=Symbol.for("react.context"),B=Symbol.for("react.forward_ref"),_=Symbol.for("react.suspense"),O=Symbol.for("react.suspense_list"),P=Symbol.for("react.memo"),j=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var M=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var T=Symbol.iterator;function z(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=T&&e[T]||e["@@iterator"])?e:null}var L,D=Object.assign;function R(e){if(void 0===L)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);L=t&&t[1]||""}return"\n"+L+e}var F=!1;function I(e,t){if(!e||F)return"";F=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(e){var r=e}Reflect.construct(e,[],t)}else{try{t.call()}catch(e){r=e}e.call(t.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(t){if(t&&r&&"string"==typeof t.stack){for(var a=t.stack.split("\n"),o=r.stack.split("\n"),l=a.length-1,i=o.length-1;1<=l&&0<=i&&a[l]!==o[i];)i--;for(;1<=l&&0<=i;l--,i--)if(a[l]!==o[i]){if(1!==l||1!==i)do{if(l--,0>--i||a[l]!==o[i]){var c="\n"+a[l].replace(" at new "," at ");return e.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",e.displayName)),c}}while(1<=l&&0<=i);break}}}finally{F=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?R(e):""}function U(e){switch(e.tag){case 5:return R(e.type);case 16:return R("Lazy");case 13:return R("Suspense");case 19:return R("SuspenseList");case 0:case 2:case 15:return I(e.type,!1);case 11:return I(e.type.render,!1);case 1:return I(e.type,!0);default:return""}}function W(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case x:return"Fragment";case w:return"Portal";case S:return"Profiler";case k:return"StrictMode";case _:return"Suspense";case O:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case C:return(e.displayName||"Context")+".Consumer";case N:return(e._context.displayName||"Context")+".Provider";case B:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case P:return null!==(t=e.displayName||null)?t:W(e.type)||"Memo";case j:t=e._payload,e=e._init;try{return W(e(t))}catch(e){}}return null}function H(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=t.render).displayName||e.name||"",t.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return W(t);case 8:return t===k?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"==typeof t)return t.displayName||t.name||null;if("string"==typeof t)return t}return null}function $(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function q(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function V(e){e._valueTracker||(e._valueTracker=function(e){var t=q(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var a=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return a.call(this)},set:function(e){r=""+e,o.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function G(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=q(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function Q(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Y(e,t){var n=t.checked;return D({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function K(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=$(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function X(e,t){null!=(t=t.checked)&&A(e,"checked",t,!1)}function J(e,t){X(e,t);var n=$(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?ee(e,t.type,n):t.hasOwnProperty("defaultValue")&&ee(e,t.type,$(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function Z(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function ee(e,t,n){"number"===t&&Q(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var te=Array.isArray;function ne(e,t,n,r){if(e=e.options,t){t={};for(var a=0;a<n.length;a++)t["$"+n[a]]=!0;for(n=0;n<e.length;n++)a=t.hasOwnProperty("$"+e[n].value),e[n].selected!==a&&(e[n].selected=a),a&&r&&(e[n].defaultSelected=!0)}else{for(n=""+$(n),t=null,a=0;a<e.length;a++){if(e[a].value===n)return e[a].selected=!0,void(r&&(e[a].defaultSelected=!0));null!==t||e[a].disabled||(t=e[a])}null!==t&&(t.selected=!0)}}function re(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(o(91));return D({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function ae(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(o(92));if(te(n)){if(1<n.length)throw Error(o(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:$(n)}}function oe(e,t){var n=$(t.value),r=$(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function le(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}function ie(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ce(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?ie(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var se,ue,fe=(ue=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((se=se||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=se.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction(function(){return ue(e,t)})}:ue);function de(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var me={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},pe=["Webkit","ms","Moz","O"];function he(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||me.hasOwnProperty(e)&&me[e]?(""+t).trim():t+"px"}function ve(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),a=he(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,a):e[n]=a}}Object.keys(me).forEach(function(e){pe.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),me[t]=me[e]})});var ge=D({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function be(e,t){if(t){if(ge[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(o(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(o(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(o(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(o(62))}}function Ae(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ye=null;function Ee(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var we=null,xe=null,ke=null;function Se(e){if(e=Aa(e)){if("function"!=typeof we)throw Error(o(280));var t=e.stateNode;t&&(t=Ea(t),we(e.stateNode,e.type,t))}}function Ne(e){xe?ke?ke.push(e):ke=[e]:xe=e}function Ce(){if(xe){var e=xe,t=ke;if(ke=xe=null,Se(e),t)for(e=0;e<t.length;e++)Se(t[e])}}function Be(e,t){return e(t)}function _e(){}var Oe=!1;function Pe(e,t,n){if(Oe)return e(t,n);Oe=!0;try{return Be(e,t,n)}finally{Oe=!1,(null!==xe||null!==ke)&&(_e(),Ce())}}function je(e,t){var n=e.stateNode;if(null===n)return null;var r=Ea(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(o(231,t,typeof n));return n}var Me=!1;if(u)try{var Te={};Object.defineProperty(Te,"passive",{get:function(){Me=!0}}),window.addEventListener("test",Te,Te),window.removeEventListener("test",Te,Te)}catch(ue){Me=!1}function ze(e,t,n,r,a,o,l,i,c){var s=Array.prototype.slice.call(arguments,3);try{t.apply(n,s)}catch(e){this.onError(e)}}var Le=!1,De=null,Re=!1,Fe=null,Ie={onError:function(e){Le=!0,De=e}};function Ue(e,t,n,r,a,o,l,i,c){Le=!1,De=null,ze.apply(Ie,arguments)}function We(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{!!(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function He(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function $e(e){if(We(e)!==e)throw Error(o(188))}function qe(e){return null!==(e=function(e){var t=e.alternate;if(!t){if(null===(t=We(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var a=n.return;if(null===a)break;var l=a.alternate;if(null===l){if(null!==(r=a.return)){n=r;continue}break}if(a.child===l.child){for(l=a.child;l;){if(l===n)return $e(a),e;if(l===r)return $e(a),t;l=l.sibling}throw Error(o(188))}if(n.return!==r.return)n=a,r=l;else{for(var i=!1,c=a.child;c;){if(c===n){i=!0,n=a,r=l;break}if(c===r){i=!0,r=a,n=l;break}c=c.sibling}if(!i){for(c=l.child;c;){if(c===n){i=!0,n=l,r=a;break}if(c===r){i=!0,r=l,n=a;break}c=c.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(e))?Ve(e):null}function Ve(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var t=Ve(e);if(null!==t)return t;e=e.sibling}return null}var Ge=a.unstable_scheduleCallback,Qe=a.unstable_cancelCallback,Ye=a.unstable_shouldYield,Ke=a.unstable_requestPaint,Xe=a.unstable_now,Je=a.unstable_getCurrentPriorityLevel,Ze=a.unstable_ImmediatePriority,et=a.unstable_UserBlockingPriority,tt=a.unstable_NormalPriority,nt=a.unstable_LowPriority,rt=a.unstable_IdlePriority,at=null,ot=null,lt=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(it(e)/ct|0)|0},it=Math.log,ct=Math.LN2,st=64,ut=4194304;function ft(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function dt(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,a=e.suspendedLanes,o=e.pingedLanes,l=268435455&n;if(0!==l){var i=l&~a;0!==i?r=ft(i):0!==(o&=l)&&(r=ft(o))}else 0!==(l=n&~a)?r=ft(l):0!==o&&(r=ft(o));if(0===r)return 0;if(0!==t&&t!==r&&0===(t&a)&&((a=r&-r)>=(o=t&-t)||16===a&&4194240&o))return t;if(4&r&&(r|=16&n),0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)a=1<<(n=31-lt(t)),r|=e[n],t&=~a;return r}function mt(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function pt(e){return 0!=(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function ht(){var e=st;return!(4194240&(st<<=1))&&(st=64),e}function vt(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function gt(e,t,n){e.pendingLanes|=t,536870912!==t&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[t=31-lt(t)]=n}function bt(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-lt(n),a=1<<r;a&t|e[r]&t&&(e[r]|=t),n&=~a}}var At=0;function yt(e){return 1<(e&=-e)?4<e?268435455&e?16:536870912:4:1}var Et,wt,xt,kt,St,Nt=!1,Ct=[],Bt=null,_t=null,Ot=null,Pt=new Map,jt=new Map,Mt=[],Tt="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function zt(e,t){switch(e){case"focusin":case"focusout":Bt=null;break;case"dragenter":case"dragleave":_t=null;break;case"mouseover":case"mouseout":Ot=null;break;case"pointerover":case"pointerout":Pt.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":jt.delete(t.pointerId)}}function Lt(e,t,n,r,a,o){return null===e||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[a]},null!==t&&null!==(t=Aa(t))&&wt(t),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==a&&-1===t.indexOf(a)&&t.push(a),e)}function Dt(e){var t=ba(e.target);if(null!==t){var n=We(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=He(n)))return e.blockedOn=t,void St(e.priority,function(){xt(n)})}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Rt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Yt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=Aa(n))&&wt(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);ye=r,n.target.dispatchEvent(r),ye=null,t.shift()}return!0}function Ft(e,t,n){Rt(e)&&n.delete(t)}function It(){Nt=!1,null!==Bt&&Rt(Bt)&&(Bt=null),null!==_t&&Rt(_t)&&(_t=null),null!==Ot&&Rt(Ot)&&(Ot=null),Pt.forEach(Ft),jt.forEach(Ft)}function Ut(e,t){e.blockedOn===t&&(e.blockedOn=null,Nt||(Nt=!0,a.unstable_scheduleCallback(a.unstable_NormalPriority,It)))}function Wt(e){function t(t){return Ut(t,e)}if(0<Ct.length){Ut(Ct[0],e);for(var n=1;n<Ct.length;n++){var r=Ct[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==Bt&&Ut(Bt,e),null!==_t&&Ut(_t,e),null!==Ot&&Ut(Ot,e),Pt.forEach(t),jt.forEach(t),n=0;n<Mt.length;n++)(r=Mt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<Mt.length&&null===(n=Mt[0]).blockedOn;)Dt(n),null===n.blockedOn&&Mt.shift()}var Ht=y.ReactCurrentBatchConfig,$t=!0;function qt(e,t,n,r){var a=At,o=Ht.transition;Ht.transition=null;try{At=1,Gt(e,t,n,r)}finally{At=a,Ht.transition=o}}function Vt(e,t,n,r){var a=At,o=Ht.transition;Ht.transition=null;try{At=4,Gt(e,t,n,r)}finally{At=a,Ht.transition=o}}function Gt(e,t,n,r){if($t){var a=Yt(e,t,n,r);if(null===a)$r(e,t,r,Qt,n),zt(e,r);else if(function(e,t,n,r,a){switch(t){case"focusin":return Bt=Lt(Bt,e,t,n,r,a),!0;case"dragenter":return _t=Lt(_t,e,t,n,r,a),!0;case"mouseover":return Ot=Lt(Ot,e,t,n,r,a),!0;case"pointerover":var o=a.pointerId;return Pt.set(o,Lt(Pt.get(o)||null,e,t,n,r,a)),!0;case"gotpointercapture":return o=a.pointerId,jt.set(o,Lt(jt.get(o)||null,e,t,n,r,a)),!0}return!1}(a,e,t,n,r))r.stopPropagation();else if(zt(e,r),4&t&&-1<Tt.indexOf(e)){for(;null!==a;){var o=Aa(a);if(null!==o&&Et(o),null===(o=Yt(e,t,n,r))&&$r(e,t,r,Qt,n),o===a)break;a=o}null!==a&&r.stopPropagation()}else $r(e,t,r,null,n)}}var Qt=null;function Yt(e,t,n,r){if(Qt=null,null!==(e=ba(e=Ee(r))))if(null===(t=We(e)))e=null;else if(13===(n=t.tag)){if(null!==(e=He(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Qt=e,null}function Kt(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Je()){case Ze:return 1;case et:return 4;case tt:case nt:return 16;case rt:return 536870912;default:return 16}default:return 16}}var Xt=null,Jt=null,Zt=null;function en(){if(Zt)return Zt;var e,t,n=Jt,r=n.length,a="value"in Xt?Xt.value:Xt.textContent,o=a.length;for(e=0;e<r&&n[e]===a[e];e++);var l=r-e;for(t=1;t<=l&&n[r-t]===a[o-t];t++);return Zt=a.slice(e,1<t?1-t:void 0)}function tn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function nn(){return!0}function rn(){return!1}function an(e){function t(t,n,r,a,o){for(var l in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=a,this.target=o,this.currentTarget=null,e)e.hasOwnProperty(l)&&(t=e[l],this[l]=t?t(a):a[l]);return this.isDefaultPrevented=(null!=a.defaultPrevented?a.defaultPrevented:!1===a.returnValue)?nn:rn,this.isPropagationStopped=rn,this}return D(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=nn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=nn)},persist:function(){},isPersistent:nn}),t}var on,ln,cn,sn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},un=an(sn),fn=D({},sn,{view:0,detail:0}),dn=an(fn),mn=D({},fn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Sn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==cn&&(cn&&"mousemove"===e.type?(on=e.screenX-cn.screenX,ln=e.screenY-cn.screenY):ln=on=0,cn=e),on)},movementY:function(e){return"movementY"in e?e.movementY:ln}}),pn=an(mn),hn=an(D({},mn,{dataTransfer:0})),vn=an(D({},fn,{relatedTarget:0})),gn=an(D({},sn,{animationName:0,elapsedTime:0,pseudoElement:0})),bn=D({},sn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),An=an(bn),yn=an(D({},sn,{data:0})),En={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},wn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},xn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function kn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=xn[e])&&!!t[e]}function Sn(){return kn}var Nn=D({},fn,{key:function(e){if(e.key){var t=En[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=tn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?wn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Sn,charCode:function(e){return"keypress"===e.type?tn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Cn=an(Nn),Bn=an(D({},mn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),_n=an(D({},fn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Sn})),On=an(D({},sn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Pn=D({},mn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),jn=an(Pn),Mn=[9,13,27,32],Tn=u&&"CompositionEvent"in window,zn=null;u&&"documentMode"in document&&(zn=document.documentMode);var Ln=u&&"TextEvent"in window&&!zn,Dn=u&&(!Tn||zn&&8<zn&&11>=zn),Rn=String.fromCharCode(32),Fn=!1;function In(e,t){switch(e){case"keyup":return-1!==Mn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Un(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var Wn=!1,Hn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function $n(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Hn[e.type]:"textarea"===t}function qn(e,t,n,r){Ne(r),0<(t=Vr(t,"onChange")).length&&(n=new un("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Vn=null,Gn=null;function Qn(e){Rr(e,0)}function Yn(e){if(G(ya(e)))return e}function Kn(e,t){if("change"===e)return t}var Xn=!1;if(u){var Jn;if(u){var Zn="oninput"in document;if(!Zn){var er=document.createElement("div");er.setAttribute("oninput","return;"),Zn="function"==typeof er.oninput}Jn=Zn}else Jn=!1;Xn=Jn&&(!document.documentMode||9<document.documentMode)}function tr(){Vn&&(Vn.detachEvent("onpropertychange",nr),Gn=Vn=null)}function nr(e){if("value"===e.propertyName&&Yn(Gn)){var t=[];qn(t,Gn,e,Ee(e)),Pe(Qn,t)}}function rr(e,t,n){"focusin"===e?(tr(),Gn=n,(Vn=t).attachEvent("onpropertychange",nr)):"focusout"===e&&tr()}function ar(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Yn(Gn)}function or(e,t){if("click"===e)return Yn(t)}function lr(e,t){if("input"===e||"change"===e)return Yn(t)}var ir="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t};function cr(e,t){if(ir(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var a=n[r];if(!f.call(t,a)||!ir(e[a],t[a]))return!1}return!0}function sr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function ur(e,t){var n,r=sr(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=sr(r)}}function fr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?fr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function dr(){for(var e=window,t=Q();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=Q((e=t.contentWindow).document)}return t}function mr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function pr(e){var t=dr(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&fr(n.ownerDocument.documentElement,n)){if(null!==r&&mr(n))if(t=r.start,void 0===(e=r.end)&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if((e=(t=n.ownerDocument||document)&&t.defaultView||window).getSelection){e=e.getSelection();var a=n.textContent.length,o=Math.min(r.start,a);r=void 0===r.end?o:Math.min(r.end,a),!e.extend&&o>r&&(a=r,r=o,o=a),a=ur(n,o);var l=ur(n,r);a&&l&&(1!==e.rangeCount||e.anchorNode!==a.node||e.anchorOffset!==a.offset||e.focusNode!==l.node||e.focusOffset!==l.offset)&&((t=t.createRange()).setStart(a.node,a.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(l.node,l.offset)):(t.setEnd(l.node,l.offset),e.addRange(t)))}for(t=[],e=n;e=e.parentNode;)1===e.nodeType&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"==typeof n.focus&&n.focus(),n=0;n<t.length;n++)(e=t[n]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var hr=u&&"documentMode"in document&&11>=document.documentMode,vr=null,gr=null,br=null,Ar=!1;function yr(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;Ar||null==vr||vr!==Q(r)||(r="selectionStart"in(r=vr)&&mr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},br&&cr(br,r)||(br=r,0<(r=Vr(gr,"onSelect")).length&&(t=new un("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=vr)))}function Er(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var wr={animationend:Er("Animation","AnimationEnd"),animationiteration:Er("Animation","AnimationIteration"),animationstart:Er("Animation","AnimationStart"),transitionend:Er("Transition","TransitionEnd")},xr={},kr={};function Sr(e){if(xr[e])return xr[e];if(!wr[e])return e;var t,n=wr[e];for(t in n)if(n.hasOwnProperty(t)&&t in kr)return xr[e]=n[t];return e}u&&(kr=document.createElement("div").style,"AnimationEvent"in window||(delete wr.animationend.animation,delete wr.animationiteration.animation,delete wr.animationstart.animation),"TransitionEvent"in window||delete wr.transitionend.transition);var Nr=Sr("animationend"),Cr=Sr("animationiteration"),Br=Sr("animationstart"),_r=Sr("transitionend"),Or=new Map,Pr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function jr(e,t){Or.set(e,t),c(t,[e])}for(var Mr=0;Mr<Pr.length;Mr++){var Tr=Pr[Mr];jr(Tr.toLowerCase(),"on"+(Tr[0].toUpperCase()+Tr.slice(1)))}jr(Nr,"onAnimationEnd"),jr(Cr,"onAnimationIteration"),jr(Br,"onAnimationStart"),jr("dblclick","onDoubleClick"),jr("focusin","onFocus"),jr("focusout","onBlur"),jr(_r,"onTransitionEnd"),s("onMouseEnter",["mouseout","mouseover"]),s("onMouseLeave",["mouseout","mouseover"]),s("onPointerEnter",["pointerout","pointerover"]),s("onPointerLeave",["pointerout","pointerover"]),c("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),c("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),c("onBeforeInput",["compositionend","keypress","textInput","paste"]),c("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),c("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),c("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var zr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Lr=new Set("cancel close invalid load scroll toggle".split(" ").concat(zr));function Dr(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,a,l,i,c,s){if(Ue.apply(this,arguments),Le){if(!Le)throw Error(o(198));var u=De;Le=!1,De=null,Re||(Re=!0,Fe=u)}}(r,t,void 0,e),e.currentTarget=null}function Rr(e,t){t=!!(4&t);for(var n=0;n<e.length;n++){var r=e[n],a=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var l=r.length-1;0<=l;l--){var i=r[l],c=i.instance,s=i.currentTarget;if(i=i.listener,c!==o&&a.isPropagationStopped())break e;Dr(a,i,s),o=c}else for(l=0;l<r.length;l++){if(c=(i=r[l]).instance,s=i.currentTarget,i=i.listener,c!==o&&a.isPropagationStopped())break e;Dr(a,i,s),o=c}}}if(Re)throw e=Fe,Re=!1,Fe=null,e}function Fr(e,t){var n=t[ha];void 0===n&&(n=t[ha]=new Set);var r=e+"__bubble";n.has(r)||(Hr(t,e,2,!1),n.add(r))}function Ir(e,t,n){var r=0;t&&(r|=4),Hr(n,e,r,t)}var Ur="_reactListening"+Math.random().toString(36).slice(2);function Wr(e){if(!e[Ur]){e[Ur]=!0,l.forEach(function(t){"selectionchange"!==t&&(Lr.has(t)||Ir(t,!1,e),Ir(t,!0,e))});var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Ur]||(t[Ur]=!0,Ir("selectionchange",!1,t))}}function Hr(e,t,n,r){switch(Kt(t)){case 1:var a=qt;break;case 4:a=Vt;break;default:a=Gt}n=a.bind(null,t,n,e),a=void 0,!Me||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(a=!0),r?void 0!==a?e.addEventListener(t,n,{capture:!0,passive:a}):e.addEventListener(t,n,!0):void 0!==a?e.addEventListener(t,n,{passive:a}):e.addEventListener(t,n,!1)}function $r(e,t,n,r,a){var o=r;if(!(1&t||2&t||null===r))e:for(;;){if(null===r)return;var l=r.tag;if(3===l||4===l){var i=r.stateNode.containerInfo;if(i===a||8===i.nodeType&&i.parentNode===a)break;if(4===l)for(l=r.return;null!==l;){var c=l.tag;if((3===c||4===c)&&((c=l.stateNode.containerInfo)===a||8===c.nodeType&&c.parentNode===a))return;l=l.return}for(;null!==i;){if(null===(l=ba(i)))return;if(5===(c=l.tag)||6===c){r=o=l;continue e}i=i.parentNode}}r=r.return}Pe(function(){var r=o,a=Ee(n),l=[];e:{var i=Or.get(e);if(void 0!==i){var c=un,s=e;switch(e){case"keypress":if(0===tn(n))break e;case"keydown":case"keyup":c=Cn;break;case"focusin":s="focus",c=vn;break;case"focusout":s="blur",c=vn;break;case"beforeblur":case"afterblur":c=vn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":c=pn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":c=hn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":c=_n;break;case Nr:case Cr:case Br:c=gn;break;case _r:c=On;break;case"scroll":c=dn;break;case"wheel":c=jn;break;case"copy":case"cut":case"paste":c=An;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":c=Bn}var u=!!(4&t),f=!u&&"scroll"===e,d=u?null!==i?i+"Capture":null:i;u=[];for(var m,p=r;null!==p;){var h=(m=p).stateNode;if(5===m.tag&&null!==h&&(m=h,null!==d&&null!=(h=je(p,d))&&u.push(qr(p,h,m))),f)break;p=p.return}0<u.length&&(i=new c(i,s,null,n,a),l.push({event:i,listeners:u}))}}if(!(7&t)){if(c="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||n===ye||!(s=n.relatedTarget||n.fromElement)||!ba(s)&&!s[pa])&&(c||i)&&(i=a.window===a?a:(i=a.ownerDocument)?i.defaultView||i.parentWindow:window,c?(c=r,null!==(s=(s=n.relatedTarget||n.toElement)?ba(s):null)&&(s!==(f=We(s))||5!==s.tag&&6!==s.tag)&&(s=null)):(c=null,s=r),c!==s)){if(u=pn,h="onMouseLeave",d="onMouseEnter",p="mouse","pointerout"!==e&&"pointerover"!==e||(u=Bn,h="onPointerLeave",d="onPointerEnter",p="pointer"),f=null==c?i:ya(c),m=null==s?i:ya(s),(i=new u(h,p+"leave",c,n,a)).target=f,i.relatedTarget=m,h=null,ba(a)===r&&((u=new u(d,p+"enter",s,n,a)).target=m,u.relatedTarget=f,h=u),f=h,c&&s)e:{for(d=s,p=0,m=u=c;m;m=Gr(m))p++;for(m=0,h=d;h;h=Gr(h))m++;for(;0<p-m;)u=Gr(u),p--;for(;0<m-p;)d=Gr(d),m--;for(;p--;){if(u===d||null!==d&&u===d.alternate)break e;u=Gr(u),d=Gr(d)}u=null}else u=null;null!==c&&Qr(l,i,c,u,!1),null!==s&&null!==f&&Qr(l,f,s,u,!0)}if("select"===(c=(i=r?ya(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===c&&"file"===i.type)var v=Kn;else if($n(i))if(Xn)v=lr;else{v=ar;var g=rr}else(c=i.nodeName)&&"input"===c.toLowerCase()&&("checkbox"===i.type||"radio"===i.type)&&(v=or);switch(v&&(v=v(e,r))?qn(l,v,n,a):(g&&g(e,i,r),"focusout"===e&&(g=i._wrapperState)&&g.controlled&&"number"===i.type&&ee(i,"number",i.value)),g=r?ya(r):window,e){case"focusin":($n(g)||"true"===g.contentEditable)&&(vr=g,gr=r,br=null);break;case"focusout":br=gr=vr=null;break;case"mousedown":Ar=!0;break;case"contextmenu":case"mouseup":case"dragend":Ar=!1,yr(l,n,a);break;case"selectionchange":if(hr)break;case"keydown":case"keyup":yr(l,n,a)}var b;if(Tn)e:{switch(e){case"compositionstart":var A="onCompositionStart";break e;case"compositionend":A="onCompositionEnd";break e;case"compositionupdate":A="onCompositionUpdate";break e}A=void 0}else Wn?In(e,n)&&(A="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(A="onCompositionStart");A&&(Dn&&"ko"!==n.locale&&(Wn||"onCompositionStart"!==A?"onCompositionEnd"===A&&Wn&&(b=en()):(Jt="value"in(Xt=a)?Xt.value:Xt.textContent,Wn=!0)),0<(g=Vr(r,A)).length&&(A=new yn(A,e,null,n,a),l.push({event:A,listeners:g}),(b||null!==(b=Un(n)))&&(A.data=b))),(b=Ln?function(e,t){switch(e){case"compositionend":return Un(t);case"keypress":return 32!==t.which?null:(Fn=!0,Rn);case"textInput":return(e=t.data)===Rn&&Fn?null:e;default:return null}}(e,n):function(e,t){if(Wn)return"compositionend"===e||!Tn&&In(e,t)?(e=en(),Zt=Jt=Xt=null,Wn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Dn&&"ko"!==t.locale?null:t.data}}(e,n))&&0<(r=Vr(r,"onBeforeInput")).length&&(a=new yn("onBeforeInput","beforeinput",null,n,a),l.push({event:a,listeners:r}),a.data=b)}Rr(l,t)})}function qr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Vr(e,t){for(var n=t+"Capture",r=[];null!==e;){var a=e,o=a.stateNode;5===a.tag&&null!==o&&(a=o,null!=(o=je(e,n))&&r.unshift(qr(e,o,a)),null!=(o=je(e,t))&&r.push(qr(e,o,a))),e=e.return}return r}function Gr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Qr(e,t,n,r,a){for(var o=t._reactName,l=[];null!==n&&n!==r;){var i=n,c=i.alternate,s=i.stateNode;if(null!==c&&c===r)break;5===i.tag&&null!==s&&(i=s,a?null!=(c=je(n,o))&&l.unshift(qr(n,c,i)):a||null!=(c=je(n,o))&&l.push(qr(n,c,i))),n=n.return}0!==l.length&&e.push({event:t,listeners:l})}var Yr=/\r\n?/g,Kr=/\u0000|\uFFFD/g;function Xr(e){return("string"==typeof e?e:""+e).replace(Yr,"\n").replace(Kr,"")}function Jr(e,t,n){if(t=Xr(t),Xr(e)!==t&&n)throw Error(o(425))}function Zr(){}var ea=null,ta=null;function na(e,t){return"textarea"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ra="function"==typeof setTimeout?setTimeout:void 0,aa="function"==typeof clearTimeout?clearTimeout:void 0,oa="function"==typeof Promise?Promise:void 0,la="function"==typeof queueMicrotask?queueMicrotask:void 0!==oa?function(e){return oa.resolve(null).then(e).catch(ia)}:ra;function ia(e){setTimeout(function(){throw e})}function ca(e,t){var n=t,r=0;do{var a=n.nextSibling;if(e.removeChild(n),a&&8===a.nodeType)if("/$"===(n=a.data)){if(0===r)return e.removeChild(a),void Wt(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=a}while(n);Wt(t)}function sa(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t)break;if("/$"===t)return null}}return e}function ua(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var fa=Math.random().toString(36).slice(2),da="__reactFiber$"+fa,ma="__reactProps$"+fa,pa="__reactContainer$"+fa,ha="__reactEvents$"+fa,va="__reactListeners$"+fa,ga="__reactHandles$"+fa;function ba(e){var t=e[da];if(t)return t;for(var n=e.parentNode;n;){if(t=n[pa]||n[da]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=ua(e);null!==e;){if(n=e[da])return n;e=ua(e)}return t}n=(e=n).parentNode}return null}function Aa(e){return!(e=e[da]||e[pa])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function ya(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(o(33))}function Ea(e){return e[ma]||null}var wa=[],xa=-1;function ka(e){return{current:e}}function Sa(e){0>xa||(e.current=wa[xa],wa[xa]=null,xa--)}function Na(e,t){xa++,wa[xa]=e.current,e.current=t}var Ca={},Ba=ka(Ca),_a=ka(!1),Oa=Ca;function Pa(e,t){var n=e.type.contextTypes;if(!n)return Ca;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var a,o={};for(a in n)o[a]=t[a];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function ja(e){return null!=e.childContextTypes}function Ma(){Sa(_a),Sa(Ba)}function Ta(e,t,n){if(Ba.current!==Ca)throw Error(o(168));Na(Ba,t),Na(_a,n)}function za(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var a in r=r.getChildContext())if(!(a in t))throw Error(o(108,H(e)||"Unknown",a));return D({},n,r)}function La(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ca,Oa=Ba.current,Na(Ba,e),Na(_a,_a.current),!0}function Da(e,t,n){var r=e.stateNode;if(!r)throw Error(o(169));n?(e=za(e,t,Oa),r.__reactInternalMemoizedMergedChildContext=e,Sa(_a),Sa(Ba),Na(Ba,e)):Sa(_a),Na(_a,n)}var Ra=null,Fa=!1,Ia=!1;function Ua(e){null===Ra?Ra=[e]:Ra.push(e)}function Wa(){if(!Ia&&null!==Ra){Ia=!0;var e=0,t=At;try{var n=Ra;for(At=1;e<n.length;e++){var r=n[e];do{r=r(!0)}while(null!==r)}Ra=null,Fa=!1}catch(t){throw null!==Ra&&(Ra=Ra.slice(e+1)),Ge(Ze,Wa),t}finally{At=t,Ia=!1}}return null}var Ha=[],$a=0,qa=null,Va=0,Ga=[],Qa=0,Ya=null,Ka=1,Xa="";function Ja(e,t){Ha[$a++]=Va,Ha[$a++]=qa,qa=e,Va=t}function Za(e,t,n){Ga[Qa++]=Ka,Ga[Qa++]=Xa,Ga[Qa++]=Ya,Ya=e;var r=Ka;e=Xa;var a=32-lt(r)-1;r&=~(1<<a),n+=1;var o=32-lt(t)+a;if(30<o){var l=a-a%5;o=(r&(1<<l)-1).toString(32),r>>=l,a-=l,Ka=1<<32-lt(t)+a|n<<a|r,Xa=o+e}else Ka=1<<o|n<<a|r,Xa=e}function eo(e){null!==e.return&&(Ja(e,1),Za(e,1,0))}function to(e){for(;e===qa;)qa=Ha[--$a],Ha[$a]=null,Va=Ha[--$a],Ha[$a]=null;for(;e===Ya;)Ya=Ga[--Qa],Ga[Qa]=null,Xa=Ga[--Qa],Ga[Qa]=null,Ka=Ga[--Qa],Ga[Qa]=null}var no=null,ro=null,ao=!1,oo=null;function lo(e,t){var n=Ps(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,null===(t=e.deletions)?(e.deletions=[n],e.flags|=16):t.push(n)}function io(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,no=e,ro=sa(t.firstChild),!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,no=e,ro=null,!0);case 13:return null!==(t=8!==t.nodeType?null:t)&&(n=null!==Ya?{id:Ka,overflow:Xa}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},(n=Ps(18,null,null,0)).stateNode=t,n.return=e,e.child=n,no=e,ro=null,!0);default:return!1}}function co(e){return!(!(1&e.mode)||128&e.flags)}function so(e){if(ao){var t=ro;if(t){var n=t;if(!io(e,t)){if(co(e))throw Error(o(418));t=sa(n.nextSibling);var r=no;t&&io(e,t)?lo(r,n):(e.flags=-4097&e.flags|2,ao=!1,no=e)}}else{if(co(e))throw Error(o(418));e.flags=-4097&e.flags|2,ao=!1,no=e}}}function uo(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;no=e}function fo(e){if(e!==no)return!1;if(!ao)return uo(e),ao=!0,!1;var t;if((t=3!==e.tag)&&!(t=5!==e.tag)&&(t="head"!==(t=e.type)&&"body"!==t&&!na(e.type,e.memoizedProps)),t&&(t=ro)){if(co(e))throw mo(),Error(o(418));for(;t;)lo(e,t),t=sa(t.nextSibling)}if(uo(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){ro=sa(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}ro=null}}else ro=no?sa(e.stateNode.nextSibling):null;return!0}function mo(){for(var e=ro;e;)e=sa(e.nextSibling)}function po(){ro=no=null,ao=!1}function ho(e){null===oo?oo=[e]:oo.push(e)}var vo=y.ReactCurrentBatchConfig;function go(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(o(309));var r=n.stateNode}if(!r)throw Error(o(147,e));var a=r,l=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===l?t.ref:(t=function(e){var t=a.refs;null===e?delete t[l]:t[l]=e},t._stringRef=l,t)}if("string"!=typeof e)throw Error(o(284));if(!n._owner)throw Error(o(290,e))}return e}function bo(e,t){throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Ao(e){return(0,e._init)(e._payload)}function yo(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function a(e,t){return(e=Ms(e,t)).index=0,e.sibling=null,e}function l(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=2,n):r:(t.flags|=2,n):(t.flags|=1048576,n)}function i(t){return e&&null===t.alternate&&(t.flags|=2),t}function c(e,t,n,r){return null===t||6!==t.tag?((t=Ds(n,e.mode,r)).return=e,t):((t=a(t,n)).return=e,t)}function s(e,t,n,r){var o=n.type;return o===x?f(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===o||"object"==typeof o&&null!==o&&o.$$typeof===j&&Ao(o)===t.type)?((r=a(t,n.props)).ref=go(e,t,n),r.return=e,r):((r=Ts(n.type,n.key,n.props,null,e.mode,r)).ref=go(e,t,n),r.return=e,r)}function u(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Rs(n,e.mode,r)).return=e,t):((t=a(t,n.children||[])).return=e,t)}function f(e,t,n,r,o){return null===t||7!==t.tag?((t=zs(n,e.mode,r,o)).return=e,t):((t=a(t,n)).return=e,t)}function d(e,t,n){if("string"==typeof t&&""!==t||"number"==typeof t)return(t=Ds(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case E:return(n=Ts(t.type,t.key,t.props,null,e.mode,n)).ref=go(e,null,t),n.return=e,n;case w:return(t=Rs(t,e.mode,n)).return=e,t;case j:return d(e,(0,t._init)(t._payload),n)}if(te(t)||z(t))return(t=zs(t,e.mode,n,null)).return=e,t;bo(e,t)}return null}function m(e,t,n,r){var a=null!==t?t.key:null;if("string"==typeof n&&""!==n||"number"==typeof n)return null!==a?null:c(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case E:return n.key===a?s(e,t,n,r):null;case w:return n.key===a?u(e,t,n,r):null;case j:return m(e,t,(a=n._init)(n._payload),r)}if(te(n)||z(n))return null!==a?null:f(e,t,n,r,null);bo(e,n)}return null}function p(e,t,n,r,a){if("string"==typeof r&&""!==r||"number"==typeof r)return c(t,e=e.get(n)||null,""+r,a);if("object"==typeof r&&null!==r){switch(r.$$typeof){case E:return s(t,e=e.get(null===r.key?n:r.key)||null,r,a);case w:return u(t,e=e.get(null===r.key?n:r.key)||null,r,a);case j:return p(e,t,n,(0,r._init)(r._payload),a)}if(te(r)||z(r))return f(t,e=e.get(n)||null,r,a,null);bo(t,r)}return null}function h(a,o,i,c){for(var s=null,u=null,f=o,h=o=0,v=null;null!==f&&h<i.length;h++){f.index>h?(v=f,f=null):v=f.sibling;var g=m(a,f,i[h],c);if(null===g){null===f&&(f=v);break}e&&f&&null===g.alternate&&t(a,f),o=l(g,o,h),null===u?s=g:u.sibling=g,u=g,f=v}if(h===i.length)return n(a,f),ao&&Ja(a,h),s;if(null===f){for(;h<i.length;h++)null!==(f=d(a,i[h],c))&&(o=l(f,o,h),null===u?s=f:u.sibling=f,u=f);return ao&&Ja(a,h),s}for(f=r(a,f);h<i.length;h++)null!==(v=p(f,a,h,i[h],c))&&(e&&null!==v.alternate&&f.delete(null===v.key?h:v.key),o=l(v,o,h),null===u?s=v:u.sibling=v,u=v);return e&&f.forEach(function(e){return t(a,e)}),ao&&Ja(a,h),s}function v(a,i,c,s){var u=z(c);if("function"!=typeof u)throw Error(o(150));if(null==(c=u.call(c)))throw Error(o(151));for(var f=u=null,h=i,v=i=0,g=null,b=c.next();null!==h&&!b.done;v++,b=c.next()){h.index>v?(g=h,h=null):g=h.sibling;var A=m(a,h,b.value,s);if(null===A){null===h&&(h=g);break}e&&h&&null===A.alternate&&t(a,h),i=l(A,i,v),null===f?u=A:f.sibling=A,f=A,h=g}if(b.done)return n(a,h),ao&&Ja(a,v),u;if(null===h){for(;!b.done;v++,b=c.next())null!==(b=d(a,b.value,s))&&(i=l(b,i,v),null===f?u=b:f.sibling=b,f=b);return ao&&Ja(a,v),u}for(h=r(a,h);!b.done;v++,b=c.next())null!==(b=p(h,a,v,b.value,s))&&(e&&null!==b.alternate&&h.delete(null===b.key?v:b.key),i=l(b,i,v),null===f?u=b:f.sibling=b,f=b);return e&&h.forEach(function(e){return t(a,e)}),ao&&Ja(a,v),u}return function e(r,o,l,c){if("object"==typeof l&&null!==l&&l.type===x&&null===l.key&&(l=l.props.children),"object"==typeof l&&null!==l){switch(l.$$typeof){case E:e:{for(var s=l.key,u=o;null!==u;){if(u.key===s){if((s=l.type)===x){if(7===u.tag){n(r,u.sibling),(o=a(u,l.props.children)).return=r,r=o;break e}}else if(u.elementType===s||"object"==typeof s&&null!==s&&s.$$typeof===j&&Ao(s)===u.type){n(r,u.sibling),(o=a(u,l.props)).ref=go(r,u,l),o.return=r,r=o;break e}n(r,u);break}t(r,u),u=u.sibling}l.type===x?((o=zs(l.props.children,r.mode,c,l.key)).return=r,r=o):((c=Ts(l.type,l.key,l.props,null,r.mode,c)).ref=go(r,o,l),c.return=r,r=c)}return i(r);case w:e:{for(u=l.key;null!==o;){if(o.key===u){if(4===o.tag&&o.stateNode.containerInfo===l.containerInfo&&o.stateNode.implementation===l.implementation){n(r,o.sibling),(o=a(o,l.children||[])).return=r,r=o;break e}n(r,o);break}t(r,o),o=o.sibling}(o=Rs(l,r.mode,c)).return=r,r=o}return i(r);case j:return e(r,o,(u=l._init)(l._payload),c)}if(te(l))return h(r,o,l,c);if(z(l))return v(r,o,l,c);bo(r,l)}return"string"==typeof l&&""!==l||"number"==typeof l?(l=""+l,null!==o&&6===o.tag?(n(r,o.sibling),(o=a(o,l)).return=r,r=o):(n(r,o),(o=Ds(l,r.mode,c)).return=r,r=o),i(r)):n(r,o)}}var Eo=yo(!0),wo=yo(!1),xo=ka(null),ko=null,So=null,No=null;function Co(){No=So=ko=null}function Bo(e){var t=xo.current;Sa(xo),e._currentValue=t}function _o(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Oo(e,t){ko=e,No=So=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&t)&&(Ai=!0),e.firstContext=null)}function Po(e){var t=e._currentValue;if(No!==e)if(e={context:e,memoizedValue:t,next:null},null===So){if(null===ko)throw Error(o(308));So=e,ko.dependencies={lanes:0,firstContext:e}}else So=So.next=e;return t}var jo=null;function Mo(e){null===jo?jo=[e]:jo.push(e)}function To(e,t,n,r){var a=t.interleaved;return null===a?(n.next=n,Mo(t)):(n.next=a.next,a.next=n),t.interleaved=n,zo(e,r)}function zo(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}var Lo=!1;function Do(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Ro(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Fo(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Io(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,2&Bc){var a=r.pending;return null===a?t.next=t:(t.next=a.next,a.next=t),r.pending=t,zo(e,n)}return null===(a=r.interleaved)?(t.next=t,Mo(r)):(t.next=a.next,a.next=t),r.interleaved=t,zo(e,n)}function Uo(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,4194240&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,bt(e,n)}}function Wo(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var a=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var l={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?a=o=l:o=o.next=l,n=n.next}while(null!==n);null===o?a=o=t:o=o.next=t}else a=o=t;return n={baseState:r.baseState,firstBaseUpdate:a,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Ho(e,t,n,r){var a=e.updateQueue;Lo=!1;var o=a.firstBaseUpdate,l=a.lastBaseUpdate,i=a.shared.pending;if(null!==i){a.shared.pending=null;var c=i,s=c.next;c.next=null,null===l?o=s:l.next=s,l=c;var u=e.alternate;null!==u&&(i=(u=u.updateQueue).lastBaseUpdate)!==l&&(null===i?u.firstBaseUpdate=s:i.next=s,u.lastBaseUpdate=c)}if(null!==o){var f=a.baseState;for(l=0,u=s=c=null,i=o;;){var d=i.lane,m=i.eventTime;if((r&d)===d){null!==u&&(u=u.next={eventTime:m,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var p=e,h=i;switch(d=t,m=n,h.tag){case 1:if("function"==typeof(p=h.payload)){f=p.call(m,f,d);break e}f=p;break e;case 3:p.flags=-65537&p.flags|128;case 0:if(null==(d="function"==typeof(p=h.payload)?p.call(m,f,d):p))break e;f=D({},f,d);break e;case 2:Lo=!0}}null!==i.callback&&0!==i.lane&&(e.flags|=64,null===(d=a.effects)?a.effects=[i]:d.push(i))}else m={eventTime:m,lane:d,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===u?(s=u=m,c=f):u=u.next=m,l|=d;if(null===(i=i.next)){if(null===(i=a.shared.pending))break;i=(d=i).next,d.next=null,a.lastBaseUpdate=d,a.shared.pending=null}}if(null===u&&(c=f),a.baseState=c,a.firstBaseUpdate=s,a.lastBaseUpdate=u,null!==(t=a.shared.interleaved)){a=t;do{l|=a.lane,a=a.next}while(a!==t)}else null===o&&(a.shared.lanes=0);Lc|=l,e.lanes=l,e.memoizedState=f}}function $o(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],a=r.callback;if(null!==a){if(r.callback=null,r=n,"function"!=typeof a)throw Error(o(191,a));a.call(r)}}}var qo={},Vo=ka(qo),Go=ka(qo),Qo=ka(qo);function Yo(e){if(e===qo)throw Error(o(174));return e}function Ko(e,t){switch(Na(Qo,t),Na(Go,e),Na(Vo,qo),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ce(null,"");break;default:t=ce(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}Sa(Vo),Na(Vo,t)}function Xo(){Sa(Vo),Sa(Go),Sa(Qo)}function Jo(e){Yo(Qo.current);var t=Yo(Vo.current),n=ce(t,e.type);t!==n&&(Na(Go,e),Na(Vo,n))}function Zo(e){Go.current===e&&(Sa(Vo),Sa(Go))}var el=ka(0);function tl(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(128&t.flags)return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var nl=[];function rl(){for(var e=0;e<nl.length;e++)nl[e]._workInProgressVersionPrimary=null;nl.length=0}var al=y.ReactCurrentDispatcher,ol=y.ReactCurrentBatchConfig,ll=0,il=null,cl=null,sl=null,ul=!1,fl=!1,dl=0,ml=0;function pl(){throw Error(o(321))}function hl(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!ir(e[n],t[n]))return!1;return!0}function vl(e,t,n,r,a,l){if(ll=l,il=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,al.current=null===e||null===e.memoizedState?Zl:ei,e=n(r,a),fl){l=0;do{if(fl=!1,dl=0,25<=l)throw Error(o(301));l+=1,sl=cl=null,t.updateQueue=null,al.current=ti,e=n(r,a)}while(fl)}if(al.current=Jl,t=null!==cl&&null!==cl.next,ll=0,sl=cl=il=null,ul=!1,t)throw Error(o(300));return e}function gl(){var e=0!==dl;return dl=0,e}function bl(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===sl?il.memoizedState=sl=e:sl=sl.next=e,sl}function Al(){if(null===cl){var e=il.alternate;e=null!==e?e.memoizedState:null}else e=cl.next;var t=null===sl?il.memoizedState:sl.next;if(null!==t)sl=t,cl=e;else{if(null===e)throw Error(o(310));e={memoizedState:(cl=e).memoizedState,baseState:cl.baseState,baseQueue:cl.baseQueue,queue:cl.queue,next:null},null===sl?il.memoizedState=sl=e:sl=sl.next=e}return sl}function yl(e,t){return"function"==typeof t?t(e):t}function El(e){var t=Al(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=cl,a=r.baseQueue,l=n.pending;if(null!==l){if(null!==a){var i=a.next;a.next=l.next,l.next=i}r.baseQueue=a=l,n.pending=null}if(null!==a){l=a.next,r=r.baseState;var c=i=null,s=null,u=l;do{var f=u.lane;if((ll&f)===f)null!==s&&(s=s.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:e(r,u.action);else{var d={lane:f,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};null===s?(c=s=d,i=r):s=s.next=d,il.lanes|=f,Lc|=f}u=u.next}while(null!==u&&u!==l);null===s?i=r:s.next=c,ir(r,t.memoizedState)||(Ai=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(null!==(e=n.interleaved)){a=e;do{l=a.lane,il.lanes|=l,Lc|=l,a=a.next}while(a!==e)}else null===a&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function wl(e){var t=Al(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,a=n.pending,l=t.memoizedState;if(null!==a){n.pending=null;var i=a=a.next;do{l=e(l,i.action),i=i.next}while(i!==a);ir(l,t.memoizedState)||(Ai=!0),t.memoizedState=l,null===t.baseQueue&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function xl(){}function kl(e,t){var n=il,r=Al(),a=t(),l=!ir(r.memoizedState,a);if(l&&(r.memoizedState=a,Ai=!0),r=r.queue,Ll(Cl.bind(null,n,r,e),[e]),r.getSnapshot!==t||l||null!==sl&&1&sl.memoizedState.tag){if(n.flags|=2048,Pl(9,Nl.bind(null,n,r,a,t),void 0,null),null===_c)throw Error(o(349));30&ll||Sl(n,t,a)}return a}function Sl(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=il.updateQueue)?(t={lastEffect:null,stores:null},il.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Nl(e,t,n,r){t.value=n,t.getSnapshot=r,Bl(t)&&_l(e)}function Cl(e,t,n){return n(function(){Bl(t)&&_l(e)})}function Bl(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!ir(e,n)}catch(e){return!0}}function _l(e){var t=zo(e,1);null!==t&&ns(t,e,1,-1)}function Ol(e){var t=bl();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:yl,lastRenderedState:e},t.queue=e,e=e.dispatch=Ql.bind(null,il,e),[t.memoizedState,e]}function Pl(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=il.updateQueue)?(t={lastEffect:null,stores:null},il.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function jl(){return Al().memoizedState}function Ml(e,t,n,r){var a=bl();il.flags|=e,a.memoizedState=Pl(1|t,n,void 0,void 0===r?null:r)}function Tl(e,t,n,r){var a=Al();r=void 0===r?null:r;var o=void 0;if(null!==cl){var l=cl.memoizedState;if(o=l.destroy,null!==r&&hl(r,l.deps))return void(a.memoizedState=Pl(t,n,o,r))}il.flags|=e,a.memoizedState=Pl(1|t,n,o,r)}function zl(e,t){return Ml(8390656,8,e,t)}function Ll(e,t){return Tl(2048,8,e,t)}function Dl(e,t){return Tl(4,2,e,t)}function Rl(e,t){return Tl(4,4,e,t)}function Fl(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Il(e,t,n){return n=null!=n?n.concat([e]):null,Tl(4,4,Fl.bind(null,t,e),n)}function Ul(){}function Wl(e,t){var n=Al();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&hl(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Hl(e,t){var n=Al();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&hl(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function $l(e,t,n){return 21&ll?(ir(n,t)||(n=ht(),il.lanes|=n,Lc|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,Ai=!0),e.memoizedState=n)}function ql(e,t){var n=At;At=0!==n&&4>n?n:4,e(!0);var r=ol.transition;ol.transition={};try{e(!1),t()}finally{At=n,ol.transition=r}}function Vl(){return Al().memoizedState}function Gl(e,t,n){var r=ts(e);n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Yl(e)?Kl(t,n):null!==(n=To(e,t,n,r))&&(ns(n,e,r,es()),Xl(n,t,r))}function Ql(e,t,n){var r=ts(e),a={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Yl(e))Kl(t,a);else{var o=e.alternate;if(0===e.lanes&&(null===o||0===o.lanes)&&null!==(o=t.lastRenderedReducer))try{var l=t.lastRenderedState,i=o(l,n);if(a.hasEagerState=!0,a.eagerState=i,ir(i,l)){var c=t.interleaved;return null===c?(a.next=a,Mo(t)):(a.next=c.next,c.next=a),void(t.interleaved=a)}}catch(e){}null!==(n=To(e,t,a,r))&&(ns(n,e,r,a=es()),Xl(n,t,r))}}function Yl(e){var t=e.alternate;return e===il||null!==t&&t===il}function Kl(e,t){fl=ul=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Xl(e,t,n){if(4194240&n){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,bt(e,n)}}var Jl={readContext:Po,useCallback:pl,useContext:pl,useEffect:pl,useImperativeHandle:pl,useInsertionEffect:pl,useLayoutEffect:pl,useMemo:pl,useReducer:pl,useRef:pl,useState:pl,useDebugValue:pl,useDeferredValue:pl,useTransition:pl,useMutableSource:pl,useSyncExternalStore:pl,useId:pl,unstable_isNewReconciler:!1},Zl={readContext:Po,useCallback:function(e,t){return bl().memoizedState=[e,void 0===t?null:t],e},useContext:Po,useEffect:zl,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,Ml(4194308,4,Fl.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Ml(4194308,4,e,t)},useInsertionEffect:function(e,t){return Ml(4,2,e,t)},useMemo:function(e,t){var n=bl();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=bl();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Gl.bind(null,il,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},bl().memoizedState=e},useState:Ol,useDebugValue:Ul,useDeferredValue:function(e){return bl().memoizedState=e},useTransition:function(){var e=Ol(!1),t=e[0];return e=ql.bind(null,e[1]),bl().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=il,a=bl();if(ao){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===_c)throw Error(o(349));30&ll||Sl(r,t,n)}a.memoizedState=n;var l={value:n,getSnapshot:t};return a.queue=l,zl(Cl.bind(null,r,l,e),[e]),r.flags|=2048,Pl(9,Nl.bind(null,r,l,n,t),void 0,null),n},useId:function(){var e=bl(),t=_c.identifierPrefix;if(ao){var n=Xa;t=":"+t+"R"+(n=(Ka&~(1<<32-lt(Ka)-1)).toString(32)+n),0<(n=dl++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=ml++).toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},ei={readContext:Po,useCallback:Wl,useContext:Po,useEffect:Ll,useImperativeHandle:Il,useInsertionEffect:Dl,useLayoutEffect:Rl,useMemo:Hl,useReducer:El,useRef:jl,useState:function(){return El(yl)},useDebugValue:Ul,useDeferredValue:function(e){return $l(Al(),cl.memoizedState,e)},useTransition:function(){return[El(yl)[0],Al().memoizedState]},useMutableSource:xl,useSyncExternalStore:kl,useId:Vl,unstable_isNewReconciler:!1},ti={readContext:Po,useCallback:Wl,useContext:Po,useEffect:Ll,useImperativeHandle:Il,useInsertionEffect:Dl,useLayoutEffect:Rl,useMemo:Hl,useReducer:wl,useRef:jl,useState:function(){return wl(yl)},useDebugValue:Ul,useDeferredValue:function(e){var t=Al();return null===cl?t.memoizedState=e:$l(t,cl.memoizedState,e)},useTransition:function(){return[wl(yl)[0],Al().memoizedState]},useMutableSource:xl,useSyncExternalStore:kl,useId:Vl,unstable_isNewReconciler:!1};function ni(e,t){if(e&&e.defaultProps){for(var n in t=D({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}function ri(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:D({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ai={isMounted:function(e){return!!(e=e._reactInternals)&&We(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=es(),a=ts(e),o=Fo(r,a);o.payload=t,null!=n&&(o.callback=n),null!==(t=Io(e,o,a))&&(ns(t,e,a,r),Uo(t,e,a))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=es(),a=ts(e),o=Fo(r,a);o.tag=1,o.payload=t,null!=n&&(o.callback=n),null!==(t=Io(e,o,a))&&(ns(t,e,a,r),Uo(t,e,a))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=es(),r=ts(e),a=Fo(n,r);a.tag=2,null!=t&&(a.callback=t),null!==(t=Io(e,a,r))&&(ns(t,e,r,n),Uo(t,e,r))}};function oi(e,t,n,r,a,o,l){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,o,l):!(t.prototype&&t.prototype.isPureReactComponent&&cr(n,r)&&cr(a,o))}function li(e,t,n){var r=!1,a=Ca,o=t.contextType;return"object"==typeof o&&null!==o?o=Po(o):(a=ja(t)?Oa:Ba.current,o=(r=null!=(r=t.contextTypes))?Pa(e,a):Ca),t=new t(n,o),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ai,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=a,e.__reactInternalMemoizedMaskedChildContext=o),t}function ii(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ai.enqueueReplaceState(t,t.state,null)}function ci(e,t,n,r){var a=e.stateNode;a.props=n,a.state=e.memoizedState,a.refs={},Do(e);var o=t.contextType;"object"==typeof o&&null!==o?a.context=Po(o):(o=ja(t)?Oa:Ba.current,a.context=Pa(e,o)),a.state=e.memoizedState,"function"==typeof(o=t.getDerivedStateFromProps)&&(ri(e,t,o,n),a.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof a.getSnapshotBeforeUpdate||"function"!=typeof a.UNSAFE_componentWillMount&&"function"!=typeof a.componentWillMount||(t=a.state,"function"==typeof a.componentWillMount&&a.componentWillMount(),"function"==typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount(),t!==a.state&&ai.enqueueReplaceState(a,a.state,null),Ho(e,n,a,r),a.state=e.memoizedState),"function"==typeof a.componentDidMount&&(e.flags|=4194308)}function si(e,t){try{var n="",r=t;do{n+=U(r),r=r.return}while(r);var a=n}catch(e){a="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:t,stack:a,digest:null}}function ui(e,t,n){return{value:e,source:null,stack:null!=n?n:null,digest:null!=t?t:null}}function fi(e,t){try{console.error(t.value)}catch(e){setTimeout(function(){throw e})}}var di="function"==typeof WeakMap?WeakMap:Map;function mi(e,t,n){(n=Fo(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){$c||($c=!0,qc=r),fi(0,t)},n}function pi(e,t,n){(n=Fo(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var a=t.value;n.payload=function(){return r(a)},n.callback=function(){fi(0,t)}}var o=e.stateNode;return null!==o&&"function"==typeof o.componentDidCatch&&(n.callback=function(){fi(0,t),"function"!=typeof r&&(null===Vc?Vc=new Set([this]):Vc.add(this));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}function hi(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new di;var a=new Set;r.set(t,a)}else void 0===(a=r.get(t))&&(a=new Set,r.set(t,a));a.has(n)||(a.add(n),e=Ss.bind(null,e,t,n),t.then(e,e))}function vi(e){do{var t;if((t=13===e.tag)&&(t=null===(t=e.memoizedState)||null!==t.dehydrated),t)return e;e=e.return}while(null!==e);return null}function gi(e,t,n,r,a){return 1&e.mode?(e.flags|=65536,e.lanes=a,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((t=Fo(-1,1)).tag=2,Io(n,t,1))),n.lanes|=1),e)}var bi=y.ReactCurrentOwner,Ai=!1;function yi(e,t,n,r){t.child=null===e?wo(t,null,n,r):Eo(t,e.child,n,r)}function Ei(e,t,n,r,a){n=n.render;var o=t.ref;return Oo(t,a),r=vl(e,t,n,r,o,a),n=gl(),null===e||Ai?(ao&&n&&eo(t),t.flags|=1,yi(e,t,r,a),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~a,$i(e,t,a))}function wi(e,t,n,r,a){if(null===e){var o=n.type;return"function"!=typeof o||js(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Ts(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=o,xi(e,t,o,r,a))}if(o=e.child,0===(e.lanes&a)){var l=o.memoizedProps;if((n=null!==(n=n.compare)?n:cr)(l,r)&&e.ref===t.ref)return $i(e,t,a)}return t.flags|=1,(e=Ms(o,r)).ref=t.ref,e.return=t,t.child=e}function xi(e,t,n,r,a){if(null!==e){var o=e.memoizedProps;if(cr(o,r)&&e.ref===t.ref){if(Ai=!1,t.pendingProps=r=o,0===(e.lanes&a))return t.lanes=e.lanes,$i(e,t,a);131072&e.flags&&(Ai=!0)}}return Ni(e,t,n,r,a)}function ki(e,t,n){var r=t.pendingProps,a=r.children,o=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(1&t.mode){if(!(1073741824&n))return e=null!==o?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,Na(Mc,jc),jc|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==o?o.baseLanes:n,Na(Mc,jc),jc|=r}else t.memoizedState={baseLanes:0,cachePool:null,transitions:null},Na(Mc,jc),jc|=n;else null!==o?(r=o.baseLanes|n,t.memoizedState=null):r=n,Na(Mc,jc),jc|=r;return yi(e,t,a,n),t.child}function Si(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Ni(e,t,n,r,a){var o=ja(n)?Oa:Ba.current;return o=Pa(t,o),Oo(t,a),n=vl(e,t,n,r,o,a),r=gl(),null===e||Ai?(ao&&r&&eo(t),t.flags|=1,yi(e,t,n,a),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~a,$i(e,t,a))}function Ci(e,t,n,r,a){if(ja(n)){var o=!0;La(t)}else o=!1;if(Oo(t,a),null===t.stateNode)Hi(e,t),li(t,n,r),ci(t,n,r,a),r=!0;else if(null===e){var l=t.stateNode,i=t.memoizedProps;l.props=i;var c=l.context,s=n.contextType;s="object"==typeof s&&null!==s?Po(s):Pa(t,s=ja(n)?Oa:Ba.current);var u=n.getDerivedStateFromProps,f="function"==typeof u||"function"==typeof l.getSnapshotBeforeUpdate;f||"function"!=typeof l.UNSAFE_componentWillReceiveProps&&"function"!=typeof l.componentWillReceiveProps||(i!==r||c!==s)&&ii(t,l,r,s),Lo=!1;var d=t.memoizedState;l.state=d,Ho(t,r,l,a),c=t.memoizedState,i!==r||d!==c||_a.current||Lo?("function"==typeof u&&(ri(t,n,u,r),c=t.memoizedState),(i=Lo||oi(t,n,i,r,d,c,s))?(f||"function"!=typeof l.UNSAFE_componentWillMount&&"function"!=typeof l.componentWillMount||("function"==typeof l.componentWillMount&&l.componentWillMount(),"function"==typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount()),"function"==typeof l.componentDidMount&&(t.flags|=4194308)):("function"==typeof l.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=c),l.props=r,l.state=c,l.context=s,r=i):("function"==typeof l.componentDidMount&&(t.flags|=4194308),r=!1)}else{l=t.stateNode,Ro(e,t),i=t.memoizedProps,s=t.type===t.elementType?i:ni(t.type,i),l.props=s,f=t.pendingProps,d=l.context,c="object"==typeof(c=n.contextType)&&null!==c?Po(c):Pa(t,c=ja(n)?Oa:Ba.current);var m=n.getDerivedStateFromProps;(u="function"==typeof m||"function"==typeof l.getSnapshotBeforeUpdate)||"function"!=typeof l.UNSAFE_componentWillReceiveProps&&"function"!=typeof l.componentWillReceiveProps||(i!==f||d!==c)&&ii(t,l,r,c),Lo=!1,d=t.memoizedState,l.state=d,Ho(t,r,l,a);var p=t.memoizedState;i!==f||d!==p||_a.current||Lo?("function"==typeof m&&(ri(t,n,m,r),p=t.memoizedState),(s=Lo||oi(t,n,s,r,d,p,c)||!1)?(u||"function"!=typeof l.UNSAFE_componentWillUpdate&&"function"!=typeof l.componentWillUpdate||("function"==typeof l.componentWillUpdate&&l.componentWillUpdate(r,p,c),"function"==typeof l.UNSAFE_componentWillUpdate&&l.UNSAFE_componentWillUpdate(r,p,c)),"function"==typeof l.componentDidUpdate&&(t.flags|=4),"function"==typeof l.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!=typeof l.componentDidUpdate||i===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!=typeof l.getSnapshotBeforeUpdate||i===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),l.props=r,l.state=p,l.context=c,r=s):("function"!=typeof l.componentDidUpdate||i===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!=typeof l.getSnapshotBeforeUpdate||i===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return Bi(e,t,n,r,o,a)}function Bi(e,t,n,r,a,o){Si(e,t);var l=!!(128&t.flags);if(!r&&!l)return a&&Da(t,n,!1),$i(e,t,o);r=t.stateNode,bi.current=t;var i=l&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&l?(t.child=Eo(t,e.child,null,o),t.child=Eo(t,null,i,o)):yi(e,t,i,o),t.memoizedState=r.state,a&&Da(t,n,!0),t.child}function _i(e){var t=e.stateNode;t.pendingContext?Ta(0,t.pendingContext,t.pendingContext!==t.context):t.context&&Ta(0,t.context,!1),Ko(e,t.containerInfo)}function Oi(e,t,n,r,a){return po(),ho(a),t.flags|=256,yi(e,t,n,r),t.child}var Pi,ji,Mi,Ti,zi={dehydrated:null,treeContext:null,retryLane:0};function Li(e){return{baseLanes:e,cachePool:null,transitions:null}}function Di(e,t,n){var r,a=t.pendingProps,l=el.current,i=!1,c=!!(128&t.flags);if((r=c)||(r=(null===e||null!==e.memoizedState)&&!!(2&l)),r?(i=!0,t.flags&=-129):null!==e&&null===e.memoizedState||(l|=1),Na(el,1&l),null===e)return so(t),null!==(e=t.memoizedState)&&null!==(e=e.dehydrated)?(1&t.mode?"$!"===e.data?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(c=a.children,e=a.fallback,i?(a=t.mode,i=t.child,c={mode:"hidden",children:c},1&a||null===i?i=Ls(c,a,0,null):(i.childLanes=0,i.pendingProps=c),e=zs(e,a,n,null),i.return=t,e.return=t,i.sibling=e,t.child=i,t.child.memoizedState=Li(n),t.memoizedState=zi,e):Ri(t,c));if(null!==(l=e.memoizedState)&&null!==(r=l.dehydrated))return function(e,t,n,r,a,l,i){if(n)return 256&t.flags?(t.flags&=-257,Fi(e,t,i,r=ui(Error(o(422))))):null!==t.memoizedState?(t.child=e.child,t.flags|=128,null):(l=r.fallback,a=t.mode,r=Ls({mode:"visible",children:r.children},a,0,null),(l=zs(l,a,i,null)).flags|=2,r.return=t,l.return=t,r.sibling=l,t.child=r,1&t.mode&&Eo(t,e.child,null,i),t.child.memoizedState=Li(i),t.memoizedState=zi,l);if(!(1&t.mode))return Fi(e,t,i,null);if("$!"===a.data){if(r=a.nextSibling&&a.nextSibling.dataset)var c=r.dgst;return r=c,Fi(e,t,i,r=ui(l=Error(o(419)),r,void 0))}if(c=0!==(i&e.childLanes),Ai||c){if(null!==(r=_c)){switch(i&-i){case 4:a=2;break;case 16:a=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:a=32;break;case 536870912:a=268435456;break;default:a=0}0!==(a=0!==(a&(r.suspendedLanes|i))?0:a)&&a!==l.retryLane&&(l.retryLane=a,zo(e,a),ns(r,e,a,-1))}return hs(),Fi(e,t,i,r=ui(Error(o(421))))}return"$?"===a.data?(t.flags|=128,t.child=e.child,t=Cs.bind(null,e),a._reactRetry=t,null):(e=l.treeContext,ro=sa(a.nextSibling),no=t,ao=!0,oo=null,null!==e&&(Ga[Qa++]=Ka,Ga[Qa++]=Xa,Ga[Qa++]=Ya,Ka=e.id,Xa=e.overflow,Ya=t),(t=Ri(t,r.children)).flags|=4096,t)}(e,t,c,a,r,l,n);if(i){i=a.fallback,c=t.mode,r=(l=e.child).sibling;var s={mode:"hidden",children:a.children};return 1&c||t.child===l?(a=Ms(l,s)).subtreeFlags=14680064&l.subtreeFlags:((a=t.child).childLanes=0,a.pendingProps=s,t.deletions=null),null!==r?i=Ms(r,i):(i=zs(i,c,n,null)).flags|=2,i.return=t,a.return=t,a.sibling=i,t.child=a,a=i,i=t.child,c=null===(c=e.child.memoizedState)?Li(n):{baseLanes:c.baseLanes|n,cachePool:null,transitions:c.transitions},i.memoizedState=c,i.childLanes=e.childLanes&~n,t.memoizedState=zi,a}return e=(i=e.child).sibling,a=Ms(i,{mode:"visible",children:a.children}),!(1&t.mode)&&(a.lanes=n),a.return=t,a.sibling=null,null!==e&&(null===(n=t.deletions)?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=a,t.memoizedState=null,a}function Ri(e,t){return(t=Ls({mode:"visible",children:t},e.mode,0,null)).return=e,e.child=t}function Fi(e,t,n,r){return null!==r&&ho(r),Eo(t,e.child,null,n),(e=Ri(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Ii(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),_o(e.return,t,n)}function Ui(e,t,n,r,a){var o=e.memoizedState;null===o?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:a}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=a)}function Wi(e,t,n){var r=t.pendingProps,a=r.revealOrder,o=r.tail;if(yi(e,t,r.children,n),2&(r=el.current))r=1&r|2,t.flags|=128;else{if(null!==e&&128&e.flags)e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ii(e,n,t);else if(19===e.tag)Ii(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Na(el,r),1&t.mode)switch(a){case"forwards":for(n=t.child,a=null;null!==n;)null!==(e=n.alternate)&&null===tl(e)&&(a=n),n=n.sibling;null===(n=a)?(a=t.child,t.child=null):(a=n.sibling,n.sibling=null),Ui(t,!1,a,n,o);break;case"backwards":for(n=null,a=t.child,t.child=null;null!==a;){if(null!==(e=a.alternate)&&null===tl(e)){t.child=a;break}e=a.sibling,a.sibling=n,n=a,a=e}Ui(t,!0,n,null,o);break;case"together":Ui(t,!1,null,null,void 0);break;default:t.memoizedState=null}else t.memoizedState=null;return t.child}function Hi(e,t){!(1&t.mode)&&null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2)}function $i(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Lc|=t.lanes,0===(n&t.childLanes))return null;if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=Ms(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Ms(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function qi(e,t){if(!ao)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Vi(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=14680064&a.subtreeFlags,r|=14680064&a.flags,a.return=e,a=a.sibling;else for(a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=a.subtreeFlags,r|=a.flags,a.return=e,a=a.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Gi(e,t,n){var r=t.pendingProps;switch(to(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Vi(t),null;case 1:case 17:return ja(t.type)&&Ma(),Vi(t),null;case 3:return r=t.stateNode,Xo(),Sa(_a),Sa(Ba),rl(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(fo(t)?t.flags|=4:null===e||e.memoizedState.isDehydrated&&!(256&t.flags)||(t.flags|=1024,null!==oo&&(ls(oo),oo=null))),ji(e,t),Vi(t),null;case 5:Zo(t);var a=Yo(Qo.current);if(n=t.type,null!==e&&null!=t.stateNode)Mi(e,t,n,r,a),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(null===t.stateNode)throw Error(o(166));return Vi(t),null}if(e=Yo(Vo.current),fo(t)){r=t.stateNode,n=t.type;var l=t.memoizedProps;switch(r[da]=t,r[ma]=l,e=!!(1&t.mode),n){case"dialog":Fr("cancel",r),Fr("close",r);break;case"iframe":case"object":case"embed":Fr("load",r);break;case"video":case"audio":for(a=0;a<zr.length;a++)Fr(zr[a],r);break;case"source":Fr("error",r);break;case"img":case"image":case"link":Fr("error",r),Fr("load",r);break;case"details":Fr("toggle",r);break;case"input":K(r,l),Fr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!l.multiple},Fr("invalid",r);break;case"textarea":ae(r,l),Fr("invalid",r)}for(var c in be(n,l),a=null,l)if(l.hasOwnProperty(c)){var s=l[c];"children"===c?"string"==typeof s?r.textContent!==s&&(!0!==l.suppressHydrationWarning&&Jr(r.textContent,s,e),a=["children",s]):"number"==typeof s&&r.textContent!==""+s&&(!0!==l.suppressHydrationWarning&&Jr(r.textContent,s,e),a=["children",""+s]):i.hasOwnProperty(c)&&null!=s&&"onScroll"===c&&Fr("scroll",r)}switch(n){case"input":V(r),Z(r,l,!0);break;case"textarea":V(r),le(r);break;case"select":case"option":break;default:"function"==typeof l.onClick&&(r.onclick=Zr)}r=a,t.updateQueue=r,null!==r&&(t.flags|=4)}else{c=9===a.nodeType?a:a.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=ie(n)),"http://www.w3.org/1999/xhtml"===e?"script"===n?((e=c.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=c.createElement(n,{is:r.is}):(e=c.createElement(n),"select"===n&&(c=e,r.multiple?c.multiple=!0:r.size&&(c.size=r.size))):e=c.createElementNS(e,n),e[da]=t,e[ma]=r,Pi(e,t,!1,!1),t.stateNode=e;e:{switch(c=Ae(n,r),n){case"dialog":Fr("cancel",e),Fr("close",e),a=r;break;case"iframe":case"object":case"embed":Fr("load",e),a=r;break;case"video":case"audio":for(a=0;a<zr.length;a++)Fr(zr[a],e);a=r;break;case"source":Fr("error",e),a=r;break;case"img":case"image":case"link":Fr("error",e),Fr("load",e),a=r;break;case"details":Fr("toggle",e),a=r;break;case"input":K(e,r),a=Y(e,r),Fr("invalid",e);break;case"option":default:a=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},a=D({},r,{value:void 0}),Fr("invalid",e);break;case"textarea":ae(e,r),a=re(e,r),Fr("invalid",e)}for(l in be(n,a),s=a)if(s.hasOwnProperty(l)){var u=s[l];"style"===l?ve(e,u):"dangerouslySetInnerHTML"===l?null!=(u=u?u.__html:void 0)&&fe(e,u):"children"===l?"string"==typeof u?("textarea"!==n||""!==u)&&de(e,u):"number"==typeof u&&de(e,""+u):"suppressContentEditableWarning"!==l&&"suppressHydrationWarning"!==l&&"autoFocus"!==l&&(i.hasOwnProperty(l)?null!=u&&"onScroll"===l&&Fr("scroll",e):null!=u&&A(e,l,u,c))}switch(n){case"input":V(e),Z(e,r,!1);break;case"textarea":V(e),le(e);break;case"option":null!=r.value&&e.setAttribute("value",""+$(r.value));break;case"select":e.multiple=!!r.multiple,null!=(l=r.value)?ne(e,!!r.multiple,l,!1):null!=r.defaultValue&&ne(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof a.onClick&&(e.onclick=Zr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}null!==t.ref&&(t.flags|=512,t.flags|=2097152)}return Vi(t),null;case 6:if(e&&null!=t.stateNode)Ti(e,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(o(166));if(n=Yo(Qo.current),Yo(Vo.current),fo(t)){if(r=t.stateNode,n=t.memoizedProps,r[da]=t,(l=r.nodeValue!==n)&&null!==(e=no))switch(e.tag){case 3:Jr(r.nodeValue,n,!!(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Jr(r.nodeValue,n,!!(1&e.mode))}l&&(t.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[da]=t,t.stateNode=r}return Vi(t),null;case 13:if(Sa(el),r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(ao&&null!==ro&&1&t.mode&&!(128&t.flags))mo(),po(),t.flags|=98560,l=!1;else if(l=fo(t),null!==r&&null!==r.dehydrated){if(null===e){if(!l)throw Error(o(318));if(!(l=null!==(l=t.memoizedState)?l.dehydrated:null))throw Error(o(317));l[da]=t}else po(),!(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Vi(t),l=!1}else null!==oo&&(ls(oo),oo=null),l=!0;if(!l)return 65536&t.flags?t:null}return 128&t.flags?(t.lanes=n,t):((r=null!==r)!=(null!==e&&null!==e.memoizedState)&&r&&(t.child.flags|=8192,1&t.mode&&(null===e||1&el.current?0===Tc&&(Tc=3):hs())),null!==t.updateQueue&&(t.flags|=4),Vi(t),null);case 4:return Xo(),ji(e,t),null===e&&Wr(t.stateNode.containerInfo),Vi(t),null;case 10:return Bo(t.type._context),Vi(t),null;case 19:if(Sa(el),null===(l=t.memoizedState))return Vi(t),null;if(r=!!(128&t.flags),null===(c=l.rendering))if(r)qi(l,!1);else{if(0!==Tc||null!==e&&128&e.flags)for(e=t.child;null!==e;){if(null!==(c=tl(e))){for(t.flags|=128,qi(l,!1),null!==(r=c.updateQueue)&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;null!==n;)e=r,(l=n).flags&=14680066,null===(c=l.alternate)?(l.childLanes=0,l.lanes=e,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=c.childLanes,l.lanes=c.lanes,l.child=c.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=c.memoizedProps,l.memoizedState=c.memoizedState,l.updateQueue=c.updateQueue,l.type=c.type,e=c.dependencies,l.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return Na(el,1&el.current|2),t.child}e=e.sibling}null!==l.tail&&Xe()>Wc&&(t.flags|=128,r=!0,qi(l,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=tl(c))){if(t.flags|=128,r=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),qi(l,!0),null===l.tail&&"hidden"===l.tailMode&&!c.alternate&&!ao)return Vi(t),null}else 2*Xe()-l.renderingStartTime>Wc&&1073741824!==n&&(t.flags|=128,r=!0,qi(l,!1),t.lanes=4194304);l.isBackwards?(c.sibling=t.child,t.child=c):(null!==(n=l.last)?n.sibling=c:t.child=c,l.last=c)}return null!==l.tail?(t=l.tail,l.rendering=t,l.tail=t.sibling,l.renderingStartTime=Xe(),t.sibling=null,n=el.current,Na(el,r?1&n|2:1&n),t):(Vi(t),null);case 22:case 23:return fs(),r=null!==t.memoizedState,null!==e&&null!==e.memoizedState!==r&&(t.flags|=8192),r&&1&t.mode?!!(1073741824&jc)&&(Vi(t),6&t.subtreeFlags&&(t.flags|=8192)):Vi(t),null;case 24:case 25:return null}throw Error(o(156,t.tag))}function Qi(e,t){switch(to(t),t.tag){case 1:return ja(t.type)&&Ma(),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return Xo(),Sa(_a),Sa(Ba),rl(),65536&(e=t.flags)&&!(128&e)?(t.flags=-65537&e|128,t):null;case 5:return Zo(t),null;case 13:if(Sa(el),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));po()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Sa(el),null;case 4:return Xo(),null;case 10:return Bo(t.type._context),null;case 22:case 23:return fs(),null;default:return null}}Pi=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},ji=function(){},Mi=function(e,t,n,r){var a=e.memoizedProps;if(a!==r){e=t.stateNode,Yo(Vo.current);var o,l=null;switch(n){case"input":a=Y(e,a),r=Y(e,r),l=[];break;case"select":a=D({},a,{value:void 0}),r=D({},r,{value:void 0}),l=[];break;case"textarea":a=re(e,a),r=re(e,r),l=[];break;default:"function"!=typeof a.onClick&&"function"==typeof r.onClick&&(e.onclick=Zr)}for(u in be(n,r),n=null,a)if(!r.hasOwnProperty(u)&&a.hasOwnProperty(u)&&null!=a[u])if("style"===u){var c=a[u];for(o in c)c.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else"dangerouslySetInnerHTML"!==u&&"children"!==u&&"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&"autoFocus"!==u&&(i.hasOwnProperty(u)?l||(l=[]):(l=l||[]).push(u,null));for(u in r){var s=r[u];if(c=null!=a?a[u]:void 0,r.hasOwnProperty(u)&&s!==c&&(null!=s||null!=c))if("style"===u)if(c){for(o in c)!c.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in s)s.hasOwnProperty(o)&&c[o]!==s[o]&&(n||(n={}),n[o]=s[o])}else n||(l||(l=[]),l.push(u,n)),n=s;else"dangerouslySetInnerHTML"===u?(s=s?s.__html:void 0,c=c?c.__html:void 0,null!=s&&c!==s&&(l=l||[]).push(u,s)):"children"===u?"string"!=typeof s&&"number"!=typeof s||(l=l||[]).push(u,""+s):"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&(i.hasOwnProperty(u)?(null!=s&&"onScroll"===u&&Fr("scroll",e),l||c===s||(l=[])):(l=l||[]).push(u,s))}n&&(l=l||[]).push("style",n);var u=l;(t.updateQueue=u)&&(t.flags|=4)}},Ti=function(e,t,n,r){n!==r&&(t.flags|=4)};var Yi=!1,Ki=!1,Xi="function"==typeof WeakSet?WeakSet:Set,Ji=null;function Zi(e,t){var n=e.ref;if(null!==n)if("function"==typeof n)try{n(null)}catch(n){ks(e,t,n)}else n.current=null}function ec(e,t,n){try{n()}catch(n){ks(e,t,n)}}var tc=!1;function nc(e,t,n){var r=t.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var a=r=r.next;do{if((a.tag&e)===e){var o=a.destroy;a.destroy=void 0,void 0!==o&&ec(t,n,o)}a=a.next}while(a!==r)}}function rc(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function ac(e){var t=e.ref;if(null!==t){var n=e.stateNode;e.tag,e=n,"function"==typeof t?t(e):t.current=e}}function oc(e){var t=e.alternate;null!==t&&(e.alternate=null,oc(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&null!==(t=e.stateNode)&&(delete t[da],delete t[ma],delete t[ha],delete t[va],delete t[ga]),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function lc(e){return 5===e.tag||3===e.tag||4===e.tag}function ic(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||lc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function cc(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=Zr));else if(4!==r&&null!==(e=e.child))for(cc(e,t,n),e=e.sibling;null!==e;)cc(e,t,n),e=e.sibling}function sc(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(sc(e,t,n),e=e.sibling;null!==e;)sc(e,t,n),e=e.sibling}var uc=null,fc=!1;function dc(e,t,n){for(n=n.child;null!==n;)mc(e,t,n),n=n.sibling}function mc(e,t,n){if(ot&&"function"==typeof ot.onCommitFiberUnmount)try{ot.onCommitFiberUnmount(at,n)}catch(e){}switch(n.tag){case 5:Ki||Zi(n,t);case 6:var r=uc,a=fc;uc=null,dc(e,t,n),fc=a,null!==(uc=r)&&(fc?(e=uc,n=n.stateNode,8===e.nodeType?e.parentNode.removeChild(n):e.removeChild(n)):uc.removeChild(n.stateNode));break;case 18:null!==uc&&(fc?(e=uc,n=n.stateNode,8===e.nodeType?ca(e.parentNode,n):1===e.nodeType&&ca(e,n),Wt(e)):ca(uc,n.stateNode));break;case 4:r=uc,a=fc,uc=n.stateNode.containerInfo,fc=!0,dc(e,t,n),uc=r,fc=a;break;case 0:case 11:case 14:case 15:if(!Ki&&null!==(r=n.updateQueue)&&null!==(r=r.lastEffect)){a=r=r.next;do{var o=a,l=o.destroy;o=o.tag,void 0!==l&&(2&o||4&o)&&ec(n,t,l),a=a.next}while(a!==r)}dc(e,t,n);break;case 1:if(!Ki&&(Zi(n,t),"function"==typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(e){ks(n,t,e)}dc(e,t,n);break;case 21:dc(e,t,n);break;case 22:1&n.mode?(Ki=(r=Ki)||null!==n.memoizedState,dc(e,t,n),Ki=r):dc(e,t,n);break;default:dc(e,t,n)}}function pc(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new Xi),t.forEach(function(t){var r=Bs.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))})}}function hc(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var a=n[r];try{var l=e,i=t,c=i;e:for(;null!==c;){switch(c.tag){case 5:uc=c.stateNode,fc=!1;break e;case 3:case 4:uc=c.stateNode.containerInfo,fc=!0;break e}c=c.return}if(null===uc)throw Error(o(160));mc(l,i,a),uc=null,fc=!1;var s=a.alternate;null!==s&&(s.return=null),a.return=null}catch(e){ks(a,t,e)}}if(12854&t.subtreeFlags)for(t=t.child;null!==t;)vc(t,e),t=t.sibling}function vc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(hc(t,e),gc(e),4&r){try{nc(3,e,e.return),rc(3,e)}catch(t){ks(e,e.return,t)}try{nc(5,e,e.return)}catch(t){ks(e,e.return,t)}}break;case 1:hc(t,e),gc(e),512&r&&null!==n&&Zi(n,n.return);break;case 5:if(hc(t,e),gc(e),512&r&&null!==n&&Zi(n,n.return),32&e.flags){var a=e.stateNode;try{de(a,"")}catch(t){ks(e,e.return,t)}}if(4&r&&null!=(a=e.stateNode)){var l=e.memoizedProps,i=null!==n?n.memoizedProps:l,c=e.type,s=e.updateQueue;if(e.updateQueue=null,null!==s)try{"input"===c&&"radio"===l.type&&null!=l.name&&X(a,l),Ae(c,i);var u=Ae(c,l);for(i=0;i<s.length;i+=2){var f=s[i],d=s[i+1];"style"===f?ve(a,d):"dangerouslySetInnerHTML"===f?fe(a,d):"children"===f?de(a,d):A(a,f,d,u)}switch(c){case"input":J(a,l);break;case"textarea":oe(a,l);break;case"select":var m=a._wrapperState.wasMultiple;a._wrapperState.wasMultiple=!!l.multiple;var p=l.value;null!=p?ne(a,!!l.multiple,p,!1):m!==!!l.multiple&&(null!=l.defaultValue?ne(a,!!l.multiple,l.defaultValue,!0):ne(a,!!l.multiple,l.multiple?[]:"",!1))}a[ma]=l}catch(t){ks(e,e.return,t)}}break;case 6:if(hc(t,e),gc(e),4&r){if(null===e.stateNode)throw Error(o(162));a=e.stateNode,l=e.memoizedProps;try{a.nodeValue=l}catch(t){ks(e,e.return,t)}}break;case 3:if(hc(t,e),gc(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Wt(t.containerInfo)}catch(t){ks(e,e.return,t)}break;case 4:default:hc(t,e),gc(e);break;case 13:hc(t,e),gc(e),8192&(a=e.child).flags&&(l=null!==a.memoizedState,a.stateNode.isHidden=l,!l||null!==a.alternate&&null!==a.alternate.memoizedState||(Uc=Xe())),4&r&&pc(e);break;case 22:if(f=null!==n&&null!==n.memoizedState,1&e.mode?(Ki=(u=Ki)||f,hc(t,e),Ki=u):hc(t,e),gc(e),8192&r){if(u=null!==e.memoizedState,(e.stateNode.isHidden=u)&&!f&&1&e.mode)for(Ji=e,f=e.child;null!==f;){for(d=Ji=f;null!==Ji;){switch(p=(m=Ji).child,m.tag){case 0:case 11:case 14:case 15:nc(4,m,m.return);break;case 1:Zi(m,m.return);var h=m.stateNode;if("function"==typeof h.componentWillUnmount){r=m,n=m.return;try{t=r,h.props=t.memoizedProps,h.state=t.memoizedState,h.componentWillUnmount()}catch(e){ks(r,n,e)}}break;case 5:Zi(m,m.return);break;case 22:if(null!==m.memoizedState){Ec(d);continue}}null!==p?(p.return=m,Ji=p):Ec(d)}f=f.sibling}e:for(f=null,d=e;;){if(5===d.tag){if(null===f){f=d;try{a=d.stateNode,u?"function"==typeof(l=a.style).setProperty?l.setProperty("display","none","important"):l.display="none":(c=d.stateNode,i=null!=(s=d.memoizedProps.style)&&s.hasOwnProperty("display")?s.display:null,c.style.display=he("display",i))}catch(t){ks(e,e.return,t)}}}else if(6===d.tag){if(null===f)try{d.stateNode.nodeValue=u?"":d.memoizedProps}catch(t){ks(e,e.return,t)}}else if((22!==d.tag&&23!==d.tag||null===d.memoizedState||d===e)&&null!==d.child){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;null===d.sibling;){if(null===d.return||d.return===e)break e;f===d&&(f=null),d=d.return}f===d&&(f=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:hc(t,e),gc(e),4&r&&pc(e);case 21:}}function gc(e){var t=e.flags;if(2&t){try{e:{for(var n=e.return;null!==n;){if(lc(n)){var r=n;break e}n=n.return}throw Error(o(160))}switch(r.tag){case 5:var a=r.stateNode;32&r.flags&&(de(a,""),r.flags&=-33),sc(e,ic(e),a);break;case 3:case 4:var l=r.stateNode.containerInfo;cc(e,ic(e),l);break;default:throw Error(o(161))}}catch(t){ks(e,e.return,t)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function bc(e,t,n){Ji=e,Ac(e,t,n)}function Ac(e,t,n){for(var r=!!(1&e.mode);null!==Ji;){var a=Ji,o=a.child;if(22===a.tag&&r){var l=null!==a.memoizedState||Yi;if(!l){var i=a.alternate,c=null!==i&&null!==i.memoizedState||Ki;i=Yi;var s=Ki;if(Yi=l,(Ki=c)&&!s)for(Ji=a;null!==Ji;)c=(l=Ji).child,22===l.tag&&null!==l.memoizedState?wc(a):null!==c?(c.return=l,Ji=c):wc(a);for(;null!==o;)Ji=o,Ac(o,t,n),o=o.sibling;Ji=a,Yi=i,Ki=s}yc(e)}else 8772&a.subtreeFlags&&null!==o?(o.return=a,Ji=o):yc(e)}}function yc(e){for(;null!==Ji;){var t=Ji;if(8772&t.flags){var n=t.alternate;try{if(8772&t.flags)switch(t.tag){case 0:case 11:case 15:Ki||rc(5,t);break;case 1:var r=t.stateNode;if(4&t.flags&&!Ki)if(null===n)r.componentDidMount();else{var a=t.elementType===t.type?n.memoizedProps:ni(t.type,n.memoizedProps);r.componentDidUpdate(a,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var l=t.updateQueue;null!==l&&$o(t,l,r);break;case 3:var i=t.updateQueue;if(null!==i){if(n=null,null!==t.child)switch(t.child.tag){case 5:case 1:n=t.child.stateNode}$o(t,i,n)}break;case 5:var c=t.stateNode;if(null===n&&4&t.flags){n=c;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===t.memoizedState){var u=t.alternate;if(null!==u){var f=u.memoizedState;if(null!==f){var d=f.dehydrated;null!==d&&Wt(d)}}}break;default:throw Error(o(163))}Ki||512&t.flags&&ac(t)}catch(e){ks(t,t.return,e)}}if(t===e){Ji=null;break}if(null!==(n=t.sibling)){n.return=t.return,Ji=n;break}Ji=t.return}}function Ec(e){for(;null!==Ji;){var t=Ji;if(t===e){Ji=null;break}var n=t.sibling;if(null!==n){n.return=t.return,Ji=n;break}Ji=t.return}}function wc(e){for(;null!==Ji;){var t=Ji;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{rc(4,t)}catch(e){ks(t,n,e)}break;case 1:var r=t.stateNode;if("function"==typeof r.componentDidMount){var a=t.return;try{r.componentDidMount()}catch(e){ks(t,a,e)}}var o=t.return;try{ac(t)}catch(e){ks(t,o,e)}break;case 5:var l=t.return;try{ac(t)}catch(e){ks(t,l,e)}}}catch(e){ks(t,t.return,e)}if(t===e){Ji=null;break}var i=t.sibling;if(null!==i){i.return=t.return,Ji=i;break}Ji=t.return}}var xc,kc=Math.ceil,Sc=y.ReactCurrentDispatcher,Nc=y.ReactCurrentOwner,Cc=y.ReactCurrentBatchConfig,Bc=0,_c=null,Oc=null,Pc=0,jc=0,Mc=ka(0),Tc=0,zc=null,Lc=0,Dc=0,Rc=0,Fc=null,Ic=null,Uc=0,Wc=1/0,Hc=null,$c=!1,qc=null,Vc=null,Gc=!1,Qc=null,Yc=0,Kc=0,Xc=null,Jc=-1,Zc=0;function es(){return 6&Bc?Xe():-1!==Jc?Jc:Jc=Xe()}function ts(e){return 1&e.mode?2&Bc&&0!==Pc?Pc&-Pc:null!==vo.transition?(0===Zc&&(Zc=ht()),Zc):0!==(e=At)?e:e=void 0===(e=window.event)?16:Kt(e.type):1}function ns(e,t,n,r){if(50<Kc)throw Kc=0,Xc=null,Error(o(185));gt(e,n,r),2&Bc&&e===_c||(e===_c&&(!(2&Bc)&&(Dc|=n),4===Tc&&is(e,Pc)),rs(e,r),1===n&&0===Bc&&!(1&t.mode)&&(Wc=Xe()+500,Fa&&Wa()))}function rs(e,t){var n=e.callbackNode;!function(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,a=e.expirationTimes,o=e.pendingLanes;0<o;){var l=31-lt(o),i=1<<l,c=a[l];-1===c?0!==(i&n)&&0===(i&r)||(a[l]=mt(i,t)):c<=t&&(e.expiredLanes|=i),o&=~i}}(e,t);var r=dt(e,e===_c?Pc:0);if(0===r)null!==n&&Qe(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(null!=n&&Qe(n),1===t)0===e.tag?function(e){Fa=!0,Ua(e)}(cs.bind(null,e)):Ua(cs.bind(null,e)),la(function(){!(6&Bc)&&Wa()}),n=null;else{switch(yt(r)){case 1:n=Ze;break;case 4:n=et;break;case 16:default:n=tt;break;case 536870912:n=rt}n=_s(n,as.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function as(e,t){if(Jc=-1,Zc=0,6&Bc)throw Error(o(327));var n=e.callbackNode;if(ws()&&e.callbackNode!==n)return null;var r=dt(e,e===_c?Pc:0);if(0===r)return null;if(30&r||0!==(r&e.expiredLanes)||t)t=vs(e,r);else{t=r;var a=Bc;Bc|=2;var l=ps();for(_c===e&&Pc===t||(Hc=null,Wc=Xe()+500,ds(e,t));;)try{bs();break}catch(t){ms(e,t)}Co(),Sc.current=l,Bc=a,null!==Oc?t=0:(_c=null,Pc=0,t=Tc)}if(0!==t){if(2===t&&0!==(a=pt(e))&&(r=a,t=os(e,a)),1===t)throw n=zc,ds(e,0),is(e,r),rs(e,Xe()),n;if(6===t)is(e,r);else{if(a=e.current.alternate,!(30&r||function(e){for(var t=e;;){if(16384&t.flags){var n=t.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var a=n[r],o=a.getSnapshot;a=a.value;try{if(!ir(o(),a))return!1}catch(e){return!1}}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}(a)||(t=vs(e,r),2===t&&(l=pt(e),0!==l&&(r=l,t=os(e,l))),1!==t)))throw n=zc,ds(e,0),is(e,r),rs(e,Xe()),n;switch(e.finishedWork=a,e.finishedLanes=r,t){case 0:case 1:throw Error(o(345));case 2:case 5:Es(e,Ic,Hc);break;case 3:if(is(e,r),(130023424&r)===r&&10<(t=Uc+500-Xe())){if(0!==dt(e,0))break;if(((a=e.suspendedLanes)&r)!==r){es(),e.pingedLanes|=e.suspendedLanes&a;break}e.timeoutHandle=ra(Es.bind(null,e,Ic,Hc),t);break}Es(e,Ic,Hc);break;case 4:if(is(e,r),(4194240&r)===r)break;for(t=e.eventTimes,a=-1;0<r;){var i=31-lt(r);l=1<<i,(i=t[i])>a&&(a=i),r&=~l}if(r=a,10<(r=(120>(r=Xe()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*kc(r/1960))-r)){e.timeoutHandle=ra(Es.bind(null,e,Ic,Hc),r);break}Es(e,Ic,Hc);break;default:throw Error(o(329))}}}return rs(e,Xe()),e.callbackNode===n?as.bind(null,e):null}function os(e,t){var n=Fc;return e.current.memoizedState.isDehydrated&&(ds(e,t).flags|=256),2!==(e=vs(e,t))&&(t=Ic,Ic=n,null!==t&&ls(t)),e}function ls(e){null===Ic?Ic=e:Ic.push.apply(Ic,e)}function is(e,t){for(t&=~Rc,t&=~Dc,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-lt(t),r=1<<n;e[n]=-1,t&=~r}}function cs(e){if(6&Bc)throw Error(o(327));ws();var t=dt(e,0);if(!(1&t))return rs(e,Xe()),null;var n=vs(e,t);if(0!==e.tag&&2===n){var r=pt(e);0!==r&&(t=r,n=os(e,r))}if(1===n)throw n=zc,ds(e,0),is(e,t),rs(e,Xe()),n;if(6===n)throw Error(o(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Es(e,Ic,Hc),rs(e,Xe()),null}function ss(e,t){var n=Bc;Bc|=1;try{return e(t)}finally{0===(Bc=n)&&(Wc=Xe()+500,Fa&&Wa())}}function us(e){null!==Qc&&0===Qc.tag&&!(6&Bc)&&ws();var t=Bc;Bc|=1;var n=Cc.transition,r=At;try{if(Cc.transition=null,At=1,e)return e()}finally{At=r,Cc.transition=n,!(6&(Bc=t))&&Wa()}}function fs(){jc=Mc.current,Sa(Mc)}function ds(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,aa(n)),null!==Oc)for(n=Oc.return;null!==n;){var r=n;switch(to(r),r.tag){case 1:null!=(r=r.type.childContextTypes)&&Ma();break;case 3:Xo(),Sa(_a),Sa(Ba),rl();break;case 5:Zo(r);break;case 4:Xo();break;case 13:case 19:Sa(el);break;case 10:Bo(r.type._context);break;case 22:case 23:fs()}n=n.return}if(_c=e,Oc=e=Ms(e.current,null),Pc=jc=t,Tc=0,zc=null,Rc=Dc=Lc=0,Ic=Fc=null,null!==jo){for(t=0;t<jo.length;t++)if(null!==(r=(n=jo[t]).interleaved)){n.interleaved=null;var a=r.next,o=n.pending;if(null!==o){var l=o.next;o.next=a,r.next=l}n.pending=r}jo=null}return e}function ms(e,t){for(;;){var n=Oc;try{if(Co(),al.current=Jl,ul){for(var r=il.memoizedState;null!==r;){var a=r.queue;null!==a&&(a.pending=null),r=r.next}ul=!1}if(ll=0,sl=cl=il=null,fl=!1,dl=0,Nc.current=null,null===n||null===n.return){Tc=1,zc=t,Oc=null;break}e:{var l=e,i=n.return,c=n,s=t;if(t=Pc,c.flags|=32768,null!==s&&"object"==typeof s&&"function"==typeof s.then){var u=s,f=c,d=f.tag;if(!(1&f.mode||0!==d&&11!==d&&15!==d)){var m=f.alternate;m?(f.updateQueue=m.updateQueue,f.memoizedState=m.memoizedState,f.lanes=m.lanes):(f.updateQueue=null,f.memoizedState=null)}var p=vi(i);if(null!==p){p.flags&=-257,gi(p,i,c,0,t),1&p.mode&&hi(l,u,t),s=u;var h=(t=p).updateQueue;if(null===h){var v=new Set;v.add(s),t.updateQueue=v}else h.add(s);break e}if(!(1&t)){hi(l,u,t),hs();break e}s=Error(o(426))}else if(ao&&1&c.mode){var g=vi(i);if(null!==g){!(65536&g.flags)&&(g.flags|=256),gi(g,i,c,0,t),ho(si(s,c));break e}}l=s=si(s,c),4!==Tc&&(Tc=2),null===Fc?Fc=[l]:Fc.push(l),l=i;do{switch(l.tag){case 3:l.flags|=65536,t&=-t,l.lanes|=t,Wo(l,mi(0,s,t));break e;case 1:c=s;var b=l.type,A=l.stateNode;if(!(128&l.flags||"function"!=typeof b.getDerivedStateFromError&&(null===A||"function"!=typeof A.componentDidCatch||null!==Vc&&Vc.has(A)))){l.flags|=65536,t&=-t,l.lanes|=t,Wo(l,pi(l,c,t));break e}}l=l.return}while(null!==l)}ys(n)}catch(e){t=e,Oc===n&&null!==n&&(Oc=n=n.return);continue}break}}function ps(){var e=Sc.current;return Sc.current=Jl,null===e?Jl:e}function hs(){0!==Tc&&3!==Tc&&2!==Tc||(Tc=4),null===_c||!(268435455&Lc)&&!(268435455&Dc)||is(_c,Pc)}function vs(e,t){var n=Bc;Bc|=2;var r=ps();for(_c===e&&Pc===t||(Hc=null,ds(e,t));;)try{gs();break}catch(t){ms(e,t)}if(Co(),Bc=n,Sc.current=r,null!==Oc)throw Error(o(261));return _c=null,Pc=0,Tc}function gs(){for(;null!==Oc;)As(Oc)}function bs(){for(;null!==Oc&&!Ye();)As(Oc)}function As(e){var t=xc(e.alternate,e,jc);e.memoizedProps=e.pendingProps,null===t?ys(e):Oc=t,Nc.current=null}function ys(e){var t=e;do{var n=t.alternate;if(e=t.return,32768&t.flags){if(null!==(n=Qi(n,t)))return n.flags&=32767,void(Oc=n);if(null===e)return Tc=6,void(Oc=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}else if(null!==(n=Gi(n,t,jc)))return void(Oc=n);if(null!==(t=t.sibling))return void(Oc=t);Oc=t=e}while(null!==t);0===Tc&&(Tc=5)}function Es(e,t,n){var r=At,a=Cc.transition;try{Cc.transition=null,At=1,function(e,t,n,r){do{ws()}while(null!==Qc);if(6&Bc)throw Error(o(327));n=e.finishedWork;var a=e.finishedLanes;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(o(177));e.callbackNode=null,e.callbackPriority=0;var l=n.lanes|n.childLanes;if(function(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var a=31-lt(n),o=1<<a;t[a]=0,r[a]=-1,e[a]=-1,n&=~o}}(e,l),e===_c&&(Oc=_c=null,Pc=0),!(2064&n.subtreeFlags)&&!(2064&n.flags)||Gc||(Gc=!0,_s(tt,function(){return ws(),null})),l=!!(15990&n.flags),15990&n.subtreeFlags||l){l=Cc.transition,Cc.transition=null;var i=At;At=1;var c=Bc;Bc|=4,Nc.current=null,function(e,t){if(ea=$t,mr(e=dr())){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var a=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch(e){n=null;break e}var i=0,c=-1,s=-1,u=0,f=0,d=e,m=null;t:for(;;){for(var p;d!==n||0!==a&&3!==d.nodeType||(c=i+a),d!==l||0!==r&&3!==d.nodeType||(s=i+r),3===d.nodeType&&(i+=d.nodeValue.length),null!==(p=d.firstChild);)m=d,d=p;for(;;){if(d===e)break t;if(m===n&&++u===a&&(c=i),m===l&&++f===r&&(s=i),null!==(p=d.nextSibling))break;m=(d=m).parentNode}d=p}n=-1===c||-1===s?null:{start:c,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(ta={focusedElem:e,selectionRange:n},$t=!1,Ji=t;null!==Ji;)if(e=(t=Ji).child,1028&t.subtreeFlags&&null!==e)e.return=t,Ji=e;else for(;null!==Ji;){t=Ji;try{var h=t.alternate;if(1024&t.flags)switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==h){var v=h.memoizedProps,g=h.memoizedState,b=t.stateNode,A=b.getSnapshotBeforeUpdate(t.elementType===t.type?v:ni(t.type,v),g);b.__reactInternalSnapshotBeforeUpdate=A}break;case 3:var y=t.stateNode.containerInfo;1===y.nodeType?y.textContent="":9===y.nodeType&&y.documentElement&&y.removeChild(y.documentElement);break;default:throw Error(o(163))}}catch(e){ks(t,t.return,e)}if(null!==(e=t.sibling)){e.return=t.return,Ji=e;break}Ji=t.return}h=tc,tc=!1}(e,n),vc(n,e),pr(ta),$t=!!ea,ta=ea=null,e.current=n,bc(n,e,a),Ke(),Bc=c,At=i,Cc.transition=l}else e.current=n;if(Gc&&(Gc=!1,Qc=e,Yc=a),0===(l=e.pendingLanes)&&(Vc=null),function(e){if(ot&&"function"==typeof ot.onCommitFiberRoot)try{ot.onCommitFiberRoot(at,e,void 0,!(128&~e.current.flags))}catch(e){}}(n.stateNode),rs(e,Xe()),null!==t)for(r=e.onRecoverableError,n=0;n<t.length;n++)r((a=t[n]).value,{componentStack:a.stack,digest:a.digest});if($c)throw $c=!1,e=qc,qc=null,e;!!(1&Yc)&&0!==e.tag&&ws(),1&(l=e.pendingLanes)?e===Xc?Kc++:(Kc=0,Xc=e):Kc=0,Wa()}(e,t,n,r)}finally{Cc.transition=a,At=r}return null}function ws(){if(null!==Qc){var e=yt(Yc),t=Cc.transition,n=At;try{if(Cc.transition=null,At=16>e?16:e,null===Qc)var r=!1;else{if(e=Qc,Qc=null,Yc=0,6&Bc)throw Error(o(331));var a=Bc;for(Bc|=4,Ji=e.current;null!==Ji;){var l=Ji,i=l.child;if(16&Ji.flags){var c=l.deletions;if(null!==c){for(var s=0;s<c.length;s++){var u=c[s];for(Ji=u;null!==Ji;){var f=Ji;switch(f.tag){case 0:case 11:case 15:nc(8,f,l)}var d=f.child;if(null!==d)d.return=f,Ji=d;else for(;null!==Ji;){var m=(f=Ji).sibling,p=f.return;if(oc(f),f===u){Ji=null;break}if(null!==m){m.return=p,Ji=m;break}Ji=p}}}var h=l.alternate;if(null!==h){var v=h.child;if(null!==v){h.child=null;do{var g=v.sibling;v.sibling=null,v=g}while(null!==v)}}Ji=l}}if(2064&l.subtreeFlags&&null!==i)i.return=l,Ji=i;else e:for(;null!==Ji;){if(2048&(l=Ji).flags)switch(l.tag){case 0:case 11:case 15:nc(9,l,l.return)}var b=l.sibling;if(null!==b){b.return=l.return,Ji=b;break e}Ji=l.return}}var A=e.current;for(Ji=A;null!==Ji;){var y=(i=Ji).child;if(2064&i.subtreeFlags&&null!==y)y.return=i,Ji=y;else e:for(i=A;null!==Ji;){if(2048&(c=Ji).flags)try{switch(c.tag){case 0:case 11:case 15:rc(9,c)}}catch(e){ks(c,c.return,e)}if(c===i){Ji=null;break e}var E=c.sibling;if(null!==E){E.return=c.return,Ji=E;break e}Ji=c.return}}if(Bc=a,Wa(),ot&&"function"==typeof ot.onPostCommitFiberRoot)try{ot.onPostCommitFiberRoot(at,e)}catch(e){}r=!0}return r}finally{At=n,Cc.transition=t}}return!1}function xs(e,t,n){e=Io(e,t=mi(0,t=si(n,t),1),1),t=es(),null!==e&&(gt(e,1,t),rs(e,t))}function ks(e,t,n){if(3===e.tag)xs(e,e,n);else for(;null!==t;){if(3===t.tag){xs(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"==typeof t.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Vc||!Vc.has(r))){t=Io(t,e=pi(t,e=si(n,e),1),1),e=es(),null!==t&&(gt(t,1,e),rs(t,e));break}}t=t.return}}function Ss(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=es(),e.pingedLanes|=e.suspendedLanes&n,_c===e&&(Pc&n)===n&&(4===Tc||3===Tc&&(130023424&Pc)===Pc&&500>Xe()-Uc?ds(e,0):Rc|=n),rs(e,t)}function Ns(e,t){0===t&&(1&e.mode?(t=ut,!(130023424&(ut<<=1))&&(ut=4194304)):t=1);var n=es();null!==(e=zo(e,t))&&(gt(e,t,n),rs(e,n))}function Cs(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),Ns(e,n)}function Bs(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,a=e.memoizedState;null!==a&&(n=a.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(o(314))}null!==r&&r.delete(t),Ns(e,n)}function _s(e,t){return Ge(e,t)}function Os(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ps(e,t,n,r){return new Os(e,t,n,r)}function js(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Ms(e,t){var n=e.alternate;return null===n?((n=Ps(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Ts(e,t,n,r,a,l){var i=2;if(r=e,"function"==typeof e)js(e)&&(i=1);else if("string"==typeof e)i=5;else e:switch(e){case x:return zs(n.children,a,l,t);case k:i=8,a|=8;break;case S:return(e=Ps(12,n,t,2|a)).elementType=S,e.lanes=l,e;case _:return(e=Ps(13,n,t,a)).elementType=_,e.lanes=l,e;case O:return(e=Ps(19,n,t,a)).elementType=O,e.lanes=l,e;case M:return Ls(n,a,l,t);default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case N:i=10;break e;case C:i=9;break e;case B:i=11;break e;case P:i=14;break e;case j:i=16,r=null;break e}throw Error(o(130,null==e?e:typeof e,""))}return(t=Ps(i,n,t,a)).elementType=e,t.type=r,t.lanes=l,t}function zs(e,t,n,r){return(e=Ps(7,e,r,t)).lanes=n,e}function Ls(e,t,n,r){return(e=Ps(22,e,r,t)).elementType=M,e.lanes=n,e.stateNode={isHidden:!1},e}function Ds(e,t,n){return(e=Ps(6,e,null,t)).lanes=n,e}function Rs(e,t,n){return(t=Ps(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Fs(e,t,n,r,a){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=vt(0),this.expirationTimes=vt(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=vt(0),this.identifierPrefix=r,this.onRecoverableError=a,this.mutableSourceEagerHydrationData=null}function Is(e,t,n,r,a,o,l,i,c){return e=new Fs(e,t,n,i,c),1===t?(t=1,!0===o&&(t|=8)):t=0,o=Ps(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Do(o),e}function Us(e){if(!e)return Ca;e:{if(We(e=e._reactInternals)!==e||1!==e.tag)throw Error(o(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ja(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(null!==t);throw Error(o(171))}if(1===e.tag){var n=e.type;if(ja(n))return za(e,n,t)}return t}function Ws(e,t,n,r,a,o,l,i,c){return(e=Is(n,r,!0,e,0,o,0,i,c)).context=Us(null),n=e.current,(o=Fo(r=es(),a=ts(n))).callback=null!=t?t:null,Io(n,o,a),e.current.lanes=a,gt(e,a,r),rs(e,r),e}function Hs(e,t,n,r){var a=t.current,o=es(),l=ts(a);return n=Us(n),null===t.context?t.context=n:t.pendingContext=n,(t=Fo(o,l)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),null!==(e=Io(a,t,l))&&(ns(e,a,l,o),Uo(e,a,l)),l}function $s(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function qs(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Vs(e,t){qs(e,t),(e=e.alternate)&&qs(e,t)}xc=function(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps||_a.current)Ai=!0;else{if(0===(e.lanes&n)&&!(128&t.flags))return Ai=!1,function(e,t,n){switch(t.tag){case 3:_i(t),po();break;case 5:Jo(t);break;case 1:ja(t.type)&&La(t);break;case 4:Ko(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,a=t.memoizedProps.value;Na(xo,r._currentValue),r._currentValue=a;break;case 13:if(null!==(r=t.memoizedState))return null!==r.dehydrated?(Na(el,1&el.current),t.flags|=128,null):0!==(n&t.child.childLanes)?Di(e,t,n):(Na(el,1&el.current),null!==(e=$i(e,t,n))?e.sibling:null);Na(el,1&el.current);break;case 19:if(r=0!==(n&t.childLanes),128&e.flags){if(r)return Wi(e,t,n);t.flags|=128}if(null!==(a=t.memoizedState)&&(a.rendering=null,a.tail=null,a.lastEffect=null),Na(el,el.current),r)break;return null;case 22:case 23:return t.lanes=0,ki(e,t,n)}return $i(e,t,n)}(e,t,n);Ai=!!(131072&e.flags)}else Ai=!1,ao&&1048576&t.flags&&Za(t,Va,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Hi(e,t),e=t.pendingProps;var a=Pa(t,Ba.current);Oo(t,n),a=vl(null,t,r,e,a,n);var l=gl();return t.flags|=1,"object"==typeof a&&null!==a&&"function"==typeof a.render&&void 0===a.$$typeof?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ja(r)?(l=!0,La(t)):l=!1,t.memoizedState=null!==a.state&&void 0!==a.state?a.state:null,Do(t),a.updater=ai,t.stateNode=a,a._reactInternals=t,ci(t,r,e,n),t=Bi(null,t,r,!0,l,n)):(t.tag=0,ao&&l&&eo(t),yi(null,t,a,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Hi(e,t),e=t.pendingProps,r=(a=r._init)(r._payload),t.type=r,a=t.tag=function(e){if("function"==typeof e)return js(e)?1:0;if(null!=e){if((e=e.$$typeof)===B)return 11;if(e===P)return 14}return 2}(r),e=ni(r,e),a){case 0:t=Ni(null,t,r,e,n);break e;case 1:t=Ci(null,t,r,e,n);break e;case 11:t=Ei(null,t,r,e,n);break e;case 14:t=wi(null,t,r,ni(r.type,e),n);break e}throw Error(o(306,r,""))}return t;case 0:return r=t.type,a=t.pendingProps,Ni(e,t,r,a=t.elementType===r?a:ni(r,a),n);case 1:return r=t.type,a=t.pendingProps,Ci(e,t,r,a=t.elementType===r?a:ni(r,a),n);case 3:e:{if(_i(t),null===e)throw Error(o(387));r=t.pendingProps,a=(l=t.memoizedState).element,Ro(e,t),Ho(t,r,null,n);var i=t.memoizedState;if(r=i.element,l.isDehydrated){if(l={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=l,t.memoizedState=l,256&t.flags){t=Oi(e,t,r,n,a=si(Error(o(423)),t));break e}if(r!==a){t=Oi(e,t,r,n,a=si(Error(o(424)),t));break e}for(ro=sa(t.stateNode.containerInfo.firstChild),no=t,ao=!0,oo=null,n=wo(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(po(),r===a){t=$i(e,t,n);break e}yi(e,t,r,n)}t=t.child}return t;case 5:return Jo(t),null===e&&so(t),r=t.type,a=t.pendingProps,l=null!==e?e.memoizedProps:null,i=a.children,na(r,a)?i=null:null!==l&&na(r,l)&&(t.flags|=32),Si(e,t),yi(e,t,i,n),t.child;case 6:return null===e&&so(t),null;case 13:return Di(e,t,n);case 4:return Ko(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=Eo(t,null,r,n):yi(e,t,r,n),t.child;case 11:return r=t.type,a=t.pendingProps,Ei(e,t,r,a=t.elementType===r?a:ni(r,a),n);case 7:return yi(e,t,t.pendingProps,n),t.child;case 8:case 12:return yi(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,a=t.pendingProps,l=t.memoizedProps,i=a.value,Na(xo,r._currentValue),r._currentValue=i,null!==l)if(ir(l.value,i)){if(l.children===a.children&&!_a.current){t=$i(e,t,n);break e}}else for(null!==(l=t.child)&&(l.return=t);null!==l;){var c=l.dependencies;if(null!==c){i=l.child;for(var s=c.firstContext;null!==s;){if(s.context===r){if(1===l.tag){(s=Fo(-1,n&-n)).tag=2;var u=l.updateQueue;if(null!==u){var f=(u=u.shared).pending;null===f?s.next=s:(s.next=f.next,f.next=s),u.pending=s}}l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),_o(l.return,n,t),c.lanes|=n;break}s=s.next}}else if(10===l.tag)i=l.type===t.type?null:l.child;else if(18===l.tag){if(null===(i=l.return))throw Error(o(341));i.lanes|=n,null!==(c=i.alternate)&&(c.lanes|=n),_o(i,n,t),i=l.sibling}else i=l.child;if(null!==i)i.return=l;else for(i=l;null!==i;){if(i===t){i=null;break}if(null!==(l=i.sibling)){l.return=i.return,i=l;break}i=i.return}l=i}yi(e,t,a.children,n),t=t.child}return t;case 9:return a=t.type,r=t.pendingProps.children,Oo(t,n),r=r(a=Po(a)),t.flags|=1,yi(e,t,r,n),t.child;case 14:return a=ni(r=t.type,t.pendingProps),wi(e,t,r,a=ni(r.type,a),n);case 15:return xi(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,a=t.pendingProps,a=t.elementType===r?a:ni(r,a),Hi(e,t),t.tag=1,ja(r)?(e=!0,La(t)):e=!1,Oo(t,n),li(t,r,a),ci(t,r,a,n),Bi(null,t,r,!0,e,n);case 19:return Wi(e,t,n);case 22:return ki(e,t,n)}throw Error(o(156,t.tag))};var Gs="function"==typeof reportError?reportError:function(e){console.error(e)};function Qs(e){this._internalRoot=e}function Ys(e){this._internalRoot=e}function Ks(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Xs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Js(){}function Zs(e,t,n,r,a){var o=n._reactRootContainer;if(o){var l=o;if("function"==typeof a){var i=a;a=function(){var e=$s(l);i.call(e)}}Hs(t,l,e,a)}else l=function(e,t,n,r,a){if(a){if("function"==typeof r){var o=r;r=function(){var e=$s(l);o.call(e)}}var l=Ws(t,r,e,0,null,!1,0,"",Js);return e._reactRootContainer=l,e[pa]=l.current,Wr(8===e.nodeType?e.parentNode:e),us(),l}for(;a=e.lastChild;)e.removeChild(a);if("function"==typeof r){var i=r;r=function(){var e=$s(c);i.call(e)}}var c=Is(e,0,!1,null,0,!1,0,"",Js);return e._reactRootContainer=c,e[pa]=c.current,Wr(8===e.nodeType?e.parentNode:e),us(function(){Hs(t,c,n,r)}),c}(n,t,e,a,r);return $s(l)}Ys.prototype.render=Qs.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));Hs(e,t,null,null)},Ys.prototype.unmount=Qs.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;us(function(){Hs(null,e,null,null)}),t[pa]=null}},Ys.prototype.unstable_scheduleHydration=function(e){if(e){var t=kt();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Mt.length&&0!==t&&t<Mt[n].priority;n++);Mt.splice(n,0,e),0===n&&Dt(e)}},Et=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=ft(t.pendingLanes);0!==n&&(bt(t,1|n),rs(t,Xe()),!(6&Bc)&&(Wc=Xe()+500,Wa()))}break;case 13:us(function(){var t=zo(e,1);if(null!==t){var n=es();ns(t,e,1,n)}}),Vs(e,1)}},wt=function(e){if(13===e.tag){var t=zo(e,134217728);null!==t&&ns(t,e,134217728,es()),Vs(e,134217728)}},xt=function(e){if(13===e.tag){var t=ts(e),n=zo(e,t);null!==n&&ns(n,e,t,es()),Vs(e,t)}},kt=function(){return At},St=function(e,t){var n=At;try{return At=e,t()}finally{At=n}},we=function(e,t,n){switch(t){case"input":if(J(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var a=Ea(r);if(!a)throw Error(o(90));G(r),J(r,a)}}}break;case"textarea":oe(e,n);break;case"select":null!=(t=n.value)&&ne(e,!!n.multiple,t,!1)}},Be=ss,_e=us;var eu={usingClientEntryPoint:!1,Events:[Aa,ya,Ea,Ne,Ce,ss]},tu={findFiberByHostInstance:ba,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},nu={bundleType:tu.bundleType,version:tu.version,rendererPackageName:tu.rendererPackageName,rendererConfig:tu.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:y.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=qe(e))?null:e.stateNode},findFiberByHostInstance:tu.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var ru=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ru.isDisabled&&ru.supportsFiber)try{at=ru.inject(nu),ot=ru}catch(ue){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=eu,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Ks(t))throw Error(o(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:w,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.createRoot=function(e,t){if(!Ks(e))throw Error(o(299));var n=!1,r="",a=Gs;return null!=t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onRecoverableError&&(a=t.onRecoverableError)),t=Is(e,1,!1,null,0,n,0,r,a),e[pa]=t.current,Wr(8===e.nodeType?e.parentNode:e),new Qs(t)},t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"==typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return null===(e=qe(t))?null:e.stateNode},t.flushSync=function(e){return us(e)},t.hydrate=function(e,t,n){if(!Xs(t))throw Error(o(200));return Zs(null,e,t,!0,n)},t.hydrateRoot=function(e,t,n){if(!Ks(e))throw Error(o(405));var r=null!=n&&n.hydratedSources||null,a=!1,l="",i=Gs;if(null!=n&&(!0===n.unstable_strictMode&&(a=!0),void 0!==n.identifierPrefix&&(l=n.identifierPrefix),void 0!==n.onRecoverableError&&(i=n.onRecoverableError)),t=Ws(t,null,e,1,null!=n?n:null,a,0,l,i),e[pa]=t.current,Wr(e),r)for(e=0;e<r.length;e++)a=(a=(n=r[e])._getVersion)(n._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[n,a]:t.mutableSourceEagerHydrationData.push(n,a);return new Ys(t)},t.render=function(e,t,n){if(!Xs(t))throw Error(o(200));return Zs(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Xs(e))throw Error(o(40));return!!e._reactRootContainer&&(us(function(){Zs(null,null,e,!1,function(){e._reactRootContainer=null,e[pa]=null})}),!0)},t.unstable_batchedUpdates=ss,t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Xs(n))throw Error(o(200));if(null==e||void 0===e._reactInternals)throw Error(o(38));return Zs(e,t,n,!1,r)},t.version="18.3.1-next-f1338f8080-20240426"},659:e=>{var t={};e.exports=function(e,n){var r=function(e){if(void 0===t[e]){var n=document.querySelector(e);if(window.HTMLIFrameElement&&n instanceof window.HTMLIFrameElement)try{n=n.contentDocument.head}catch(e){n=null}t[e]=n}return t[e]}(e);if(!r)throw new Error("Couldn't find a style target. This probably means that the value for the 'insert' parameter is invalid.");r.appendChild(n)}},825:e=>{e.exports=function(e){if("undefined"==typeof document)return{update:function(){},remove:function(){}};var t=e.insertStyleElement(e);return{update:function(n){!function(e,t,n){var r="";n.supports&&(r+="@supports (".concat(n.supports,") {")),n.media&&(r+="@media ".concat(n.media," {"));var a=void 0!==n.layer;a&&(r+="@layer".concat(n.layer.length>0?" ".concat(n.layer):""," {")),r+=n.css,a&&(r+="}"),n.media&&(r+="}"),n.supports&&(r+="}");var o=n.sourceMap;o&&"undefined"!=typeof btoa&&(r+="\n/*# sourceMappingURL=data:application/json;base64,".concat(btoa(unescape(encodeURIComponent(JSON.stringify(o))))," */")),t.styleTagTransform(r,e,t.options)}(t,e,n)},remove:function(){!function(e){if(null===e.parentNode)return!1;e.parentNode.removeChild(e)}(t)}}}},956:(e,t,n)=>{n.d(t,{A:()=>i});var r=n(354),a=n.n(r),o=n(314),l=n.n(o)()(a());l.push([e.id,"*, ::before, ::after {\n  --tw-border-spacing-x: 0;\n  --tw-border-spacing-y: 0;\n  --tw-translate-x: 0;\n  --tw-translate-y: 0;\n  --tw-rotate: 0;\n  --tw-skew-x: 0;\n  --tw-skew-y: 0;\n  --tw-scale-x: 1;\n  --tw-scale-y: 1;\n  --tw-pan-x:  ;\n  --tw-pan-y:  ;\n  --tw-pinch-zoom:  ;\n  --tw-scroll-snap-strictness: proximity;\n  --tw-gradient-from-position:  ;\n  --tw-gradient-via-position:  ;\n  --tw-gradient-to-position:  ;\n  --tw-ordinal:  ;\n  --tw-slashed-zero:  ;\n  --tw-numeric-figure:  ;\n  --tw-numeric-spacing:  ;\n  --tw-numeric-fraction:  ;\n  --tw-ring-inset:  ;\n  --tw-ring-offset-width: 0px;\n  --tw-ring-offset-color: #fff;\n  --tw-ring-color: rgb(59 130 246 / 0.5);\n  --tw-ring-offset-shadow: 0 0 #0000;\n  --tw-ring-shadow: 0 0 #0000;\n  --tw-shadow: 0 0 #0000;\n  --tw-shadow-colored: 0 0 #0000;\n  --tw-blur:  ;\n  --tw-brightness:  ;\n  --tw-contrast:  ;\n  --tw-grayscale:  ;\n  --tw-hue-rotate:  ;\n  --tw-invert:  ;\n  --tw-saturate:  ;\n  --tw-sepia:  ;\n  --tw-drop-shadow:  ;\n  --tw-backdrop-blur:  ;\n  --tw-backdrop-brightness:  ;\n  --tw-backdrop-contrast:  ;\n  --tw-backdrop-grayscale:  ;\n  --tw-backdrop-hue-rotate:  ;\n  --tw-backdrop-invert:  ;\n  --tw-backdrop-opacity:  ;\n  --tw-backdrop-saturate:  ;\n  --tw-backdrop-sepia:  ;\n  --tw-contain-size:  ;\n  --tw-contain-layout:  ;\n  --tw-contain-paint:  ;\n  --tw-contain-style:  ;\n}\n\n::backdrop {\n  --tw-border-spacing-x: 0;\n  --tw-border-spacing-y: 0;\n  --tw-translate-x: 0;\n  --tw-translate-y: 0;\n  --tw-rotate: 0;\n  --tw-skew-x: 0;\n  --tw-skew-y: 0;\n  --tw-scale-x: 1;\n  --tw-scale-y: 1;\n  --tw-pan-x:  ;\n  --tw-pan-y:  ;\n  --tw-pinch-zoom:  ;\n  --tw-scroll-snap-strictness: proximity;\n  --tw-gradient-from-position:  ;\n  --tw-gradient-via-position:  ;\n  --tw-gradient-to-position:  ;\n  --tw-ordinal:  ;\n  --tw-slashed-zero:  ;\n  --tw-numeric-figure:  ;\n  --tw-numeric-spacing:  ;\n  --tw-numeric-fraction:  ;\n  --tw-ring-inset:  ;\n  --tw-ring-offset-width: 0px;\n  --tw-ring-offset-color: #fff;\n  --tw-ring-color: rgb(59 130 246 / 0.5);\n  --tw-ring-offset-shadow: 0 0 #0000;\n  --tw-ring-shadow: 0 0 #0000;\n  --tw-shadow: 0 0 #0000;\n  --tw-shadow-colored: 0 0 #0000;\n  --tw-blur:  ;\n  --tw-brightness:  ;\n  --tw-contrast:  ;\n  --tw-grayscale:  ;\n  --tw-hue-rotate:  ;\n  --tw-invert:  ;\n  --tw-saturate:  ;\n  --tw-sepia:  ;\n  --tw-drop-shadow:  ;\n  --tw-backdrop-blur:  ;\n  --tw-backdrop-brightness:  ;\n  --tw-backdrop-contrast:  ;\n  --tw-backdrop-grayscale:  ;\n  --tw-backdrop-hue-rotate:  ;\n  --tw-backdrop-invert:  ;\n  --tw-backdrop-opacity:  ;\n  --tw-backdrop-saturate:  ;\n  --tw-backdrop-sepia:  ;\n  --tw-contain-size:  ;\n  --tw-contain-layout:  ;\n  --tw-contain-paint:  ;\n  --tw-contain-style:  ;\n}/*\n! tailwindcss v3.4.19 | MIT License | https://tailwindcss.com\n*//*\n1. Prevent padding and border from affecting element width. (https://github.com/mozdevs/cssremedy/issues/4)\n2. Allow adding a border to an element by just adding a border-width. (https://github.com/tailwindcss/tailwindcss/pull/116)\n*/\n\n*,\n::before,\n::after {\n  box-sizing: border-box; /* 1 */\n  border-width: 0; /* 2 */\n  border-style: solid; /* 2 */\n  border-color: #e5e7eb; /* 2 */\n}\n\n::before,\n::after {\n  --tw-content: '';\n}\n\n/*\n1. Use a consistent sensible line-height in all browsers.\n2. Prevent adjustments of font size after orientation changes in iOS.\n3. Use a more readable tab size.\n4. Use the user's configured `sans` font-family by default.\n5. Use the user's configured `sans` font-feature-settings by default.\n6. Use the user's configured `sans` font-variation-settings by default.\n7. Disable tap highlights on iOS\n*/\n\nhtml,\n:host {\n  line-height: 1.5; /* 1 */\n  -webkit-text-size-adjust: 100%; /* 2 */\n  -moz-tab-size: 4; /* 3 */\n  -o-tab-size: 4;\n     tab-size: 4; /* 3 */\n  font-family: ui-sans-serif, system-ui, sans-serif, \"Apple Color Emoji\", \"Segoe UI Emoji\", \"Segoe UI Symbol\", \"Noto Color Emoji\"; /* 4 */\n  font-feature-settings: normal; /* 5 */\n  font-variation-settings: normal; /* 6 */\n  -webkit-tap-highlight-color: transparent; /* 7 */\n}\n\n/*\n1. Remove the margin in all browsers.\n2. Inherit line-height from `html` so users can set them as a class directly on the `html` element.\n*/\n\nbody {\n  margin: 0; /* 1 */\n  line-height: inherit; /* 2 */\n}\n\n/*\n1. Add the correct height in Firefox.\n2. Correct the inheritance of border color in Firefox. (https://bugzilla.mozilla.org/show_bug.cgi?id=190655)\n3. Ensure horizontal rules are visible by default.\n*/\n\nhr {\n  height: 0; /* 1 */\n  color: inherit; /* 2 */\n  border-top-width: 1px; /* 3 */\n}\n\n/*\nAdd the correct text decoration in Chrome, Edge, and Safari.\n*/\n\nabbr:where([title]) {\n  -webkit-text-decoration: underline dotted;\n          text-decoration: underline dotted;\n}\n\n/*\nRemove the default font size and weight for headings.\n*/\n\nh1,\nh2,\nh3,\nh4,\nh5,\nh6 {\n  font-size: inherit;\n  font-weight: inherit;\n}\n\n/*\nReset links to optimize for opt-in styling instead of opt-out.\n*/\n\na {\n  color: inherit;\n  text-decoration: inherit;\n}\n\n/*\nAdd the correct font weight in Edge and Safari.\n*/\n\nb,\nstrong {\n  font-weight: bolder;\n}\n\n/*\n1. Use the user's configured `mono` font-family by default.\n2. Use the user's configured `mono` font-feature-settings by default.\n3. Use the user's configured `mono` font-variation-settings by default.\n4. Correct the odd `em` font sizing in all browsers.\n*/\n\ncode,\nkbd,\nsamp,\npre {\n  font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, \"Liberation Mono\", \"Courier New\", monospace; /* 1 */\n  font-feature-settings: normal; /* 2 */\n  font-variation-settings: normal; /* 3 */\n  font-size: 1em; /* 4 */\n}\n\n/*\nAdd the correct font size in all browsers.\n*/\n\nsmall {\n  font-size: 80%;\n}\n\n/*\nPrevent `sub` and `sup` elements from affecting the line height in all browsers.\n*/\n\nsub,\nsup {\n  font-size: 75%;\n  line-height: 0;\n  position: relative;\n  vertical-align: baseline;\n}\n\nsub {\n  bottom: -0.25em;\n}\n\nsup {\n  top: -0.5em;\n}\n\n/*\n1. Remove text indentation from table contents in Chrome and Safari. (https://bugs.chromium.org/p/chromium/issues/detail?id=999088, https://bugs.webkit.org/show_bug.cgi?id=201297)\n2. Correct table border color inheritance in all Chrome and Safari. (https://bugs.chromium.org/p/chromium/issues/detail?id=935729, https://bugs.webkit.org/show_bug.cgi?id=195016)\n3. Remove gaps between table borders by default.\n*/\n\ntable {\n  text-indent: 0; /* 1 */\n  border-color: inherit; /* 2 */\n  border-collapse: collapse; /* 3 */\n}\n\n/*\n1. Change the font styles in all browsers.\n2. Remove the margin in Firefox and Safari.\n3. Remove default padding in all browsers.\n*/\n\nbutton,\ninput,\noptgroup,\nselect,\ntextarea {\n  font-family: inherit; /* 1 */\n  font-feature-settings: inherit; /* 1 */\n  font-variation-settings: inherit; /* 1 */\n  font-size: 100%; /* 1 */\n  font-weight: inherit; /* 1 */\n  line-height: inherit; /* 1 */\n  letter-spacing: inherit; /* 1 */\n  color: inherit; /* 1 */\n  margin: 0; /* 2 */\n  padding: 0; /* 3 */\n}\n\n/*\nRemove the inheritance of text transform in Edge and Firefox.\n*/\n\nbutton,\nselect {\n  text-transform: none;\n}\n\n/*\n1. Correct the inability to style clickable types in iOS and Safari.\n2. Remove default button styles.\n*/\n\nbutton,\ninput:where([type='button']),\ninput:where([type='reset']),\ninput:where([type='submit']) {\n  -webkit-appearance: button; /* 1 */\n  background-color: transparent; /* 2 */\n  background-image: none; /* 2 */\n}\n\n/*\nUse the modern Firefox focus style for all focusable elements.\n*/\n\n:-moz-focusring {\n  outline: auto;\n}\n\n/*\nRemove the additional `:invalid` styles in Firefox. (https://github.com/mozilla/gecko-dev/blob/2f9eacd9d3d995c937b4251a5557d95d494c9be1/layout/style/res/forms.css#L728-L737)\n*/\n\n:-moz-ui-invalid {\n  box-shadow: none;\n}\n\n/*\nAdd the correct vertical alignment in Chrome and Firefox.\n*/\n\nprogress {\n  vertical-align: baseline;\n}\n\n/*\nCorrect the cursor style of increment and decrement buttons in Safari.\n*/\n\n::-webkit-inner-spin-button,\n::-webkit-outer-spin-button {\n  height: auto;\n}\n\n/*\n1. Correct the odd appearance in Chrome and Safari.\n2. Correct the outline style in Safari.\n*/\n\n[type='search'] {\n  -webkit-appearance: textfield; /* 1 */\n  outline-offset: -2px; /* 2 */\n}\n\n/*\nRemove the inner padding in Chrome and Safari on macOS.\n*/\n\n::-webkit-search-decoration {\n  -webkit-appearance: none;\n}\n\n/*\n1. Correct the inability to style clickable types in iOS and Safari.\n2. Change font properties to `inherit` in Safari.\n*/\n\n::-webkit-file-upload-button {\n  -webkit-appearance: button; /* 1 */\n  font: inherit; /* 2 */\n}\n\n/*\nAdd the correct display in Chrome and Safari.\n*/\n\nsummary {\n  display: list-item;\n}\n\n/*\nRemoves the default spacing and border for appropriate elements.\n*/\n\nblockquote,\ndl,\ndd,\nh1,\nh2,\nh3,\nh4,\nh5,\nh6,\nhr,\nfigure,\np,\npre {\n  margin: 0;\n}\n\nfieldset {\n  margin: 0;\n  padding: 0;\n}\n\nlegend {\n  padding: 0;\n}\n\nol,\nul,\nmenu {\n  list-style: none;\n  margin: 0;\n  padding: 0;\n}\n\n/*\nReset default styling for dialogs.\n*/\ndialog {\n  padding: 0;\n}\n\n/*\nPrevent resizing textareas horizontally by default.\n*/\n\ntextarea {\n  resize: vertical;\n}\n\n/*\n1. Reset the default placeholder opacity in Firefox. (https://github.com/tailwindlabs/tailwindcss/issues/3300)\n2. Set the default placeholder color to the user's configured gray 400 color.\n*/\n\ninput::-moz-placeholder, textarea::-moz-placeholder {\n  opacity: 1; /* 1 */\n  color: #9ca3af; /* 2 */\n}\n\ninput::placeholder,\ntextarea::placeholder {\n  opacity: 1; /* 1 */\n  color: #9ca3af; /* 2 */\n}\n\n/*\nSet the default cursor for buttons.\n*/\n\nbutton,\n[role=\"button\"] {\n  cursor: pointer;\n}\n\n/*\nMake sure disabled buttons don't get the pointer cursor.\n*/\n:disabled {\n  cursor: default;\n}\n\n/*\n1. Make replaced elements `display: block` by default. (https://github.com/mozdevs/cssremedy/issues/14)\n2. Add `vertical-align: middle` to align replaced elements more sensibly by default. (https://github.com/jensimmons/cssremedy/issues/14#issuecomment-634934210)\n   This can trigger a poorly considered lint error in some tools but is included by design.\n*/\n\nimg,\nsvg,\nvideo,\ncanvas,\naudio,\niframe,\nembed,\nobject {\n  display: block; /* 1 */\n  vertical-align: middle; /* 2 */\n}\n\n/*\nConstrain images and videos to the parent width and preserve their intrinsic aspect ratio. (https://github.com/mozdevs/cssremedy/issues/14)\n*/\n\nimg,\nvideo {\n  max-width: 100%;\n  height: auto;\n}\n\n/* Make elements with the HTML hidden attribute stay hidden by default */\n[hidden]:where(:not([hidden=\"until-found\"])) {\n  display: none;\n}\n\n/* Global styles for Minimal Server Manager */\n\n* {\n  margin: 0;\n  padding: 0;\n  box-sizing: border-box;\n}\n\nbody {\n  -webkit-font-smoothing: antialiased;\n  -moz-osx-font-smoothing: grayscale;\n  background-color: #f8fafc;\n  color: #1e293b;\n}\n\n.app-container {\n  display: flex;\n  flex-direction: column;\n  height: 100vh;\n  width: 100vw;\n}\n\n.main-content {\n  display: flex;\n  flex: 1;\n  overflow: hidden;\n}\n\n.content-area {\n  flex: 1;\n  padding: 1.5rem;\n  overflow-y: auto;\n  background-color: #f8fafc;\n}\n\n/* Navigation styles */\n.navbar {\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n  color: white;\n  padding: 1rem 1.5rem;\n  display: flex;\n  justify-content: between;\n  align-items: center;\n  box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);\n}\n\n.navbar-brand {\n  font-size: 1.5rem;\n  font-weight: bold;\n  color: white;\n  text-decoration: none;\n}\n\n.navbar-actions {\n  display: flex;\n  gap: 1rem;\n  align-items: center;\n}\n\n/* Sidebar styles */\n.sidebar {\n  width: 250px;\n  background-color: #1e293b;\n  color: white;\n  padding: 1.5rem 0;\n  overflow-y: auto;\n  box-shadow: 2px 0 10px rgba(0, 0, 0, 0.1);\n}\n\n.sidebar-nav {\n  list-style: none;\n}\n\n.sidebar-nav li {\n  margin: 0.5rem 0;\n}\n\n.sidebar-nav a {\n  display: flex;\n  align-items: center;\n  padding: 0.75rem 1.5rem;\n  color: #cbd5e1;\n  text-decoration: none;\n  transition: all 0.2s ease;\n}\n\n.sidebar-nav a:hover,\n.sidebar-nav a.active {\n  background-color: #334155;\n  color: white;\n  border-right: 3px solid #667eea;\n}\n\n.sidebar-nav a i {\n  margin-right: 0.75rem;\n  width: 20px;\n  text-align: center;\n}\n\n/* Card styles */\n.card {\n  background: white;\n  border-radius: 0.5rem;\n  box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);\n  padding: 1.5rem;\n  margin-bottom: 1.5rem;\n}\n\n.card-header {\n  display: flex;\n  justify-content: between;\n  align-items: center;\n  margin-bottom: 1rem;\n  padding-bottom: 0.75rem;\n  border-bottom: 1px solid #e2e8f0;\n}\n\n.card-title {\n  font-size: 1.25rem;\n  font-weight: 600;\n  color: #1e293b;\n}\n\n.card-actions {\n  display: flex;\n  gap: 0.5rem;\n}\n\n/* Button styles */\n.btn {\n  display: inline-flex;\n  align-items: center;\n  justify-content: center;\n  padding: 0.5rem 1rem;\n  border-radius: 0.375rem;\n  font-size: 0.875rem;\n  font-weight: 500;\n  text-decoration: none;\n  border: none;\n  cursor: pointer;\n  transition: all 0.2s ease;\n}\n\n.btn-primary {\n  background-color: #667eea;\n  color: white;\n}\n\n.btn-primary:hover {\n  background-color: #5a67d8;\n}\n\n.btn-secondary {\n  background-color: #6b7280;\n  color: white;\n}\n\n.btn-secondary:hover {\n  background-color: #4b5563;\n}\n\n.btn-success {\n  background-color: #10b981;\n  color: white;\n}\n\n.btn-success:hover {\n  background-color: #059669;\n}\n\n.btn-danger {\n  background-color: #ef4444;\n  color: white;\n}\n\n.btn-danger:hover {\n  background-color: #dc2626;\n}\n\n.btn-sm {\n  padding: 0.25rem 0.75rem;\n  font-size: 0.75rem;\n}\n\n.btn-lg {\n  padding: 0.75rem 1.5rem;\n  font-size: 1rem;\n}\n\n/* Form styles */\n.form-group {\n  margin-bottom: 1rem;\n}\n\n.form-label {\n  display: block;\n  margin-bottom: 0.5rem;\n  font-weight: 500;\n  color: #374151;\n}\n\n.form-input {\n  width: 100%;\n  padding: 0.5rem 0.75rem;\n  border: 1px solid #d1d5db;\n  border-radius: 0.375rem;\n  font-size: 0.875rem;\n  transition: border-color 0.2s ease;\n}\n\n.form-input:focus {\n  outline: none;\n  border-color: #667eea;\n  box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);\n}\n\n.form-select {\n  width: 100%;\n  padding: 0.5rem 0.75rem;\n  border: 1px solid #d1d5db;\n  border-radius: 0.375rem;\n  font-size: 0.875rem;\n  background-color: white;\n}\n\n.form-textarea {\n  width: 100%;\n  padding: 0.5rem 0.75rem;\n  border: 1px solid #d1d5db;\n  border-radius: 0.375rem;\n  font-size: 0.875rem;\n  resize: vertical;\n  min-height: 100px;\n}\n\n/* Table styles */\n.table {\n  width: 100%;\n  border-collapse: collapse;\n  margin-top: 1rem;\n}\n\n.table th,\n.table td {\n  padding: 0.75rem;\n  text-align: left;\n  border-bottom: 1px solid #e2e8f0;\n}\n\n.table th {\n  background-color: #f8fafc;\n  font-weight: 600;\n  color: #374151;\n}\n\n.table tbody tr:hover {\n  background-color: #f8fafc;\n}\n\n/* Status badges */\n.status-badge {\n  display: inline-flex;\n  align-items: center;\n  padding: 0.25rem 0.75rem;\n  border-radius: 9999px;\n  font-size: 0.75rem;\n  font-weight: 500;\n}\n\n.status-online {\n  background-color: #dcfce7;\n  color: #166534;\n}\n\n.status-offline {\n  background-color: #fee2e2;\n  color: #991b1b;\n}\n\n.status-active {\n  background-color: #dbeafe;\n  color: #1e40af;\n}\n\n.status-inactive {\n  background-color: #f3f4f6;\n  color: #374151;\n}\n\n/* Alert styles */\n.alert {\n  padding: 1rem;\n  border-radius: 0.375rem;\n  margin-bottom: 1rem;\n}\n\n.alert-success {\n  background-color: #dcfce7;\n  color: #166534;\n  border: 1px solid #bbf7d0;\n}\n\n.alert-error {\n  background-color: #fee2e2;\n  color: #991b1b;\n  border: 1px solid #fecaca;\n}\n\n.alert-warning {\n  background-color: #fef3c7;\n  color: #92400e;\n  border: 1px solid #fde68a;\n}\n\n.alert-info {\n  background-color: #dbeafe;\n  color: #1e40af;\n  border: 1px solid #bfdbfe;\n}\n\n/* Loading spinner */\n.spinner {\n  display: inline-block;\n  width: 20px;\n  height: 20px;\n  border: 3px solid #f3f3f3;\n  border-top: 3px solid #667eea;\n  border-radius: 50%;\n  animation: spin 1s linear infinite;\n}\n\n@keyframes spin {\n  0% { transform: rotate(0deg); }\n  100% { transform: rotate(360deg); }\n}\n\n/* Custom component styles that extend TailwindCSS */\n\n/* Loading spinner animation */\n@keyframes spin {\n  0% { transform: rotate(0deg); }\n  100% { transform: rotate(360deg); }\n}\n\n.spinner {\n  display: inline-block;\n  width: 20px;\n  height: 20px;\n  border: 3px solid #f3f3f3;\n  border-top: 3px solid #667eea;\n  border-radius: 50%;\n  animation: spin 1s linear infinite;\n}\n\n/* Custom gradient backgrounds */\n.gradient-primary {\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n}\n\n.gradient-success {\n  background: linear-gradient(135deg, #10b981 0%, #059669 100%);\n}\n\n.gradient-danger {\n  background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);\n}\n\n/* Custom scrollbar styles */\n.custom-scrollbar::-webkit-scrollbar {\n  width: 6px;\n}\n\n.custom-scrollbar::-webkit-scrollbar-track {\n  background: #f1f5f9;\n}\n\n.custom-scrollbar::-webkit-scrollbar-thumb {\n  background: #cbd5e1;\n  border-radius: 3px;\n}\n\n.custom-scrollbar::-webkit-scrollbar-thumb:hover {\n  background: #94a3b8;\n}","",{version:3,sources:["webpack://./src/styles/global.css"],names:[],mappings:"AAAA;EAAA,wBAAc;EAAd,wBAAc;EAAd,mBAAc;EAAd,mBAAc;EAAd,cAAc;EAAd,cAAc;EAAd,cAAc;EAAd,eAAc;EAAd,eAAc;EAAd,aAAc;EAAd,aAAc;EAAd,kBAAc;EAAd,sCAAc;EAAd,8BAAc;EAAd,6BAAc;EAAd,4BAAc;EAAd,eAAc;EAAd,oBAAc;EAAd,sBAAc;EAAd,uBAAc;EAAd,wBAAc;EAAd,kBAAc;EAAd,2BAAc;EAAd,4BAAc;EAAd,sCAAc;EAAd,kCAAc;EAAd,2BAAc;EAAd,sBAAc;EAAd,8BAAc;EAAd,YAAc;EAAd,kBAAc;EAAd,gBAAc;EAAd,iBAAc;EAAd,kBAAc;EAAd,cAAc;EAAd,gBAAc;EAAd,aAAc;EAAd,mBAAc;EAAd,qBAAc;EAAd,2BAAc;EAAd,yBAAc;EAAd,0BAAc;EAAd,2BAAc;EAAd,uBAAc;EAAd,wBAAc;EAAd,yBAAc;EAAd,sBAAc;EAAd,oBAAc;EAAd,sBAAc;EAAd,qBAAc;EAAd;AAAc;;AAAd;EAAA,wBAAc;EAAd,wBAAc;EAAd,mBAAc;EAAd,mBAAc;EAAd,cAAc;EAAd,cAAc;EAAd,cAAc;EAAd,eAAc;EAAd,eAAc;EAAd,aAAc;EAAd,aAAc;EAAd,kBAAc;EAAd,sCAAc;EAAd,8BAAc;EAAd,6BAAc;EAAd,4BAAc;EAAd,eAAc;EAAd,oBAAc;EAAd,sBAAc;EAAd,uBAAc;EAAd,wBAAc;EAAd,kBAAc;EAAd,2BAAc;EAAd,4BAAc;EAAd,sCAAc;EAAd,kCAAc;EAAd,2BAAc;EAAd,sBAAc;EAAd,8BAAc;EAAd,YAAc;EAAd,kBAAc;EAAd,gBAAc;EAAd,iBAAc;EAAd,kBAAc;EAAd,cAAc;EAAd,gBAAc;EAAd,aAAc;EAAd,mBAAc;EAAd,qBAAc;EAAd,2BAAc;EAAd,yBAAc;EAAd,0BAAc;EAAd,2BAAc;EAAd,uBAAc;EAAd,wBAAc;EAAd,yBAAc;EAAd,sBAAc;EAAd,oBAAc;EAAd,sBAAc;EAAd,qBAAc;EAAd;AAAc,CAAd;;CAAc,CAAd;;;CAAc;;AAAd;;;EAAA,sBAAc,EAAd,MAAc;EAAd,eAAc,EAAd,MAAc;EAAd,mBAAc,EAAd,MAAc;EAAd,qBAAc,EAAd,MAAc;AAAA;;AAAd;;EAAA,gBAAc;AAAA;;AAAd;;;;;;;;CAAc;;AAAd;;EAAA,gBAAc,EAAd,MAAc;EAAd,8BAAc,EAAd,MAAc;EAAd,gBAAc,EAAd,MAAc;EAAd,cAAc;KAAd,WAAc,EAAd,MAAc;EAAd,+HAAc,EAAd,MAAc;EAAd,6BAAc,EAAd,MAAc;EAAd,+BAAc,EAAd,MAAc;EAAd,wCAAc,EAAd,MAAc;AAAA;;AAAd;;;CAAc;;AAAd;EAAA,SAAc,EAAd,MAAc;EAAd,oBAAc,EAAd,MAAc;AAAA;;AAAd;;;;CAAc;;AAAd;EAAA,SAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;EAAd,qBAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,yCAAc;UAAd,iCAAc;AAAA;;AAAd;;CAAc;;AAAd;;;;;;EAAA,kBAAc;EAAd,oBAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,cAAc;EAAd,wBAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,mBAAc;AAAA;;AAAd;;;;;CAAc;;AAAd;;;;EAAA,+GAAc,EAAd,MAAc;EAAd,6BAAc,EAAd,MAAc;EAAd,+BAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,cAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,cAAc;EAAd,cAAc;EAAd,kBAAc;EAAd,wBAAc;AAAA;;AAAd;EAAA,eAAc;AAAA;;AAAd;EAAA,WAAc;AAAA;;AAAd;;;;CAAc;;AAAd;EAAA,cAAc,EAAd,MAAc;EAAd,qBAAc,EAAd,MAAc;EAAd,yBAAc,EAAd,MAAc;AAAA;;AAAd;;;;CAAc;;AAAd;;;;;EAAA,oBAAc,EAAd,MAAc;EAAd,8BAAc,EAAd,MAAc;EAAd,gCAAc,EAAd,MAAc;EAAd,eAAc,EAAd,MAAc;EAAd,oBAAc,EAAd,MAAc;EAAd,oBAAc,EAAd,MAAc;EAAd,uBAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;EAAd,SAAc,EAAd,MAAc;EAAd,UAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,oBAAc;AAAA;;AAAd;;;CAAc;;AAAd;;;;EAAA,0BAAc,EAAd,MAAc;EAAd,6BAAc,EAAd,MAAc;EAAd,sBAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,aAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,gBAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,wBAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,YAAc;AAAA;;AAAd;;;CAAc;;AAAd;EAAA,6BAAc,EAAd,MAAc;EAAd,oBAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,wBAAc;AAAA;;AAAd;;;CAAc;;AAAd;EAAA,0BAAc,EAAd,MAAc;EAAd,aAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,kBAAc;AAAA;;AAAd;;CAAc;;AAAd;;;;;;;;;;;;;EAAA,SAAc;AAAA;;AAAd;EAAA,SAAc;EAAd,UAAc;AAAA;;AAAd;EAAA,UAAc;AAAA;;AAAd;;;EAAA,gBAAc;EAAd,SAAc;EAAd,UAAc;AAAA;;AAAd;;CAAc;AAAd;EAAA,UAAc;AAAA;;AAAd;;CAAc;;AAAd;EAAA,gBAAc;AAAA;;AAAd;;;CAAc;;AAAd;EAAA,UAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;AAAA;;AAAd;;EAAA,UAAc,EAAd,MAAc;EAAd,cAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,eAAc;AAAA;;AAAd;;CAAc;AAAd;EAAA,eAAc;AAAA;;AAAd;;;;CAAc;;AAAd;;;;;;;;EAAA,cAAc,EAAd,MAAc;EAAd,sBAAc,EAAd,MAAc;AAAA;;AAAd;;CAAc;;AAAd;;EAAA,eAAc;EAAd,YAAc;AAAA;;AAAd,wEAAc;AAAd;EAAA,aAAc;AAAA;;AAId,6CAA6C;;AAE7C;EACE,SAAS;EACT,UAAU;EACV,sBAAsB;AACxB;;AAEA;EACE,mCAAmC;EACnC,kCAAkC;EAClC,yBAAyB;EACzB,cAAc;AAChB;;AAEA;EACE,aAAa;EACb,sBAAsB;EACtB,aAAa;EACb,YAAY;AACd;;AAEA;EACE,aAAa;EACb,OAAO;EACP,gBAAgB;AAClB;;AAEA;EACE,OAAO;EACP,eAAe;EACf,gBAAgB;EAChB,yBAAyB;AAC3B;;AAEA,sBAAsB;AACtB;EACE,6DAA6D;EAC7D,YAAY;EACZ,oBAAoB;EACpB,aAAa;EACb,wBAAwB;EACxB,mBAAmB;EACnB,yCAAyC;AAC3C;;AAEA;EACE,iBAAiB;EACjB,iBAAiB;EACjB,YAAY;EACZ,qBAAqB;AACvB;;AAEA;EACE,aAAa;EACb,SAAS;EACT,mBAAmB;AACrB;;AAEA,mBAAmB;AACnB;EACE,YAAY;EACZ,yBAAyB;EACzB,YAAY;EACZ,iBAAiB;EACjB,gBAAgB;EAChB,yCAAyC;AAC3C;;AAEA;EACE,gBAAgB;AAClB;;AAEA;EACE,gBAAgB;AAClB;;AAEA;EACE,aAAa;EACb,mBAAmB;EACnB,uBAAuB;EACvB,cAAc;EACd,qBAAqB;EACrB,yBAAyB;AAC3B;;AAEA;;EAEE,yBAAyB;EACzB,YAAY;EACZ,+BAA+B;AACjC;;AAEA;EACE,qBAAqB;EACrB,WAAW;EACX,kBAAkB;AACpB;;AAEA,gBAAgB;AAChB;EACE,iBAAiB;EACjB,qBAAqB;EACrB,wCAAwC;EACxC,eAAe;EACf,qBAAqB;AACvB;;AAEA;EACE,aAAa;EACb,wBAAwB;EACxB,mBAAmB;EACnB,mBAAmB;EACnB,uBAAuB;EACvB,gCAAgC;AAClC;;AAEA;EACE,kBAAkB;EAClB,gBAAgB;EAChB,cAAc;AAChB;;AAEA;EACE,aAAa;EACb,WAAW;AACb;;AAEA,kBAAkB;AAClB;EACE,oBAAoB;EACpB,mBAAmB;EACnB,uBAAuB;EACvB,oBAAoB;EACpB,uBAAuB;EACvB,mBAAmB;EACnB,gBAAgB;EAChB,qBAAqB;EACrB,YAAY;EACZ,eAAe;EACf,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,YAAY;AACd;;AAEA;EACE,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,YAAY;AACd;;AAEA;EACE,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,YAAY;AACd;;AAEA;EACE,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,YAAY;AACd;;AAEA;EACE,yBAAyB;AAC3B;;AAEA;EACE,wBAAwB;EACxB,kBAAkB;AACpB;;AAEA;EACE,uBAAuB;EACvB,eAAe;AACjB;;AAEA,gBAAgB;AAChB;EACE,mBAAmB;AACrB;;AAEA;EACE,cAAc;EACd,qBAAqB;EACrB,gBAAgB;EAChB,cAAc;AAChB;;AAEA;EACE,WAAW;EACX,uBAAuB;EACvB,yBAAyB;EACzB,uBAAuB;EACvB,mBAAmB;EACnB,kCAAkC;AACpC;;AAEA;EACE,aAAa;EACb,qBAAqB;EACrB,8CAA8C;AAChD;;AAEA;EACE,WAAW;EACX,uBAAuB;EACvB,yBAAyB;EACzB,uBAAuB;EACvB,mBAAmB;EACnB,uBAAuB;AACzB;;AAEA;EACE,WAAW;EACX,uBAAuB;EACvB,yBAAyB;EACzB,uBAAuB;EACvB,mBAAmB;EACnB,gBAAgB;EAChB,iBAAiB;AACnB;;AAEA,iBAAiB;AACjB;EACE,WAAW;EACX,yBAAyB;EACzB,gBAAgB;AAClB;;AAEA;;EAEE,gBAAgB;EAChB,gBAAgB;EAChB,gCAAgC;AAClC;;AAEA;EACE,yBAAyB;EACzB,gBAAgB;EAChB,cAAc;AAChB;;AAEA;EACE,yBAAyB;AAC3B;;AAEA,kBAAkB;AAClB;EACE,oBAAoB;EACpB,mBAAmB;EACnB,wBAAwB;EACxB,qBAAqB;EACrB,kBAAkB;EAClB,gBAAgB;AAClB;;AAEA;EACE,yBAAyB;EACzB,cAAc;AAChB;;AAEA;EACE,yBAAyB;EACzB,cAAc;AAChB;;AAEA;EACE,yBAAyB;EACzB,cAAc;AAChB;;AAEA;EACE,yBAAyB;EACzB,cAAc;AAChB;;AAEA,iBAAiB;AACjB;EACE,aAAa;EACb,uBAAuB;EACvB,mBAAmB;AACrB;;AAEA;EACE,yBAAyB;EACzB,cAAc;EACd,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,cAAc;EACd,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,cAAc;EACd,yBAAyB;AAC3B;;AAEA;EACE,yBAAyB;EACzB,cAAc;EACd,yBAAyB;AAC3B;;AAEA,oBAAoB;AACpB;EACE,qBAAqB;EACrB,WAAW;EACX,YAAY;EACZ,yBAAyB;EACzB,6BAA6B;EAC7B,kBAAkB;EAClB,kCAAkC;AACpC;;AAEA;EACE,KAAK,uBAAuB,EAAE;EAC9B,OAAO,yBAAyB,EAAE;AACpC;;AAEA,oDAAoD;;AAEpD,8BAA8B;AAC9B;EACE,KAAK,uBAAuB,EAAE;EAC9B,OAAO,yBAAyB,EAAE;AACpC;;AAEA;EACE,qBAAqB;EACrB,WAAW;EACX,YAAY;EACZ,yBAAyB;EACzB,6BAA6B;EAC7B,kBAAkB;EAClB,kCAAkC;AACpC;;AAEA,gCAAgC;AAChC;EACE,6DAA6D;AAC/D;;AAEA;EACE,6DAA6D;AAC/D;;AAEA;EACE,6DAA6D;AAC/D;;AAEA,4BAA4B;AAC5B;EACE,UAAU;AACZ;;AAEA;EACE,mBAAmB;AACrB;;AAEA;EACE,mBAAmB;EACnB,kBAAkB;AACpB;;AAEA;EACE,mBAAmB;AACrB",sourcesContent:["@tailwind base;\r\n@tailwind components;\r\n@tailwind utilities;\r\n\r\n/* Global styles for Minimal Server Manager */\r\n\r\n* {\r\n  margin: 0;\r\n  padding: 0;\r\n  box-sizing: border-box;\r\n}\r\n\r\nbody {\r\n  -webkit-font-smoothing: antialiased;\r\n  -moz-osx-font-smoothing: grayscale;\r\n  background-color: #f8fafc;\r\n  color: #1e293b;\r\n}\r\n\r\n.app-container {\r\n  display: flex;\r\n  flex-direction: column;\r\n  height: 100vh;\r\n  width: 100vw;\r\n}\r\n\r\n.main-content {\r\n  display: flex;\r\n  flex: 1;\r\n  overflow: hidden;\r\n}\r\n\r\n.content-area {\r\n  flex: 1;\r\n  padding: 1.5rem;\r\n  overflow-y: auto;\r\n  background-color: #f8fafc;\r\n}\r\n\r\n/* Navigation styles */\r\n.navbar {\r\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\r\n  color: white;\r\n  padding: 1rem 1.5rem;\r\n  display: flex;\r\n  justify-content: between;\r\n  align-items: center;\r\n  box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);\r\n}\r\n\r\n.navbar-brand {\r\n  font-size: 1.5rem;\r\n  font-weight: bold;\r\n  color: white;\r\n  text-decoration: none;\r\n}\r\n\r\n.navbar-actions {\r\n  display: flex;\r\n  gap: 1rem;\r\n  align-items: center;\r\n}\r\n\r\n/* Sidebar styles */\r\n.sidebar {\r\n  width: 250px;\r\n  background-color: #1e293b;\r\n  color: white;\r\n  padding: 1.5rem 0;\r\n  overflow-y: auto;\r\n  box-shadow: 2px 0 10px rgba(0, 0, 0, 0.1);\r\n}\r\n\r\n.sidebar-nav {\r\n  list-style: none;\r\n}\r\n\r\n.sidebar-nav li {\r\n  margin: 0.5rem 0;\r\n}\r\n\r\n.sidebar-nav a {\r\n  display: flex;\r\n  align-items: center;\r\n  padding: 0.75rem 1.5rem;\r\n  color: #cbd5e1;\r\n  text-decoration: none;\r\n  transition: all 0.2s ease;\r\n}\r\n\r\n.sidebar-nav a:hover,\r\n.sidebar-nav a.active {\r\n  background-color: #334155;\r\n  color: white;\r\n  border-right: 3px solid #667eea;\r\n}\r\n\r\n.sidebar-nav a i {\r\n  margin-right: 0.75rem;\r\n  width: 20px;\r\n  text-align: center;\r\n}\r\n\r\n/* Card styles */\r\n.card {\r\n  background: white;\r\n  border-radius: 0.5rem;\r\n  box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);\r\n  padding: 1.5rem;\r\n  margin-bottom: 1.5rem;\r\n}\r\n\r\n.card-header {\r\n  display: flex;\r\n  justify-content: between;\r\n  align-items: center;\r\n  margin-bottom: 1rem;\r\n  padding-bottom: 0.75rem;\r\n  border-bottom: 1px solid #e2e8f0;\r\n}\r\n\r\n.card-title {\r\n  font-size: 1.25rem;\r\n  font-weight: 600;\r\n  color: #1e293b;\r\n}\r\n\r\n.card-actions {\r\n  display: flex;\r\n  gap: 0.5rem;\r\n}\r\n\r\n/* Button styles */\r\n.btn {\r\n  display: inline-flex;\r\n  align-items: center;\r\n  justify-content: center;\r\n  padding: 0.5rem 1rem;\r\n  border-radius: 0.375rem;\r\n  font-size: 0.875rem;\r\n  font-weight: 500;\r\n  text-decoration: none;\r\n  border: none;\r\n  cursor: pointer;\r\n  transition: all 0.2s ease;\r\n}\r\n\r\n.btn-primary {\r\n  background-color: #667eea;\r\n  color: white;\r\n}\r\n\r\n.btn-primary:hover {\r\n  background-color: #5a67d8;\r\n}\r\n\r\n.btn-secondary {\r\n  background-color: #6b7280;\r\n  color: white;\r\n}\r\n\r\n.btn-secondary:hover {\r\n  background-color: #4b5563;\r\n}\r\n\r\n.btn-success {\r\n  background-color: #10b981;\r\n  color: white;\r\n}\r\n\r\n.btn-success:hover {\r\n  background-color: #059669;\r\n}\r\n\r\n.btn-danger {\r\n  background-color: #ef4444;\r\n  color: white;\r\n}\r\n\r\n.btn-danger:hover {\r\n  background-color: #dc2626;\r\n}\r\n\r\n.btn-sm {\r\n  padding: 0.25rem 0.75rem;\r\n  font-size: 0.75rem;\r\n}\r\n\r\n.btn-lg {\r\n  padding: 0.75rem 1.5rem;\r\n  font-size: 1rem;\r\n}\r\n\r\n/* Form styles */\r\n.form-group {\r\n  margin-bottom: 1rem;\r\n}\r\n\r\n.form-label {\r\n  display: block;\r\n  margin-bottom: 0.5rem;\r\n  font-weight: 500;\r\n  color: #374151;\r\n}\r\n\r\n.form-input {\r\n  width: 100%;\r\n  padding: 0.5rem 0.75rem;\r\n  border: 1px solid #d1d5db;\r\n  border-radius: 0.375rem;\r\n  font-size: 0.875rem;\r\n  transition: border-color 0.2s ease;\r\n}\r\n\r\n.form-input:focus {\r\n  outline: none;\r\n  border-color: #667eea;\r\n  box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);\r\n}\r\n\r\n.form-select {\r\n  width: 100%;\r\n  padding: 0.5rem 0.75rem;\r\n  border: 1px solid #d1d5db;\r\n  border-radius: 0.375rem;\r\n  font-size: 0.875rem;\r\n  background-color: white;\r\n}\r\n\r\n.form-textarea {\r\n  width: 100%;\r\n  padding: 0.5rem 0.75rem;\r\n  border: 1px solid #d1d5db;\r\n  border-radius: 0.375rem;\r\n  font-size: 0.875rem;\r\n  resize: vertical;\r\n  min-height: 100px;\r\n}\r\n\r\n/* Table styles */\r\n.table {\r\n  width: 100%;\r\n  border-collapse: collapse;\r\n  margin-top: 1rem;\r\n}\r\n\r\n.table th,\r\n.table td {\r\n  padding: 0.75rem;\r\n  text-align: left;\r\n  border-bottom: 1px solid #e2e8f0;\r\n}\r\n\r\n.table th {\r\n  background-color: #f8fafc;\r\n  font-weight: 600;\r\n  color: #374151;\r\n}\r\n\r\n.table tbody tr:hover {\r\n  background-color: #f8fafc;\r\n}\r\n\r\n/* Status badges */\r\n.status-badge {\r\n  display: inline-flex;\r\n  align-items: center;\r\n  padding: 0.25rem 0.75rem;\r\n  border-radius: 9999px;\r\n  font-size: 0.75rem;\r\n  font-weight: 500;\r\n}\r\n\r\n.status-online {\r\n  background-color: #dcfce7;\r\n  color: #166534;\r\n}\r\n\r\n.status-offline {\r\n  background-color: #fee2e2;\r\n  color: #991b1b;\r\n}\r\n\r\n.status-active {\r\n  background-color: #dbeafe;\r\n  color: #1e40af;\r\n}\r\n\r\n.status-inactive {\r\n  background-color: #f3f4f6;\r\n  color: #374151;\r\n}\r\n\r\n/* Alert styles */\r\n.alert {\r\n  padding: 1rem;\r\n  border-radius: 0.375rem;\r\n  margin-bottom: 1rem;\r\n}\r\n\r\n.alert-success {\r\n  background-color: #dcfce7;\r\n  color: #166534;\r\n  border: 1px solid #bbf7d0;\r\n}\r\n\r\n.alert-error {\r\n  background-color: #fee2e2;\r\n  color: #991b1b;\r\n  border: 1px solid #fecaca;\r\n}\r\n\r\n.alert-warning {\r\n  background-color: #fef3c7;\r\n  color: #92400e;\r\n  border: 1px solid #fde68a;\r\n}\r\n\r\n.alert-info {\r\n  background-color: #dbeafe;\r\n  color: #1e40af;\r\n  border: 1px solid #bfdbfe;\r\n}\r\n\r\n/* Loading spinner */\r\n.spinner {\r\n  display: inline-block;\r\n  width: 20px;\r\n  height: 20px;\r\n  border: 3px solid #f3f3f3;\r\n  border-top: 3px solid #667eea;\r\n  border-radius: 50%;\r\n  animation: spin 1s linear infinite;\r\n}\r\n\r\n@keyframes spin {\r\n  0% { transform: rotate(0deg); }\r\n  100% { transform: rotate(360deg); }\r\n}\r\n\r\n/* Custom component styles that extend TailwindCSS */\r\n\r\n/* Loading spinner animation */\r\n@keyframes spin {\r\n  0% { transform: rotate(0deg); }\r\n  100% { transform: rotate(360deg); }\r\n}\r\n\r\n.spinner {\r\n  display: inline-block;\r\n  width: 20px;\r\n  height: 20px;\r\n  border: 3px solid #f3f3f3;\r\n  border-top: 3px solid #667eea;\r\n  border-radius: 50%;\r\n  animation: spin 1s linear infinite;\r\n}\r\n\r\n/* Custom gradient backgrounds */\r\n.gradient-primary {\r\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\r\n}\r\n\r\n.gradient-success {\r\n  background: linear-gradient(135deg, #10b981 0%, #059669 100%);\r\n}\r\n\r\n.gradient-danger {\r\n  background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);\r\n}\r\n\r\n/* Custom scrollbar styles */\r\n.custom-scrollbar::-webkit-scrollbar {\r\n  width: 6px;\r\n}\r\n\r\n.custom-scrollbar::-webkit-scrollbar-track {\r\n  background: #f1f5f9;\r\n}\r\n\r\n.custom-scrollbar::-webkit-scrollbar-thumb {\r\n  background: #cbd5e1;\r\n  border-radius: 3px;\r\n}\r\n\r\n.custom-scrollbar::-webkit-scrollbar-thumb:hover {\r\n  background: #94a3b8;\r\n}"],sourceRoot:""}]);const i=l},961:(e,t,n)=>{!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(551)},982:(e,t,n)=>{e.exports=n(463)}},r={};function a(e){var t=r[e];if(void 0!==t)return t.exports;var o=r[e]={id:e,exports:{}};return n[e](o,o.exports,a),o.exports}a.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return a.d(t,{a:t}),t},t=Object.getPrototypeOf?e=>Object.getPrototypeOf(e):e=>e.__proto__,a.t=function(n,r){if(1&r&&(n=this(n)),8&r)return n;if("object"==typeof n&&n){if(4&r&&n.__esModule)return n;if(16&r&&"function"==typeof n.then)return n}var o=Object.create(null);a.r(o);var l={};e=e||[null,t({}),t([]),t(t)];for(var i=2&r&&n;("object"==typeof i||"function"==typeof i)&&!~e.indexOf(i);i=t(i))Object.getOwnPropertyNames(i).forEach(e=>l[e]=()=>n[e]);return l.default=()=>n,a.d(o,l),o},a.d=(e,t)=>{for(var n in t)a.o(t,n)&&!a.o(e,n)&&Object.defineProperty(e,n,{enumerable:!0,get:t[n]})},a.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),a.r=e=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},a.nc=void 0;var o,l=a(540),i=a.t(l,2),c=a(338),s=a(961),u=a.t(s,2);function f(){return f=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},f.apply(this,arguments)}!function(e){e.Pop="POP",e.Push="PUSH",e.Replace="REPLACE"}(o||(o={}));const d="popstate";function m(e,t){if(!1===e||null==e)throw new Error(t)}function p(e,t){if(!e){"undefined"!=typeof console&&console.warn(t);try{throw new Error(t)}catch(e){}}}function h(e,t){return{usr:e.state,key:e.key,idx:t}}function v(e,t,n,r){return void 0===n&&(n=null),f({pathname:"string"==typeof e?e:e.pathname,search:"",hash:""},"string"==typeof t?b(t):t,{state:n,key:t&&t.key||r||Math.random().toString(36).substr(2,8)})}function g(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function b(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substr(n),e=e.substr(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substr(r),e=e.substr(0,r)),e&&(t.pathname=e)}return t}var A;function y(e,t,n){return void 0===n&&(n="/"),function(e,t,n,r){let a=T(("string"==typeof t?b(t):t).pathname||"/",n);if(null==a)return null;let o=E(e);!function(e){e.sort((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){return e.length===t.length&&e.slice(0,-1).every((e,n)=>e===t[n])?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map(e=>e.childrenIndex),t.routesMeta.map(e=>e.childrenIndex)))}(o);let l=null;for(let e=0;null==l&&e<o.length;++e){let t=M(a);l=P(o[e],t,r)}return l}(e,t,n,!1)}function E(e,t,n,r){void 0===t&&(t=[]),void 0===n&&(n=[]),void 0===r&&(r="");let a=(e,a,o)=>{let l={relativePath:void 0===o?e.path||"":o,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};l.relativePath.startsWith("/")&&(m(l.relativePath.startsWith(r),'Absolute route path "'+l.relativePath+'" nested under path "'+r+'" is not valid. An absolute child route path must start with the combined path of all its parent routes.'),l.relativePath=l.relativePath.slice(r.length));let i=I([r,l.relativePath]),c=n.concat(l);e.children&&e.children.length>0&&(m(!0!==e.index,'Index routes must not have child routes. Please remove all child routes from route path "'+i+'".'),E(e.children,t,c,i)),(null!=e.path||e.index)&&t.push({path:i,score:O(i,e.index),routesMeta:c})};return e.forEach((e,t)=>{var n;if(""!==e.path&&null!=(n=e.path)&&n.includes("?"))for(let n of w(e.path))a(e,t,n);else a(e,t)}),t}function w(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,a=n.endsWith("?"),o=n.replace(/\?$/,"");if(0===r.length)return a?[o,""]:[o];let l=w(r.join("/")),i=[];return i.push(...l.map(e=>""===e?o:[o,e].join("/"))),a&&i.push(...l),i.map(t=>e.startsWith("/")&&""===t?"/":t)}!function(e){e.data="data",e.deferred="deferred",e.redirect="redirect",e.error="error"}(A||(A={})),new Set(["lazy","caseSensitive","path","id","index","children"]);const x=/^:[\w-]+$/,k=3,S=2,N=1,C=10,B=-2,_=e=>"*"===e;function O(e,t){let n=e.split("/"),r=n.length;return n.some(_)&&(r+=B),t&&(r+=S),n.filter(e=>!_(e)).reduce((e,t)=>e+(x.test(t)?k:""===t?N:C),r)}function P(e,t,n){void 0===n&&(n=!1);let{routesMeta:r}=e,a={},o="/",l=[];for(let e=0;e<r.length;++e){let i=r[e],c=e===r.length-1,s="/"===o?t:t.slice(o.length)||"/",u=j({path:i.relativePath,caseSensitive:i.caseSensitive,end:c},s),f=i.route;if(!u&&c&&n&&!r[r.length-1].route.index&&(u=j({path:i.relativePath,caseSensitive:i.caseSensitive,end:!1},s)),!u)return null;Object.assign(a,u.params),l.push({params:a,pathname:I([o,u.pathname]),pathnameBase:U(I([o,u.pathnameBase])),route:f}),"/"!==u.pathnameBase&&(o=I([o,u.pathnameBase]))}return l}function j(e,t){"string"==typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=function(e,t,n){void 0===t&&(t=!1),void 0===n&&(n=!0),p("*"===e||!e.endsWith("*")||e.endsWith("/*"),'Route path "'+e+'" will be treated as if it were "'+e.replace(/\*$/,"/*")+'" because the `*` character must always follow a `/` in the pattern. To get rid of this warning, please change the route path to "'+e.replace(/\*$/,"/*")+'".');let r=[],a="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)"));return e.endsWith("*")?(r.push({paramName:"*"}),a+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?a+="\\/*$":""!==e&&"/"!==e&&(a+="(?:(?=\\/|$))"),[new RegExp(a,t?void 0:"i"),r]}(e.path,e.caseSensitive,e.end),a=t.match(n);if(!a)return null;let o=a[0],l=o.replace(/(.)\/+$/,"$1"),i=a.slice(1);return{params:r.reduce((e,t,n)=>{let{paramName:r,isOptional:a}=t;if("*"===r){let e=i[n]||"";l=o.slice(0,o.length-e.length).replace(/(.)\/+$/,"$1")}const c=i[n];return e[r]=a&&!c?void 0:(c||"").replace(/%2F/g,"/"),e},{}),pathname:o,pathnameBase:l,pattern:e}}function M(e){try{return e.split("/").map(e=>decodeURIComponent(e).replace(/\//g,"%2F")).join("/")}catch(t){return p(!1,'The URL path "'+e+'" could not be decoded because it is is a malformed URL segment. This is probably due to a bad percent encoding ('+t+")."),e}}function T(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}const z=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i;function L(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)}),n.length>1?n.join("/"):"/"}function D(e,t,n,r){return"Cannot include a '"+e+"' character in a manually specified `to."+t+"` field ["+JSON.stringify(r)+"].  Please separate it out to the `to."+n+'` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.'}function R(e,t){let n=function(e){return e.filter((e,t)=>0===t||e.route.path&&e.route.path.length>0)}(e);return t?n.map((e,t)=>t===n.length-1?e.pathname:e.pathnameBase):n.map(e=>e.pathnameBase)}function F(e,t,n,r){let a;void 0===r&&(r=!1),"string"==typeof e?a=b(e):(a=f({},e),m(!a.pathname||!a.pathname.includes("?"),D("?","pathname","search",a)),m(!a.pathname||!a.pathname.includes("#"),D("#","pathname","hash",a)),m(!a.search||!a.search.includes("#"),D("#","search","hash",a)));let o,l=""===e||""===a.pathname,i=l?"/":a.pathname;if(null==i)o=n;else{let e=t.length-1;if(!r&&i.startsWith("..")){let t=i.split("/");for(;".."===t[0];)t.shift(),e-=1;a.pathname=t.join("/")}o=e>=0?t[e]:"/"}let c=function(e,t){void 0===t&&(t="/");let n,{pathname:r,search:a="",hash:o=""}="string"==typeof e?b(e):e;if(r)if(l=r,z.test(l))n=r;else{if(r.includes("//")){let e=r;r=r.replace(/\/\/+/g,"/"),p(!1,"Pathnames cannot have embedded double slashes - normalizing "+e+" -> "+r)}n=r.startsWith("/")?L(r.substring(1),"/"):L(r,t)}else n=t;var l;return{pathname:n,search:W(a),hash:H(o)}}(a,o),s=i&&"/"!==i&&i.endsWith("/"),u=(l||"."===i)&&n.endsWith("/");return c.pathname.endsWith("/")||!s&&!u||(c.pathname+="/"),c}const I=e=>e.join("/").replace(/\/\/+/g,"/"),U=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),W=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",H=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";Error;const $=["post","put","patch","delete"],q=(new Set($),["get",...$]);function V(){return V=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},V.apply(this,arguments)}new Set(q),new Set([301,302,303,307,308]),new Set([307,308]),Symbol("deferred");const G=l.createContext(null),Q=l.createContext(null),Y=l.createContext(null),K=l.createContext(null),X=l.createContext({outlet:null,matches:[],isDataRoute:!1}),J=l.createContext(null);function Z(){return null!=l.useContext(K)}function ee(){return Z()||m(!1),l.useContext(K).location}function te(e){l.useContext(Y).static||l.useLayoutEffect(e)}function ne(){let{isDataRoute:e}=l.useContext(X);return e?function(){let{router:e}=function(){let e=l.useContext(G);return e||m(!1),e}(se.UseNavigateStable),t=fe(ue.UseNavigateStable),n=l.useRef(!1);te(()=>{n.current=!0});let r=l.useCallback(function(r,a){void 0===a&&(a={}),n.current&&("number"==typeof r?e.navigate(r):e.navigate(r,V({fromRouteId:t},a)))},[e,t]);return r}():function(){Z()||m(!1);let e=l.useContext(G),{basename:t,future:n,navigator:r}=l.useContext(Y),{matches:a}=l.useContext(X),{pathname:o}=ee(),i=JSON.stringify(R(a,n.v7_relativeSplatPath)),c=l.useRef(!1);te(()=>{c.current=!0});let s=l.useCallback(function(n,a){if(void 0===a&&(a={}),!c.current)return;if("number"==typeof n)return void r.go(n);let l=F(n,JSON.parse(i),o,"path"===a.relative);null==e&&"/"!==t&&(l.pathname="/"===l.pathname?t:I([t,l.pathname])),(a.replace?r.replace:r.push)(l,a.state,a)},[t,r,i,o,e]);return s}()}function re(e,t){let{relative:n}=void 0===t?{}:t,{future:r}=l.useContext(Y),{matches:a}=l.useContext(X),{pathname:o}=ee(),i=JSON.stringify(R(a,r.v7_relativeSplatPath));return l.useMemo(()=>F(e,JSON.parse(i),o,"path"===n),[e,i,o,n])}function ae(e,t,n,r){Z()||m(!1);let{navigator:a}=l.useContext(Y),{matches:i}=l.useContext(X),c=i[i.length-1],s=c?c.params:{},u=(c&&c.pathname,c?c.pathnameBase:"/");c&&c.route;let f,d=ee();if(t){var p;let e="string"==typeof t?b(t):t;"/"===u||(null==(p=e.pathname)?void 0:p.startsWith(u))||m(!1),f=e}else f=d;let h=f.pathname||"/",v=h;if("/"!==u){let e=u.replace(/^\//,"").split("/");v="/"+h.replace(/^\//,"").split("/").slice(e.length).join("/")}let g=y(e,{pathname:v}),A=function(e,t,n,r){var a;if(void 0===t&&(t=[]),void 0===n&&(n=null),void 0===r&&(r=null),null==e){var o;if(!n)return null;if(n.errors)e=n.matches;else{if(!(null!=(o=r)&&o.v7_partialHydration&&0===t.length&&!n.initialized&&n.matches.length>0))return null;e=n.matches}}let i=e,c=null==(a=n)?void 0:a.errors;if(null!=c){let e=i.findIndex(e=>e.route.id&&void 0!==(null==c?void 0:c[e.route.id]));e>=0||m(!1),i=i.slice(0,Math.min(i.length,e+1))}let s=!1,u=-1;if(n&&r&&r.v7_partialHydration)for(let e=0;e<i.length;e++){let t=i[e];if((t.route.HydrateFallback||t.route.hydrateFallbackElement)&&(u=e),t.route.id){let{loaderData:e,errors:r}=n,a=t.route.loader&&void 0===e[t.route.id]&&(!r||void 0===r[t.route.id]);if(t.route.lazy||a){s=!0,i=u>=0?i.slice(0,u+1):[i[0]];break}}}return i.reduceRight((e,r,a)=>{let o,f=!1,d=null,m=null;var p;n&&(o=c&&r.route.id?c[r.route.id]:void 0,d=r.route.errorElement||le,s&&(u<0&&0===a?(de[p="route-fallback"]||(de[p]=!0),f=!0,m=null):u===a&&(f=!0,m=r.route.hydrateFallbackElement||null)));let h=t.concat(i.slice(0,a+1)),v=()=>{let t;return t=o?d:f?m:r.route.Component?l.createElement(r.route.Component,null):r.route.element?r.route.element:e,l.createElement(ce,{match:r,routeContext:{outlet:e,matches:h,isDataRoute:null!=n},children:t})};return n&&(r.route.ErrorBoundary||r.route.errorElement||0===a)?l.createElement(ie,{location:n.location,revalidation:n.revalidation,component:d,error:o,children:v(),routeContext:{outlet:null,matches:h,isDataRoute:!0}}):v()},null)}(g&&g.map(e=>Object.assign({},e,{params:Object.assign({},s,e.params),pathname:I([u,a.encodeLocation?a.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?u:I([u,a.encodeLocation?a.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])})),i,n,r);return t&&A?l.createElement(K.Provider,{value:{location:V({pathname:"/",search:"",hash:"",state:null,key:"default"},f),navigationType:o.Pop}},A):A}function oe(){let e=function(){var e;let t=l.useContext(J),n=function(){let e=l.useContext(Q);return e||m(!1),e}(ue.UseRouteError),r=fe(ue.UseRouteError);return void 0!==t?t:null==(e=n.errors)?void 0:e[r]}(),t=function(e){return null!=e&&"number"==typeof e.status&&"string"==typeof e.statusText&&"boolean"==typeof e.internal&&"data"in e}(e)?e.status+" "+e.statusText:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r={padding:"0.5rem",backgroundColor:"rgba(200,200,200, 0.5)"};return l.createElement(l.Fragment,null,l.createElement("h2",null,"Unexpected Application Error!"),l.createElement("h3",{style:{fontStyle:"italic"}},t),n?l.createElement("pre",{style:r},n):null,null)}const le=l.createElement(oe,null);class ie extends l.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return void 0!==this.state.error?l.createElement(X.Provider,{value:this.props.routeContext},l.createElement(J.Provider,{value:this.state.error,children:this.props.component})):this.props.children}}function ce(e){let{routeContext:t,match:n,children:r}=e,a=l.useContext(G);return a&&a.static&&a.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(a.staticContext._deepestRenderedBoundaryId=n.route.id),l.createElement(X.Provider,{value:t},r)}var se=function(e){return e.UseBlocker="useBlocker",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e}(se||{}),ue=function(e){return e.UseBlocker="useBlocker",e.UseLoaderData="useLoaderData",e.UseActionData="useActionData",e.UseRouteError="useRouteError",e.UseNavigation="useNavigation",e.UseRouteLoaderData="useRouteLoaderData",e.UseMatches="useMatches",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e.UseRouteId="useRouteId",e}(ue||{});function fe(e){let t=function(){let e=l.useContext(X);return e||m(!1),e}(),n=t.matches[t.matches.length-1];return n.route.id||m(!1),n.route.id}const de={};function me(e){m(!1)}function pe(e){let{basename:t="/",children:n=null,location:r,navigationType:a=o.Pop,navigator:i,static:c=!1,future:s}=e;Z()&&m(!1);let u=t.replace(/^\/*/,"/"),f=l.useMemo(()=>({basename:u,navigator:i,static:c,future:V({v7_relativeSplatPath:!1},s)}),[u,s,i,c]);"string"==typeof r&&(r=b(r));let{pathname:d="/",search:p="",hash:h="",state:v=null,key:g="default"}=r,A=l.useMemo(()=>{let e=T(d,u);return null==e?null:{location:{pathname:e,search:p,hash:h,state:v,key:g},navigationType:a}},[u,d,p,h,v,g,a]);return null==A?null:l.createElement(Y.Provider,{value:f},l.createElement(K.Provider,{children:n,value:A}))}function he(e){let{children:t,location:n}=e;return ae(ve(t),n)}function ve(e,t){void 0===t&&(t=[]);let n=[];return l.Children.forEach(e,(e,r)=>{if(!l.isValidElement(e))return;let a=[...t,r];if(e.type===l.Fragment)return void n.push.apply(n,ve(e.props.children,a));e.type!==me&&m(!1),e.props.index&&e.props.children&&m(!1);let o={id:e.props.id||a.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(o.children=ve(e.props.children,a)),n.push(o)}),n}function ge(){return ge=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ge.apply(this,arguments)}i.startTransition,new Promise(()=>{}),l.Component,new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);const be=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"];try{window.__reactRouterVersion="6"}catch(e){}new Map;const Ae=i.startTransition;function ye(e){let{basename:t,children:n,future:r,window:a}=e,i=l.useRef();null==i.current&&(i.current=function(e){return void 0===e&&(e={}),function(e,t,n,r){void 0===r&&(r={});let{window:a=document.defaultView,v5Compat:l=!1}=r,i=a.history,c=o.Pop,s=null,u=p();function p(){return(i.state||{idx:null}).idx}function b(){c=o.Pop;let e=p(),t=null==e?null:e-u;u=e,s&&s({action:c,location:y.location,delta:t})}function A(e){let t="null"!==a.location.origin?a.location.origin:a.location.href,n="string"==typeof e?e:g(e);return n=n.replace(/ $/,"%20"),m(t,"No window.location.(origin|href) available to create URL for href: "+n),new URL(n,t)}null==u&&(u=0,i.replaceState(f({},i.state,{idx:u}),""));let y={get action(){return c},get location(){return e(a,i)},listen(e){if(s)throw new Error("A history only accepts one active listener");return a.addEventListener(d,b),s=e,()=>{a.removeEventListener(d,b),s=null}},createHref:e=>t(a,e),createURL:A,encodeLocation(e){let t=A(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){c=o.Push;let r=v(y.location,e,t);n&&n(r,e),u=p()+1;let f=h(r,u),d=y.createHref(r);try{i.pushState(f,"",d)}catch(e){if(e instanceof DOMException&&"DataCloneError"===e.name)throw e;a.location.assign(d)}l&&s&&s({action:c,location:y.location,delta:1})},replace:function(e,t){c=o.Replace;let r=v(y.location,e,t);n&&n(r,e),u=p();let a=h(r,u),f=y.createHref(r);i.replaceState(a,"",f),l&&s&&s({action:c,location:y.location,delta:0})},go:e=>i.go(e)};return y}(function(e,t){let{pathname:n,search:r,hash:a}=e.location;return v("",{pathname:n,search:r,hash:a},t.state&&t.state.usr||null,t.state&&t.state.key||"default")},function(e,t){return"string"==typeof t?t:g(t)},null,e)}({window:a,v5Compat:!0}));let c=i.current,[s,u]=l.useState({action:c.action,location:c.location}),{v7_startTransition:p}=r||{},b=l.useCallback(e=>{p&&Ae?Ae(()=>u(e)):u(e)},[u,p]);return l.useLayoutEffect(()=>c.listen(b),[c,b]),l.useEffect(()=>{return null==(e=r)||e.v7_startTransition,void 0===(null==e?void 0:e.v7_relativeSplatPath)&&(!t||t.v7_relativeSplatPath),void(t&&(t.v7_fetcherPersist,t.v7_normalizeFormMethod,t.v7_partialHydration,t.v7_skipActionErrorRevalidation));var e,t},[r]),l.createElement(pe,{basename:t,children:n,location:s.location,navigationType:s.action,navigator:c,future:r})}u.flushSync,i.useId;const Ee="undefined"!=typeof window&&void 0!==window.document&&void 0!==window.document.createElement,we=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,xe=l.forwardRef(function(e,t){let n,{onClick:r,relative:a,reloadDocument:o,replace:i,state:c,target:s,to:u,preventScrollReset:f,viewTransition:d}=e,p=function(e,t){if(null==e)return{};var n,r,a={},o=Object.keys(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)>=0||(a[n]=e[n]);return a}(e,be),{basename:h}=l.useContext(Y),v=!1;if("string"==typeof u&&we.test(u)&&(n=u,Ee))try{let e=new URL(window.location.href),t=u.startsWith("//")?new URL(e.protocol+u):new URL(u),n=T(t.pathname,h);t.origin===e.origin&&null!=n?u=n+t.search+t.hash:v=!0}catch(e){}let b=function(e,t){let{relative:n}=void 0===t?{}:t;Z()||m(!1);let{basename:r,navigator:a}=l.useContext(Y),{hash:o,pathname:i,search:c}=re(e,{relative:n}),s=i;return"/"!==r&&(s="/"===i?r:I([r,i])),a.createHref({pathname:s,search:c,hash:o})}(u,{relative:a}),A=function(e,t){let{target:n,replace:r,state:a,preventScrollReset:o,relative:i,viewTransition:c}=void 0===t?{}:t,s=ne(),u=ee(),f=re(e,{relative:i});return l.useCallback(t=>{if(function(e,t){return!(0!==e.button||t&&"_self"!==t||function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e))}(t,n)){t.preventDefault();let n=void 0!==r?r:g(u)===g(f);s(e,{replace:n,state:a,preventScrollReset:o,relative:i,viewTransition:c})}},[u,s,f,r,a,n,e,o,i,c])}(u,{replace:i,state:c,target:s,preventScrollReset:f,relative:a,viewTransition:d});return l.createElement("a",ge({},p,{href:n||b,onClick:v||o?r:function(e){r&&r(e),e.defaultPrevented||A(e)},ref:t,target:s}))});var ke,Se;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(ke||(ke={})),function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"}(Se||(Se={}));var Ne=a(72),Ce=a.n(Ne),Be=a(825),_e=a.n(Be),Oe=a(659),Pe=a.n(Oe),je=a(56),Me=a.n(je),Te=a(159),ze=a.n(Te),Le=a(113),De=a.n(Le),Re=a(956),Fe={};function Ie(e){return Ie="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ie(e)}function Ue(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return We(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(We(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,We(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,We(f,"constructor",s),We(s,"constructor",c),c.displayName="GeneratorFunction",We(s,a,"GeneratorFunction"),We(f),We(f,a,"Generator"),We(f,r,function(){return this}),We(f,"toString",function(){return"[object Generator]"}),(Ue=function(){return{w:o,m:d}})()}function We(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}We=function(e,t,n,r){function o(t,n){We(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},We(e,t,n,r)}function He(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function $e(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?He(Object(n),!0).forEach(function(t){qe(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):He(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function qe(e,t,n){return(t=Ye(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ve(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Ge(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Ve(o,r,a,l,i,"next",e)}function i(e){Ve(o,r,a,l,i,"throw",e)}l(void 0)})}}function Qe(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Ye(r.key),r)}}function Ye(e){var t=function(e){if("object"!=Ie(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=Ie(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==Ie(t)?t:t+""}Fe.styleTagTransform=De(),Fe.setAttributes=Me(),Fe.insert=Pe().bind(null,"head"),Fe.domAPI=_e(),Fe.insertStyleElement=ze(),Ce()(Re.A,Fe),Re.A&&Re.A.locals&&Re.A.locals;var Ke=function(){return e=function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.baseURL="http://localhost:8000",this.retryAttempts=3,this.retryDelay=1e3},t=[{key:"request",value:(P=Ge(Ue().m(function e(t){var n,r,a,o,l,i,c,s,u,f,d=arguments;return Ue().w(function(e){for(;;)switch(e.p=e.n){case 0:n=d.length>1&&void 0!==d[1]?d[1]:{},r="".concat(this.baseURL).concat(t),a=$e({headers:$e({"Content-Type":"application/json"},n.headers)},n),l=1;case 1:if(!(l<=this.retryAttempts)){e.n=16;break}return e.p=2,e.n=3,fetch(r,a);case 3:if((i=e.v).ok){e.n=8;break}return e.n=4,i.json().catch(function(){return{}});case 4:if(c=e.v,s=c.detail||c.message||"HTTP error! status: ".concat(i.status),!(i.status>=400&&i.status<500)){e.n=5;break}throw new Error(s);case 5:if(!(l<this.retryAttempts)){e.n=7;break}return console.warn("Request failed (attempt ".concat(l,"/").concat(this.retryAttempts,"):"),s),e.n=6,this.delay(this.retryDelay*l);case 6:return e.a(3,15);case 7:throw new Error(s);case 8:if(!(u=i.headers.get("content-type"))||!u.includes("application/json")){e.n=10;break}return e.n=9,i.json();case 9:return e.a(2,e.v);case 10:return e.n=11,i.text();case 11:return e.a(2,e.v);case 12:if(e.p=12,f=e.v,o=f,console.error("API request failed (attempt ".concat(l,"/").concat(this.retryAttempts,"):"),f),"TypeError"!==f.name||!f.message.includes("fetch")){e.n=14;break}if(!(l<this.retryAttempts)){e.n=14;break}return e.n=13,this.delay(this.retryDelay*l);case 13:return e.a(3,15);case 14:return e.a(3,16);case 15:l++,e.n=1;break;case 16:throw console.error("All retry attempts failed"),o;case 17:return e.a(2)}},e,this,[[2,12]])})),function(e){return P.apply(this,arguments)})},{key:"delay",value:function(e){return new Promise(function(t){return setTimeout(t,e)})}},{key:"getServers",value:(O=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/"))},e,this)})),function(){return O.apply(this,arguments)})},{key:"getServer",value:(_=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t)))},e,this)})),function(e){return _.apply(this,arguments)})},{key:"createServer",value:(B=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/",{method:"POST",body:JSON.stringify(t)}))},e,this)})),function(e){return B.apply(this,arguments)})},{key:"updateServer",value:(C=Ge(Ue().m(function e(t,n){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t),{method:"PUT",body:JSON.stringify(n)}))},e,this)})),function(e,t){return C.apply(this,arguments)})},{key:"deleteServer",value:(N=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t),{method:"DELETE"}))},e,this)})),function(e){return N.apply(this,arguments)})},{key:"toggleServerStatus",value:(S=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/toggle"),{method:"POST"}))},e,this)})),function(e){return S.apply(this,arguments)})},{key:"startMonitoring",value:(k=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/monitor/start"),{method:"POST"}))},e,this)})),function(e){return k.apply(this,arguments)})},{key:"stopMonitoring",value:(x=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/monitor/stop"),{method:"POST"}))},e,this)})),function(e){return x.apply(this,arguments)})},{key:"getServerMetrics",value:(w=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/metrics")))},e,this)})),function(e){return w.apply(this,arguments)})},{key:"getServerSpecs",value:(E=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/specs")))},e,this)})),function(e){return E.apply(this,arguments)})},{key:"getAlerts",value:(y=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/"))},e,this)})),function(){return y.apply(this,arguments)})},{key:"getActiveAlerts",value:(A=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/active/"))},e,this)})),function(){return A.apply(this,arguments)})},{key:"createAlert",value:(b=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/",{method:"POST",body:JSON.stringify(t)}))},e,this)})),function(e){return b.apply(this,arguments)})},{key:"getAlertHistory",value:(g=Ge(Ue().m(function e(){var t,n=arguments;return Ue().w(function(e){for(;;)if(0===e.n)return t=n.length>0&&void 0!==n[0]?n[0]:100,e.a(2,this.request("/alerts/history/?limit=".concat(t)))},e,this)})),function(){return g.apply(this,arguments)})},{key:"resolveAlert",value:(v=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/".concat(t,"/resolve"),{method:"POST"}))},e,this)})),function(e){return v.apply(this,arguments)})},{key:"acknowledgeAlert",value:(h=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/".concat(t,"/acknowledge"),{method:"POST"}))},e,this)})),function(e){return h.apply(this,arguments)})},{key:"deleteAlert",value:(p=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/alerts/".concat(t),{method:"DELETE"}))},e,this)})),function(e){return p.apply(this,arguments)})},{key:"getServerStatus",value:(m=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/status")))},e,this)})),function(e){return m.apply(this,arguments)})},{key:"getAllServerStatuses",value:(d=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/status/"))},e,this)})),function(){return d.apply(this,arguments)})},{key:"getRealtimeMetrics",value:(f=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/servers/".concat(t,"/metrics/realtime")))},e,this)})),function(e){return f.apply(this,arguments)})},{key:"getMetricsHistory",value:(u=Ge(Ue().m(function e(t){var n,r=arguments;return Ue().w(function(e){for(;;)if(0===e.n)return n=r.length>1&&void 0!==r[1]?r[1]:"1h",e.a(2,this.request("/servers/".concat(t,"/metrics/history?range=").concat(n)))},e,this)})),function(e){return u.apply(this,arguments)})},{key:"getSubscriptionStatus",value:(s=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/ws/subscriptions/"))},e,this)})),function(){return s.apply(this,arguments)})},{key:"getSystemHealth",value:(c=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/health/detailed"))},e,this)})),function(){return c.apply(this,arguments)})},{key:"getMonitoringStatus",value:(i=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/monitoring/status/"))},e,this)})),function(){return i.apply(this,arguments)})},{key:"getLogSources",value:(l=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/logs/sources/"))},e,this)})),function(){return l.apply(this,arguments)})},{key:"createLogSource",value:(o=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/logs/sources/",{method:"POST",body:JSON.stringify(t)}))},e,this)})),function(e){return o.apply(this,arguments)})},{key:"analyzeLogs",value:(a=Ge(Ue().m(function e(t){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/logs/analyze/".concat(t)))},e,this)})),function(e){return a.apply(this,arguments)})},{key:"getRecentLogs",value:(r=Ge(Ue().m(function e(t){var n,r=arguments;return Ue().w(function(e){for(;;)if(0===e.n)return n=r.length>1&&void 0!==r[1]?r[1]:50,e.a(2,this.request("/logs/recent/".concat(t,"?limit=").concat(n)))},e,this)})),function(e){return r.apply(this,arguments)})},{key:"healthCheck",value:(n=Ge(Ue().m(function e(){return Ue().w(function(e){for(;;)if(0===e.n)return e.a(2,this.request("/health"))},e,this)})),function(){return n.apply(this,arguments)})}],t&&Qe(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,t,n,r,a,o,l,i,c,s,u,f,d,m,p,h,v,g,b,A,y,E,w,x,k,S,N,C,B,_,O,P}();const Xe=new Ke;function Je(e){return Je="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Je(e)}function Ze(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}function et(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,tt(r.key),r)}}function tt(e){var t=function(e){if("object"!=Je(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=Je(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==Je(t)?t:t+""}const nt=new(function(){return e=function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.socket=null,this.reconnectInterval=5e3,this.maxReconnectAttempts=10,this.reconnectAttempts=0,this.messageHandlers={},this.isConnected=!1,this.connectionPromise=null,this.connectionResolve=null,this.subscriptions=new Set,this.heartbeatInterval=null,this.lastPingTime=null,this.backendUrl="ws://localhost:8000/ws",this.textDecoder=new TextDecoder},t=[{key:"connect",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null;return t&&(this.backendUrl=t),this.socket&&this.socket.readyState===WebSocket.OPEN?(console.log("WebSocket already connected"),Promise.resolve()):(this.connectionPromise=new Promise(function(t){e.connectionResolve=t}),this.socket=new WebSocket(this.backendUrl),this.socket.binaryType="arraybuffer",this.socket.onopen=function(){console.log("WebSocket connected successfully"),e.isConnected=!0,e.reconnectAttempts=0,e.startHeartbeat(),e.resubscribeAll(),e.connectionResolve&&(e.connectionResolve(),e.connectionResolve=null)},this.socket.onmessage=function(t){try{var n="string"==typeof t.data?t.data:e.textDecoder.decode(t.data),r=JSON.parse(n);console.log("WebSocket message received:",r),e.dispatchFrame(r)}catch(e){console.error("Error parsing WebSocket message:",e)}},this.socket.onclose=function(t){console.log("WebSocket disconnected:",t.code,t.reason),e.isConnected=!1,e.stopHeartbeat(),e.reconnectAttempts<e.maxReconnectAttempts?(e.reconnectAttempts++,console.log("Attempting to reconnect (".concat(e.reconnectAttempts,"/").concat(e.maxReconnectAttempts,")...")),setTimeout(function(){return e.connect()},e.reconnectInterval)):(console.error("Max reconnection attempts reached"),e.handleMessage({type:"connection_failed",data:{attempts:e.reconnectAttempts}}))},this.socket.onerror=function(e){console.error("WebSocket error:",e)},this.connectionPromise)}},{key:"disconnect",value:function(){this.stopHeartbeat(),this.socket&&(this.socket.close(),this.socket=null,this.isConnected=!1,this.reconnectAttempts=0,this.subscriptions.clear())}},{key:"startHeartbeat",value:function(){var e=this;this.stopHeartbeat(),this.heartbeatInterval=setInterval(function(){e.isConnected&&e.ping()},3e4)}},{key:"stopHeartbeat",value:function(){this.heartbeatInterval&&(clearInterval(this.heartbeatInterval),this.heartbeatInterval=null)}},{key:"subscribe",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,n=t?"".concat(e,":").concat(t):e;this.subscriptions.add(n),this.isConnected&&this.sendMessage({type:"subscribe",subscription:e,server_id:t}),console.log("Subscribed to: ".concat(n))}},{key:"unsubscribe",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,n=t?"".concat(e,":").concat(t):e;this.subscriptions.delete(n),this.isConnected&&this.sendMessage({type:"unsubscribe",subscription:e,server_id:t}),console.log("Unsubscribed from: ".concat(n))}},{key:"resubscribeAll",value:function(){var e=this;this.subscriptions.forEach(function(t){var n=function(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return Ze(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Ze(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}(t.split(":"),2),r=n[0],a=n[1];e.sendMessage({type:"subscribe",subscription:r,server_id:a===r?null:a})})}},{key:"sendMessage",value:function(e){if(!this.socket||this.socket.readyState!==WebSocket.OPEN)return console.warn("WebSocket not connected. Message not sent:",e),!1;try{var t="string"==typeof e?e:JSON.stringify(e);return this.socket.send(t),console.log("WebSocket message sent:",e),!0}catch(e){return console.error("Error sending WebSocket message:",e),!1}}},{key:"onMessage",value:function(e,t){this.messageHandlers[e]||(this.messageHandlers[e]=[]),this.messageHandlers[e].push(t)}},{key:"offMessage",value:function(e,t){this.messageHandlers[e]&&(this.messageHandlers[e]=this.messageHandlers[e].filter(function(e){return e!==t}))}},{key:"dispatchFrame",value:function(e){var t=this;"batch"!==e.type?Array.isArray(e.data)?e.data.forEach(function(n){return t.handleMessage(Object.assign({},e,{data:n}))}):this.handleMessage(e):e.items.forEach(function(e){return t.dispatchFrame(e)})}},{key:"handleMessage",value:function(e){if(e&&e.type){switch(console.log("WebSocket message received:",e),e.type){case"pong":console.log("Received pong from server"),this.lastPingTime=Date.now();break;case"subscribed":console.log("Successfully subscribed to:",e.subscription);break;case"unsubscribed":console.log("Successfully unsubscribed from:",e.subscription);break;case"error":console.error("Server error:",e.data),this.messageHandlers.error&&this.messageHandlers.error.forEach(function(t){try{t(e)}catch(e){console.error("Error in error handler:",e)}});break;case"connection_failed":console.error("WebSocket connection failed after",e.data.attempts,"attempts")}switch(e.type){case"server_status_update":this.handleServerStatusUpdate(e.data);break;case"server_metrics_update":this.handleServerMetricsUpdate(e.data);break;case"alert_created":this.handleAlertCreated(e.data);break;case"alert_resolved":this.handleAlertResolved(e.data);break;case"server_created":case"server_updated":case"server_deleted":this.handleServerChange(e)}this.messageHandlers[e.type]&&this.messageHandlers[e.type].forEach(function(t){try{t(e)}catch(e){console.error("Error in message handler:",e)}})}else console.warn("Invalid message format:",e)}},{key:"handleServerStatusUpdate",value:function(e){console.log("Server status update:",e),this.messageHandlers.server_status_update&&this.messageHandlers.server_status_update.forEach(function(t){try{t(e)}catch(e){console.error("Error in server status handler:",e)}})}},{key:"handleServerMetricsUpdate",value:function(e){console.log("Server metrics update:",e),this.messageHandlers.server_metrics_update&&this.messageHandlers.server_metrics_update.forEach(function(t){try{t(e)}catch(e){console.error("Error in server metrics handler:",e)}})}},{key:"handleAlertCreated",value:function(e){console.log("New alert created:",e),this.messageHandlers.alert_created&&this.messageHandlers.alert_created.forEach(function(t){try{t(e)}catch(e){console.error("Error in alert created handler:",e)}})}},{key:"handleAlertResolved",value:function(e){console.log("Alert resolved:",e),this.messageHandlers.alert_resolved&&this.messageHandlers.alert_resolved.forEach(function(t){try{t(e)}catch(e){console.error("Error in alert resolved handler:",e)}})}},{key:"handleServerChange",value:function(e){console.log("Server change:",e.type,e.data),this.messageHandlers[e.type]&&this.messageHandlers[e.type].forEach(function(t){try{t(e.data)}catch(e){console.error("Error in server change handler:",e)}})}},{key:"ping",value:function(){return this.sendMessage({type:"ping",timestamp:(new Date).toISOString()})}},{key:"getStatus",value:function(){return{isConnected:this.isConnected,reconnectAttempts:this.reconnectAttempts,maxReconnectAttempts:this.maxReconnectAttempts}}}],t&&et(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,t}());function rt(e){return rt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},rt(e)}function at(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ot(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?at(Object(n),!0).forEach(function(t){lt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):at(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function lt(e,t,n){return(t=function(e){var t=function(e){if("object"!=rt(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=rt(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==rt(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function it(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return ct(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(ct(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,ct(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,ct(f,"constructor",s),ct(s,"constructor",c),c.displayName="GeneratorFunction",ct(s,a,"GeneratorFunction"),ct(f),ct(f,a,"Generator"),ct(f,r,function(){return this}),ct(f,"toString",function(){return"[object Generator]"}),(it=function(){return{w:o,m:d}})()}function ct(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}ct=function(e,t,n,r){function o(t,n){ct(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},ct(e,t,n,r)}function st(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function ut(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){st(o,r,a,l,i,"next",e)}function i(e){st(o,r,a,l,i,"throw",e)}l(void 0)})}}function ft(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return dt(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?dt(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function dt(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const mt=function(){var e=ft((0,l.useState)([]),2),t=e[0],n=e[1],r=ft((0,l.useState)(!0),2),a=r[0],o=r[1],i=ft((0,l.useState)(""),2),c=i[0],s=i[1],u=ft((0,l.useState)("all"),2),f=u[0],d=u[1],m=ft((0,l.useState)("disconnected"),2),p=m[0],h=m[1],v=ft((0,l.useState)(null),2),g=v[0],b=v[1],A=ft((0,l.useState)(!0),2),y=A[0],E=A[1];(0,l.useEffect)(function(){B(),w();var e=setInterval(function(){y&&B()},3e4);return function(){clearInterval(e),x()}},[y]);var w=function(){var e=ut(it().m(function e(){var t;return it().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,h("connecting"),e.n=1,nt.connect();case 1:h("connected"),nt.subscribe("server_status"),nt.subscribe("server_metrics"),nt.onMessage("server_status_update",k),nt.onMessage("server_metrics_update",S),nt.onMessage("server_created",C),nt.onMessage("server_updated",C),nt.onMessage("server_deleted",C),nt.onMessage("connection_failed",N),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to connect to WebSocket:",t),h("error");case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),x=function(){nt.offMessage("server_status_update",k),nt.offMessage("server_metrics_update",S),nt.offMessage("server_created",C),nt.offMessage("server_updated",C),nt.offMessage("server_deleted",C),nt.offMessage("connection_failed",N)},k=function(e){console.log("Server status updated:",e),b(new Date),n(function(t){return t.map(function(t){return t.id===e.server_id?ot(ot({},t),{},{status:e.status,updated_at:e.timestamp}):t})})},S=function(e){console.log("Server metrics updated:",e),b(new Date),n(function(t){return t.map(function(t){return t.id===e.server_id?ot(ot({},t),{},{last_metrics:e.metrics,updated_at:e.timestamp}):t})})},N=function(){h("error")},C=function(){B()},B=function(){var e=ut(it().m(function e(){var t,r;return it().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,o(!0),e.n=1,Xe.getServers();case 1:t=e.v,n(t),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error fetching servers:",r);case 3:return e.p=3,o(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),_=function(){var e=ut(it().m(function e(t){var n;return it().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.toggleServerStatus(t);case 1:e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error toggling server status:",n);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(t){return e.apply(this,arguments)}}(),O=function(){var e=ut(it().m(function e(t){var n;return it().w(function(e){for(;;)switch(e.p=e.n){case 0:if(!window.confirm("Are you sure you want to delete this server?")){e.n=4;break}return e.p=1,e.n=2,Xe.deleteServer(t);case 2:e.n=4;break;case 3:e.p=3,n=e.v,console.error("Error deleting server:",n);case 4:return e.a(2)}},e,null,[[1,3]])}));return function(t){return e.apply(this,arguments)}}(),P=t.filter(function(e){var t=e.name.toLowerCase().includes(c.toLowerCase())||e.ip.includes(c),n="all"===f||e.status===f;return t&&n});return a?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading servers..."))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900 mb-2"},"Servers"),l.createElement("p",{className:"text-gray-600"},"Manage your server infrastructure")),l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("div",{className:"w-3 h-3 rounded-full ".concat("connected"===p?"bg-green-500":"connecting"===p?"bg-yellow-500 animate-pulse":"error"===p?"bg-red-500":"bg-gray-400")}),l.createElement("span",{className:"text-sm text-gray-600 capitalize"},p)),l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("input",{type:"checkbox",id:"autoRefresh",checked:y,onChange:function(e){return E(e.target.checked)},className:"form-checkbox"}),l.createElement("label",{htmlFor:"autoRefresh",className:"text-sm text-gray-600"},"Auto-refresh")),g&&l.createElement("div",{className:"text-sm text-gray-500"},"Updated: ",g.toLocaleTimeString()),l.createElement(xe,{to:"/servers/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Add Server"))),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"flex flex-col md:flex-row gap-4"},l.createElement("div",{className:"flex-1"},l.createElement("input",{type:"text",placeholder:"Search servers by name or IP...",className:"form-input",value:c,onChange:function(e){return s(e.target.value)}})),l.createElement("div",{className:"md:w-48"},l.createElement("select",{className:"form-select",value:f,onChange:function(e){return d(e.target.value)}},l.createElement("option",{value:"all"},"All Status"),l.createElement("option",{value:"active"},"Active"),l.createElement("option",{value:"inactive"},"Inactive"))))),l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Server List (",P.length," of ",t.length,")")),0===P.length?l.createElement("div",{className:"text-center py-12"},0===t.length?l.createElement(l.Fragment,null,l.createElement("i",{className:"fas fa-server text-6xl text-gray-300 mb-4"}),l.createElement("h3",{className:"text-xl font-semibold text-gray-600 mb-2"},"No servers configured"),l.createElement("p",{className:"text-gray-500 mb-6"},"Get started by adding your first server"),l.createElement(xe,{to:"/servers/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Add Your First Server")):l.createElement(l.Fragment,null,l.createElement("i",{className:"fas fa-search text-4xl text-gray-300 mb-4"}),l.createElement("h3",{className:"text-lg font-semibold text-gray-600 mb-2"},"No servers found"),l.createElement("p",{className:"text-gray-500"},"Try adjusting your search or filter criteria"))):l.createElement("div",{className:"overflow-x-auto"},l.createElement("table",{className:"table"},l.createElement("thead",null,l.createElement("tr",null,l.createElement("th",null,"Name"),l.createElement("th",null,"IP Address"),l.createElement("th",null,"Port"),l.createElement("th",null,"User"),l.createElement("th",null,"Status"),l.createElement("th",null,"Created"),l.createElement("th",null,"Actions"))),l.createElement("tbody",null,P.map(function(e){return l.createElement("tr",{key:e.id},l.createElement("td",null,l.createElement(xe,{to:"/servers/".concat(e.id),className:"text-blue-600 hover:text-blue-800 font-medium"},e.name)),l.createElement("td",{className:"text-gray-600 font-mono"},e.ip),l.createElement("td",{className:"text-gray-600"},e.port),l.createElement("td",{className:"text-gray-600"},e.user),l.createElement("td",null,l.createElement("span",{className:"status-badge ".concat("active"===e.status?"status-online":"status-offline")},e.status)),l.createElement("td",{className:"text-gray-600"},new Date(e.created_at).toLocaleDateString()),l.createElement("td",null,l.createElement("div",{className:"flex space-x-2"},l.createElement(xe,{to:"/servers/".concat(e.id),className:"btn btn-sm btn-secondary",title:"View Details"},l.createElement("i",{className:"fas fa-eye"})),l.createElement("button",{className:"btn btn-sm ".concat("active"===e.status?"btn-warning":"btn-success"),title:"active"===e.status?"Deactivate":"Activate",onClick:function(){return _(e.id)}},l.createElement("i",{className:"fas ".concat("active"===e.status?"fa-pause":"fa-play")})),l.createElement("button",{className:"btn btn-sm btn-danger",title:"Delete Server",onClick:function(){return O(e.id)}},l.createElement("i",{className:"fas fa-trash"})))))}))))),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mt-6"},l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-server text-3xl text-blue-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.length),l.createElement("div",{className:"text-gray-600"},"Total Servers")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-check-circle text-3xl text-green-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return"active"===e.status}).length),l.createElement("div",{className:"text-gray-600"},"Active Servers")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-times-circle text-3xl text-red-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return"inactive"===e.status}).length),l.createElement("div",{className:"text-gray-600"},"Inactive Servers"))))};function pt(e){return pt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},pt(e)}function ht(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function vt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ht(Object(n),!0).forEach(function(t){gt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ht(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function gt(e,t,n){return(t=function(e){var t=function(e){if("object"!=pt(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=pt(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==pt(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function bt(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return At(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(At(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,At(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,At(f,"constructor",s),At(s,"constructor",c),c.displayName="GeneratorFunction",At(s,a,"GeneratorFunction"),At(f),At(f,a,"Generator"),At(f,r,function(){return this}),At(f,"toString",function(){return"[object Generator]"}),(bt=function(){return{w:o,m:d}})()}function At(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}At=function(e,t,n,r){function o(t,n){At(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},At(e,t,n,r)}function yt(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Et(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){yt(o,r,a,l,i,"next",e)}function i(e){yt(o,r,a,l,i,"throw",e)}l(void 0)})}}function wt(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return xt(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?xt(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function xt(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const kt=function(){var e,t,n,r,a,o,i,c,s=function(){let{matches:e}=l.useContext(X),t=e[e.length-1];return t?t.params:{}}().id,u=ne(),f=wt((0,l.useState)(null),2),d=f[0],m=f[1],p=wt((0,l.useState)(null),2),h=p[0],v=p[1],g=wt((0,l.useState)(null),2),b=g[0],A=g[1],y=wt((0,l.useState)(null),2),E=y[0],w=y[1],x=wt((0,l.useState)(!0),2),k=x[0],S=x[1],N=wt((0,l.useState)(!1),2),C=N[0],B=N[1],_=wt((0,l.useState)(!1),2),O=_[0],P=_[1],j=wt((0,l.useState)("overview"),2),M=j[0],T=j[1],z=wt((0,l.useState)("disconnected"),2),L=z[0],D=z[1],R=wt((0,l.useState)(null),2),F=R[0],I=R[1],U=wt((0,l.useState)(!1),2),W=U[0],H=U[1];(0,l.useEffect)(function(){return s&&(Y(),K(),$()),function(){q()}},[s]);var $=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,D("connecting"),e.n=1,nt.connect();case 1:D("connected"),nt.subscribe("server_status",s),nt.subscribe("server_metrics",s),nt.onMessage("server_status_update",V),nt.onMessage("server_metrics_update",G),nt.onMessage("connection_failed",Q),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to connect to WebSocket:",t),D("error");case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),q=function(){nt.offMessage("server_status_update",V),nt.offMessage("server_metrics_update",G),nt.offMessage("connection_failed",Q),nt.unsubscribe("server_status",s),nt.unsubscribe("server_metrics",s)},V=function(e){console.log("Server status updated:",e),e.server_id===parseInt(s)&&(m(function(t){return t?vt(vt({},t),{},{status:e.status,updated_at:e.timestamp}):null}),I(new Date))},G=function(e){console.log("Server metrics updated:",e),e.server_id===parseInt(s)&&(A(e.metrics),I(new Date))},Q=function(){D("error")},Y=function(){var e=Et(bt().m(function e(){var t,n;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,S(!0),e.n=1,Xe.getServer(s);case 1:t=e.v,m(t),H(t.monitoring_enabled||!1),e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error fetching server details:",n);case 3:return e.p=3,S(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),K=function(){var e=Et(bt().m(function e(){var t,n;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,P(!0),e.n=1,Xe.getServerSpecs(s);case 1:t=e.v,w(t),e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error fetching server specs:",n),w(null);case 3:return e.p=3,P(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),J=function(){var e=Et(bt().m(function e(){var t,n;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,B(!0),e.n=1,Xe.getServerMetrics(s);case 1:t=e.v,v(t),e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error fetching metrics:",n),v(null);case 3:return e.p=3,B(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),Z=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.toggleServerStatus(s);case 1:Y(),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Error toggling server status:",t);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),ee=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:if(!window.confirm("Are you sure you want to delete this server?")){e.n=4;break}return e.p=1,e.n=2,Xe.deleteServer(s);case 2:u("/servers"),e.n=4;break;case 3:e.p=3,t=e.v,console.error("Error deleting server:",t);case 4:return e.a(2)}},e,null,[[1,3]])}));return function(){return e.apply(this,arguments)}}(),te=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.startMonitoring(s);case 1:H(!0),alert("Monitoring started successfully"),nt.subscribe("server_metrics",s),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Error starting monitoring:",t),alert("Failed to start monitoring: "+t.message);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),re=function(){var e=Et(bt().m(function e(){var t;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.stopMonitoring(s);case 1:H(!1),A(null),alert("Monitoring stopped successfully"),nt.unsubscribe("server_metrics",s),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Error stopping monitoring:",t),alert("Failed to stop monitoring: "+t.message);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),ae=function(){var e=Et(bt().m(function e(){var t,n;return bt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,B(!0),e.n=1,Xe.getRealtimeMetrics(s);case 1:t=e.v,A(t),I(new Date),e.n=3;break;case 2:e.p=2,n=e.v,console.error("Error fetching realtime metrics:",n);case 3:return e.p=3,B(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}();return k?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading server details..."))):d?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",{className:"flex items-center space-x-4"},l.createElement(xe,{to:"/servers",className:"btn btn-secondary btn-sm"},l.createElement("i",{className:"fas fa-arrow-left mr-2"}),"Back"),l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900"},d.name),l.createElement("p",{className:"text-gray-600"},d.ip,":",d.port))),l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("div",{className:"w-3 h-3 rounded-full ".concat("connected"===L?"bg-green-500":"connecting"===L?"bg-yellow-500 animate-pulse":"error"===L?"bg-red-500":"bg-gray-400")}),l.createElement("span",{className:"text-sm text-gray-600 capitalize"},L)),F&&l.createElement("div",{className:"text-sm text-gray-500"},"Updated: ",F.toLocaleTimeString()),l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("div",{className:"w-3 h-3 rounded-full ".concat(W?"bg-green-500":"bg-gray-400")}),l.createElement("span",{className:"text-sm text-gray-600"},W?"Monitoring":"Not Monitoring")),l.createElement("button",{className:"btn ".concat("active"===d.status?"btn-warning":"btn-success"),onClick:Z},l.createElement("i",{className:"fas ".concat("active"===d.status?"fa-pause":"fa-play"," mr-2")}),"active"===d.status?"Deactivate":"Activate"),l.createElement("button",{className:"btn btn-danger",onClick:ee},l.createElement("i",{className:"fas fa-trash mr-2"}),"Delete"))),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"flex justify-between items-center"},l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"w-4 h-4 rounded-full ".concat("active"===d.status?"bg-green-500":"bg-red-500")}),l.createElement("div",null,l.createElement("h3",{className:"text-lg font-semibold"},"Server Status"),l.createElement("p",{className:"text-gray-600"},"Last updated: ",new Date(d.updated_at).toLocaleString()))),l.createElement("div",{className:"text-right"},l.createElement("span",{className:"status-badge ".concat("active"===d.status?"status-online":"status-offline"," text-lg px-4 py-2")},d.status)))),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"border-b border-gray-200"},l.createElement("nav",{className:"-mb-px flex space-x-8"},[{id:"overview",label:"Overview",icon:"fas fa-info-circle"},{id:"metrics",label:"Metrics",icon:"fas fa-chart-line"},{id:"monitoring",label:"Monitoring",icon:"fas fa-eye"},{id:"logs",label:"Logs",icon:"fas fa-file-alt"}].map(function(e){return l.createElement("button",{key:e.id,className:"py-4 px-1 border-b-2 font-medium text-sm ".concat(M===e.id?"border-blue-500 text-blue-600":"border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300"),onClick:function(){return T(e.id)}},l.createElement("i",{className:"".concat(e.icon," mr-2")}),e.label)}))),l.createElement("div",{className:"p-6"},"overview"===M&&l.createElement("div",{className:"space-y-6"},l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Server Information"),l.createElement("div",{className:"space-y-3"},l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Name:"),l.createElement("span",{className:"font-medium"},d.name)),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"IP Address:"),l.createElement("span",{className:"font-mono"},d.ip)),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Port:"),l.createElement("span",{className:"font-medium"},d.port)),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"User:"),l.createElement("span",{className:"font-medium"},d.user)),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Status:"),l.createElement("span",{className:"status-badge ".concat("active"===d.status?"status-online":"status-offline")},d.status)))),l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Timestamps"),l.createElement("div",{className:"space-y-3"},l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Created:"),l.createElement("span",{className:"font-medium"},new Date(d.created_at).toLocaleString())),l.createElement("div",{className:"flex justify-between"},l.createElement("span",{className:"text-gray-600"},"Last Updated:"),l.createElement("span",{className:"font-medium"},new Date(d.updated_at).toLocaleString()))))),l.createElement("div",null,l.createElement("div",{className:"flex justify-between items-center mb-4"},l.createElement("h4",{className:"text-lg font-semibold"},"Hardware Specifications"),l.createElement("button",{className:"btn btn-secondary btn-sm",onClick:K,disabled:O,title:"Refresh hardware specifications"},O?l.createElement("div",{className:"spinner mr-2"}):l.createElement("i",{className:"fas fa-sync-alt mr-2"}),"Refresh")),E&&E.cpu_model?l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4"},l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-microchip mr-2 text-blue-500"}),"CPU"),l.createElement("div",{className:"space-y-2 text-sm"},l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Model:"),l.createElement("div",{className:"font-medium"},E.cpu_model)),l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Cores:"),l.createElement("div",{className:"font-medium"},E.cpu_cores||"Unknown")),E.cpu_threads&&l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Threads:"),l.createElement("div",{className:"font-medium"},E.cpu_threads)))),l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-memory mr-2 text-green-500"}),"Memory"),l.createElement("div",{className:"space-y-2 text-sm"},l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Total RAM:"),l.createElement("div",{className:"font-medium"},E.total_ram||"Unknown")))),l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-hdd mr-2 text-purple-500"}),"Storage"),l.createElement("div",{className:"space-y-2 text-sm"},E.disk_info&&E.disk_info.length>0?l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Disks:"),l.createElement("div",{className:"font-medium"},E.disk_info.length," device(s)")):l.createElement("div",{className:"text-gray-500"},"No disk information available"))),l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-desktop mr-2 text-orange-500"}),"Operating System"),l.createElement("div",{className:"space-y-2 text-sm"},l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"OS:"),l.createElement("div",{className:"font-medium"},E.os_info||"Unknown")))),E.last_updated&&l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2 flex items-center"},l.createElement("i",{className:"fas fa-clock mr-2 text-gray-500"}),"Last Updated"),l.createElement("div",{className:"space-y-2 text-sm"},l.createElement("div",null,l.createElement("span",{className:"text-gray-600"},"Updated:"),l.createElement("div",{className:"font-medium"},new Date(E.last_updated).toLocaleString()))))):l.createElement("div",{className:"text-center py-8"},l.createElement("i",{className:"fas fa-info-circle text-4xl text-gray-300 mb-4"}),l.createElement("p",{className:"text-gray-500 mb-4"},O?"Loading hardware specifications...":"No hardware specifications available"),!O&&l.createElement("button",{className:"btn btn-primary btn-sm",onClick:K},l.createElement("i",{className:"fas fa-download mr-2"}),"Fetch Specifications")))),"metrics"===M&&l.createElement("div",null,l.createElement("div",{className:"flex justify-between items-center mb-4"},l.createElement("h4",{className:"text-lg font-semibold"},"Performance Metrics"),l.createElement("div",{className:"flex space-x-2"},l.createElement("button",{className:"btn btn-secondary btn-sm",onClick:ae,disabled:C||!W,title:W?"Fetch latest metrics":"Start monitoring to enable real-time metrics"},C?l.createElement("div",{className:"spinner mr-2"}):l.createElement("i",{className:"fas fa-bolt mr-2"}),"Real-time"),l.createElement("button",{className:"btn btn-primary btn-sm",onClick:J,disabled:C},C?l.createElement("div",{className:"spinner mr-2"}):l.createElement("i",{className:"fas fa-sync-alt mr-2"}),"Refresh"))),W&&b&&l.createElement("div",{className:"mb-6 p-4 bg-green-50 border border-green-200 rounded-lg"},l.createElement("div",{className:"flex items-center justify-between mb-3"},l.createElement("h5",{className:"font-semibold text-green-800"},l.createElement("i",{className:"fas fa-circle text-green-500 mr-2"}),"Live Metrics"),l.createElement("span",{className:"text-sm text-green-600"},"Last update: ",null==F?void 0:F.toLocaleTimeString())),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4"},b.cpu_usage&&l.createElement("div",{className:"bg-white p-3 rounded border"},l.createElement("div",{className:"text-sm text-gray-600"},"CPU Usage"),l.createElement("div",{className:"text-xl font-bold text-blue-600"},null===(e=b.cpu_usage.totalUsage)||void 0===e?void 0:e.toFixed(1),"%"),l.createElement("div",{className:"text-xs text-gray-500"},"User: ",null===(t=b.cpu_usage.user)||void 0===t?void 0:t.toFixed(1),"% | System: ",null===(n=b.cpu_usage.system)||void 0===n?void 0:n.toFixed(1),"%")),b.memory_usage&&l.createElement("div",{className:"bg-white p-3 rounded border"},l.createElement("div",{className:"text-sm text-gray-600"},"Memory Usage"),l.createElement("div",{className:"text-xl font-bold text-green-600"},null===(r=b.memory_usage.usage_percent)||void 0===r?void 0:r.toFixed(1),"%"),l.createElement("div",{className:"text-xs text-gray-500"},b.memory_usage.used_mb,"MB / ",b.memory_usage.total_mb,"MB")),b.network&&l.createElement("div",{className:"bg-white p-3 rounded border"},l.createElement("div",{className:"text-sm text-gray-600"},"Network I/O"),l.createElement("div",{className:"text-sm"},l.createElement("div",null,"In: ",(b.network.bytes_recv/1024/1024).toFixed(1)," MB"),l.createElement("div",null,"Out: ",(b.network.bytes_sent/1024/1024).toFixed(1)," MB"))))),!h&&!C&&!b&&l.createElement("div",{className:"text-center py-8"},l.createElement("i",{className:"fas fa-chart-line text-4xl text-gray-300 mb-4"}),l.createElement("p",{className:"text-gray-500 mb-4"},W?'Click "Refresh" to load historical performance data':"Start monitoring to see real-time metrics")),h&&l.createElement("div",null,l.createElement("h5",{className:"font-semibold mb-4"},"Historical Metrics"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6"},h.cpu_usage&&l.createElement("div",{className:"card"},l.createElement("h6",{className:"font-semibold mb-2"},"CPU Usage"),l.createElement("div",{className:"text-2xl font-bold text-blue-600"},null===(a=h.cpu_usage.totalUsage)||void 0===a?void 0:a.toFixed(1),"%"),l.createElement("div",{className:"text-sm text-gray-600 mt-2"},"User: ",null===(o=h.cpu_usage.user)||void 0===o?void 0:o.toFixed(1),"% | System: ",null===(i=h.cpu_usage.system)||void 0===i?void 0:i.toFixed(1),"%")),h.memory_usage&&l.createElement("div",{className:"card"},l.createElement("h6",{className:"font-semibold mb-2"},"Memory Usage"),l.createElement("div",{className:"text-2xl font-bold text-green-600"},null===(c=h.memory_usage.usage_percent)||void 0===c?void 0:c.toFixed(1),"%"),l.createElement("div",{className:"text-sm text-gray-600 mt-2"},h.memory_usage.used_mb,"MB / ",h.memory_usage.total_mb,"MB")),h.disk_usage&&l.createElement("div",{className:"card"},l.createElement("h6",{className:"font-semibold mb-2"},"Disk Usage"),l.createElement("div",{className:"space-y-2"},h.disk_usage.slice(0,3).map(function(e,t){var n;return l.createElement("div",{key:t,className:"flex justify-between text-sm"},l.createElement("span",{className:"text-gray-600"},e.mount_point),l.createElement("span",{className:"font-medium"},null===(n=e.usage_percent)||void 0===n?void 0:n.toFixed(1),"%"))})))))),"monitoring"===M&&l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Monitoring Control"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2"},"Start Monitoring"),l.createElement("p",{className:"text-gray-600 mb-4"},"Begin collecting real-time metrics and performance data for this server."),l.createElement("button",{className:"btn btn-success",onClick:te},l.createElement("i",{className:"fas fa-play mr-2"}),"Start Monitoring")),l.createElement("div",{className:"card"},l.createElement("h5",{className:"font-semibold mb-2"},"Stop Monitoring"),l.createElement("p",{className:"text-gray-600 mb-4"},"Stop collecting metrics for this server. Existing data will be preserved."),l.createElement("button",{className:"btn btn-warning",onClick:re},l.createElement("i",{className:"fas fa-stop mr-2"}),"Stop Monitoring")))),"logs"===M&&l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Server Logs"),l.createElement("div",{className:"text-center py-8"},l.createElement("i",{className:"fas fa-file-alt text-4xl text-gray-300 mb-4"}),l.createElement("p",{className:"text-gray-500"},"Log viewing functionality will be implemented in the next phase")))))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"text-center py-12"},l.createElement("i",{className:"fas fa-exclamation-triangle text-4xl text-yellow-500 mb-4"}),l.createElement("h3",{className:"text-xl font-semibold text-gray-600 mb-2"},"Server not found"),l.createElement("p",{className:"text-gray-500 mb-6"},"The server you're looking for doesn't exist"),l.createElement(xe,{to:"/servers",className:"btn btn-primary"},"Back to Servers")))};function St(e){return St="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},St(e)}function Nt(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return Ct(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(Ct(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,Ct(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,Ct(f,"constructor",s),Ct(s,"constructor",c),c.displayName="GeneratorFunction",Ct(s,a,"GeneratorFunction"),Ct(f),Ct(f,a,"Generator"),Ct(f,r,function(){return this}),Ct(f,"toString",function(){return"[object Generator]"}),(Nt=function(){return{w:o,m:d}})()}function Ct(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}Ct=function(e,t,n,r){function o(t,n){Ct(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},Ct(e,t,n,r)}function Bt(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function _t(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Bt(o,r,a,l,i,"next",e)}function i(e){Bt(o,r,a,l,i,"throw",e)}l(void 0)})}}function Ot(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Pt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Ot(Object(n),!0).forEach(function(t){jt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ot(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function jt(e,t,n){return(t=function(e){var t=function(e){if("object"!=St(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=St(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==St(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Mt(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return Tt(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Tt(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Tt(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const zt=function(){var e=ne(),t=Mt((0,l.useState)({name:"",ip:"",port:22,user:"",ssh_key_path:"",password:""}),2),n=t[0],r=t[1],a=Mt((0,l.useState)(!1),2),o=a[0],i=a[1],c=Mt((0,l.useState)(!1),2),s=c[0],u=c[1],f=Mt((0,l.useState)(null),2),d=f[0],m=f[1],p=function(e){var t=e.target,n=t.name,a=t.value;r(function(e){return Pt(Pt({},e),{},jt({},n,a))})},h=function(){var e=_t(Nt().m(function e(){var t,r,a,o,l;return Nt().w(function(e){for(;;)switch(e.p=e.n){case 0:if(n.ip&&n.user){e.n=1;break}return alert("Please fill in IP address and username before testing connection"),e.a(2);case 1:return u(!0),m(null),e.p=2,t={name:"Test Connection",ip:n.ip,port:parseInt(n.port),user:n.user,ssh_key_path:n.ssh_key_path||null,password:n.password||null},e.n=3,Xe.createServer(t);case 3:return r=e.v,e.p=4,e.n=5,Xe.getServerMetrics(r.id);case 5:a=e.v,m({success:!0,message:"Connection successful! Server is reachable.",data:a}),e.n=7;break;case 6:e.p=6,o=e.v,m({success:!1,message:"Server created but connection test failed. Please check credentials.",error:o.message});case 7:return e.n=8,Xe.deleteServer(r.id);case 8:e.n=10;break;case 9:e.p=9,l=e.v,m({success:!1,message:"Connection test failed",error:l.message});case 10:return e.p=10,u(!1),e.f(10);case 11:return e.a(2)}},e,null,[[4,6],[2,9,10,11]])}));return function(){return e.apply(this,arguments)}}(),v=function(){var t=_t(Nt().m(function t(r){var a,o;return Nt().w(function(t){for(;;)switch(t.p=t.n){case 0:if(r.preventDefault(),n.name&&n.ip&&n.user){t.n=1;break}return alert("Please fill in all required fields"),t.a(2);case 1:return i(!0),t.p=2,a={name:n.name,ip:n.ip,port:parseInt(n.port),user:n.user,ssh_key_path:n.ssh_key_path||null,password:n.password||null},t.n=3,Xe.createServer(a);case 3:e("/servers"),t.n=5;break;case 4:t.p=4,o=t.v,console.error("Error creating server:",o),alert("Failed to create server: "+o.message);case 5:return t.p=5,i(!1),t.f(5);case 6:return t.a(2)}},t,null,[[2,4,5,6]])}));return function(e){return t.apply(this,arguments)}}();return l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",{className:"flex items-center space-x-4"},l.createElement(xe,{to:"/servers",className:"btn btn-secondary btn-sm"},l.createElement("i",{className:"fas fa-arrow-left mr-2"}),"Back to Servers"),l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900"},"Add New Server"),l.createElement("p",{className:"text-gray-600"},"Configure a new server for monitoring")))),l.createElement("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-6"},l.createElement("div",{className:"lg:col-span-2"},l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Server Configuration")),l.createElement("form",{onSubmit:v,className:"p-6"},l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",null,l.createElement("label",{className:"form-label"},"Server Name *"),l.createElement("input",{type:"text",name:"name",className:"form-input",value:n.name,onChange:p,placeholder:"e.g., Web Server 1",required:!0})),l.createElement("div",null,l.createElement("label",{className:"form-label"},"IP Address *"),l.createElement("input",{type:"text",name:"ip",className:"form-input",value:n.ip,onChange:p,placeholder:"192.168.1.100",required:!0})),l.createElement("div",null,l.createElement("label",{className:"form-label"},"SSH Port"),l.createElement("input",{type:"number",name:"port",className:"form-input",value:n.port,onChange:p,min:"1",max:"65535"})),l.createElement("div",null,l.createElement("label",{className:"form-label"},"Username *"),l.createElement("input",{type:"text",name:"user",className:"form-input",value:n.user,onChange:p,placeholder:"e.g., ubuntu, root",required:!0})),l.createElement("div",{className:"md:col-span-2"},l.createElement("label",{className:"form-label"},"SSH Key Path (optional)"),l.createElement("input",{type:"text",name:"ssh_key_path",className:"form-input",value:n.ssh_key_path,onChange:p,placeholder:"/path/to/private/key"}),l.createElement("p",{className:"text-sm text-gray-500 mt-1"},"Leave empty to use password authentication")),l.createElement("div",{className:"md:col-span-2"},l.createElement("label",{className:"form-label"},"Password (optional)"),l.createElement("input",{type:"password",name:"password",className:"form-input",value:n.password,onChange:p,placeholder:"Enter password if not using SSH keys"}),l.createElement("p",{className:"text-sm text-gray-500 mt-1"},"Leave empty if using SSH key authentication"))),l.createElement("div",{className:"flex justify-between items-center mt-8"},l.createElement("button",{type:"button",className:"btn btn-secondary",onClick:function(){return e("/servers")}},"Cancel"),l.createElement("div",{className:"flex space-x-3"},l.createElement("button",{type:"button",className:"btn btn-info",onClick:h,disabled:s||!n.ip||!n.user},s?l.createElement(l.Fragment,null,l.createElement("div",{className:"spinner mr-2"}),"Testing..."):l.createElement(l.Fragment,null,l.createElement("i",{className:"fas fa-plug mr-2"}),"Test Connection")),l.createElement("button",{type:"submit",className:"btn btn-primary",disabled:o},o?l.createElement(l.Fragment,null,l.createElement("div",{className:"spinner mr-2"}),"Creating..."):l.createElement(l.Fragment,null,l.createElement("i",{className:"fas fa-plus mr-2"}),"Create Server"))))))),l.createElement("div",{className:"space-y-6"},d&&l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Connection Test")),l.createElement("div",{className:"p-4"},l.createElement("div",{className:"flex items-center mb-3 ".concat(d.success?"text-green-600":"text-red-600")},l.createElement("i",{className:"fas ".concat(d.success?"fa-check-circle":"fa-times-circle"," mr-2")}),l.createElement("span",{className:"font-medium"},d.success?"Success":"Failed")),l.createElement("p",{className:"text-sm text-gray-600 mb-2"},d.message),d.error&&l.createElement("p",{className:"text-xs text-red-500"},"Error: ",d.error))),l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Connection Help")),l.createElement("div",{className:"p-4 text-sm text-gray-600"},l.createElement("div",{className:"space-y-3"},l.createElement("div",null,l.createElement("h4",{className:"font-medium text-gray-900"},"SSH Key Authentication"),l.createElement("p",null,"Recommended for better security. Provide the path to your private key file.")),l.createElement("div",null,l.createElement("h4",{className:"font-medium text-gray-900"},"Password Authentication"),l.createElement("p",null,"Simpler setup but less secure. Use strong passwords.")),l.createElement("div",null,l.createElement("h4",{className:"font-medium text-gray-900"},"Port"),l.createElement("p",null,"Default SSH port is 22. Change if your server uses a different port."))))))))};function Lt(e){return Lt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Lt(e)}function Dt(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Rt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Dt(Object(n),!0).forEach(function(t){Ft(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Dt(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ft(e,t,n){return(t=function(e){var t=function(e){if("object"!=Lt(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=Lt(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==Lt(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function It(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return Ut(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(Ut(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,Ut(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,Ut(f,"constructor",s),Ut(s,"constructor",c),c.displayName="GeneratorFunction",Ut(s,a,"GeneratorFunction"),Ut(f),Ut(f,a,"Generator"),Ut(f,r,function(){return this}),Ut(f,"toString",function(){return"[object Generator]"}),(It=function(){return{w:o,m:d}})()}function Ut(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}Ut=function(e,t,n,r){function o(t,n){Ut(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},Ut(e,t,n,r)}function Wt(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Ht(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Wt(o,r,a,l,i,"next",e)}function i(e){Wt(o,r,a,l,i,"throw",e)}l(void 0)})}}function $t(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return qt(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?qt(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function qt(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const Vt=function(){var e=$t((0,l.useState)({telegram:{bot_token:"",chat_id:"",enabled:!1},monitoring:{interval:60,retention_days:30},alerts:{default_cooldown:10,email_notifications:!0}}),2),t=e[0],n=e[1],r=$t((0,l.useState)(!0),2),a=r[0],o=r[1],i=$t((0,l.useState)(!1),2),c=i[0],s=i[1],u=$t((0,l.useState)("general"),2),f=u[0],d=u[1];(0,l.useEffect)(function(){m()},[]);var m=function(){var e=Ht(It().m(function e(){return It().w(function(e){for(;;)switch(e.n){case 0:try{o(!0)}catch(e){console.error("Error fetching settings:",e)}finally{o(!1)}case 1:return e.a(2)}},e)}));return function(){return e.apply(this,arguments)}}(),p=function(){var e=Ht(It().m(function e(){return It().w(function(e){for(;;)switch(e.n){case 0:try{s(!0),alert("Settings saved successfully!")}catch(e){console.error("Error saving settings:",e),alert("Error saving settings")}finally{s(!1)}case 1:return e.a(2)}},e)}));return function(){return e.apply(this,arguments)}}(),h=function(){var e=Ht(It().m(function e(){return It().w(function(e){for(;;)switch(e.n){case 0:try{alert("Telegram test functionality will be implemented")}catch(e){console.error("Error testing Telegram connection:",e)}case 1:return e.a(2)}},e)}));return function(){return e.apply(this,arguments)}}();return a?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading settings..."))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900 mb-2"},"Settings"),l.createElement("p",{className:"text-gray-600"},"Configure your server manager preferences")),l.createElement("button",{className:"btn btn-primary",onClick:p,disabled:c},c?l.createElement("div",{className:"spinner mr-2"}):l.createElement("i",{className:"fas fa-save mr-2"}),"Save Settings")),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"border-b border-gray-200"},l.createElement("nav",{className:"-mb-px flex space-x-8"},[{id:"general",label:"General",icon:"fas fa-cog"},{id:"monitoring",label:"Monitoring",icon:"fas fa-chart-line"},{id:"alerts",label:"Alerts",icon:"fas fa-bell"},{id:"notifications",label:"Notifications",icon:"fas fa-envelope"}].map(function(e){return l.createElement("button",{key:e.id,className:"py-4 px-1 border-b-2 font-medium text-sm ".concat(f===e.id?"border-blue-500 text-blue-600":"border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300"),onClick:function(){return d(e.id)}},l.createElement("i",{className:"".concat(e.icon," mr-2")}),e.label)}))),l.createElement("div",{className:"p-6"},"general"===f&&l.createElement("div",{className:"space-y-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Application Settings"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Application Name"),l.createElement("input",{type:"text",className:"form-input",defaultValue:"Minimal Server Manager",readOnly:!0})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Version"),l.createElement("input",{type:"text",className:"form-input",defaultValue:"1.0.0",readOnly:!0})))),l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Database Settings"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Database Path"),l.createElement("input",{type:"text",className:"form-input",defaultValue:"./data/app.db",readOnly:!0})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Database Type"),l.createElement("select",{className:"form-select",defaultValue:"sqlite",readOnly:!0},l.createElement("option",{value:"sqlite"},"SQLite")))))),"monitoring"===f&&l.createElement("div",{className:"space-y-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Monitoring Configuration"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Monitoring Interval (seconds)"),l.createElement("input",{type:"number",className:"form-input",value:t.monitoring.interval,onChange:function(e){return n(Rt(Rt({},t),{},{monitoring:Rt(Rt({},t.monitoring),{},{interval:parseInt(e.target.value)})}))},min:"10",max:"3600"}),l.createElement("small",{className:"text-gray-500"},"How often to collect metrics (10-3600 seconds)")),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Data Retention (days)"),l.createElement("input",{type:"number",className:"form-input",value:t.monitoring.retention_days,onChange:function(e){return n(Rt(Rt({},t),{},{monitoring:Rt(Rt({},t.monitoring),{},{retention_days:parseInt(e.target.value)})}))},min:"1",max:"365"}),l.createElement("small",{className:"text-gray-500"},"How long to keep historical data (1-365 days)")))),l.createElement("div",{className:"alert alert-info"},l.createElement("i",{className:"fas fa-info-circle mr-2"}),l.createElement("strong",null,"Note:")," Changes to monitoring settings will affect all servers. Existing data will be preserved.")),"alerts"===f&&l.createElement("div",{className:"space-y-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Alert Configuration"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Default Cooldown (minutes)"),l.createElement("input",{type:"number",className:"form-input",value:t.alerts.default_cooldown,onChange:function(e){return n(Rt(Rt({},t),{},{alerts:Rt(Rt({},t.alerts),{},{default_cooldown:parseInt(e.target.value)})}))},min:"1",max:"60"}),l.createElement("small",{className:"text-gray-500"},"Minimum time between alert notifications")),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Email Notifications"),l.createElement("div",{className:"flex items-center mt-2"},l.createElement("input",{type:"checkbox",className:"mr-2",checked:t.alerts.email_notifications,onChange:function(e){return n(Rt(Rt({},t),{},{alerts:Rt(Rt({},t.alerts),{},{email_notifications:e.target.checked})}))}}),l.createElement("span",{className:"text-gray-700"},"Enable email notifications"))))),l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Default Alert Thresholds"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"CPU Usage (%)"),l.createElement("input",{type:"number",className:"form-input",defaultValue:"80",min:"0",max:"100"})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Memory Usage (%)"),l.createElement("input",{type:"number",className:"form-input",defaultValue:"85",min:"0",max:"100"})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Disk Usage (%)"),l.createElement("input",{type:"number",className:"form-input",defaultValue:"90",min:"0",max:"100"}))))),"notifications"===f&&l.createElement("div",{className:"space-y-6"},l.createElement("div",null,l.createElement("h4",{className:"text-lg font-semibold mb-4"},"Telegram Configuration"),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Bot Token"),l.createElement("input",{type:"password",className:"form-input",value:t.telegram.bot_token,onChange:function(e){return n(Rt(Rt({},t),{},{telegram:Rt(Rt({},t.telegram),{},{bot_token:e.target.value})}))},placeholder:"Enter your Telegram bot token"})),l.createElement("div",{className:"form-group"},l.createElement("label",{className:"form-label"},"Chat ID"),l.createElement("input",{type:"text",className:"form-input",value:t.telegram.chat_id,onChange:function(e){return n(Rt(Rt({},t),{},{telegram:Rt(Rt({},t.telegram),{},{chat_id:e.target.value})}))},placeholder:"Enter your Telegram chat ID"}))),l.createElement("div",{className:"flex items-center mt-4"},l.createElement("input",{type:"checkbox",className:"mr-2",checked:t.telegram.enabled,onChange:function(e){return n(Rt(Rt({},t),{},{telegram:Rt(Rt({},t.telegram),{},{enabled:e.target.checked})}))}}),l.createElement("span",{className:"text-gray-700"},"Enable Telegram notifications")),l.createElement("div",{className:"mt-4"},l.createElement("button",{className:"btn btn-secondary btn-sm",onClick:h},l.createElement("i",{className:"fas fa-paper-plane mr-2"}),"Test Connection"))),l.createElement("div",{className:"alert alert-warning"},l.createElement("i",{className:"fas fa-exclamation-triangle mr-2"}),l.createElement("strong",null,"Security Note:")," Bot tokens are sensitive information. Keep them secure and never share them publicly.")))))};function Gt(e){return Gt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Gt(e)}function Qt(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Yt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Qt(Object(n),!0).forEach(function(t){Kt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Qt(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Kt(e,t,n){return(t=function(e){var t=function(e){if("object"!=Gt(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=Gt(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==Gt(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Xt(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return Jt(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(Jt(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,Jt(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,Jt(f,"constructor",s),Jt(s,"constructor",c),c.displayName="GeneratorFunction",Jt(s,a,"GeneratorFunction"),Jt(f),Jt(f,a,"Generator"),Jt(f,r,function(){return this}),Jt(f,"toString",function(){return"[object Generator]"}),(Xt=function(){return{w:o,m:d}})()}function Jt(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}Jt=function(e,t,n,r){function o(t,n){Jt(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},Jt(e,t,n,r)}function Zt(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function en(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Zt(o,r,a,l,i,"next",e)}function i(e){Zt(o,r,a,l,i,"throw",e)}l(void 0)})}}function tn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||nn(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function nn(e,t){if(e){if("string"==typeof e)return rn(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?rn(e,t):void 0}}function rn(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const an=function(){var e=tn((0,l.useState)({totalServers:0,onlineServers:0,offlineServers:0,activeAlerts:0}),2),t=e[0],n=e[1],r=tn((0,l.useState)([]),2),a=r[0],o=r[1],i=tn((0,l.useState)([]),2),c=i[0],s=i[1],u=tn((0,l.useState)(!0),2),f=u[0],d=u[1],m=tn((0,l.useState)("disconnected"),2),p=m[0],h=m[1],v=tn((0,l.useState)(null),2),g=v[0],b=v[1];(0,l.useEffect)(function(){B(),A();var e=setInterval(function(){B()},3e4);return function(){clearInterval(e),y()}},[]);var A=function(){var e=en(Xt().m(function e(){var t;return Xt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,h("connecting"),e.n=1,nt.connect();case 1:h("connected"),nt.subscribe("server_status"),nt.subscribe("server_metrics"),nt.subscribe("alerts"),nt.onMessage("server_status_update",E),nt.onMessage("server_metrics_update",w),nt.onMessage("alert_created",x),nt.onMessage("alert_resolved",k),nt.onMessage("server_created",C),nt.onMessage("server_updated",C),nt.onMessage("server_deleted",C),nt.onMessage("connection_failed",S),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to connect to WebSocket:",t),h("error");case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),y=function(){nt.offMessage("server_status_update",E),nt.offMessage("server_metrics_update",w),nt.offMessage("alert_created",x),nt.offMessage("alert_resolved",k),nt.offMessage("server_created",C),nt.offMessage("server_updated",C),nt.offMessage("server_deleted",C),nt.offMessage("connection_failed",S)},E=function(e){console.log("Server status updated:",e),b(new Date),N(e)},w=function(e){console.log("Server metrics updated:",e),b(new Date)},x=function(e){console.log("New alert:",e),s(function(t){return[e].concat((n=t,function(e){if(Array.isArray(e))return rn(e)}(n)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(n)||nn(n)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}())).slice(0,5);var n}),n(function(e){return Yt(Yt({},e),{},{activeAlerts:e.activeAlerts+1})}),b(new Date)},k=function(e){console.log("Alert resolved:",e),s(function(t){return t.filter(function(t){return t.id!==e.id})}),n(function(e){return Yt(Yt({},e),{},{activeAlerts:Math.max(0,e.activeAlerts-1)})}),b(new Date)},S=function(){h("error")},N=function(e){n(function(t){var n=Yt({},t);return"active"===e.status?(n.onlineServers+=1,n.offlineServers=Math.max(0,n.offlineServers-1)):(n.offlineServers+=1,n.onlineServers=Math.max(0,n.onlineServers-1)),n})},C=function(){B()},B=function(){var e=en(Xt().m(function e(){var t,r,a,l,i,c,u;return Xt().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,d(!0),e.n=1,Promise.all([Xe.getServers(),Xe.getActiveAlerts().catch(function(){return[]})]);case 1:t=e.v,r=tn(t,2),a=r[0],l=r[1],i=a.filter(function(e){return"active"===e.status}).length,c=a.filter(function(e){return"inactive"===e.status}).length,n({totalServers:a.length,onlineServers:i,offlineServers:c,activeAlerts:l.length||0}),o(a.slice(-5).reverse()),s(l.slice(0,5)),b(new Date),e.n=3;break;case 2:e.p=2,u=e.v,console.error("Error fetching dashboard data:",u);case 3:return e.p=3,d(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),_=function(e){var t=e.title,n=e.value,r=e.icon,a=e.color,o=e.link;return l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},t),l.createElement("i",{className:"".concat(r," text-2xl ").concat(a)})),l.createElement("div",{className:"text-center"},l.createElement("div",{className:"text-3xl font-bold text-gray-900 mb-2"},n),o&&l.createElement(xe,{to:o,className:"btn btn-primary btn-sm"},"View Details")))};return f?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading dashboard..."))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"mb-6"},l.createElement("div",{className:"flex justify-between items-start"},l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900 mb-2"},"Dashboard"),l.createElement("p",{className:"text-gray-600"},"Overview of your server infrastructure")),l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"flex items-center space-x-2"},l.createElement("div",{className:"w-3 h-3 rounded-full ".concat("connected"===p?"bg-green-500":"connecting"===p?"bg-yellow-500 animate-pulse":"error"===p?"bg-red-500":"bg-gray-400")}),l.createElement("span",{className:"text-sm text-gray-600 capitalize"},p)),g&&l.createElement("div",{className:"text-sm text-gray-500"},"Last updated: ",g.toLocaleTimeString())))),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8"},l.createElement(_,{title:"Total Servers",value:t.totalServers,icon:"fas fa-server",color:"text-blue-500",link:"/servers"}),l.createElement(_,{title:"Online Servers",value:t.onlineServers,icon:"fas fa-check-circle",color:"text-green-500",link:"/servers"}),l.createElement(_,{title:"Offline Servers",value:t.offlineServers,icon:"fas fa-times-circle",color:"text-red-500",link:"/servers"}),l.createElement(_,{title:"Active Alerts",value:t.activeAlerts,icon:"fas fa-bell",color:"text-yellow-500",link:"/alerts"})),l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Recent Servers"),l.createElement(xe,{to:"/servers",className:"btn btn-primary btn-sm"},"View All")),0===a.length?l.createElement("div",{className:"text-center py-8"},l.createElement("i",{className:"fas fa-server text-4xl text-gray-300 mb-4"}),l.createElement("p",{className:"text-gray-500 mb-4"},"No servers configured yet"),l.createElement(xe,{to:"/servers/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Add Your First Server")):l.createElement("div",{className:"overflow-x-auto"},l.createElement("table",{className:"table"},l.createElement("thead",null,l.createElement("tr",null,l.createElement("th",null,"Name"),l.createElement("th",null,"IP Address"),l.createElement("th",null,"Status"),l.createElement("th",null,"User"),l.createElement("th",null,"Actions"))),l.createElement("tbody",null,a.map(function(e){return l.createElement("tr",{key:e.id},l.createElement("td",null,l.createElement(xe,{to:"/servers/".concat(e.id),className:"text-blue-600 hover:text-blue-800 font-medium"},e.name)),l.createElement("td",{className:"text-gray-600"},e.ip,":",e.port),l.createElement("td",null,l.createElement("span",{className:"status-badge ".concat("active"===e.status?"status-online":"status-offline")},e.status)),l.createElement("td",{className:"text-gray-600"},e.user),l.createElement("td",null,l.createElement("div",{className:"flex space-x-2"},l.createElement(xe,{to:"/servers/".concat(e.id),className:"btn btn-sm btn-secondary"},l.createElement("i",{className:"fas fa-eye"})),l.createElement("button",{className:"btn btn-sm btn-primary"},l.createElement("i",{className:"fas fa-play"})))))}))))),c.length>0&&l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Recent Alerts"),l.createElement(xe,{to:"/alerts",className:"btn btn-warning btn-sm"},"View All Alerts")),l.createElement("div",{className:"space-y-3"},c.map(function(e){return l.createElement("div",{key:e.id,className:"flex items-center justify-between p-3 bg-yellow-50 border border-yellow-200 rounded-lg"},l.createElement("div",{className:"flex items-center space-x-3"},l.createElement("i",{className:"fas fa-exclamation-triangle text-yellow-600"}),l.createElement("div",null,l.createElement("div",{className:"font-medium text-gray-900"},e.title||e.message),l.createElement("div",{className:"text-sm text-gray-600"},e.server_name&&"Server: ".concat(e.server_name),e.severity&&" • Severity: ".concat(e.severity),e.created_at&&" • ".concat(new Date(e.created_at).toLocaleString())))),l.createElement("div",{className:"flex space-x-2"},l.createElement("button",{className:"btn btn-sm btn-secondary",onClick:function(){return Xe.acknowledgeAlert(e.id).catch(console.error)},title:"Acknowledge Alert"},l.createElement("i",{className:"fas fa-check"}))))}))),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mt-8"},l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-plus-circle text-4xl text-blue-500 mb-4"}),l.createElement("h3",{className:"text-lg font-semibold mb-2"},"Add Server"),l.createElement("p",{className:"text-gray-600 mb-4"},"Connect a new server to start monitoring"),l.createElement(xe,{to:"/servers/new",className:"btn btn-primary"},"Add Server")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-chart-line text-4xl text-green-500 mb-4"}),l.createElement("h3",{className:"text-lg font-semibold mb-2"},"View Monitoring"),l.createElement("p",{className:"text-gray-600 mb-4"},"Check real-time performance metrics"),l.createElement(xe,{to:"/monitoring",className:"btn btn-success"},"View Metrics")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-cog text-4xl text-gray-500 mb-4"}),l.createElement("h3",{className:"text-lg font-semibold mb-2"},"Configure Alerts"),l.createElement("p",{className:"text-gray-600 mb-4"},"Set up notifications and thresholds"),l.createElement(xe,{to:"/alerts",className:"btn btn-secondary"},"Configure"))))};function on(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||ln(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ln(e,t){if(e){if("string"==typeof e)return cn(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?cn(e,t):void 0}}function cn(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const sn=function(){var e=on((0,l.useState)("disconnected"),2),t=e[0],n=e[1],r=on((0,l.useState)([]),2),a=r[0],o=r[1],i=on((0,l.useState)(""),2),c=i[0],s=i[1],u=on((0,l.useState)({}),2),f=u[0],d=u[1];(0,l.useEffect)(function(){var e=function(e){n("connected"),m("System","WebSocket connected successfully")},t=function(e){n("disconnected"),m("System","WebSocket disconnected: ".concat(e.reason))},r=function(e){m("Server",JSON.stringify(e,null,2))},a=function(e){m("Server","Pong received: ".concat(e.timestamp))},o=function(e){m("Error",e.error||"Unknown error")};nt.onMessage("connected",e),nt.onMessage("disconnected",t),nt.onMessage("message",r),nt.onMessage("pong",a),nt.onMessage("error",o),nt.connect();var l=setInterval(function(){d(nt.getStatus())},1e3);return function(){nt.offMessage("connected",e),nt.offMessage("disconnected",t),nt.offMessage("message",r),nt.offMessage("pong",a),nt.offMessage("error",o),clearInterval(l),nt.disconnect()}},[]);var m=function(e,t){o(function(n){return[].concat(function(e){if(Array.isArray(e))return cn(e)}(r=n)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(r)||ln(r)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}(),[{sender:e,message:t,timestamp:(new Date).toISOString()}]);var r})};return l.createElement("div",{className:"websocket-test-container"},l.createElement("h2",null,"WebSocket Test"),l.createElement("div",{className:"status-bar"},l.createElement("span",{className:"status-indicator ".concat(t)},t),l.createElement("div",{className:"connection-info"},l.createElement("span",null,"Attempts: ",f.reconnectAttempts||0,"/",f.maxReconnectAttempts||0))),l.createElement("div",{className:"controls"},l.createElement("button",{onClick:function(){nt.ping()?m("Client","Ping sent"):m("System","Failed to send ping - WebSocket not connected")},disabled:"connected"!==t},"Send Ping"),l.createElement("div",{className:"message-input"},l.createElement("input",{type:"text",value:c,onChange:function(e){return s(e.target.value)},placeholder:"Type a message...",disabled:"connected"!==t}),l.createElement("button",{onClick:function(){if(c.trim()){var e={type:"custom",content:c,timestamp:(new Date).toISOString()};nt.sendMessage(e)?(m("Client",c),s("")):m("System","Failed to send message - WebSocket not connected")}},disabled:"connected"!==t||!c.trim()},"Send"))),l.createElement("div",{className:"message-log"},l.createElement("h3",null,"Message Log"),l.createElement("div",{className:"messages"},0===a.length?l.createElement("p",{className:"no-messages"},"No messages yet"):a.map(function(e,t){return l.createElement("div",{key:t,className:"message ".concat(e.sender.toLowerCase())},l.createElement("div",{className:"message-header"},l.createElement("span",{className:"sender"},e.sender),l.createElement("span",{className:"timestamp"},new Date(e.timestamp).toLocaleTimeString())),l.createElement("div",{className:"message-content"},l.createElement("pre",null,e.message)))}))),l.createElement("style",{jsx:!0},"\n        .websocket-test-container {\n          max-width: 800px;\n          margin: 0 auto;\n          padding: 20px;\n          font-family: Arial, sans-serif;\n        }\n\n        .status-bar {\n          display: flex;\n          align-items: center;\n          gap: 10px;\n          margin-bottom: 20px;\n          padding: 10px;\n          background-color: #f5f5f5;\n          border-radius: 5px;\n        }\n\n        .status-indicator {\n          padding: 5px 10px;\n          border-radius: 15px;\n          font-weight: bold;\n          font-size: 12px;\n        }\n\n        .status-indicator.connected {\n          background-color: #4CAF50;\n          color: white;\n        }\n\n        .status-indicator.disconnected {\n          background-color: #F44336;\n          color: white;\n        }\n\n        .connection-info {\n          font-size: 12px;\n          color: #666;\n        }\n\n        .controls {\n          display: flex;\n          gap: 10px;\n          margin-bottom: 20px;\n        }\n\n        button {\n          padding: 8px 16px;\n          background-color: #4CAF50;\n          color: white;\n          border: none;\n          border-radius: 4px;\n          cursor: pointer;\n        }\n\n        button:disabled {\n          background-color: #cccccc;\n          cursor: not-allowed;\n        }\n\n        .message-input {\n          display: flex;\n          gap: 5px;\n          flex-grow: 1;\n        }\n\n        input {\n          flex-grow: 1;\n          padding: 8px;\n          border: 1px solid #ddd;\n          border-radius: 4px;\n        }\n\n        .message-log {\n          border: 1px solid #ddd;\n          border-radius: 5px;\n          padding: 15px;\n          max-height: 400px;\n          overflow-y: auto;\n        }\n\n        .messages {\n          display: flex;\n          flex-direction: column;\n          gap: 10px;\n        }\n\n        .message {\n          padding: 10px;\n          border-radius: 5px;\n          border-left: 3px solid #ddd;\n        }\n\n        .message.system {\n          border-left-color: #666;\n          background-color: #f9f9f9;\n        }\n\n        .message.client {\n          border-left-color: #4CAF50;\n          background-color: #f0fff0;\n          margin-left: 20px;\n        }\n\n        .message.server {\n          border-left-color: #2196F3;\n          background-color: #f0f7ff;\n          margin-left: 40px;\n        }\n\n        .message.error {\n          border-left-color: #F44336;\n          background-color: #fff0f0;\n        }\n\n        .message-header {\n          display: flex;\n          justify-content: space-between;\n          margin-bottom: 5px;\n          font-size: 12px;\n          color: #666;\n        }\n\n        .message-content {\n          font-size: 14px;\n        }\n\n        .message-content pre {\n          margin: 0;\n          white-space: pre-wrap;\n          word-wrap: break-word;\n        }\n\n        .no-messages {\n          color: #999;\n          text-align: center;\n          padding: 20px;\n        }\n      "))},un=function(){return l.createElement("nav",{className:"navbar"},l.createElement(xe,{to:"/",className:"navbar-brand"},l.createElement("i",{className:"fas fa-server mr-2"}),"Minimal Server Manager"),l.createElement("div",{className:"navbar-actions"},l.createElement("div",{className:"flex items-center space-x-4"},l.createElement("div",{className:"text-sm"},l.createElement("span",{className:"text-gray-200"},"Status: "),l.createElement("span",{className:"status-badge status-online"},"Connected")),l.createElement("button",{className:"btn btn-sm btn-secondary"},l.createElement("i",{className:"fas fa-cog mr-1"}),"Settings"),l.createElement("button",{className:"btn btn-sm btn-secondary"},l.createElement("i",{className:"fas fa-question-circle mr-1"}),"Help"))))},fn=function(){var e=ee();return l.createElement("aside",{className:"sidebar"},l.createElement("nav",null,l.createElement("ul",{className:"sidebar-nav"},[{path:"/",icon:"fas fa-tachometer-alt",label:"Dashboard"},{path:"/servers",icon:"fas fa-server",label:"Servers"},{path:"/monitoring",icon:"fas fa-chart-line",label:"Monitoring"},{path:"/alerts",icon:"fas fa-bell",label:"Alerts"},{path:"/logs",icon:"fas fa-file-alt",label:"Logs"},{path:"/settings",icon:"fas fa-cog",label:"Settings"}].map(function(t){return l.createElement("li",{key:t.path},l.createElement(xe,{to:t.path,className:(n=t.path,("/"===n?"/"===e.pathname:e.pathname.startsWith(n))?"active":"")},l.createElement("i",{className:t.icon}),t.label));var n}))),l.createElement("div",{className:"mt-8 px-4"},l.createElement("div",{className:"text-xs text-gray-400 uppercase tracking-wide mb-2"},"Quick Actions"),l.createElement("div",{className:"space-y-2"},l.createElement(xe,{to:"/servers/new",className:"block w-full btn btn-primary btn-sm text-center"},l.createElement("i",{className:"fas fa-plus mr-1"}),"Add Server"),l.createElement(xe,{to:"/websocket-test",className:"block w-full btn btn-secondary btn-sm text-center"},l.createElement("i",{className:"fas fa-plug mr-1"}),"Test Connection"))))};function dn(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return mn(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(mn(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,mn(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,mn(f,"constructor",s),mn(s,"constructor",c),c.displayName="GeneratorFunction",mn(s,a,"GeneratorFunction"),mn(f),mn(f,a,"Generator"),mn(f,r,function(){return this}),mn(f,"toString",function(){return"[object Generator]"}),(dn=function(){return{w:o,m:d}})()}function mn(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}mn=function(e,t,n,r){function o(t,n){mn(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},mn(e,t,n,r)}function pn(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function hn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||function(e,t){if(e){if("string"==typeof e)return vn(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?vn(e,t):void 0}}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function vn(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const gn=function(e){var t=e.alert,n=e.onAcknowledge,r=e.onDismiss,a=hn((0,l.useState)(!0),2),o=a[0],i=a[1],c=hn((0,l.useState)(!1),2),s=c[0],u=c[1],f=function(){var e,r=(e=dn().m(function e(){var r;return dn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,u(!0),e.n=1,Xe.acknowledgeAlert(t.id);case 1:null==n||n(t),i(!1),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error acknowledging alert:",r);case 3:return e.p=3,u(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}),function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){pn(o,r,a,l,i,"next",e)}function i(e){pn(o,r,a,l,i,"throw",e)}l(void 0)})});return function(){return r.apply(this,arguments)}}();return o?l.createElement("div",{className:"fixed top-4 right-4 max-w-md p-4 border-l-4 rounded-lg shadow-lg z-50 ".concat(function(e){switch(null==e?void 0:e.toLowerCase()){case"critical":return"bg-red-100 border-red-500 text-red-800";case"warning":return"bg-yellow-100 border-yellow-500 text-yellow-800";case"info":return"bg-blue-100 border-blue-500 text-blue-800";default:return"bg-gray-100 border-gray-500 text-gray-800"}}(t.severity))},l.createElement("div",{className:"flex items-start"},l.createElement("div",{className:"flex-shrink-0"},l.createElement("i",{className:"".concat(function(e){switch(null==e?void 0:e.toLowerCase()){case"critical":return"fas fa-exclamation-triangle";case"warning":return"fas fa-exclamation-circle";case"info":return"fas fa-info-circle";default:return"fas fa-bell"}}(t.severity)," text-lg")})),l.createElement("div",{className:"ml-3 flex-1"},l.createElement("div",{className:"flex items-center justify-between"},l.createElement("h3",{className:"text-sm font-medium"},t.title||"Server Alert"),l.createElement("button",{onClick:function(){i(!1),null==r||r(t)},className:"ml-2 text-gray-400 hover:text-gray-600"},l.createElement("i",{className:"fas fa-times"}))),l.createElement("div",{className:"mt-1 text-sm"},l.createElement("p",null,t.message),t.server_name&&l.createElement("p",{className:"mt-1 text-xs opacity-75"},"Server: ",t.server_name),t.created_at&&l.createElement("p",{className:"mt-1 text-xs opacity-75"},new Date(t.created_at).toLocaleString())),l.createElement("div",{className:"mt-3 flex space-x-2"},l.createElement("button",{onClick:f,disabled:s,className:"text-xs bg-white bg-opacity-50 hover:bg-opacity-75 px-3 py-1 rounded border"},s?l.createElement("div",{className:"spinner mr-1"}):l.createElement("i",{className:"fas fa-check mr-1"}),"Acknowledge"))))):null};function bn(e){return bn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},bn(e)}function An(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function yn(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?An(Object(n),!0).forEach(function(t){En(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):An(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function En(e,t,n){return(t=function(e){var t=function(e){if("object"!=bn(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=bn(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==bn(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function wn(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return xn(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(xn(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,xn(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,xn(f,"constructor",s),xn(s,"constructor",c),c.displayName="GeneratorFunction",xn(s,a,"GeneratorFunction"),xn(f),xn(f,a,"Generator"),xn(f,r,function(){return this}),xn(f,"toString",function(){return"[object Generator]"}),(wn=function(){return{w:o,m:d}})()}function xn(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}xn=function(e,t,n,r){function o(t,n){xn(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},xn(e,t,n,r)}function kn(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Sn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||Nn(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Nn(e,t){if(e){if("string"==typeof e)return Cn(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Cn(e,t):void 0}}function Cn(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const Bn=function(){var e=Sn((0,l.useState)([]),2),t=e[0],n=e[1],r=Sn((0,l.useState)(!1),2),a=(r[0],r[1]);(0,l.useEffect)(function(){return o(),function(){i()}},[]);var o=function(){var e,t=(e=wn().m(function e(){var t;return wn().w(function(e){for(;;)switch(e.p=e.n){case 0:if(e.p=0,nt.getStatus().isConnected){e.n=1;break}return e.n=1,nt.connect();case 1:a(!0),nt.subscribe("alerts"),nt.onMessage("alert_created",c),nt.onMessage("alert_resolved",s),nt.onMessage("alert_updated",u),console.log("AlertManager initialized"),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to initialize AlertManager:",t),a(!1);case 3:return e.a(2)}},e,null,[[0,2]])}),function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){kn(o,r,a,l,i,"next",e)}function i(e){kn(o,r,a,l,i,"throw",e)}l(void 0)})});return function(){return t.apply(this,arguments)}}(),i=function(){nt.offMessage("alert_created",c),nt.offMessage("alert_resolved",s),nt.offMessage("alert_updated",u)},c=function(e){console.log("New alert received:",e);var t={id:e.id||Date.now(),title:e.title||"Server Alert",message:e.message||"A new alert has been triggered",severity:e.severity||"info",server_name:e.server_name,server_id:e.server_id,created_at:e.created_at||(new Date).toISOString(),acknowledged:!1,status:"active"};n(function(e){return[t].concat((n=e,function(e){if(Array.isArray(e))return Cn(e)}(n)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(n)||Nn(n)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}())).slice(0,10);var n}),"granted"===Notification.permission&&new Notification("Alert: ".concat(t.title),{body:t.message,icon:"/favicon.ico",tag:t.id})},s=function(e){console.log("Alert resolved:",e),n(function(t){return t.map(function(t){return t.id===e.id?yn(yn({},t),{},{status:"resolved",resolved_at:e.resolved_at}):t})})},u=function(e){console.log("Alert updated:",e),n(function(t){return t.map(function(t){return t.id===e.id?yn(yn({},t),e):t})})},f=function(e){console.log("Alert acknowledged:",e),n(function(t){return t.map(function(t){return t.id===e.id?yn(yn({},t),{},{acknowledged:!0,acknowledged_at:(new Date).toISOString()}):t})})},d=function(e){console.log("Alert dismissed:",e),n(function(t){return t.filter(function(t){return t.id!==e.id})})};return(0,l.useEffect)(function(){"Notification"in window&&"default"===Notification.permission&&Notification.requestPermission().then(function(e){"granted"===e&&console.log("Notification permission granted")})},[]),(0,l.useEffect)(function(){var e=setInterval(function(){n(function(e){return e.filter(function(e){if("resolved"===e.status){var t=new Date(e.resolved_at||e.updated_at);return new Date-t<3e4}return!0})})},5e3);return function(){return clearInterval(e)}},[]),l.createElement(l.Fragment,null,t.map(function(e){return l.createElement(gn,{key:e.id,alert:e,onAcknowledge:f,onDismiss:d})}),!1)};function _n(e){return _n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},_n(e)}function On(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Pn(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?On(Object(n),!0).forEach(function(t){jn(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):On(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function jn(e,t,n){return(t=function(e){var t=function(e){if("object"!=_n(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=_n(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==_n(t)?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Mn(e){return function(e){if(Array.isArray(e))return In(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||Fn(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Tn(){var e,t,n="function"==typeof Symbol?Symbol:{},r=n.iterator||"@@iterator",a=n.toStringTag||"@@toStringTag";function o(n,r,a,o){var c=r&&r.prototype instanceof i?r:i,s=Object.create(c.prototype);return zn(s,"_invoke",function(n,r,a){var o,i,c,s=0,u=a||[],f=!1,d={p:0,n:0,v:e,a:m,f:m.bind(e,4),d:function(t,n){return o=t,i=0,c=e,d.n=n,l}};function m(n,r){for(i=n,c=r,t=0;!f&&s&&!a&&t<u.length;t++){var a,o=u[t],m=d.p,p=o[2];n>3?(a=p===r)&&(c=o[(i=o[4])?5:(i=3,3)],o[4]=o[5]=e):o[0]<=m&&((a=n<2&&m<o[1])?(i=0,d.v=r,d.n=o[1]):m<p&&(a=n<3||o[0]>r||r>p)&&(o[4]=n,o[5]=r,d.n=p,i=0))}if(a||n>1)return l;throw f=!0,r}return function(a,u,p){if(s>1)throw TypeError("Generator is already running");for(f&&1===u&&m(u,p),i=u,c=p;(t=i<2?e:c)||!f;){o||(i?i<3?(i>1&&(d.n=-1),m(i,c)):d.n=c:d.v=c);try{if(s=2,o){if(i||(a="next"),t=o[a]){if(!(t=t.call(o,c)))throw TypeError("iterator result is not an object");if(!t.done)return t;c=t.value,i<2&&(i=0)}else 1===i&&(t=o.return)&&t.call(o),i<2&&(c=TypeError("The iterator does not provide a '"+a+"' method"),i=1);o=e}else if((t=(f=d.n<0)?c:n.call(r,d))!==l)break}catch(t){o=e,i=1,c=t}finally{s=1}}return{value:t,done:f}}}(n,a,o),!0),s}var l={};function i(){}function c(){}function s(){}t=Object.getPrototypeOf;var u=[][r]?t(t([][r]())):(zn(t={},r,function(){return this}),t),f=s.prototype=i.prototype=Object.create(u);function d(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,s):(e.__proto__=s,zn(e,a,"GeneratorFunction")),e.prototype=Object.create(f),e}return c.prototype=s,zn(f,"constructor",s),zn(s,"constructor",c),c.displayName="GeneratorFunction",zn(s,a,"GeneratorFunction"),zn(f),zn(f,a,"Generator"),zn(f,r,function(){return this}),zn(f,"toString",function(){return"[object Generator]"}),(Tn=function(){return{w:o,m:d}})()}function zn(e,t,n,r){var a=Object.defineProperty;try{a({},"",{})}catch(e){a=0}zn=function(e,t,n,r){function o(t,n){zn(e,t,function(e){return this._invoke(t,n,e)})}t?a?a(e,t,{value:n,enumerable:!r,configurable:!r,writable:!r}):e[t]=n:(o("next",0),o("throw",1),o("return",2))},zn(e,t,n,r)}function Ln(e,t,n,r,a,o,l){try{var i=e[o](l),c=i.value}catch(e){return void n(e)}i.done?t(c):Promise.resolve(c).then(r,a)}function Dn(e){return function(){var t=this,n=arguments;return new Promise(function(r,a){var o=e.apply(t,n);function l(e){Ln(o,r,a,l,i,"next",e)}function i(e){Ln(o,r,a,l,i,"throw",e)}l(void 0)})}}function Rn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,a,o,l,i=[],c=!0,s=!1;try{if(o=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;c=!1}else for(;!(c=(r=o.call(n)).done)&&(i.push(r.value),i.length!==t);c=!0);}catch(e){s=!0,a=e}finally{try{if(!c&&null!=n.return&&(l=n.return(),Object(l)!==l))return}finally{if(s)throw a}}return i}}(e,t)||Fn(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Fn(e,t){if(e){if("string"==typeof e)return In(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?In(e,t):void 0}}function In(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}const Un=function(){var e=Rn((0,l.useState)([]),2),t=e[0],n=e[1],r=Rn((0,l.useState)(!0),2),a=r[0],o=r[1],i=Rn((0,l.useState)("all"),2),c=i[0],s=i[1],u=Rn((0,l.useState)("created_at"),2),f=u[0],d=u[1],m=Rn((0,l.useState)("desc"),2),p=m[0],h=m[1];(0,l.useEffect)(function(){return E(),v(),function(){g()}},[]);var v=function(){var e=Dn(Tn().m(function e(){var t;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,nt.connect();case 1:nt.subscribe("alerts"),nt.onMessage("alert_created",b),nt.onMessage("alert_resolved",A),nt.onMessage("alert_updated",y),e.n=3;break;case 2:e.p=2,t=e.v,console.error("Failed to connect to WebSocket:",t);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(){return e.apply(this,arguments)}}(),g=function(){nt.offMessage("alert_created",b),nt.offMessage("alert_resolved",A),nt.offMessage("alert_updated",y)},b=function(e){n(function(t){return[e].concat(Mn(t))})},A=function(e){n(function(t){return t.map(function(t){return t.id===e.id?Pn(Pn({},t),{},{status:"resolved",resolved_at:e.resolved_at}):t})})},y=function(e){n(function(t){return t.map(function(t){return t.id===e.id?Pn(Pn({},t),e):t})})},E=function(){var e=Dn(Tn().m(function e(){var t,r;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,o(!0),e.n=1,Xe.getAlerts();case 1:t=e.v,n(t),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error fetching alerts:",r);case 3:return e.p=3,o(!1),e.f(3);case 4:return e.a(2)}},e,null,[[0,2,3,4]])}));return function(){return e.apply(this,arguments)}}(),w=function(){var e=Dn(Tn().m(function e(t){var r;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.acknowledgeAlert(t);case 1:n(function(e){return e.map(function(e){return e.id===t?Pn(Pn({},e),{},{acknowledged:!0,acknowledged_at:(new Date).toISOString()}):e})}),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error acknowledging alert:",r);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(t){return e.apply(this,arguments)}}(),x=function(){var e=Dn(Tn().m(function e(t){var r;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:return e.p=0,e.n=1,Xe.resolveAlert(t);case 1:n(function(e){return e.map(function(e){return e.id===t?Pn(Pn({},e),{},{status:"resolved",resolved_at:(new Date).toISOString()}):e})}),e.n=3;break;case 2:e.p=2,r=e.v,console.error("Error resolving alert:",r);case 3:return e.a(2)}},e,null,[[0,2]])}));return function(t){return e.apply(this,arguments)}}(),k=function(){var e=Dn(Tn().m(function e(t){var r;return Tn().w(function(e){for(;;)switch(e.p=e.n){case 0:if(!window.confirm("Are you sure you want to delete this alert?")){e.n=4;break}return e.p=1,e.n=2,Xe.deleteAlert(t);case 2:n(function(e){return e.filter(function(e){return e.id!==t})}),e.n=4;break;case 3:e.p=3,r=e.v,console.error("Error deleting alert:",r);case 4:return e.a(2)}},e,null,[[1,3]])}));return function(t){return e.apply(this,arguments)}}(),S=function(e){switch(null==e?void 0:e.toLowerCase()){case"critical":return"text-red-600 bg-red-100";case"warning":return"text-yellow-600 bg-yellow-100";case"info":return"text-blue-600 bg-blue-100";default:return"text-gray-600 bg-gray-100"}},N=function(e){switch(null==e?void 0:e.toLowerCase()){case"resolved":return"text-green-600 bg-green-100";case"acknowledged":return"text-blue-600 bg-blue-100";case"active":return"text-red-600 bg-red-100";default:return"text-gray-600 bg-gray-100"}},C=Mn(t.filter(function(e){return"all"===c||("active"===c?"active"===e.status:"acknowledged"===c?e.acknowledged&&"resolved"!==e.status:"resolved"!==c||"resolved"===e.status)})).sort(function(e,t){var n=e[f],r=t[f];return"created_at"!==f&&"acknowledged_at"!==f&&"resolved_at"!==f||(n=new Date(n),r=new Date(r)),"asc"===p?n>r?1:-1:n<r?1:-1});return a?l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-center items-center h-64"},l.createElement("div",{className:"spinner"}),l.createElement("span",{className:"ml-2"},"Loading alerts..."))):l.createElement("div",{className:"content-area"},l.createElement("div",{className:"flex justify-between items-center mb-6"},l.createElement("div",null,l.createElement("h1",{className:"text-2xl font-bold text-gray-900 mb-2"},"Alerts"),l.createElement("p",{className:"text-gray-600"},"Monitor and manage system alerts")),l.createElement(xe,{to:"/alerts/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Create Alert")),l.createElement("div",{className:"card mb-6"},l.createElement("div",{className:"flex flex-col md:flex-row gap-4"},l.createElement("div",{className:"flex-1"},l.createElement("select",{className:"form-select",value:c,onChange:function(e){return s(e.target.value)}},l.createElement("option",{value:"all"},"All Alerts"),l.createElement("option",{value:"active"},"Active"),l.createElement("option",{value:"acknowledged"},"Acknowledged"),l.createElement("option",{value:"resolved"},"Resolved"))),l.createElement("div",{className:"flex gap-2"},l.createElement("select",{className:"form-select",value:f,onChange:function(e){return d(e.target.value)}},l.createElement("option",{value:"created_at"},"Sort by Date"),l.createElement("option",{value:"severity"},"Sort by Severity"),l.createElement("option",{value:"status"},"Sort by Status")),l.createElement("button",{className:"btn btn-secondary",onClick:function(){return h("asc"===p?"desc":"asc")}},l.createElement("i",{className:"fas ".concat("asc"===p?"fa-arrow-up":"fa-arrow-down")}))))),l.createElement("div",{className:"card"},l.createElement("div",{className:"card-header"},l.createElement("h3",{className:"card-title"},"Alert List (",C.length," of ",t.length,")")),0===C.length?l.createElement("div",{className:"text-center py-12"},l.createElement("i",{className:"fas fa-bell text-6xl text-gray-300 mb-4"}),l.createElement("h3",{className:"text-xl font-semibold text-gray-600 mb-2"},"No alerts found"),l.createElement("p",{className:"text-gray-500 mb-6"},"all"===c?"No alerts have been created yet":"No ".concat(c," alerts found")),l.createElement(xe,{to:"/alerts/new",className:"btn btn-primary"},l.createElement("i",{className:"fas fa-plus mr-2"}),"Create Your First Alert")):l.createElement("div",{className:"overflow-x-auto"},l.createElement("table",{className:"table"},l.createElement("thead",null,l.createElement("tr",null,l.createElement("th",null,"Severity"),l.createElement("th",null,"Title"),l.createElement("th",null,"Server"),l.createElement("th",null,"Status"),l.createElement("th",null,"Created"),l.createElement("th",null,"Actions"))),l.createElement("tbody",null,C.map(function(e){return l.createElement("tr",{key:e.id},l.createElement("td",null,l.createElement("span",{className:"px-2 py-1 rounded-full text-xs font-medium ".concat(S(e.severity))},e.severity||"Unknown")),l.createElement("td",null,l.createElement("div",null,l.createElement("div",{className:"font-medium"},e.title||"Alert"),l.createElement("div",{className:"text-sm text-gray-600"},e.message))),l.createElement("td",{className:"text-gray-600"},e.server_name||"N/A"),l.createElement("td",null,l.createElement("span",{className:"px-2 py-1 rounded-full text-xs font-medium ".concat(N(e.status))},e.status||"active",e.acknowledged&&!e.resolved_at&&" (Ack)")),l.createElement("td",{className:"text-gray-600"},new Date(e.created_at).toLocaleString()),l.createElement("td",null,l.createElement("div",{className:"flex space-x-2"},!e.acknowledged&&l.createElement("button",{className:"btn btn-sm btn-secondary",onClick:function(){return w(e.id)},title:"Acknowledge Alert"},l.createElement("i",{className:"fas fa-check"})),"resolved"!==e.status&&l.createElement("button",{className:"btn btn-sm btn-success",onClick:function(){return x(e.id)},title:"Resolve Alert"},l.createElement("i",{className:"fas fa-check-double"})),l.createElement("button",{className:"btn btn-sm btn-danger",onClick:function(){return k(e.id)},title:"Delete Alert"},l.createElement("i",{className:"fas fa-trash"})))))}))))),l.createElement("div",{className:"grid grid-cols-1 md:grid-cols-4 gap-6 mt-6"},l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-bell text-3xl text-blue-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.length),l.createElement("div",{className:"text-gray-600"},"Total Alerts")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-exclamation-circle text-3xl text-red-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return"active"===e.status}).length),l.createElement("div",{className:"text-gray-600"},"Active")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-check-circle text-3xl text-yellow-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return e.acknowledged&&"resolved"!==e.status}).length),l.createElement("div",{className:"text-gray-600"},"Acknowledged")),l.createElement("div",{className:"card text-center"},l.createElement("i",{className:"fas fa-check-double text-3xl text-green-500 mb-2"}),l.createElement("div",{className:"text-2xl font-bold text-gray-900"},t.filter(function(e){return"resolved"===e.status}).length),l.createElement("div",{className:"text-gray-600"},"Resolved"))))},Wn=function(){return l.createElement(ye,null,l.createElement("div",{className:"app-container"},l.createElement(un,null),l.createElement("div",{className:"main-content"},l.createElement(fn,null),l.createElement("div",{className:"content-area"},l.createElement(he,null,l.createElement(me,{path:"/",element:l.createElement(an,null)}),l.createElement(me,{path:"/servers",element:l.createElement(mt,null)}),l.createElement(me,{path:"/servers/new",element:l.createElement(zt,null)}),l.createElement(me,{path:"/servers/:id",element:l.createElement(kt,null)}),l.createElement(me,{path:"/alerts",element:l.createElement(Un,null)}),l.createElement(me,{path:"/settings",element:l.createElement(Vt,null)}),l.createElement(me,{path:"/websocket-test",element:l.createElement(sn,null)})))),l.createElement(Bn,null)))};c.createRoot(document.getElementById("root")).render(l.createElement(l.StrictMode,null,l.createElement(Wn,null)))})();
 //# sourceMappingURL=bundle.js.map
\ No newline at end of file
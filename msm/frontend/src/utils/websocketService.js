@@ -15,6 +15,7 @@ class WebSocketService {
     this.heartbeatInterval = null;
     this.lastPingTime = null;
     this.backendUrl = 'ws://localhost:8000/ws';
+    this.textDecoder = new TextDecoder();
   }
 
   // Initialize WebSocket connection
@@ -33,6 +34,8 @@ class WebSocketService {
     });
 
     this.socket = new WebSocket(this.backendUrl);
+    // The server sends pre-encoded UTF-8 JSON as binary frames
+    this.socket.binaryType = 'arraybuffer';
 
     this.socket.onopen = () => {
       console.log('WebSocket connected successfully');
@@ -53,11 +56,11 @@ class WebSocketService {
 
     this.socket.onmessage = (event) => {
       try {
-        const message = JSON.parse(event.data);
+        const text = typeof event.data === 'string' ? event.data : this.textDecoder.decode(event.data);
+        const message = JSON.parse(text);
         console.log('WebSocket message received:', message);
         
-        // Handle different message types
-        this.handleMessage(message);
+        this.dispatchFrame(message);
       } catch (error) {
         console.error('Error parsing WebSocket message:', error);
       }
@@ -193,6 +196,24 @@ class WebSocketService {
     }
   }
 
+  // Unpack coalesced frames before handing messages to the handlers
+  dispatchFrame(message) {
+    // The server packs bursts of queued messages into a single batch frame
+    if (message.type === 'batch') {
+      message.items.forEach(item => this.dispatchFrame(item));
+      return;
+    }
+
+    // Monitoring updates of one type are flushed together as a list under one envelope
+    if (Array.isArray(message.data)) {
+      message.data.forEach(data => this.handleMessage({ ...message, data }));
+      return;
+    }
+
+    // Handle different message types
+    this.handleMessage(message);
+  }
+
   // Handle incoming messages
   handleMessage(message) {
     if (!message || !message.type) {
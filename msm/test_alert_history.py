@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test keyset pagination of the alert history
+"""
+import sys
+import os
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+from sqlalchemy.orm import sessionmaker
+from database import init_db
+from models import AlertHistory
+from services.alert_service import AlertService
+
+def test_pages_across_equal_timestamps():
+    """Entries sharing a triggered_at are neither skipped nor repeated between pages"""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'app.db')}"
+        engine = init_db(url)
+        db = sessionmaker(bind=engine)()
+        try:
+            same = datetime(2024, 3, 1, 12, 0, 0)
+            db.add_all([AlertHistory(message=f"alert {n}", triggered_at=same) for n in range(5)])
+            db.add(AlertHistory(message="older", triggered_at=datetime(2024, 3, 1, 11, 0, 0)))
+            db.commit()
+        finally:
+            db.close()
+            engine.dispose()
+
+        service = AlertService(url)
+        try:
+            seen, cursor = [], None
+            while True:
+                page = service.get_alert_history(limit=2, before=cursor)
+                seen.extend(item.message for item in page)
+                if len(page) < 2:
+                    break
+                cursor = (page[-1].triggered_at, page[-1].id)
+            assert seen == [f"alert {n}" for n in reversed(range(5))] + ["older"]
+        finally:
+            service.engine.dispose()
+
+if __name__ == "__main__":
+    test_pages_across_equal_timestamps()
+    print("[PASS] alert history pagination")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test that stopping the alert service does not wait out the mail batch window
+"""
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+from database import init_db
+from services.alert_service import AlertService
+
+def test_stop_interrupts_mail_batch():
+    """stop() returns promptly while the mail worker is gathering a batch"""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'app.db')}"
+        init_db(url).dispose()
+        service = AlertService(url)
+        service.mail_batch_window = 30
+        service.start()
+        try:
+            service._mail_queue.put(("subject", "message", ("ops@example.com",)))
+            time.sleep(0.2)  # the worker is now inside the batch window
+
+            started = time.monotonic()
+            service.stop(timeout=10)
+            assert time.monotonic() - started < 2
+        finally:
+            service.stop()
+            service.engine.dispose()
+
+if __name__ == "__main__":
+    test_stop_interrupts_mail_batch()
+    print("[PASS] alert service shutdown")
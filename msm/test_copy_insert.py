@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test that the PostgreSQL COPY payload stores values the way INSERT does
+"""
+import sys
+import os
+import csv
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+import orjson
+from sqlalchemy.dialects.postgresql import psycopg2
+from database import COPY_NULL, _copy_buffer
+from models import LogEntry, Metric, ServerCredentials
+from models.server_models import EncryptedString, LogLevel
+
+DIALECT = psycopg2.dialect()
+
+def _copy_rows(model, rows):
+    columns = list(rows[0].keys())
+    return list(csv.reader(_copy_buffer(model.__table__, columns, rows, DIALECT)))
+
+def test_copy_applies_type_decorators():
+    """IntEnumType levels go out as integers, EncryptedString values encrypted"""
+    levels = _copy_rows(LogEntry, [
+        {'source_id': 1, 'level': 'ERROR', 'message': 'disk full'},
+        {'source_id': 1, 'level': LogLevel.WARNING, 'message': None},
+    ])
+    assert levels == [
+        ['1', str(int(LogLevel.ERROR)), 'disk full'],
+        ['1', str(int(LogLevel.WARNING)), COPY_NULL],
+    ]
+
+    (row,) = _copy_rows(ServerCredentials, [{'server_id': 1, 'password_encrypted': 'hunter2'}])
+    assert row[1].startswith(EncryptedString.PREFIX)
+    assert EncryptedString().process_result_value(row[1], DIALECT) == 'hunter2'
+
+def test_copy_serializes_json():
+    """JSON values are written as JSON text, not Python reprs"""
+    (row,) = _copy_rows(Metric, [{'server_id': 1, 'metric_type': 'cpu', 'value': {'usage': 12.5}}])
+    assert orjson.loads(row[2]) == {'usage': 12.5}
+
+if __name__ == "__main__":
+    test_copy_applies_type_decorators()
+    test_copy_serializes_json()
+    print("[PASS] COPY payload")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test that init_db moves SSH credentials out of a pre-split servers table
+"""
+import sys
+import os
+import sqlite3
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+from sqlalchemy.orm import sessionmaker
+from database import init_db
+from models import ServerCredentials
+from models.server_models import EncryptedString
+
+# servers as created by the baseline schema, credentials inline
+BASELINE_SERVERS = """
+CREATE TABLE servers (
+    id INTEGER NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    ip VARCHAR(50) NOT NULL,
+    port INTEGER,
+    user VARCHAR(50) NOT NULL,
+    ssh_key_path TEXT,
+    password_encrypted TEXT,
+    use_key BOOLEAN,
+    is_active BOOLEAN,
+    created_at DATETIME,
+    updated_at DATETIME,
+    last_connected DATETIME,
+    status VARCHAR(50),
+    PRIMARY KEY (id)
+)
+"""
+
+def test_credentials_backfill():
+    """Legacy plaintext, encrypted and key-based credentials survive the upgrade"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'app.db')
+        encrypted = EncryptedString().process_bind_param('already-encrypted', None)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute(BASELINE_SERVERS)
+        conn.executemany(
+            "INSERT INTO servers (id, name, ip, port, user, ssh_key_path, password_encrypted, use_key) "
+            "VALUES (?, ?, ?, 22, 'root', ?, ?, ?)",
+            [
+                (1, 'plain', '10.0.0.1', None, 'hunter2', 0),
+                (2, 'encrypted', '10.0.0.2', None, encrypted, 0),
+                (3, 'key', '10.0.0.3', '/keys/id_rsa', None, 1),
+                (4, 'none', '10.0.0.4', None, None, None),
+            ]
+        )
+        conn.commit()
+        conn.close()
+
+        engine = init_db(f"sqlite:///{db_path}")
+        try:
+            db = sessionmaker(bind=engine)()
+            try:
+                creds = {c.server_id: c for c in db.query(ServerCredentials)}
+                assert sorted(creds) == [1, 2, 3]
+                assert creds[1].connect_args() == {'password': 'hunter2', 'key_path': None}
+                assert creds[2].connect_args() == {'password': 'already-encrypted', 'key_path': None}
+                assert creds[3].connect_args() == {'password': None, 'key_path': '/keys/id_rsa'}
+            finally:
+                db.close()
+
+            # Stored encrypted, and no longer in the servers row
+            with engine.connect() as raw:
+                stored = dict(raw.exec_driver_sql(
+                    "SELECT server_id, password_encrypted FROM server_credentials").all())
+                legacy = raw.exec_driver_sql(
+                    "SELECT COUNT(*) FROM servers WHERE password_encrypted IS NOT NULL").scalar()
+            assert stored[1].startswith(EncryptedString.PREFIX)
+            assert stored[2].startswith(EncryptedString.PREFIX)
+            assert legacy == 0
+
+            # Running init_db again is a no-op
+            init_db(f"sqlite:///{db_path}").dispose()
+            with engine.connect() as raw:
+                assert raw.exec_driver_sql("SELECT COUNT(*) FROM server_credentials").scalar() == 3
+        finally:
+            engine.dispose()
+
+if __name__ == "__main__":
+    test_credentials_backfill()
+    print("[PASS] credentials backfill")
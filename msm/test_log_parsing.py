@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test the per-format log line parsers and the separator splitters
+"""
+import sys
+import os
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+from services import log_service
+from services.log_service import (
+    COMMON_LOG_RE, SYSLOG_RE, LogService, _split_common_line, _split_syslog_line
+)
+
+NOW = '2024-03-01T12:00:00'
+
+COMMON_LINES = [
+    '127.0.0.1 - frank [10/Oct/2000:13:55:36 -0700] "GET /apache_pb.gif HTTP/1.0" 200 2326',
+    '10.0.0.5 - - [18/Sep/2023:10:23:45 +0000] "POST /api/login HTTP/1.1" 401 -',
+    '10.0.0.5 - - [18/Sep/2023:10:23:45 +0000] "GET / HTTP/1.1" 200 512 "-" "curl/8.0"',
+]
+SYSLOG_LINES = [
+    'Mar  1 12:00:01 web01 sshd[2201]: Accepted publickey for root from 10.0.0.9',
+    'Oct 11 22:14:15 db02 kernel: Out of memory: Killed process 4242 (postgres)',
+]
+MALFORMED_LINES = [
+    '',
+    'plain text without any structure',
+    '127.0.0.1 - frank 10/Oct/2000 "GET /" 200 2326',
+    'Mar  1 12:00:01 web01',
+    'Mar  1 12:00:01 web01 no-colon-here',
+]
+
+def _service():
+    # Parsing never touches the database; the engine only needs a file URL
+    return LogService(f"sqlite:///{os.path.join(tempfile.gettempdir(), 'msm-test-logs.db')}")
+
+def test_split_matches_regex():
+    """The separator splitters agree with the regexes they stand in for"""
+    for line in COMMON_LINES:
+        assert _split_common_line(line) == COMMON_LOG_RE.match(line).groups()
+    for line in SYSLOG_LINES:
+        assert _split_syslog_line(line) == SYSLOG_RE.match(line).groups()
+    for line in MALFORMED_LINES:
+        assert _split_common_line(line) is None
+        assert _split_syslog_line(line) is None
+
+def test_common_format():
+    entry = _service()._parse_log_line(COMMON_LINES[0], 'common', NOW)
+    assert entry['ip'] == '127.0.0.1'
+    assert entry['user'] == '-'
+    assert entry['request'] == 'GET /apache_pb.gif HTTP/1.0'
+    assert entry['status'] == '200'
+    assert entry['size'] == '2326'
+    assert entry['timestamp'] == '2000-10-10T13:55:36-07:00'
+
+def test_syslog_format():
+    entry = _service()._parse_log_line(SYSLOG_LINES[0], 'syslog', NOW)
+    assert entry['timestamp'] == 'Mar  1 12:00:01'
+    assert entry['hostname'] == 'web01'
+    assert entry['process'] == 'sshd[2201]'
+    assert entry['message'] == 'Accepted publickey for root from 10.0.0.9'
+
+def test_json_format():
+    service = _service()
+    entry = service._parse_log_line('{"level": "error", "@timestamp": "2024-01-01T00:00:00Z"}', 'json', NOW)
+    assert entry['json']['level'] == 'error'
+    assert entry['timestamp'] == '2024-01-01T00:00:00Z'
+    assert service._parse_log_line('{"level": "info"}', 'json', NOW)['timestamp'] == NOW
+
+def test_fallback_entry():
+    """Lines that fit no format, and unknown formats, become plain entries"""
+    service = _service()
+    for log_format, line in (('common', 'plain text'), ('syslog', 'plain text'),
+                             ('json', 'not json'), ('auto', 'anything')):
+        assert service._parse_log_line(line, log_format, NOW) == {
+            'timestamp': NOW, 'message': line, 'raw': line
+        }
+
+def test_scan_counts_match_parsing():
+    """The mmap scan for large backlogs counts the same lines as parsing them"""
+    lines = SYSLOG_LINES + MALFORMED_LINES + [
+        'Mar  1 12:00:02 web01 app[1]: ERROR connection refused',
+        'Mar  1 12:00:03 web01 app[1]: Warning: disk 91% full',
+        'plain critical failure, fatal and severe',
+        '   ',
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines * 50) + '\n')
+
+        counts = []
+        threshold = log_service.MMAP_SCAN_THRESHOLD
+        try:
+            for source_id, scan_threshold in ((1, 10 ** 9), (2, 0)):
+                log_service.MMAP_SCAN_THRESHOLD = scan_threshold
+                results = _service()._parse_log_file(
+                    SimpleNamespace(id=source_id, source_path=path, source_type='syslog'))
+                counts.append((results['error_count'], results['warning_count']))
+        finally:
+            log_service.MMAP_SCAN_THRESHOLD = threshold
+        assert counts[0] == counts[1] == (100, 50)
+
+if __name__ == "__main__":
+    test_split_matches_regex()
+    test_common_format()
+    test_syslog_format()
+    test_json_format()
+    test_fallback_entry()
+    test_scan_counts_match_parsing()
+    print("[PASS] log parsing")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test the Gorilla metric archive codec and the archive pass
+"""
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+from database import init_db
+from models import Metric, MetricArchive, Server
+from services.metric_archive import archive_metrics, decode_block, encode_block
+
+START = datetime(2024, 3, 1, 12, 0, 0)
+
+def _round_trip(samples):
+    return decode_block(MetricArchive(**encode_block(samples)))
+
+def test_scalar_round_trip():
+    """Irregular intervals, repeated, negative and missing values come back unchanged"""
+    offsets = [0, 5, 10, 15, 21, 80, 81, 4000, 4000 + 70000]
+    values = [12.5, 12.5, 13.25, -0.001, 0.0, 1e9, None, 99.999, 3.0]
+    samples = [(START + timedelta(seconds=o), v) for o, v in zip(offsets, values)]
+
+    decoded = _round_trip(samples)
+    assert [s['timestamp'] for s in decoded] == [ts for ts, _ in samples]
+    assert [s['value'] for s in decoded] == values
+
+def test_structured_round_trip():
+    """Int and float fields keep their type; constants and missing fields are preserved"""
+    readings = [
+        {'usage': 10.5, 'cores': 4, 'mount_point': '/'},
+        {'usage': 11.0, 'cores': 4, 'mount_point': '/'},
+        {'usage': 97.125, 'mount_point': '/'},
+    ]
+    samples = [(START + timedelta(seconds=5 * i), r) for i, r in enumerate(readings)]
+
+    decoded = _round_trip(samples)
+    assert [s['value'] for s in decoded] == readings
+    assert isinstance(decoded[0]['value']['cores'], int)
+
+def test_archive_metrics():
+    """Raw rows past the cutoff move into hourly blocks that decode to the same samples"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = init_db(f"sqlite:///{os.path.join(tmp, 'app.db')}")
+        db = sessionmaker(bind=engine)()
+        try:
+            db.add(Server(id=1, name='web', ip='10.0.0.1', user='root'))
+            samples = [(START + timedelta(minutes=10 * i), float(i)) for i in range(12)]
+            db.add_all([Metric(server_id=1, metric_type='cpu', value=v) for _, v in samples])
+            db.flush()
+            for metric, (ts, _) in zip(db.scalars(select(Metric).order_by(Metric.id)), samples):
+                metric.timestamp = ts
+            db.commit()
+
+            cutoff = START + timedelta(hours=1)
+            assert archive_metrics(db, cutoff) == 6
+            db.commit()
+
+            assert db.scalar(select(func.count()).select_from(Metric)) == 6
+            (block,) = db.scalars(select(MetricArchive)).all()
+            assert block.start_ts == START
+            assert [(s['timestamp'], s['value']) for s in decode_block(block)] == samples[:6]
+        finally:
+            db.close()
+            engine.dispose()
+
+if __name__ == "__main__":
+    test_scalar_round_trip()
+    test_structured_round_trip()
+    test_archive_metrics()
+    print("[PASS] metric archive")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test that the PostgreSQL partitioning DDL leaves the shared metadata untouched
+"""
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+from sqlalchemy.dialects.postgresql import psycopg2
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+from database import PARTITIONED_TABLES, init_db
+from models import Base, Metric, Server
+
+def test_postgresql_ddl():
+    """Time-series tables are range-partitioned with the partition key in the primary key"""
+    for name in PARTITIONED_TABLES:
+        ddl = str(CreateTable(Base.metadata.tables[name]).compile(dialect=psycopg2.dialect()))
+        assert "PRIMARY KEY (id, timestamp)" in ddl
+        assert "PARTITION BY RANGE (timestamp)" in ddl
+    servers = str(CreateTable(Server.__table__).compile(dialect=psycopg2.dialect()))
+    assert "PRIMARY KEY (id)" in servers and "PARTITION BY" not in servers
+
+def test_sqlite_after_postgresql_ddl():
+    """Compiling the PostgreSQL DDL first does not change the SQLite key"""
+    CreateTable(Metric.__table__).compile(dialect=psycopg2.dialect())
+    assert [c.name for c in Metric.__table__.primary_key] == ['id']
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = init_db(f"sqlite:///{os.path.join(tmp, 'app.db')}")
+        db = sessionmaker(bind=engine)()
+        try:
+            db.add(Metric(server_id=None, metric_type='cpu', value={'usage': 1.0}))
+            db.commit()
+            assert db.query(Metric).one().id == 1
+        finally:
+            db.close()
+            engine.dispose()
+
+if __name__ == "__main__":
+    test_postgresql_ddl()
+    test_sqlite_after_postgresql_ddl()
+    print("[PASS] partition DDL")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test that init_db brings a database created by the baseline schema up to date
+"""
+import sys
+import os
+import logging
+import sqlite3
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import sessionmaker
+from database import init_db
+from models import Alert, CustomCommand, Metric, TelegramConfig
+
+# Tables as created by the baseline schema
+BASELINE_SCHEMA = """
+CREATE TABLE servers (
+    id INTEGER NOT NULL, name VARCHAR(100) NOT NULL, ip VARCHAR(50) NOT NULL, port INTEGER,
+    user VARCHAR(50) NOT NULL, ssh_key_path TEXT, password_encrypted TEXT, use_key BOOLEAN,
+    is_active BOOLEAN, created_at DATETIME, updated_at DATETIME, last_connected DATETIME,
+    status VARCHAR(50), PRIMARY KEY (id)
+);
+CREATE TABLE telegram_config (
+    id INTEGER NOT NULL, bot_token VARCHAR(100), chat_id VARCHAR(50), enabled BOOLEAN,
+    last_test DATETIME, last_notification DATETIME, notification_count INTEGER, PRIMARY KEY (id)
+);
+CREATE TABLE alerts (
+    id INTEGER NOT NULL, server_id INTEGER, name VARCHAR(100) NOT NULL,
+    metric_type VARCHAR(50) NOT NULL, field VARCHAR(50) NOT NULL, comparison VARCHAR(20) NOT NULL,
+    threshold_value INTEGER NOT NULL, severity VARCHAR(20), cooldown_minutes INTEGER,
+    notification_emails TEXT, is_active BOOLEAN, created_at DATETIME,
+    PRIMARY KEY (id), FOREIGN KEY(server_id) REFERENCES servers (id)
+);
+CREATE TABLE custom_commands (
+    id INTEGER NOT NULL, server_id INTEGER, name VARCHAR(100) NOT NULL, command TEXT NOT NULL,
+    regex_pattern TEXT, enabled BOOLEAN, created_at DATETIME,
+    PRIMARY KEY (id), FOREIGN KEY(server_id) REFERENCES servers (id)
+);
+CREATE TABLE metrics (
+    id INTEGER NOT NULL, server_id INTEGER, metric_type VARCHAR(50) NOT NULL,
+    value TEXT NOT NULL, timestamp DATETIME,
+    PRIMARY KEY (id), FOREIGN KEY(server_id) REFERENCES servers (id)
+);
+"""
+
+def _baseline_db(tmp: str) -> str:
+    db_path = os.path.join(tmp, 'app.db')
+    conn = sqlite3.connect(db_path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executescript("""
+        INSERT INTO servers (id, name, ip, user) VALUES (1, 'web', '10.0.0.1', 'root');
+        INSERT INTO telegram_config (id, bot_token, chat_id, enabled, notification_count)
+            VALUES (1, 'token', '42', 1, 3);
+        INSERT INTO alerts (id, server_id, name, metric_type, field, comparison, threshold_value, is_active)
+            VALUES (1, 1, 'High CPU', 'cpu', 'usage', '>', 90, 1);
+        INSERT INTO custom_commands (id, server_id, name, command, enabled)
+            VALUES (1, 1, 'uptime', 'uptime', 1);
+        INSERT INTO metrics (server_id, metric_type, value, timestamp)
+            VALUES (1, 'cpu', '{"usage": 42.5}', '2024-03-01 12:00:00');
+    """)
+    conn.commit()
+    conn.close()
+    return db_path
+
+def test_version_columns_added():
+    """Versioned rows from before version_id load and update after the upgrade"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = _baseline_db(tmp)
+        engine = init_db(f"sqlite:///{db_path}")
+        db = sessionmaker(bind=engine)()
+        try:
+            changes = {Alert: ('threshold_value', 95), CustomCommand: ('enabled', False),
+                       TelegramConfig: ('enabled', False)}
+            for model, (field, value) in changes.items():
+                row = db.get(model, 1)
+                assert row.version_id == 0
+                setattr(row, field, value)
+            db.commit()
+            assert [db.get(model, 1).version_id for model in changes] == [1, 1, 1]
+        finally:
+            db.close()
+            engine.dispose()
+
+        # Running init_db again is a no-op
+        init_db(f"sqlite:///{db_path}").dispose()
+
+def test_legacy_metric_values():
+    """Metric values stored as JSON text by the baseline read back decoded"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = init_db(f"sqlite:///{_baseline_db(tmp)}")
+        db = sessionmaker(bind=engine)()
+        try:
+            db.add(Metric(server_id=1, metric_type='cpu', value={'usage': 50.0}))
+            db.commit()
+            assert [m.value for m in db.query(Metric).order_by(Metric.id)] == [{'usage': 42.5}, {'usage': 50.0}]
+        finally:
+            db.close()
+            engine.dispose()
+
+class _Warnings(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+def test_indexes_added_once():
+    """Missing model indexes are created; existing ones are left alone on later runs"""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{_baseline_db(tmp)}"
+        engine = init_db(url)
+        try:
+            names = {index['name'] for index in inspect(engine).get_indexes('metrics')}
+            assert 'ix_metrics_server_type_ts' in names
+        finally:
+            engine.dispose()
+
+        handler = _Warnings()
+        logging.getLogger().addHandler(handler)
+        try:
+            init_db(url).dispose()
+        finally:
+            logging.getLogger().removeHandler(handler)
+        assert not handler.records
+
+if __name__ == "__main__":
+    test_version_columns_added()
+    test_legacy_metric_values()
+    test_indexes_added_once()
+    print("[PASS] schema upgrade")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test that timestamps are filled in by the database, including for bulk inserts
+"""
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import sessionmaker
+from database import bulk_insert, init_db
+from models import Metric, Server
+
+def test_bulk_insert_timestamps():
+    """Rows inserted without a timestamp get the database's current UTC time"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = init_db(f"sqlite:///{os.path.join(tmp, 'app.db')}")
+        db = sessionmaker(bind=engine)()
+        try:
+            db.add(Server(id=1, name='web', ip='10.0.0.1', user='root'))
+            db.commit()
+            before = datetime.utcnow().replace(microsecond=0)
+            bulk_insert(db, Metric, [{'server_id': 1, 'metric_type': 'cpu', 'value': float(i)}
+                                     for i in range(5)])
+            db.commit()
+            after = datetime.utcnow() + timedelta(seconds=1)
+
+            timestamps = db.scalars(select(Metric.timestamp)).all()
+            assert len(timestamps) == 5
+            assert all(before <= ts <= after for ts in timestamps)
+        finally:
+            db.close()
+            engine.dispose()
+
+def test_updated_at_onupdate():
+    """Changing a servers column bumps updated_at on the database side"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = init_db(f"sqlite:///{os.path.join(tmp, 'app.db')}")
+        db = sessionmaker(bind=engine)()
+        try:
+            db.add(Server(id=1, name='web', ip='10.0.0.1', user='root'))
+            db.commit()
+            db.execute(text("UPDATE servers SET updated_at = '2000-01-01 00:00:00'"))
+            db.commit()
+
+            server = db.get(Server, 1)
+            server.status = 'online'
+            db.commit()
+            assert server.updated_at > datetime(2000, 1, 1)
+        finally:
+            db.close()
+            engine.dispose()
+
+if __name__ == "__main__":
+    test_bulk_insert_timestamps()
+    test_updated_at_onupdate()
+    print("[PASS] server-side defaults")
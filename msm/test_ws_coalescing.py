@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test WebSocket update coalescing: enqueue -> flush -> batched frames
+"""
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('MSM_SECRET_KEY', 'msm-test-key')
+# Importing app initialises its database and services; keep them off data/app.db
+os.environ['DB_TYPE'] = 'sqlite'
+os.environ['DB_PATH'] = os.path.join(tempfile.mkdtemp(), 'app.db')
+
+import orjson
+from app import ConnectionManager
+
+class FakeWebSocket:
+    """Records sent frames; sends block while gate is cleared"""
+    def __init__(self):
+        self.frames = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.closed = None
+
+    async def accept(self):
+        pass
+
+    async def close(self, code: int = 1000):
+        self.closed = code
+
+    async def send_bytes(self, data: bytes):
+        await self.gate.wait()
+        self.frames.append(orjson.loads(data))
+
+async def _settle(manager: ConnectionManager, turns: int = 3):
+    await asyncio.sleep(manager.flush_interval * turns)
+
+def test_enqueue_coalesces_per_type():
+    """Updates enqueued from other threads go out as one broadcast per type per flush"""
+    async def scenario():
+        manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        def producer():
+            for i in range(3):
+                manager.enqueue("metrics_update", {"server_id": i})
+            manager.enqueue_many("status_update", [{"server_id": 0, "status": "online"}])
+        thread = threading.Thread(target=producer)
+        thread.start()
+        thread.join()
+        await _settle(manager)
+        return websocket.frames
+
+    frames = asyncio.run(scenario())
+    items = [item for frame in frames for item in (frame["items"] if frame["type"] == "batch" else [frame])]
+    by_type = {item["type"]: item["data"] for item in items}
+    assert by_type["metrics_update"] == [{"server_id": 0}, {"server_id": 1}, {"server_id": 2}]
+    assert by_type["status_update"] == [{"server_id": 0, "status": "online"}]
+    assert len(items) == 2
+
+def test_backlog_is_capped():
+    """Updates beyond max_pending are dropped until the next flush"""
+    async def scenario():
+        manager = ConnectionManager()
+        manager.max_pending = 2
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+        manager.enqueue_many("metrics_update", [{"n": n} for n in range(5)])
+        await _settle(manager)
+        return websocket.frames
+
+    (frame,) = asyncio.run(scenario())
+    assert frame["data"] == [{"n": 0}, {"n": 1}]
+
+def test_sender_batches_backlog():
+    """Frames queued while a send is in flight leave as a single batch frame"""
+    async def scenario():
+        manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        websocket.gate.clear()
+        await manager.broadcast({"n": 0}, "update")
+        await asyncio.sleep(0)  # the sender picks up the first frame and blocks
+        for n in range(1, 4):
+            await manager.broadcast({"n": n}, "update")
+        websocket.gate.set()
+        await _settle(manager)
+        return websocket.frames
+
+    first, second = asyncio.run(scenario())
+    assert first["type"] == "update" and first["data"] == {"n": 0}
+    assert second["type"] == "batch"
+    assert [item["data"] for item in second["items"]] == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+def test_slow_client_queue_is_bounded():
+    """A connection that falls behind keeps only its newest max_queued frames"""
+    async def scenario():
+        manager = ConnectionManager()
+        manager.max_queued = 3
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        websocket.gate.clear()
+        await manager.broadcast({"n": 0}, "update")
+        await asyncio.sleep(0)  # the sender picks up the first frame and blocks
+        for n in range(1, 10):
+            await manager.broadcast({"n": n}, "update")
+        websocket.gate.set()
+        await _settle(manager)
+        return websocket.frames
+
+    first, second = asyncio.run(scenario())
+    assert first["data"] == {"n": 0}
+    assert [item["data"] for item in second["items"]] == [{"n": 7}, {"n": 8}, {"n": 9}]
+
+def test_stalled_send_disconnects():
+    """A write that exceeds send_timeout drops and closes the connection"""
+    async def scenario():
+        manager = ConnectionManager()
+        manager.send_timeout = 0.05
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        websocket.gate.clear()  # never reads again
+        await manager.broadcast({"n": 0}, "update")
+        await asyncio.sleep(manager.send_timeout * 4)
+        return manager.get_connection_count(), websocket.closed
+
+    count, closed = asyncio.run(scenario())
+    assert count == 0
+    assert closed is not None
+
+def test_targeted_broadcast():
+    """Broadcasts with target subscriptions only reach subscribed connections"""
+    async def scenario():
+        manager = ConnectionManager()
+        subscribed, other = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(subscribed)
+        await manager.connect(other)
+        manager.unsubscribe(other, "all")
+        manager.subscribe(subscribed, "alerts")
+        await manager.broadcast({"alert": 1}, "alert_update", target_subscriptions=["alerts"])
+        await _settle(manager)
+        return subscribed.frames, other.frames
+
+    subscribed_frames, other_frames = asyncio.run(scenario())
+    assert [frame["data"] for frame in subscribed_frames] == [{"alert": 1}]
+    assert other_frames == []
+
+if __name__ == "__main__":
+    test_enqueue_coalesces_per_type()
+    test_backlog_is_capped()
+    test_sender_batches_backlog()
+    test_slow_client_queue_is_bounded()
+    test_stalled_send_disconnects()
+    test_targeted_broadcast()
+    print("[PASS] websocket coalescing")